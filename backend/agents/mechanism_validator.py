@@ -484,6 +484,16 @@ class MechanismValidator:
         """
         results = {}
 
+        # Resolve every DOI up front (deduplicated, concurrent, stored results
+        # reused); per-mechanism citation checks then read from memory
+        if self.citation_validator:
+            dois = [mech.get('doi') for mech in mechanisms if mech.get('doi')]
+            if dois:
+                try:
+                    self.citation_validator.verify_dois(dois)
+                except Exception as e:
+                    logger.error(f"Bulk DOI verification failed: {e}")
+
         for i, mech in enumerate(mechanisms, 1):
             mech_id = mech.get('id', f'mechanism_{i}')
 
@@ -0,0 +1,39 @@
+"""Add shared graph version stamps
+
+Revision ID: add_graph_versions
+Revises: add_yaml_load_records
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_graph_versions'
+down_revision: Union[str, Sequence[str], None] = 'add_yaml_load_records'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the graph_versions table (bumped on every mechanism/node write)."""
+    inspector = sa.inspect(op.get_bind())
+    if 'graph_versions' in inspector.get_table_names():
+        return
+
+    op.create_table(
+        'graph_versions',
+        sa.Column('name', sa.String(), primary_key=True),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Drop the graph_versions table."""
+    inspector = sa.inspect(op.get_bind())
+    if 'graph_versions' in inspector.get_table_names():
+        op.drop_table('graph_versions')
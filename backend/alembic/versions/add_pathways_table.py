@@ -0,0 +1,56 @@
+"""Add precomputed pathways table
+
+Revision ID: add_pathways_table
+Revises: add_hierarchy_columns
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_pathways_table'
+down_revision: Union[str, Sequence[str], None] = 'add_hierarchy_columns'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the pathways table (contents are rebuilt by the pathway catalogue)."""
+    inspector = sa.inspect(op.get_bind())
+    if 'pathways' in inspector.get_table_names():
+        return
+
+    op.create_table(
+        'pathways',
+        sa.Column('id', sa.String(), primary_key=True),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('description', sa.Text(), nullable=False),
+        sa.Column('from_node_id', sa.String(), nullable=False),
+        sa.Column('to_node_id', sa.String(), nullable=False),
+        sa.Column('from_node_label', sa.String(), nullable=False),
+        sa.Column('to_node_label', sa.String(), nullable=False),
+        sa.Column('mechanism_ids', sa.JSON(), nullable=False),
+        sa.Column('category', sa.String(), nullable=False),
+        sa.Column('path_length', sa.Integer(), nullable=False),
+        sa.Column('avg_evidence_quality', sa.Float(), nullable=False),
+        sa.Column('overall_direction', sa.String(), nullable=False),
+        sa.Column('tags', sa.JSON(), nullable=True),
+        sa.Column('graph_version', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    )
+    op.create_index('ix_pathways_id', 'pathways', ['id'])
+    op.create_index('ix_pathways_from_node_id', 'pathways', ['from_node_id'])
+    op.create_index('ix_pathways_to_node_id', 'pathways', ['to_node_id'])
+    op.create_index('ix_pathways_category', 'pathways', ['category'])
+    op.create_index('ix_pathways_avg_evidence_quality', 'pathways', ['avg_evidence_quality'])
+
+
+def downgrade() -> None:
+    """Drop the pathways table."""
+    inspector = sa.inspect(op.get_bind())
+    if 'pathways' in inspector.get_table_names():
+        op.drop_table('pathways')
@@ -0,0 +1,49 @@
+"""Add full-text search tables
+
+Revision ID: add_search_tables
+Revises: add_graph_versions
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_search_tables'
+down_revision: Union[str, Sequence[str], None] = 'add_graph_versions'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the search table for this dialect (contents are rebuilt by the search index)."""
+    bind = op.get_bind()
+    if bind.dialect.name == 'sqlite':
+        has_fts5 = bind.exec_driver_sql(
+            "SELECT 1 FROM pragma_compile_options WHERE compile_options = 'ENABLE_FTS5'"
+        ).first() is not None
+        if not has_fts5:
+            return  # Search falls back to the in-memory index
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5("
+            "kind UNINDEXED, doc_id UNINDEXED, title, body, tokenize='unicode61')"
+        )
+    elif bind.dialect.name == 'postgresql':
+        op.execute(
+            "CREATE TABLE IF NOT EXISTS search_documents ("
+            "kind text NOT NULL, doc_id text NOT NULL, title text NOT NULL, body text, "
+            "tsv tsvector NOT NULL, PRIMARY KEY (kind, doc_id))"
+        )
+        op.execute("CREATE INDEX IF NOT EXISTS ix_search_documents_tsv ON search_documents USING GIN (tsv)")
+
+
+def downgrade() -> None:
+    """Drop the search table."""
+    bind = op.get_bind()
+    if bind.dialect.name == 'sqlite':
+        op.execute("DROP TABLE IF EXISTS search_fts")
+    elif bind.dialect.name == 'postgresql':
+        op.execute("DROP TABLE IF EXISTS search_documents")
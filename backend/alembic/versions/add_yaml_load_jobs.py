@@ -0,0 +1,53 @@
+"""Add YAML load jobs table
+
+Revision ID: add_yaml_load_jobs
+Revises: add_search_tables
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_yaml_load_jobs'
+down_revision: Union[str, Sequence[str], None] = 'add_search_tables'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the yaml_load_jobs table (status of the admin YAML load jobs)."""
+    inspector = sa.inspect(op.get_bind())
+    if 'yaml_load_jobs' in inspector.get_table_names():
+        return
+
+    op.create_table(
+        'yaml_load_jobs',
+        sa.Column('id', sa.String(), primary_key=True),
+        sa.Column('kind', sa.String(), nullable=False),
+        sa.Column('force', sa.Boolean(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('phase', sa.String(), nullable=True),
+        sa.Column('total', sa.Integer(), nullable=False),
+        sa.Column('processed', sa.Integer(), nullable=False),
+        sa.Column('loaded', sa.Integer(), nullable=False),
+        sa.Column('updated', sa.Integer(), nullable=False),
+        sa.Column('unchanged', sa.Integer(), nullable=False),
+        sa.Column('errors', sa.JSON(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+    )
+    op.create_index('ix_yaml_load_jobs_kind', 'yaml_load_jobs', ['kind'])
+    op.create_index('ix_yaml_load_jobs_status', 'yaml_load_jobs', ['status'])
+
+
+def downgrade() -> None:
+    """Drop the yaml_load_jobs table."""
+    inspector = sa.inspect(op.get_bind())
+    if 'yaml_load_jobs' in inspector.get_table_names():
+        op.drop_table('yaml_load_jobs')
@@ -0,0 +1,41 @@
+"""Add YAML load records table
+
+Revision ID: add_yaml_load_records
+Revises: add_pathways_table
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_yaml_load_records'
+down_revision: Union[str, Sequence[str], None] = 'add_pathways_table'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the yaml_load_records table (filled by the admin YAML loaders)."""
+    inspector = sa.inspect(op.get_bind())
+    if 'yaml_load_records' in inspector.get_table_names():
+        return
+
+    op.create_table(
+        'yaml_load_records',
+        sa.Column('kind', sa.String(), primary_key=True),
+        sa.Column('path', sa.String(), primary_key=True),
+        sa.Column('content_hash', sa.String(), nullable=False),
+        sa.Column('record_id', sa.String(), nullable=True),
+        sa.Column('loaded_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Drop the yaml_load_records table."""
+    inspector = sa.inspect(op.get_bind())
+    if 'yaml_load_records' in inspector.get_table_names():
+        op.drop_table('yaml_load_records')
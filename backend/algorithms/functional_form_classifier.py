@@ -21,6 +21,8 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import json
 
+from utils.llm_cache import cached_client
+
 
 @dataclass
 class FunctionalFormAssignment:
@@ -109,7 +111,7 @@ class FunctionalFormClassifier:
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY not set")
 
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+        self.client = cached_client(anthropic.Anthropic(api_key=self.api_key))
 
     def classify(
         self,
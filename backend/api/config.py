@@ -48,6 +48,8 @@ class Settings(BaseSettings):
     redis_url: str = "redis://localhost:6379/0"
     cache_enabled: bool = True
     cache_ttl: int = 3600
+    cache_backend: str = "memory"  # memory (per process) or redis (shared across workers)
+    cache_max_entries: int = 1024
 
     # Neo4j (Optional)
     neo4j_uri: str = "bolt://localhost:7687"
@@ -67,6 +69,7 @@ class Settings(BaseSettings):
     # Rate Limiting
     rate_limit_enabled: bool = True
     rate_limit_per_minute: int = 60
+    rate_limit_backend: str = "memory"  # memory (per process) or redis (shared across workers)
 
     # Data Scraping
     scraping_enabled: bool = True
@@ -78,6 +81,22 @@ class Settings(BaseSettings):
     bayesian_mcmc_chains: int = 4
     bayesian_random_seed: int = 42
 
+    # Graph Analytics
+    centrality_background_refresh: bool = True
+    betweenness_sample_size: int = 256
+    betweenness_sample_seed: int = 42
+    graph_executor_workers: int = 4
+    graph_version_check_interval: float = 1.0  # Seconds between checks for other workers' graph writes
+    pathfinding_max_expansions: int = 50000
+    pathfinding_time_budget_ms: int = 2000
+    pathway_catalogue_background_refresh: bool = True
+    pathway_catalogue_max_paths_per_pair: int = 5
+    search_index_background_refresh: bool = True
+    search_index_backend: Optional[str] = None  # sqlite_fts5, postgres_tsvector, memory (default: by dialect)
+
+    # Admin YAML loaders
+    yaml_loader_background: bool = True  # Run /admin/load-* jobs on a worker thread
+
     # Feature Flags
     enable_graph_database: bool = False
     enable_real_time_updates: bool = False
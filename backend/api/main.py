@@ -12,8 +12,13 @@ from typing import Dict, Any
 from api.config import settings
 from api.middleware.logging import LoggingMiddleware
 from api.middleware.rate_limit import RateLimitMiddleware
+from api.middleware.response_cache import ResponseCacheMiddleware
 # from api.routes import mechanisms, contexts, weights, visualizations, health
-from models.database import init_db, close_db
+from models.database import init_db, close_db, SessionLocal
+from services.graph_executor import graph_executor
+from services.graph_store import graph_store
+from api.routes.pathways import pathway_catalogue
+from api.routes.search import search_index
 
 # Configure logging
 logging.basicConfig(
@@ -33,9 +38,24 @@ async def lifespan(app: FastAPI):
         logger.error(f"Database initialization failed: {e}")
         raise
 
+    # Warm the shared mechanism graph so the first graph request is fast
+    try:
+        db = SessionLocal()
+        try:
+            graph_store.build(db)
+        finally:
+            db.close()
+    except Exception as e:
+        logger.error(f"Graph store warm-up failed: {e}")
+
+    # Rebuild the pathway catalogue and search index off the request path
+    pathway_catalogue.refresh_in_background()
+    search_index.refresh_in_background()
+
     yield
 
     logger.info("Shutting down HealthSystems Platform API...")
+    graph_executor.shutdown()
     try:
         await close_db()
         logger.info("Database connections closed")
@@ -57,6 +77,9 @@ app = FastAPI(
 )
 
 # Middleware
+if settings.cache_enabled:
+    # Innermost, so cached bodies are the uncompressed route output
+    app.add_middleware(ResponseCacheMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -71,7 +94,7 @@ if settings.rate_limit_enabled:
     app.add_middleware(RateLimitMiddleware)
 
 # Include routers
-from api.routes import mechanisms_router, nodes_router, pathways_router
+from api.routes import mechanisms_router, nodes_router, pathways_router, search_router
 
 app.include_router(mechanisms_router)
 logger.info(f"Mechanisms router included with {len(mechanisms_router.routes)} routes")
@@ -79,6 +102,8 @@ app.include_router(nodes_router)
 logger.info(f"Nodes router included with {len(nodes_router.routes)} routes: {[r.path for r in nodes_router.routes]}")
 app.include_router(pathways_router)
 logger.info(f"Pathways router included with {len(pathways_router.routes)} routes")
+app.include_router(search_router)
+logger.info(f"Search router included with {len(search_router.routes)} routes")
 # app.include_router(contexts.router, prefix="/api/contexts", tags=["Contexts"])
 # app.include_router(weights.router, prefix="/api/weights", tags=["Weights"])
 # app.include_router(visualizations.router, prefix="/api/visualizations", tags=["Visualizations"])
@@ -1,61 +1,285 @@
 """
 Rate limiting middleware to prevent API abuse.
+
+Uses a sliding-window counter: each client key keeps the request cost of
+the current and previous fixed windows, and the previous window is weighted
+by how much of it still overlaps the sliding window. That is O(1) time and
+memory per key, unlike keeping every request timestamp.
+
+Requests are charged a per-route cost (graph traversals cost more than
+simple lookups). State lives in a pluggable backend:
+- LocalRateLimitBackend: per-process, sharded locks, idle-key eviction
+- RedisRateLimitBackend: shared by all workers through an atomic Lua script
+
+If the shared backend fails, requests are charged against per-process
+counters until it is retried, so an outage weakens limits rather than
+lifting them.
 """
 
+import logging
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
 from fastapi import Request, status
+from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
-from fastapi.responses import JSONResponse  # <--- Import this
-from typing import Callable
-import time
-from collections import defaultdict
-import asyncio
 
 from api.config import settings
 
+try:
+    import redis
+    import redis.asyncio as redis_asyncio
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+EXEMPT_PATHS = {"/health", "/docs", "/redoc", "/openapi.json"}
+
+# (path prefix, cost) - first match wins, everything else costs DEFAULT_COST
+ROUTE_COSTS: List[Tuple[str, int]] = [
+    ("/api/nodes/pathfinding", 5),
+    ("/api/nodes/crisis-subgraph", 5),
+    ("/api/nodes/focal-subgraph", 5),
+    ("/api/mechanisms/export", 5),
+    ("/api/nodes/importance", 3),
+    ("/api/search", 2),
+]
+DEFAULT_COST = 1
+
+# Seconds to use per-process limits after the shared backend fails
+BACKEND_RETRY_INTERVAL = 30.0
+
+
+def route_cost(path: str) -> int:
+    """Cost charged for a request to a path."""
+    for prefix, cost in ROUTE_COSTS:
+        if path.startswith(prefix):
+            return cost
+    return DEFAULT_COST
+
+
+@dataclass
+class RateLimitResult:
+    """Outcome of charging a request against a key's budget."""
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: int = 0
+
+
+def _window_state(now: float, window: float) -> Tuple[int, float]:
+    """Current fixed-window index and the weight of the previous window."""
+    index = int(now // window)
+    elapsed = now - index * window
+    return index, 1.0 - elapsed / window
+
+
+class LocalRateLimitBackend:
+    """
+    In-process sliding-window counters.
+
+    Keys are spread over independently locked shards so concurrent requests
+    for different clients don't contend, and keys idle for two windows are
+    swept out as shards are touched.
+    """
+
+    name = "memory"
+
+    def __init__(self, limit: int, window: float = 60.0, shards: int = 16):
+        """
+        Initialize the backend.
+
+        Args:
+            limit: Cost allowed per sliding window
+            window: Window length in seconds
+            shards: Number of independently locked shards
+        """
+        self.limit = limit
+        self.window = window
+        # key -> [window index, current cost, previous cost]
+        self._shards: List[Dict[str, List]] = [{} for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._swept_at = [0] * shards
+
+    def _shard(self, key: str) -> int:
+        return zlib.crc32(key.encode("utf-8")) % len(self._shards)
+
+    async def hit(self, key: str, cost: int = 1, now: Optional[float] = None) -> RateLimitResult:
+        """
+        Charge a request against a key's budget.
+
+        Args:
+            key: Client key
+            cost: Cost of the request
+            now: Current time (defaults to time.time())
+
+        Returns:
+            RateLimitResult
+        """
+        now = time.time() if now is None else now
+        index, prev_weight = _window_state(now, self.window)
+        shard = self._shard(key)
+
+        with self._locks[shard]:
+            counters = self._shards[shard]
+            if self._swept_at[shard] < index - 1:
+                self._sweep(counters, index)
+                self._swept_at[shard] = index
+
+            state = counters.get(key)
+            if state is None or state[0] < index - 1:
+                state = [index, 0, 0]
+            elif state[0] == index - 1:
+                state = [index, 0, state[1]]
+            counters[key] = state
+
+            estimated = state[2] * prev_weight + state[1]
+            if estimated + cost > self.limit:
+                return RateLimitResult(False, self.limit, max(0, int(self.limit - estimated)),
+                                       self._retry_after(now, index))
+            state[1] += cost
+            return RateLimitResult(True, self.limit, max(0, int(self.limit - estimated - cost)))
+
+    def _retry_after(self, now: float, index: int) -> int:
+        return max(1, int((index + 1) * self.window - now) + 1)
+
+    @staticmethod
+    def _sweep(counters: Dict[str, List], index: int) -> None:
+        """Drop keys with no requests in the current or previous window."""
+        for key in [k for k, state in counters.items() if state[0] < index - 1]:
+            del counters[key]
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+
+# KEYS: current window key, previous window key
+# ARGV: limit, cost, previous-window weight, key TTL (seconds)
+_SLIDING_WINDOW_SCRIPT = """
+local prev = tonumber(redis.call('GET', KEYS[2]) or '0')
+local curr = tonumber(redis.call('GET', KEYS[1]) or '0')
+local limit = tonumber(ARGV[1])
+local cost = tonumber(ARGV[2])
+local estimated = prev * tonumber(ARGV[3]) + curr
+if estimated + cost > limit then
+    return {0, math.floor(limit - estimated)}
+end
+redis.call('INCRBY', KEYS[1], cost)
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[4]))
+return {1, math.floor(limit - estimated - cost)}
+"""
+
+
+class RedisRateLimitBackend:
+    """
+    Sliding-window counters in Redis, shared by all workers.
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str, limit: int, window: float = 60.0,
+                 prefix: str = "healthsystems:rate-limit"):
+        """
+        Initialize the backend.
+
+        Args:
+            url: Redis URL
+            limit: Cost allowed per sliding window
+            window: Window length in seconds
+            prefix: Key prefix
+
+        Raises:
+            RuntimeError: If the redis package is not installed
+            redis.RedisError: If the server can't be reached
+        """
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("redis package not installed. Install with: pip install redis")
+        self.limit = limit
+        self.window = window
+        self.prefix = prefix
+        # from_url() connects lazily; fail here so the caller can fall back
+        with redis.Redis.from_url(url) as probe:
+            probe.ping()
+        self._client = redis_asyncio.Redis.from_url(url)
+        self._script = self._client.register_script(_SLIDING_WINDOW_SCRIPT)
+
+    async def hit(self, key: str, cost: int = 1, now: Optional[float] = None) -> RateLimitResult:
+        now = time.time() if now is None else now
+        index, prev_weight = _window_state(now, self.window)
+        keys = [f"{self.prefix}:{key}:{index}", f"{self.prefix}:{key}:{index - 1}"]
+        allowed, remaining = await self._script(
+            keys=keys, args=[self.limit, cost, prev_weight, int(self.window * 2)]
+        )
+        retry_after = 0 if allowed else max(1, int((index + 1) * self.window - now) + 1)
+        return RateLimitResult(bool(allowed), self.limit, max(0, int(remaining)), retry_after)
+
+
+def create_rate_limit_backend():
+    """
+    Build the rate limit backend from settings, falling back to the local
+    backend if Redis is selected but unavailable.
+    """
+    if settings.rate_limit_backend == "redis":
+        try:
+            return RedisRateLimitBackend(settings.redis_url, settings.rate_limit_per_minute)
+        except Exception as e:
+            logger.warning(f"Redis rate limiting unavailable ({e}); using per-process limits")
+    return LocalRateLimitBackend(settings.rate_limit_per_minute)
+
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """
-    Simple in-memory rate limiting.
-    For production, use Redis-based rate limiting.
+    Per-client sliding-window rate limiting with per-route costs.
     """
 
-    def __init__(self, app):
+    def __init__(self, app, backend=None):
         super().__init__(app)
-        self.requests = defaultdict(list)
-        self.lock = asyncio.Lock()
+        self.backend = backend if backend is not None else create_rate_limit_backend()
+        # Stands in for the backend while it is failing
+        self.fallback = LocalRateLimitBackend(self.backend.limit)
+        self._backend_down_until = 0.0
+
+    async def _hit(self, key: str, cost: int) -> RateLimitResult:
+        """Charge the backend, or the per-process fallback while it is down."""
+        if time.monotonic() >= self._backend_down_until:
+            try:
+                return await self.backend.hit(key, cost)
+            except Exception as e:
+                logger.warning(
+                    f"Rate limit backend failed ({self.backend.name}): {e}; "
+                    f"using per-process limits for {BACKEND_RETRY_INTERVAL:.0f}s"
+                )
+                self._backend_down_until = time.monotonic() + BACKEND_RETRY_INTERVAL
+        return await self.fallback.hit(key, cost)
 
     async def dispatch(self, request: Request, call_next: Callable):
         # Skip rate limiting for health checks
-        if request.url.path in ["/health", "/docs", "/redoc", "/openapi.json"]:
+        if request.url.path in EXEMPT_PATHS:
             return await call_next(request)
 
         client_ip = request.client.host if request.client else "unknown"
-        current_time = time.time()
-
-        async with self.lock:
-            # Clean old requests (older than 1 minute)
-            self.requests[client_ip] = [
-                req_time for req_time in self.requests[client_ip]
-                if current_time - req_time < 60
-            ]
-
-            # Check rate limit
-            if len(self.requests[client_ip]) >= settings.rate_limit_per_minute:
-                # FIX: Return a JSONResponse instead of raising HTTPException
-                return JSONResponse(
-                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                    content={"detail": "Rate limit exceeded. Please try again later."}
-                )
+        result = await self._hit(client_ip, route_cost(request.url.path))
 
-            # Add current request
-            self.requests[client_ip].append(current_time)
+        if not result.allowed:
+            return JSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={"detail": "Rate limit exceeded. Please try again later."},
+                headers={
+                    "Retry-After": str(result.retry_after),
+                    "X-RateLimit-Limit": str(result.limit),
+                    "X-RateLimit-Remaining": str(result.remaining),
+                },
+            )
 
         response = await call_next(request)
 
         # Add rate limit headers
-        response.headers["X-RateLimit-Limit"] = str(settings.rate_limit_per_minute)
-        response.headers["X-RateLimit-Remaining"] = str(
-            settings.rate_limit_per_minute - len(self.requests[client_ip])
-        )
+        response.headers["X-RateLimit-Limit"] = str(result.limit)
+        response.headers["X-RateLimit-Remaining"] = str(result.remaining)
 
-        return response
\ No newline at end of file
+        return response
@@ -0,0 +1,177 @@
+"""
+Response caching middleware for the graph/query endpoints.
+
+Successful responses of the read-only graph endpoints are cached keyed on
+the normalized request and the graph version (see services.response_cache),
+and served with a strong ETag. Requests carrying a matching If-None-Match
+get 304 Not Modified without the body being recomputed or resent.
+
+Before keying a request the middleware runs the graph store's shared
+version check (at most once per graph_version_check_interval), so a graph
+write in another worker retires this worker's entries too.
+
+Implemented as a plain ASGI middleware (rather than BaseHTTPMiddleware) so
+the request body can be read for the cache key and replayed to the route.
+"""
+
+import logging
+from typing import List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.config import settings
+from models import SessionLocal
+from services.graph_executor import graph_executor
+from services.graph_store import GraphStore, graph_store
+from services.response_cache import (
+    CachedResponse,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    ResponseCache,
+    etag_matches,
+    make_etag,
+)
+
+logger = logging.getLogger(__name__)
+
+# (method, path prefix) pairs whose responses depend only on params + graph
+CACHED_ROUTES: List[Tuple[str, str]] = [
+    ("GET", "/api/nodes/importance"),
+    ("POST", "/api/nodes/crisis-subgraph"),
+    ("POST", "/api/nodes/focal-subgraph"),
+    ("POST", "/api/nodes/pathfinding"),
+    ("GET", "/api/pathways"),
+    ("GET", "/api/mechanisms/stats/summary"),
+]
+
+
+def is_cacheable(method: str, path: str) -> bool:
+    """Whether a request targets one of the cached endpoints."""
+    return any(method == m and path.startswith(prefix) for m, prefix in CACHED_ROUTES)
+
+
+def create_response_cache() -> Optional[ResponseCache]:
+    """
+    Build the response cache from settings, falling back to memory if
+    Redis is selected but unavailable.
+
+    Returns:
+        ResponseCache
+    """
+    if settings.cache_backend == "redis":
+        try:
+            backend = RedisCacheBackend(settings.redis_url, ttl=settings.cache_ttl)
+            return ResponseCache(graph_store, backend)
+        except Exception as e:
+            logger.warning(f"Redis response cache unavailable ({e}); using in-process cache")
+    backend = MemoryCacheBackend(max_entries=settings.cache_max_entries, ttl=settings.cache_ttl)
+    return ResponseCache(graph_store, backend)
+
+
+def _sync_graph(store: GraphStore) -> None:
+    """Pick up graph writes from other workers (runs on the graph executor)."""
+    db = SessionLocal()
+    try:
+        store.sync(db)
+    finally:
+        db.close()
+
+
+class ResponseCacheMiddleware:
+    """
+    Serve cached graph/query responses with ETag revalidation.
+    """
+
+    def __init__(self, app: ASGIApp, cache: Optional[ResponseCache] = None):
+        self.app = app
+        self.cache = cache if cache is not None else create_response_cache()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (self.cache is None or scope["type"] != "http"
+                or not is_cacheable(scope["method"], scope["path"])):
+            await self.app(scope, receive, send)
+            return
+
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        replayed = False
+
+        async def replay_receive() -> Message:
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        key = None
+        try:
+            if self.cache.store.sync_due:
+                await graph_executor.run(_sync_graph, self.cache.store)
+        except Exception as e:
+            # Without the check the cached entries may be stale
+            logger.warning(f"Graph version check failed: {e}")
+        else:
+            key = await self.cache.key(scope["method"], scope["path"], scope.get("query_string", b""), body)
+        if key is None:
+            # Fail open: a cache outage shouldn't take the API down
+            await self.app(scope, replay_receive, send)
+            return
+        if_none_match = Headers(scope=scope).get("if-none-match")
+
+        cached = await self.cache.get(key)
+        if cached is not None:
+            await self._send(send, cached, if_none_match, "HIT")
+            return
+
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+
+        async def capture_send(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, replay_receive, capture_send)
+
+        response_body = b"".join(chunks)
+        if start is None:
+            return
+        if start["status"] != 200:
+            await send(start)
+            await send({"type": "http.response.body", "body": response_body})
+            return
+
+        headers = Headers(raw=start["headers"])
+        entry = CachedResponse(
+            body=response_body,
+            media_type=headers.get("content-type", "application/json"),
+            etag=make_etag(response_body),
+        )
+        await self.cache.set(key, entry)
+        await self._send(send, entry, if_none_match, "MISS")
+
+    @staticmethod
+    async def _send(send: Send, entry: CachedResponse, if_none_match: Optional[str], status: str) -> None:
+        """Send a cached entry, or 304 if the client already has it."""
+        not_modified = etag_matches(if_none_match, entry.etag)
+        headers = MutableHeaders()
+        headers["etag"] = entry.etag
+        headers["cache-control"] = "no-cache"
+        headers["x-cache"] = status
+        if not not_modified:
+            headers["content-type"] = entry.media_type
+            headers["content-length"] = str(len(entry.body))
+        await send({
+            "type": "http.response.start",
+            "status": 304 if not_modified else entry.status_code,
+            "headers": headers.raw,
+        })
+        await send({"type": "http.response.body", "body": b"" if not_modified else entry.body})
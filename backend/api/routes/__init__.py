@@ -3,5 +3,6 @@
 from api.routes.mechanisms import router as mechanisms_router
 from api.routes.nodes import router as nodes_router
 from api.routes.pathways import router as pathways_router
+from api.routes.search import router as search_router
 
-__all__ = ["mechanisms_router", "nodes_router", "pathways_router"]
+__all__ = ["mechanisms_router", "nodes_router", "pathways_router", "search_router"]
@@ -4,14 +4,22 @@ API routes for mechanisms (CRUD operations).
 Provides REST API for accessing and managing causal mechanisms.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, selectinload
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, selectinload
+from typing import AsyncIterator, List, Literal, Optional
 from pathlib import Path
-import yaml
+import csv
+import io
+import json
 
-from models import Mechanism, Node, get_db
+from api.config import settings
+from models import Mechanism, Node, SessionLocal, get_async_db
 from pydantic import BaseModel
+from services.graph_store import graph_store
+from services.yaml_loader import YamlLoader
 
 
 router = APIRouter(prefix="/api/mechanisms", tags=["mechanisms"])
@@ -58,12 +66,37 @@ class MechanismListItem(BaseModel):
         from_attributes = True
 
 
+# Columns of MechanismListItem, in export order
+EXPORT_FIELDS = list(MechanismListItem.model_fields)
+
+# Rows fetched per round trip when streaming an export
+EXPORT_BATCH_SIZE = 1000
+
+
+def apply_mechanism_filters(query, category: Optional[str] = None, direction: Optional[str] = None,
+                            from_node: Optional[str] = None, to_node: Optional[str] = None,
+                            evidence_quality: Optional[str] = None):
+    """Apply the list/export filters to a mechanism query or select()"""
+    if category:
+        query = query.filter(Mechanism.category == category)
+    if direction:
+        query = query.filter(Mechanism.direction == direction)
+    if from_node:
+        query = query.filter(Mechanism.from_node_id == from_node)
+    if to_node:
+        query = query.filter(Mechanism.to_node_id == to_node)
+    if evidence_quality:
+        query = query.filter(Mechanism.evidence_quality == evidence_quality)
+    return query
+
+
 # ==========================================
 # GET Endpoints
 # ==========================================
 
 @router.get("/", response_model=List[MechanismListItem])
-def list_mechanisms(
+async def list_mechanisms(
+    response: Response,
     category: Optional[str] = Query(None, description="Filter by category"),
     direction: Optional[str] = Query(None, description="Filter by direction (positive/negative)"),
     from_node: Optional[str] = Query(None, description="Filter by source node ID"),
@@ -71,7 +104,8 @@ def list_mechanisms(
     evidence_quality: Optional[str] = Query(None, description="Filter by evidence quality (A/B/C)"),
     limit: int = Query(100, le=5000, description="Maximum number of results"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
-    db: Session = Depends(get_db)
+    after: Optional[str] = Query(None, description="Cursor: return mechanisms with ID after this one"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     List mechanisms with optional filtering.
@@ -83,27 +117,28 @@ def list_mechanisms(
     - to_node (target node ID)
     - evidence_quality (A, B, C)
 
+    Results are ordered by ID. For large result sets prefer cursor
+    pagination: pass the X-Next-Cursor response header back as ``after``
+    (no deep OFFSET scans). For the whole bank use /export.
+
     Returns minimal mechanism info for efficient list views.
     """
-    query = db.query(Mechanism).options(
+    query = select(Mechanism).options(
         selectinload(Mechanism.from_node),
         selectinload(Mechanism.to_node)
     )
 
     # Apply filters
-    if category:
-        query = query.filter(Mechanism.category == category)
-    if direction:
-        query = query.filter(Mechanism.direction == direction)
-    if from_node:
-        query = query.filter(Mechanism.from_node_id == from_node)
-    if to_node:
-        query = query.filter(Mechanism.to_node_id == to_node)
-    if evidence_quality:
-        query = query.filter(Mechanism.evidence_quality == evidence_quality)
+    query = apply_mechanism_filters(query, category, direction, from_node, to_node, evidence_quality)
+    if after is not None:
+        query = query.filter(Mechanism.id > after)
 
     # Paginate
-    mechanisms = query.offset(offset).limit(limit).all()
+    result = await db.execute(query.order_by(Mechanism.id).offset(offset).limit(limit))
+    mechanisms = result.scalars().all()
+
+    if len(mechanisms) == limit:
+        response.headers["X-Next-Cursor"] = mechanisms[-1].id
 
     # Format response
     return [
@@ -124,8 +159,102 @@ def list_mechanisms(
     ]
 
 
+async def iter_export_rows(db: AsyncSession, **filters) -> AsyncIterator[dict]:
+    """
+    Yield list-item rows for every matching mechanism, in ID order.
+
+    Uses a server-side cursor (yield_per), so memory stays constant
+    regardless of how many mechanisms are exported.
+    """
+    from_node = aliased(Node)
+    to_node = aliased(Node)
+
+    stmt = apply_mechanism_filters(
+        select(
+            Mechanism.id,
+            Mechanism.name,
+            Mechanism.from_node_id,
+            from_node.name,
+            from_node.scale,
+            Mechanism.to_node_id,
+            to_node.name,
+            to_node.scale,
+            Mechanism.direction,
+            Mechanism.category,
+            Mechanism.evidence_quality
+        )
+        .outerjoin(from_node, from_node.id == Mechanism.from_node_id)
+        .outerjoin(to_node, to_node.id == Mechanism.to_node_id),
+        **filters
+    ).order_by(Mechanism.id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+
+    result = await db.stream(stmt)
+    async for (mech_id, name, from_id, from_name, from_scale, to_id, to_name, to_scale,
+               direction, category, evidence_quality) in result:
+        yield {
+            "id": mech_id,
+            "name": name,
+            "from_node_id": from_id,
+            "from_node_name": from_name or from_id,
+            "from_node_scale": from_scale if from_scale is not None else 4,
+            "to_node_id": to_id,
+            "to_node_name": to_name or to_id,
+            "to_node_scale": to_scale if to_scale is not None else 4,
+            "direction": direction,
+            "category": category,
+            "evidence_quality": evidence_quality,
+        }
+
+
+async def _ndjson_lines(rows: AsyncIterator[dict]) -> AsyncIterator[str]:
+    async for row in rows:
+        yield json.dumps(row) + "\n"
+
+
+async def _csv_lines(rows: AsyncIterator[dict]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+    async for row in rows:
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+@router.get("/export")
+async def export_mechanisms(
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Export format"),
+    category: Optional[str] = Query(None, description="Filter by category"),
+    direction: Optional[str] = Query(None, description="Filter by direction (positive/negative)"),
+    from_node: Optional[str] = Query(None, description="Filter by source node ID"),
+    to_node: Optional[str] = Query(None, description="Filter by target node ID"),
+    evidence_quality: Optional[str] = Query(None, description="Filter by evidence quality (A/B/C)"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Stream every matching mechanism as NDJSON or CSV.
+
+    Rows have the same fields as the list endpoint and are streamed from a
+    server-side cursor, for bulk consumers that pull the whole bank.
+    """
+    rows = iter_export_rows(
+        db, category=category, direction=direction, from_node=from_node,
+        to_node=to_node, evidence_quality=evidence_quality
+    )
+
+    if format == "csv":
+        return StreamingResponse(
+            _csv_lines(rows),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="mechanisms.csv"'}
+        )
+    return StreamingResponse(_ndjson_lines(rows), media_type="application/x-ndjson")
+
+
 @router.get("/{mechanism_id}", response_model=MechanismResponse)
-def get_mechanism(mechanism_id: str, db: Session = Depends(get_db)):
+async def get_mechanism(mechanism_id: str, db: AsyncSession = Depends(get_async_db)):
     """
     Get detailed information for a specific mechanism.
 
@@ -136,7 +265,11 @@ def get_mechanism(mechanism_id: str, db: Session = Depends(get_db)):
     - Structural competency analysis
     - LLM metadata (if applicable)
     """
-    mechanism = db.query(Mechanism).filter(Mechanism.id == mechanism_id).first()
+    mechanism = await db.scalar(
+        select(Mechanism)
+        .options(selectinload(Mechanism.from_node), selectinload(Mechanism.to_node))
+        .filter(Mechanism.id == mechanism_id)
+    )
 
     if not mechanism:
         raise HTTPException(status_code=404, detail=f"Mechanism {mechanism_id} not found")
@@ -160,7 +293,7 @@ def get_mechanism(mechanism_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/stats/summary")
-def get_stats(db: Session = Depends(get_db)):
+async def get_stats(db: AsyncSession = Depends(get_async_db)):
     """
     Get summary statistics about the mechanism bank.
 
@@ -171,27 +304,23 @@ def get_stats(db: Session = Depends(get_db)):
     - Evidence quality distribution
     - Total nodes
     """
-    total_mechanisms = db.query(Mechanism).count()
-    total_nodes = db.query(Node).count()
+    total_mechanisms = await db.scalar(select(func.count(Mechanism.id)))
+    total_nodes = await db.scalar(select(func.count(Node.id)))
 
     # Count by category
-    from sqlalchemy import func
-    by_category = db.query(
-        Mechanism.category,
-        func.count(Mechanism.id)
-    ).group_by(Mechanism.category).all()
+    by_category = await db.execute(
+        select(Mechanism.category, func.count(Mechanism.id)).group_by(Mechanism.category)
+    )
 
     # Count by direction
-    by_direction = db.query(
-        Mechanism.direction,
-        func.count(Mechanism.id)
-    ).group_by(Mechanism.direction).all()
+    by_direction = await db.execute(
+        select(Mechanism.direction, func.count(Mechanism.id)).group_by(Mechanism.direction)
+    )
 
     # Count by evidence quality
-    by_evidence = db.query(
-        Mechanism.evidence_quality,
-        func.count(Mechanism.id)
-    ).group_by(Mechanism.evidence_quality).all()
+    by_evidence = await db.execute(
+        select(Mechanism.evidence_quality, func.count(Mechanism.id)).group_by(Mechanism.evidence_quality)
+    )
 
     return {
         "total_mechanisms": total_mechanisms,
@@ -203,181 +332,52 @@ def get_stats(db: Session = Depends(get_db)):
 
 
 # ==========================================
-# Utility: Load mechanisms from YAML files
+# Admin: Load nodes and mechanisms from YAML files
 # ==========================================
 
-def get_node_scale_from_category(category: str, node_name: str = "") -> int:
-    """
-    Determine node scale based on category and node name patterns.
-
-    7-scale taxonomy mapping:
-    - political -> 1 (structural determinants - policy)
-    - built_environment -> 2 (built environment & infrastructure)
-    - economic, social_services -> 3 (institutional infrastructure)
-    - social_environment, economic_individual -> 4 (individual/household conditions)
-    - behavioral, psychosocial -> 5 (individual behaviors & psychosocial)
-    - healthcare_access -> varies by node type (see below)
-    - clinical -> 6 (intermediate pathways)
-    - biological, crisis -> 7 (crisis endpoints)
-
-    Pattern-based overrides (applied regardless of category):
-    - Treatment/medication nodes -> Scale 5 (individual behaviors)
-    - Infrastructure/facility nodes -> Scale 3 (institutional)
-    """
-    if node_name:
-        name_lower = node_name.lower()
-
-        # Treatment/medication keywords → Scale 5 (individual behaviors)
-        # Check these FIRST regardless of category - treatments are always Scale 5
-        treatment_keywords = [
-            'gabapentin', 'naltrexone', 'disulfiram', 'acamprosate',
-            'baclofen', 'topiramate', 'pharmacotherapy', 'medication',
-            ' therapy', 'counseling', 'detox protocol', 'rehab',
-            'recovery program', 'maud', ' mat '
-        ]
-        # More specific treatment patterns that should be Scale 5
-        if any(kw in name_lower for kw in treatment_keywords):
-            return 5
-        # "treatment" alone needs more context - check it's not infrastructure
-        if 'treatment' in name_lower:
-            infrastructure_check = ['facility', 'center', 'capacity', 'availability', 'density']
-            if not any(kw in name_lower for kw in infrastructure_check):
-                return 5
-
-        # Infrastructure/facilities → Scale 3 (institutional)
-        # Only for healthcare_access category
-        if category == 'healthcare_access':
-            infrastructure_keywords = [
-                'facility', 'clinic', 'center', 'density', 'capacity',
-                'availability', 'provider', 'workforce', 'bed', 'unit',
-                'access', 'coverage', 'insurance'
-            ]
-            if any(kw in name_lower for kw in infrastructure_keywords):
-                return 3
-            # Default healthcare_access without specific patterns → Scale 6
-            return 6
-
-    scale_mapping = {
-        'political': 1,
-        'built_environment': 2,
-        'economic': 3,
-        'social_services': 3,
-        'social_environment': 4,
-        'economic_individual': 4,
-        'behavioral': 5,
-        'psychosocial': 5,
-        'healthcare_access': 6,
-        'clinical': 6,
-        'biological': 7,
-        'crisis': 7
-    }
+MECHANISM_BANK_DIR = Path(__file__).parent.parent.parent.parent / "mechanism-bank"
+
+# Shared loader (one background job at a time, skips files unchanged since the last load)
+yaml_loader = YamlLoader(
+    SessionLocal,
+    graph_store,
+    nodes_dir=MECHANISM_BANK_DIR / "nodes",
+    mechanisms_dir=MECHANISM_BANK_DIR / "mechanisms",
+    background=settings.yaml_loader_background
+)
+
 
-    return scale_mapping.get(category, 4)  # Default to scale 4
+def _job_response(job) -> dict:
+    return {**job.to_dict(), "status_url": f"{router.prefix}/admin/load-jobs/{job.id}"}
 
 
-@router.post("/admin/load-nodes-from-yaml")
-def load_nodes_from_yaml(db: Session = Depends(get_db)):
+@router.post("/admin/load-nodes-from-yaml", status_code=202)
+def load_nodes_from_yaml(
+    force: bool = Query(False, description="Reload every file, even if unchanged since the last load")
+):
     """
-    Load node definitions from mechanism-bank/nodes/*.yml files.
+    Start loading node definitions from mechanism-bank/nodes/*.yml files.
 
     This should be called BEFORE loading mechanisms, as mechanisms
     reference nodes by ID. Allows explicit node metadata including
     scale, domain, type, baseline values, and data sources.
 
-    Returns number of nodes loaded/updated.
+    The load runs in the background; poll status_url for progress.
+    Returns the job status.
     """
-    nodes_dir = Path(__file__).parent.parent.parent.parent / "mechanism-bank" / "nodes"
-
-    if not nodes_dir.exists():
+    if not yaml_loader.nodes_dir.exists():
         # Create directory if it doesn't exist
-        nodes_dir.mkdir(parents=True, exist_ok=True)
-        return {
-            "loaded": 0,
-            "updated": 0,
-            "errors": [],
-            "message": "nodes directory created but empty"
-        }
-
-    loaded_count = 0
-    updated_count = 0
-    errors = []
-
-    for yaml_file in nodes_dir.glob("*.yml"):
-        try:
-            with open(yaml_file, 'r', encoding='utf-8') as f:
-                node_data = yaml.safe_load(f)
-
-            # Validate required fields
-            required_fields = ['id', 'name', 'scale', 'category']
-            for field in required_fields:
-                if field not in node_data:
-                    raise ValueError(f"Missing required field: {field}")
-
-            # Validate scale range
-            if not (1 <= node_data['scale'] <= 7):
-                raise ValueError(f"scale must be between 1 and 7, got {node_data['scale']}")
-
-            # Check if node exists
-            node = db.query(Node).filter(Node.id == node_data['id']).first()
-
-            if node:
-                # Update existing node
-                node.name = node_data['name']
-                node.scale = node_data['scale']
-                node.category = node_data['category']
-                node.node_type = node_data.get('type', node.node_type)
-                node.unit = node_data.get('unit')
-                node.description = node_data.get('description')
-                node.measurement_method = node_data.get('measurement_method')
-                node.typical_range = node_data.get('typical_range')
-
-                # Parse data_sources if present
-                if 'data_sources' in node_data:
-                    node.data_sources = node_data['data_sources']
-
-                updated_count += 1
-            else:
-                # Create new node
-                node = Node(
-                    id=node_data['id'],
-                    name=node_data['name'],
-                    scale=node_data['scale'],
-                    category=node_data['category'],
-                    node_type=node_data.get('type', 'stock'),
-                    unit=node_data.get('unit'),
-                    description=node_data.get('description'),
-                    measurement_method=node_data.get('measurement_method'),
-                    typical_range=node_data.get('typical_range'),
-                    data_sources=node_data.get('data_sources')
-                )
-                db.add(node)
-                loaded_count += 1
-
-        except Exception as e:
-            errors.append({
-                "file": str(yaml_file),
-                "error": str(e)
-            })
-
-    # Commit all changes
-    try:
-        db.commit()
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"Database commit failed: {e}")
+        yaml_loader.nodes_dir.mkdir(parents=True, exist_ok=True)
 
-    return {
-        "loaded": loaded_count,
-        "updated": updated_count,
-        "errors": errors,
-        "total_errors": len(errors)
-    }
+    return _job_response(yaml_loader.start("nodes", force=force))
 
 
-@router.post("/admin/load-from-yaml")
-def load_mechanisms_from_yaml(db: Session = Depends(get_db)):
+@router.post("/admin/load-from-yaml", status_code=202)
+def load_mechanisms_from_yaml(
+    force: bool = Query(False, description="Reload every file, even if unchanged since the last load")
+):
     """
-    Load mechanisms from YAML files in mechanism-bank.
+    Start loading mechanisms from YAML files in mechanism-bank.
 
     This is an admin endpoint to populate the database from
     the YAML files generated by the LLM pipeline.
@@ -386,101 +386,21 @@ def load_mechanisms_from_yaml(db: Session = Depends(get_db)):
     This endpoint will still auto-create nodes if they don't exist, but with
     inferred scale values based on category.
 
-    Returns number of mechanisms loaded.
+    Mechanisms from changed files are created or updated. The load runs in
+    the background; poll status_url for progress. Returns the job status.
     """
-    mechanism_bank_path = Path(__file__).parent.parent.parent.parent / "mechanism-bank" / "mechanisms"
-
-    if not mechanism_bank_path.exists():
+    if not yaml_loader.mechanisms_dir.exists():
         raise HTTPException(status_code=404, detail="Mechanism bank directory not found")
 
-    loaded_count = 0
-    errors = []
-
-    # Walk through all YAML files
-    for yaml_file in mechanism_bank_path.rglob("*.yml"):
-        try:
-            with open(yaml_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-
-            # Check if mechanism already exists
-            existing = db.query(Mechanism).filter(Mechanism.id == data['id']).first()
-            if existing:
-                continue  # Skip existing mechanisms
-
-            # Create nodes if they don't exist
-            from_node = db.query(Node).filter(Node.id == data['from_node']['node_id']).first()
-            if not from_node:
-                category = data.get('category', 'unknown')
-                from_node_name = data['from_node']['node_name']
-                from_node = Node(
-                    id=data['from_node']['node_id'],
-                    name=from_node_name,
-                    node_type='stock',  # Default, can be updated later
-                    category=category,
-                    scale=get_node_scale_from_category(category, from_node_name)
-                )
-                db.add(from_node)
-                db.flush()  # Flush immediately to avoid duplicate key errors
-
-            to_node = db.query(Node).filter(Node.id == data['to_node']['node_id']).first()
-            if not to_node:
-                category = data.get('category', 'unknown')
-                to_node_name = data['to_node']['node_name']
-                to_node = Node(
-                    id=data['to_node']['node_id'],
-                    name=to_node_name,
-                    node_type='stock',  # Default
-                    category=category,
-                    scale=get_node_scale_from_category(category, to_node_name)
-                )
-                db.add(to_node)
-                db.flush()  # Flush immediately to avoid duplicate key errors
-
-            # Create mechanism
-            mechanism = Mechanism(
-                id=data['id'],
-                name=data['name'],
-                from_node_id=data['from_node']['node_id'],
-                to_node_id=data['to_node']['node_id'],
-                direction=data['direction'],
-                category=data['category'],
-                mechanism_pathway=data.get('mechanism_pathway', []),
-                evidence_quality=data['evidence']['quality_rating'],
-                evidence_n_studies=data['evidence']['n_studies'],
-                evidence_primary_citation=data['evidence']['primary_citation'],
-                evidence_supporting_citations=data['evidence'].get('supporting_citations'),
-                evidence_doi=data['evidence'].get('doi'),
-                varies_by_geography=data.get('spatial_variation', {}).get('varies_by_geography', False),
-                variation_notes=data.get('spatial_variation', {}).get('variation_notes'),
-                relevant_geographies=data.get('spatial_variation', {}).get('relevant_geographies'),
-                moderators=data.get('moderators'),
-                structural_competency_equity_implications=data.get('structural_competency', {}).get('equity_implications'),
-                description=data.get('description', ''),
-                version=data.get('version', '1.0'),
-                validated_by=data.get('validated_by'),
-                llm_extracted_by=data.get('llm_metadata', {}).get('extracted_by'),
-                llm_extraction_confidence=data.get('llm_metadata', {}).get('extraction_confidence'),
-                llm_prompt_version=data.get('llm_metadata', {}).get('prompt_version')
-            )
-
-            db.add(mechanism)
-            loaded_count += 1
-
-        except Exception as e:
-            errors.append({
-                "file": str(yaml_file),
-                "error": str(e)
-            })
-
-    # Commit all at once
-    try:
-        db.commit()
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"Database commit failed: {e}")
+    return _job_response(yaml_loader.start("mechanisms", force=force))
 
-    return {
-        "loaded": loaded_count,
-        "errors": errors,
-        "total_errors": len(errors)
-    }
+
+@router.get("/admin/load-jobs/{job_id}")
+def get_load_job(job_id: str):
+    """
+    Status and progress of a YAML load job.
+    """
+    job = yaml_loader.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Load job '{job_id}' not found")
+    return _job_response(job)
@@ -7,14 +7,24 @@ Provides endpoints for:
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Set, Tuple, Literal
 from pydantic import BaseModel, Field
 from enum import Enum
 import networkx as nx
-from collections import defaultdict, deque
+import numpy as np
+import math
+from collections import defaultdict
 
-from models import Mechanism, Node, get_db
+from api.config import settings
+from models import Mechanism, Node, SessionLocal, get_async_db, get_db
+from services.centrality_index import CentralityIndex
+from services.graph_csr import CSRGraph
+from services.graph_executor import graph_executor
+from services.graph_store import EVIDENCE_WEIGHTS, graph_store
+from services.path_search import ranked_simple_paths, strongest_evidence_path
 
 
 router = APIRouter(prefix="/api/nodes", tags=["nodes"])
@@ -48,6 +58,12 @@ class NodeImportance(BaseModel):
     totalConnections: int = Field(..., description="Total incoming + outgoing connections")
     avgEvidenceQuality: float = Field(..., description="Average evidence quality (0-3)")
 
+    # Approximation metadata (only set when approximate=true)
+    betweennessErrorBound: Optional[float] = Field(
+        None,
+        description="Estimated max absolute error of betweennessScore (95% bound) for sampled betweenness"
+    )
+
     class Config:
         from_attributes = True
 
@@ -105,6 +121,7 @@ class PathfindingResponse(BaseModel):
     algorithm: str
     pathsFound: int
     paths: List[PathResult]
+    truncated: bool = Field(False, description="Search budget ran out before all candidate paths were explored")
 
 
 class CrisisEndpoint(BaseModel):
@@ -265,6 +282,7 @@ class NodeListResponse(BaseModel):
     nodes: List[CanonicalNodeResponse]
     total: int
     referenced_count: int = Field(..., description="Nodes referenced by at least one mechanism")
+    next_after: Optional[str] = Field(None, description="Cursor for the next page (keyset pagination)")
 
 
 # ==========================================
@@ -272,48 +290,30 @@ class NodeListResponse(BaseModel):
 # ==========================================
 
 def build_graph(db: Session, exclude_categories: Optional[List[str]] = None,
-                only_categories: Optional[List[str]] = None) -> nx.DiGraph:
+                only_categories: Optional[List[str]] = None,
+                min_evidence: Optional[str] = None) -> nx.DiGraph:
     """
-    Build a NetworkX directed graph from database mechanisms.
+    Get a NetworkX directed graph of database mechanisms.
+
+    The graph is served from the process-wide graph store, which is built
+    once and rebuilt only after writes invalidate it. Filtered graphs are
+    read-only views; copy them before mutating.
 
     Args:
         db: Database session
         exclude_categories: Categories to exclude from graph
         only_categories: Only include these categories
+        min_evidence: Minimum evidence quality (A, B or C)
 
     Returns:
         NetworkX DiGraph with nodes and edges
     """
-    G = nx.DiGraph()
-
-    # Query all mechanisms
-    query = db.query(Mechanism)
-
-    # Apply category filters
-    if exclude_categories:
-        query = query.filter(~Mechanism.category.in_(exclude_categories))
-    if only_categories:
-        query = query.filter(Mechanism.category.in_(only_categories))
-
-    mechanisms = query.all()
-
-    # Add edges to graph
-    for m in mechanisms:
-        # Map evidence quality to numeric weight (A=3, B=2, C=1)
-        evidence_weight = {'A': 3, 'B': 2, 'C': 1}.get(m.evidence_quality, 1)
-
-        # Add edge with attributes
-        G.add_edge(
-            m.from_node_id,
-            m.to_node_id,
-            mechanism_id=m.id,
-            weight=evidence_weight,
-            direction=m.direction,
-            category=m.category,
-            evidence_quality=m.evidence_quality
-        )
-
-    return G
+    return graph_store.view(
+        db,
+        exclude_categories=exclude_categories,
+        only_categories=only_categories,
+        min_evidence=min_evidence
+    )
 
 
 def get_node_scale(node: Node) -> int:
@@ -432,73 +432,73 @@ def calculate_evidence_scores(db: Session, G: nx.DiGraph) -> dict:
     return evidence_scores
 
 
-def bfs_upstream(G: nx.DiGraph, start_node: str, max_hops: Optional[int]) -> set:
+def approximate_betweenness(G: nx.DiGraph, k: int, seed: int,
+                            confidence: float = 0.95) -> Tuple[Dict[str, float], float]:
     """
-    BFS traversal following edges backwards (predecessors).
+    Estimate betweenness centrality by sampling k source nodes.
+
+    Uses Brandes' algorithm from a fixed-seed random sample of sources
+    (Brandes & Pich, 2007), so results are reproducible for a given graph.
+    Each sampled source contributes a dependency in [0, 1] to a node's
+    normalized score, so by Hoeffding's inequality with a union bound over
+    all n nodes, every estimate is within
+
+        eps = sqrt(ln(2n / (1 - confidence)) / (2k))
+
+    of the exact normalized betweenness with the given confidence.
 
     Args:
-        G: NetworkX directed graph
-        start_node: Starting node ID
-        max_hops: Maximum hops to traverse (None = unlimited)
+        G: Graph to analyze
+        k: Number of source nodes to sample
+        seed: Random seed for source sampling
+        confidence: Confidence level for the error bound
 
     Returns:
-        Set of node IDs found upstream (excluding start_node)
+        Tuple of (betweenness scores, absolute error bound on raw scores)
     """
-    visited = set()
-    queue = deque([(start_node, 0)])  # (node_id, hop_count)
+    n = G.number_of_nodes()
+    if k >= n:
+        return nx.betweenness_centrality(G), 0.0
 
-    while queue:
-        node_id, hops = queue.popleft()
+    scores = nx.betweenness_centrality(G, k=k, seed=seed)
+    error_bound = math.sqrt(math.log(2 * n / (1 - confidence)) / (2 * k))
+    return scores, error_bound
 
-        if node_id in visited:
-            continue
-
-        visited.add(node_id)
 
-        # Stop if we've reached max hops
-        if max_hops is not None and hops >= max_hops:
-            continue
+def bfs_upstream(csr: CSRGraph, start_node: str, max_hops: Optional[int],
+                 edge_mask: Optional[np.ndarray] = None) -> set:
+    """
+    BFS traversal following edges backwards (predecessors).
 
-        # Add predecessors (nodes with edges TO current node)
-        for predecessor in G.predecessors(node_id):
-            if predecessor not in visited:
-                queue.append((predecessor, hops + 1))
+    Args:
+        csr: CSR graph to traverse
+        start_node: Starting node ID
+        max_hops: Maximum hops to traverse (None = unlimited)
+        edge_mask: Only follow edges where the mask is True
 
-    return visited - {start_node}  # Exclude start node
+    Returns:
+        Set of node IDs found upstream (excluding start_node)
+    """
+    dist = csr.multi_source_bfs([start_node], max_hops=max_hops, reverse=True, edge_mask=edge_mask)
+    return csr.nodes_within(dist) - {start_node}  # Exclude start node
 
 
-def bfs_downstream(G: nx.DiGraph, start_node: str, max_hops: Optional[int]) -> set:
+def bfs_downstream(csr: CSRGraph, start_node: str, max_hops: Optional[int],
+                   edge_mask: Optional[np.ndarray] = None) -> set:
     """
     BFS traversal following edges forward (successors).
 
     Args:
-        G: NetworkX directed graph
+        csr: CSR graph to traverse
         start_node: Starting node ID
         max_hops: Maximum hops to traverse (None = unlimited)
+        edge_mask: Only follow edges where the mask is True
 
     Returns:
         Set of node IDs found downstream (excluding start_node)
     """
-    visited = set()
-    queue = deque([(start_node, 0)])
-
-    while queue:
-        node_id, hops = queue.popleft()
-
-        if node_id in visited:
-            continue
-
-        visited.add(node_id)
-
-        if max_hops is not None and hops >= max_hops:
-            continue
-
-        # Add successors (nodes that current node points TO)
-        for successor in G.successors(node_id):
-            if successor not in visited:
-                queue.append((successor, hops + 1))
-
-    return visited - {start_node}
+    dist = csr.multi_source_bfs([start_node], max_hops=max_hops, reverse=False, edge_mask=edge_mask)
+    return csr.nodes_within(dist) - {start_node}
 
 
 def compute_crisis_subgraph(
@@ -511,11 +511,14 @@ def compute_crisis_subgraph(
     """
     Compute filtered subgraph showing upstream pathways to crisis endpoints.
 
+    Results are memoized per (crisis set, max_degrees, min_strength,
+    categories) for the current graph version, so toggling back to a previous
+    selection in the crisis explorer doesn't recompute anything.
+
     Algorithm:
-    1. FILTER: Remove all edges with strength < min_strength
-    2. TRAVERSE: BFS upstream from each crisis node up to max_degrees hops
-    3. PRUNE: Remove nodes whose paths don't ultimately lead to selected crises
-    4. ANNOTATE: Add 'degreeFromCrisis' metadata to each node
+    1. FILTER: Mask out all edges with strength < min_strength (or wrong category)
+    2. TRAVERSE: Multi-source BFS upstream from all crisis nodes, up to max_degrees hops
+    3. ANNOTATE: Add 'degreeFromCrisis' (nearest crisis) metadata to each node
 
     Args:
         db: Database session
@@ -525,25 +528,39 @@ def compute_crisis_subgraph(
         include_categories: Optional list of categories to include
 
     Returns:
-        Tuple of (nodes_list, edges_list, stats_dict)
+        Tuple of (nodes_list, edges_list, stats_dict) (shared; do not mutate)
     """
-    # Step 1: Filter edges by strength and build graph
-    query = db.query(Mechanism)
-
-    # Filter by evidence strength (A=3, B=2, C=1)
-    if min_strength == 3:
-        query = query.filter(Mechanism.evidence_quality == 'A')
-    elif min_strength == 2:
-        query = query.filter(Mechanism.evidence_quality.in_(['A', 'B']))
-    # min_strength == 1 includes all (A, B, C)
+    graph_store.sync(db)
+    key = (
+        'crisis_subgraph',
+        frozenset(crisis_node_ids),
+        max_degrees,
+        max(min_strength, 1),  # 1 includes all ratings
+        frozenset(include_categories) if include_categories else None,
+    )
+    return graph_store.memoize(key, lambda: _build_crisis_subgraph(
+        db, crisis_node_ids, max_degrees, min_strength, include_categories
+    ))
 
-    # Apply category filter if specified
-    if include_categories:
-        query = query.filter(Mechanism.category.in_(include_categories))
 
-    mechanisms = query.all()
+def _build_crisis_subgraph(
+    db: Session,
+    crisis_node_ids: List[str],
+    max_degrees: int,
+    min_strength: int,
+    include_categories: Optional[List[str]]
+) -> Tuple[List[Dict], List[Dict], Dict]:
+    """Uncached crisis subgraph computation (see compute_crisis_subgraph)."""
+    # Step 1: Filter edges by strength (A=3, B=2, C=1) and category
+    csr = graph_store.csr(db)
+    edge_mask = csr.edge_mask(
+        min_strength=min_strength if min_strength > 1 else None,  # 1 includes all ratings
+        categories=include_categories
+    )
+    if edge_mask is None:
+        edge_mask = np.ones(csr.num_edges, dtype=bool)
 
-    if not mechanisms:
+    if not edge_mask.any():
         return [], [], {
             'totalNodes': 0,
             'totalEdges': 0,
@@ -552,79 +569,24 @@ def compute_crisis_subgraph(
             'categoryBreakdown': {}
         }
 
-    # Step 2: Build reverse graph (child → parent direction for upstream traversal)
-    reverse_graph = defaultdict(list)  # Maps node_id -> list of parent node_ids
-    mechanism_map = {}  # Maps (from_id, to_id) -> mechanism
-
-    for m in mechanisms:
-        reverse_graph[m.to_node_id].append(m.from_node_id)
-        mechanism_map[(m.from_node_id, m.to_node_id)] = m
-
-    # Step 3: BFS upstream from each crisis node
-    relevant_nodes = set(crisis_node_ids)
-    node_degrees = {cid: 0 for cid in crisis_node_ids}
-
-    for crisis_id in crisis_node_ids:
-        if crisis_id not in reverse_graph and crisis_id not in [m.to_node_id for m in mechanisms]:
-            # Crisis node might not have incoming edges, but should still be included
-            relevant_nodes.add(crisis_id)
-            continue
-
-        queue = deque([(crisis_id, 0)])
-        visited = set()
-
-        while queue:
-            node_id, degree = queue.popleft()
-
-            if degree >= max_degrees or node_id in visited:
-                continue
-
-            visited.add(node_id)
-            relevant_nodes.add(node_id)
-
-            # Update degree (keep minimum degree across all paths)
-            if node_id not in node_degrees:
-                node_degrees[node_id] = degree
-            else:
-                node_degrees[node_id] = min(node_degrees[node_id], degree)
-
-            # Add parent nodes to queue
-            for parent_id in reverse_graph.get(node_id, []):
-                if parent_id not in visited:
-                    queue.append((parent_id, degree + 1))
-
-    # Step 4: Prune disconnected branches
-    # Build forward graph to verify connectivity
-    forward_graph = defaultdict(set)
-    for from_id, to_id in mechanism_map.keys():
-        if from_id in relevant_nodes and to_id in relevant_nodes:
-            forward_graph[from_id].add(to_id)
+    # Step 2: Multi-source upstream BFS from all crisis nodes at once.
+    # Distance to the nearest seed is the minimum degree across crises; nodes
+    # are kept up to max_degrees - 1 hops away. Every reached node is by
+    # construction an ancestor of a crisis node, so no separate pruning pass
+    # is needed.
+    dist = csr.multi_source_bfs(
+        crisis_node_ids, max_hops=max_degrees - 1, reverse=True, edge_mask=edge_mask
+    )
+    reached = dist >= 0
 
-    # Find all nodes that have at least one path to a crisis endpoint
-    connected_nodes = set(crisis_node_ids)
+    node_degrees = {csr.node_ids[i]: int(dist[i]) for i in np.flatnonzero(reached)}
+    # Crisis nodes without any qualifying edges are still included
     for crisis_id in crisis_node_ids:
-        # Find all ancestors using reverse graph
-        queue = deque([crisis_id])
-        ancestors = set([crisis_id])
-        visited_ancestors = set()
-
-        while queue:
-            node = queue.popleft()
-            if node in visited_ancestors:
-                continue
-            visited_ancestors.add(node)
-            ancestors.add(node)
-
-            for parent in reverse_graph.get(node, []):
-                if parent in relevant_nodes:
-                    ancestors.add(parent)
-                    queue.append(parent)
-
-        connected_nodes.update(ancestors)
+        node_degrees.setdefault(crisis_id, 0)
 
-    final_nodes = relevant_nodes.intersection(connected_nodes)
+    final_nodes = set(node_degrees)
 
-    # Step 5: Get node details from database
+    # Step 3: Get node details from database
     nodes_in_subgraph = db.query(Node).filter(Node.id.in_(final_nodes)).all()
     node_map = {n.id: n for n in nodes_in_subgraph}
 
@@ -658,21 +620,23 @@ def compute_crisis_subgraph(
             'description': node.description
         })
 
-    # Build edges list
-    edges_list = []
-    for (from_id, to_id), mechanism in mechanism_map.items():
-        if from_id in final_nodes and to_id in final_nodes:
-            strength_map = {'A': 3, 'B': 2, 'C': 1}
-            edges_list.append({
-                'mechanismId': mechanism.id,
-                'source': from_id,
-                'target': to_id,
-                'direction': mechanism.direction,
-                'evidenceQuality': mechanism.evidence_quality,
-                'strength': strength_map.get(mechanism.evidence_quality, 1),
-                'category': mechanism.category,
-                'name': mechanism.name
-            })
+    # Build edges list (qualifying edges between subgraph nodes). The CSR
+    # keeps one edge per mechanism; like the graph, report one per node pair
+    # (edge ids follow mechanism ID order, so the highest qualifying ID wins).
+    pair_edges = {}
+    for edge_id in csr.edges_within(reached, edge_mask):
+        data = csr.edge_attrs[edge_id]
+        pair_edges[(csr.edge_source[edge_id], csr.edge_target[edge_id])] = {
+            'mechanismId': data['mechanism_id'],
+            'source': csr.node_ids[csr.edge_source[edge_id]],
+            'target': csr.node_ids[csr.edge_target[edge_id]],
+            'direction': data['direction'],
+            'evidenceQuality': data['evidence_quality'],
+            'strength': int(csr.edge_strength[edge_id]) or 1,
+            'category': data['category'],
+            'name': data['name']
+        }
+    edges_list = list(pair_edges.values())
 
     # Calculate stats
     avg_degree = sum(node_degrees.values()) / len(node_degrees) if node_degrees else 0
@@ -702,7 +666,7 @@ def compute_focal_subgraph(
     Build subgraph around a focal node using BFS traversal.
 
     Algorithm:
-    1. Build filtered graph (category + evidence filters)
+    1. Build edge masks over the CSR graph (category + evidence filters)
     2. BFS upstream from focal node (limited by max_hops_upstream)
     3. BFS downstream from focal node (limited by max_hops_downstream)
     4. Combine results + filter by scale
@@ -722,25 +686,17 @@ def compute_focal_subgraph(
     Returns:
         FocalSubgraphResponse with nodes, edges, and statistics
     """
-    # Step 1: Build graph with category filters
-    G = build_graph(
-        db,
-        exclude_categories=None,
-        only_categories=include_categories
+    # Step 1: Build edge masks from category + evidence filters
+    csr = graph_store.csr(db)
+    category_mask = csr.edge_mask(categories=include_categories)
+    edge_mask = csr.edge_mask(
+        min_strength=EVIDENCE_WEIGHTS.get(min_evidence_quality) if min_evidence_quality else None,
+        categories=include_categories
     )
 
-    # Apply evidence filtering
-    if min_evidence_quality:
-        evidence_order = {'A': 3, 'B': 2, 'C': 1, None: 0}
-        min_strength = evidence_order[min_evidence_quality]
-        edges_to_remove = [
-            (u, v) for u, v, data in G.edges(data=True)
-            if evidence_order.get(data.get('evidence_quality')) < min_strength
-        ]
-        G.remove_edges_from(edges_to_remove)
-
-    # Verify focal node exists
-    if focal_node_id not in G:
+    # Verify focal node exists (has at least one mechanism in the selected categories)
+    focal_index = csr.index.get(focal_node_id)
+    if focal_index is None or not csr.incident_nodes(category_mask)[focal_index]:
         raise HTTPException(
             status_code=404,
             detail=f"Focal node '{focal_node_id}' not found in graph"
@@ -750,18 +706,20 @@ def compute_focal_subgraph(
     upstream_nodes = set()
     if traversal_direction in [TraversalDirection.UPSTREAM, TraversalDirection.BOTH]:
         upstream_nodes = bfs_upstream(
-            G,
+            csr,
             start_node=focal_node_id,
-            max_hops=max_hops_upstream
+            max_hops=max_hops_upstream,
+            edge_mask=edge_mask
         )
 
     # Step 3: BFS Downstream (following edges forward)
     downstream_nodes = set()
     if traversal_direction in [TraversalDirection.DOWNSTREAM, TraversalDirection.BOTH]:
         downstream_nodes = bfs_downstream(
-            G,
+            csr,
             start_node=focal_node_id,
-            max_hops=max_hops_downstream
+            max_hops=max_hops_downstream,
+            edge_mask=edge_mask
         )
 
     # Step 4: Combine results
@@ -847,19 +805,124 @@ def compute_focal_subgraph(
     )
 
 
+def compute_importance_rows(db: Session, G: nx.DiGraph,
+                            key: Optional[Tuple] = None) -> List[Dict]:
+    """
+    Compute importance rows for every node in a graph.
+
+    This is the expensive part of /importance (betweenness is O(V*E)); its
+    results are materialized by ``importance_index`` per (categories,
+    betweenness sample size) key.
+
+    Args:
+        db: Database session (for node details)
+        G: Graph to compute centrality over
+        key: Index key ``(categories, sample_size)``; a sample size selects
+            approximate betweenness with that many sampled sources
+
+    Returns:
+        List of row dicts sorted by composite score (descending)
+    """
+    if len(G.nodes()) == 0:
+        return []
+
+    sample_size = key[1] if key else None
+
+    # Calculate centrality measures
+    degree_centrality = nx.degree_centrality(G)
+    betweenness_error = None
+    if sample_size:
+        betweenness_centrality, raw_error = approximate_betweenness(
+            G, k=sample_size, seed=settings.betweenness_sample_seed
+        )
+        # Express the bound on the min-max normalized scale we return
+        spread = max(betweenness_centrality.values()) - min(betweenness_centrality.values())
+        betweenness_error = min(1.0, raw_error / spread) if spread > 0 else 0.0
+    else:
+        betweenness_centrality = nx.betweenness_centrality(G)
+    closeness_centrality = nx.closeness_centrality(G)
+    pagerank = nx.pagerank(G)
+
+    # Calculate evidence scores
+    evidence_scores = calculate_evidence_scores(db, G)
+
+    # Normalize all scores to 0-1 range
+    degree_norm = normalize_scores(degree_centrality)
+    betweenness_norm = normalize_scores(betweenness_centrality)
+    closeness_norm = normalize_scores(closeness_centrality)
+    pagerank_norm = normalize_scores(pagerank)
+
+    # Get node details from database
+    node_ids = list(G.nodes())
+    nodes = db.query(Node).filter(Node.id.in_(node_ids)).all()
+    node_map = {n.id: n for n in nodes}
+
+    rows = []
+    for node_id in G.nodes():
+        node = node_map.get(node_id)
+        if not node:
+            continue
+
+        scale = get_node_scale(node)
+
+        # Get normalized scores
+        degree = degree_norm.get(node_id, 0)
+        betweenness = betweenness_norm.get(node_id, 0)
+        closeness = closeness_norm.get(node_id, 0)
+        pr = pagerank_norm.get(node_id, 0)
+        evidence = evidence_scores.get(node_id, 0)
+
+        # Calculate composite score
+        composite = calculate_composite_score(
+            degree, betweenness, closeness, pr, evidence, scale
+        )
+
+        rows.append({
+            'nodeId': node_id,
+            'label': node.name,
+            'category': node.category,
+            'scale': scale,
+            'degreeScore': degree,
+            'betweennessScore': betweenness,
+            'closenessCentrality': closeness,
+            'pageRank': pr,
+            'evidenceScore': evidence,
+            'compositeScore': composite,
+            'totalConnections': G.in_degree(node_id) + G.out_degree(node_id),
+            # Average evidence quality (0-3 scale): map [0,1] back to [1,3]
+            'avgEvidenceQuality': evidence * 2 + 1,
+            'betweennessErrorBound': betweenness_error
+        })
+
+    # Sort by composite score (descending)
+    rows.sort(key=lambda x: x['compositeScore'], reverse=True)
+    return rows
+
+
+# Precomputed importance rows per (categories, sample size), refreshed on graph changes
+importance_index = CentralityIndex(
+    graph_store,
+    graph_for_key=lambda db, key: build_graph(db, only_categories=list(key[0]) if key[0] else None),
+    compute=compute_importance_rows,
+    session_factory=SessionLocal,
+    background_refresh=settings.centrality_background_refresh
+)
+
+
 # ==========================================
 # GET Endpoints
 # ==========================================
 
 @router.get("/", response_model=NodeListResponse)
-def list_nodes(
+async def list_nodes(
     referenced_only: bool = Query(True, description="Only return nodes referenced by mechanisms"),
     category: Optional[str] = Query(None, description="Filter by category"),
     scale: Optional[int] = Query(None, ge=1, le=7, description="Filter by scale (1-7)"),
     search: Optional[str] = Query(None, description="Search by name or ID (case-insensitive)"),
     limit: int = Query(1000, le=2000, description="Maximum results"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
-    db: Session = Depends(get_db)
+    after: Optional[str] = Query(None, description="Keyset cursor: return nodes with ID after this one"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     List canonical nodes from the node bank.
@@ -868,65 +931,71 @@ def list_nodes(
     description, and unit. By default returns only nodes referenced
     by at least one mechanism.
 
+    Nodes are ordered by ID. Filtering, mechanism counts and pagination run
+    in a single SQL query, so only the requested page is loaded.
+
     Query Parameters:
     - referenced_only: If true (default), only return nodes that appear in mechanisms
     - category: Filter by category (built_environment, economic, political, etc.)
     - scale: Filter by scale level (1-7)
     - search: Search by node name or ID (case-insensitive partial match)
+    - limit/offset: Offset pagination
+    - after: Keyset pagination (pass the previous page's next_after);
+      total then counts the nodes after the cursor
     """
-    from sqlalchemy import or_, func
-
-    query = db.query(Node)
+    from sqlalchemy import or_, func, union_all
+
+    # Mechanism count per referenced node ID (as source or target)
+    endpoints = union_all(
+        select(Mechanism.from_node_id.label('node_id')),
+        select(Mechanism.to_node_id.label('node_id'))
+    ).subquery()
+    mechanism_counts = (
+        select(endpoints.c.node_id, func.count().label('mechanism_count'))
+        .group_by(endpoints.c.node_id)
+        .subquery()
+    )
+    referenced_count = select(func.count()).select_from(mechanism_counts).scalar_subquery()
 
-    # Apply filters
+    filters = []
     if category:
-        query = query.filter(Node.category == category)
+        filters.append(Node.category == category)
     if scale:
-        query = query.filter(Node.scale == scale)
+        filters.append(Node.scale == scale)
     if search:
         search_pattern = f"%{search}%"
-        query = query.filter(
-            or_(
-                Node.id.ilike(search_pattern),
-                Node.name.ilike(search_pattern)
-            )
-        )
-
-    # Get all matching nodes
-    all_nodes = query.all()
-
-    # Get referenced node IDs (nodes that appear in at least one mechanism)
-    from_ids = db.query(Mechanism.from_node_id).distinct()
-    to_ids = db.query(Mechanism.to_node_id).distinct()
-    referenced_node_ids = {r[0] for r in from_ids.all()} | {r[0] for r in to_ids.all()}
-
-    # Count mechanisms per node for mechanism_count field
-    mechanism_counts = {}
-    from_counts = db.query(
-        Mechanism.from_node_id,
-        func.count(Mechanism.id)
-    ).group_by(Mechanism.from_node_id).all()
-    to_counts = db.query(
-        Mechanism.to_node_id,
-        func.count(Mechanism.id)
-    ).group_by(Mechanism.to_node_id).all()
-
-    for node_id, count in from_counts:
-        mechanism_counts[node_id] = mechanism_counts.get(node_id, 0) + count
-    for node_id, count in to_counts:
-        mechanism_counts[node_id] = mechanism_counts.get(node_id, 0) + count
-
-    # Filter to referenced nodes if requested
-    if referenced_only:
-        all_nodes = [n for n in all_nodes if n.id in referenced_node_ids]
-
-    # Apply pagination
-    total = len(all_nodes)
-    paginated_nodes = all_nodes[offset:offset + limit]
+        filters.append(or_(Node.id.ilike(search_pattern), Node.name.ilike(search_pattern)))
+
+    if after is not None:
+        filters.append(Node.id > after)
+
+    def matching(*columns):
+        return select(*columns).select_from(Node).join(
+            mechanism_counts,
+            mechanism_counts.c.node_id == Node.id,
+            isouter=not referenced_only
+        ).filter(*filters)
+
+    result = await db.execute(matching(
+        Node,
+        func.coalesce(mechanism_counts.c.mechanism_count, 0),
+        func.count().over(),  # Total matches before LIMIT/OFFSET
+        referenced_count
+    ).order_by(Node.id).offset(offset).limit(limit))
+    rows = result.all()
+
+    if rows:
+        total, referenced = rows[0][2], rows[0][3]
+    else:
+        # Empty page: the window/scalar columns have no row to ride on
+        total = await db.scalar(
+            select(func.count()).select_from(matching(Node.id).subquery())
+        ) if offset else 0
+        referenced = await db.scalar(select(referenced_count))
 
     # Build response
     nodes_response = []
-    for n in paginated_nodes:
+    for n, mechanism_count, _, _ in rows:
         # Use get_node_scale for consistent scale handling
         node_scale = get_node_scale(n)
 
@@ -938,22 +1007,25 @@ def list_nodes(
             node_type=n.node_type or "stock",
             unit=n.unit,
             description=n.description,
-            mechanism_count=mechanism_counts.get(n.id, 0)
+            mechanism_count=mechanism_count
         ))
 
     return NodeListResponse(
         nodes=nodes_response,
         total=total,
-        referenced_count=len(referenced_node_ids)
+        referenced_count=referenced,
+        next_after=rows[-1][0].id if len(rows) == limit else None
     )
 
 
 @router.get("/importance", response_model=List[NodeImportance])
-def get_node_importance(
+async def get_node_importance(
     top_n: int = Query(20, ge=1, le=100, description="Number of top nodes to return"),
     categories: Optional[str] = Query(None, description="Filter by categories (comma-separated)"),
     scales: Optional[str] = Query(None, description="Filter by scale levels (comma-separated: 1,2,3,4,5,6,7)"),
     min_connections: Optional[int] = Query(None, ge=0, description="Minimum connection threshold"),
+    approximate: bool = Query(False, description="Estimate betweenness from sampled source nodes"),
+    k: Optional[int] = Query(None, ge=1, le=10000, description="Number of sampled sources when approximate=true"),
     db: Session = Depends(get_db)
 ):
     """
@@ -969,106 +1041,46 @@ def get_node_importance(
     No scale multipliers are applied. Importance is purely data-driven based on
     network position and evidence quality, not taxonomy classification.
 
+    Centrality rows are precomputed per category filter and refreshed in the
+    background when the graph changes; scale and min_connections filters are
+    applied to the precomputed rows at query time.
+
+    For large graphs, approximate=true estimates betweenness from k sampled
+    source nodes (fixed seed, so results are reproducible) and reports the
+    estimated error in betweennessErrorBound.
+
     Returns nodes ranked by composite importance score.
     """
     # Parse filters
     category_filter = categories.split(',') if categories else None
     scale_filter = [int(s) for s in scales.split(',')] if scales else None
 
-    # Build graph
-    G = build_graph(db, only_categories=category_filter)
-
-    if len(G.nodes()) == 0:
-        return []
+    # Read precomputed rows for this filter (sorted by composite score)
+    categories_key = tuple(sorted(set(category_filter))) if category_filter else None
+    sample_size = (k or settings.betweenness_sample_size) if approximate else None
+    rows = await graph_executor.run(importance_index.get_rows, db, (categories_key, sample_size))
 
-    # Calculate centrality measures
-    degree_centrality = nx.degree_centrality(G)
-    betweenness_centrality = nx.betweenness_centrality(G)
-    closeness_centrality = nx.closeness_centrality(G)
-    pagerank = nx.pagerank(G)
-
-    # Calculate evidence scores
-    evidence_scores = calculate_evidence_scores(db, G)
-
-    # Normalize all scores to 0-1 range
-    degree_norm = normalize_scores(degree_centrality)
-    betweenness_norm = normalize_scores(betweenness_centrality)
-    closeness_norm = normalize_scores(closeness_centrality)
-    pagerank_norm = normalize_scores(pagerank)
-
-    # Get node details from database
-    node_ids = list(G.nodes())
-    nodes = db.query(Node).filter(Node.id.in_(node_ids)).all()
-    node_map = {n.id: n for n in nodes}
-
-    # Calculate composite scores for each node
+    # Apply query-time filters
     node_scores = []
-
-    for node_id in G.nodes():
-        node = node_map.get(node_id)
-        if not node:
-            continue
-
-        # Get scale for this node
-        scale = get_node_scale(node)
-
-        # Apply scale filter if specified
-        if scale_filter and scale not in scale_filter:
+    for row in rows:
+        if scale_filter and row['scale'] not in scale_filter:
             continue
-
-        # Calculate connections
-        in_degree = G.in_degree(node_id)
-        out_degree = G.out_degree(node_id)
-        total_connections = in_degree + out_degree
-
-        # Apply minimum connections filter
-        if min_connections and total_connections < min_connections:
+        if min_connections and row['totalConnections'] < min_connections:
             continue
-
-        # Get normalized scores
-        degree = degree_norm.get(node_id, 0)
-        betweenness = betweenness_norm.get(node_id, 0)
-        closeness = closeness_norm.get(node_id, 0)
-        pr = pagerank_norm.get(node_id, 0)
-        evidence = evidence_scores.get(node_id, 0)
-
-        # Calculate composite score
-        composite = calculate_composite_score(
-            degree, betweenness, closeness, pr, evidence, scale
-        )
-
-        # Calculate average evidence quality (0-3 scale)
-        avg_evidence_quality = evidence * 2 + 1  # Map [0,1] back to [1,3]
-
-        node_scores.append({
-            'nodeId': node_id,
-            'label': node.name,
-            'category': node.category,
-            'scale': scale,
-            'degreeScore': degree,
-            'betweennessScore': betweenness,
-            'closenessCentrality': closeness,
-            'pageRank': pr,
-            'evidenceScore': evidence,
-            'compositeScore': composite,
-            'totalConnections': total_connections,
-            'avgEvidenceQuality': avg_evidence_quality
-        })
-
-    # Sort by composite score (descending)
-    node_scores.sort(key=lambda x: x['compositeScore'], reverse=True)
-
-    # Assign ranks
-    for i, node in enumerate(node_scores[:top_n], start=1):
-        node['rank'] = i
-
-    # Return top N
-    return [NodeImportance(**node) for node in node_scores[:top_n]]
+        node_scores.append(row)
+        if len(node_scores) >= top_n:
+            break
+
+    # Assign ranks and return top N
+    return [
+        NodeImportance(**row, rank=i)
+        for i, row in enumerate(node_scores, start=1)
+    ]
 
 
 @router.get("/crisis-endpoints", response_model=List[CrisisEndpoint])
-def get_crisis_endpoints(
-    db: Session = Depends(get_db)
+async def get_crisis_endpoints(
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all crisis endpoint nodes (scale=7).
@@ -1080,7 +1092,7 @@ def get_crisis_endpoints(
     Returns all crisis endpoint nodes sorted alphabetically by label.
     """
     # Query all nodes
-    all_nodes = db.query(Node).all()
+    all_nodes = (await db.execute(select(Node))).scalars().all()
 
     # Filter to scale=7 nodes (crisis and biological categories)
     crisis_nodes = []
@@ -1106,7 +1118,7 @@ def get_crisis_endpoints(
 # ==========================================
 
 @router.post("/pathfinding", response_model=PathfindingResponse)
-def find_paths(
+async def find_paths(
     request: PathfindingRequest,
     db: Session = Depends(get_db)
 ):
@@ -1116,10 +1128,17 @@ def find_paths(
     Algorithms:
     - shortest: Minimize number of hops (unweighted shortest path)
     - strongest_evidence: Optimize for evidence quality (weighted shortest path)
-    - all_simple: Find multiple simple paths (no cycles)
+    - all_simple: Find multiple simple paths (no cycles), ranked by hop count
+      then evidence strength; bounded by max_paths and a per-request search
+      budget (truncated=true if the budget ran out)
 
     Returns list of paths with detailed node and mechanism information.
     """
+    return await graph_executor.run(_find_paths, request, db)
+
+
+def _find_paths(request: PathfindingRequest, db: Session) -> PathfindingResponse:
+    """Pathfinding computation (runs on the graph executor)."""
     # Build graph with filters
     G = build_graph(
         db,
@@ -1141,6 +1160,7 @@ def find_paths(
 
     # Find paths based on algorithm
     paths = []
+    truncated = False
 
     try:
         if request.algorithm == 'shortest':
@@ -1149,31 +1169,25 @@ def find_paths(
             paths = [path]
 
         elif request.algorithm == 'strongest_evidence':
-            # Weighted shortest path (maximize evidence quality)
-            # Use inverse weights: A=1/3, B=1/2, C=1
-            G_weighted = G.copy()
-            for u, v, data in G_weighted.edges(data=True):
-                weight = data.get('weight', 1)
-                # Invert weight so higher evidence = lower cost
-                G_weighted[u][v]['cost'] = 1.0 / weight
-
-            path = nx.shortest_path(
-                G_weighted,
-                request.from_node,
-                request.to_node,
-                weight='cost'
-            )
+            # Weighted shortest path (maximize evidence quality) over the
+            # precomputed edge cost: A=1/3, B=1/2, C=1
+            path = strongest_evidence_path(G, request.from_node, request.to_node)
             paths = [path]
 
         elif request.algorithm == 'all_simple':
-            # Find all simple paths up to max_depth
-            paths_generator = nx.all_simple_paths(
+            # Ranked simple paths up to max_depth (fewest hops, then strongest
+            # evidence), stopping at max_paths or when the search budget runs out
+            search = ranked_simple_paths(
                 G,
                 request.from_node,
                 request.to_node,
-                cutoff=request.max_depth
+                max_paths=request.max_paths,
+                max_depth=request.max_depth,
+                max_expansions=settings.pathfinding_max_expansions,
+                time_budget=settings.pathfinding_time_budget_ms / 1000
             )
-            paths = list(paths_generator)[:request.max_paths]
+            paths = search.paths
+            truncated = search.truncated
 
         else:
             raise HTTPException(
@@ -1299,12 +1313,13 @@ def find_paths(
         toNode=request.to_node,
         algorithm=request.algorithm,
         pathsFound=len(path_results),
-        paths=path_results
+        paths=path_results,
+        truncated=truncated
     )
 
 
 @router.post("/crisis-subgraph", response_model=CrisisSubgraphResponse)
-def get_crisis_subgraph(
+async def get_crisis_subgraph(
     request: CrisisSubgraphRequest,
     db: Session = Depends(get_db)
 ):
@@ -1324,6 +1339,11 @@ def get_crisis_subgraph(
     Returns a pruned subgraph containing only mechanistically-relevant nodes
     and edges, along with statistics and metadata.
     """
+    return await graph_executor.run(_crisis_subgraph, request, db)
+
+
+def _crisis_subgraph(request: CrisisSubgraphRequest, db: Session) -> CrisisSubgraphResponse:
+    """Crisis subgraph validation and computation (runs on the graph executor)."""
     # Validate crisis node IDs exist
     crisis_nodes = db.query(Node).filter(Node.id.in_(request.crisisNodeIds)).all()
     found_ids = {n.id for n in crisis_nodes}
@@ -1370,7 +1390,7 @@ def get_crisis_subgraph(
 
 
 @router.post("/focal-subgraph", response_model=FocalSubgraphResponse)
-def get_focal_subgraph(
+async def get_focal_subgraph(
     request: FocalSubgraphRequest,
     db: Session = Depends(get_db)
 ):
@@ -1394,7 +1414,8 @@ def get_focal_subgraph(
     - max_hops: Limit traversal depth in each direction
     """
     try:
-        return compute_focal_subgraph(
+        return await graph_executor.run(
+            compute_focal_subgraph,
             db=db,
             focal_node_id=request.focal_node_id,
             traversal_direction=request.traversal_direction,
@@ -1556,71 +1577,85 @@ def get_hierarchy_tree(
     max_depth: int = Query(3, ge=1, le=10, description="Maximum depth to traverse"),
     domains: Optional[str] = Query(None, description="Filter by domains (comma-separated)"),
     scales: Optional[str] = Query(None, description="Filter by scales (comma-separated: 1,2,3,4,5,6,7)"),
+    root: Optional[str] = Query(None, description="Return only the subtree under this node"),
+    expand: Optional[str] = Query(None, description="Node IDs (comma-separated) expanded beyond max_depth"),
     db: Session = Depends(get_db)
 ):
     """
     Get the full hierarchy tree structure.
 
     Returns a nested tree structure starting from root nodes (depth=0)
-    down to the specified max_depth.
+    down to the specified max_depth. The tree is read in one query for
+    the roots and one for everything below them, then assembled in memory.
 
     Query Parameters:
     - max_depth: Maximum depth to traverse (default 3)
     - domains: Filter by domains (comma-separated)
     - scales: Filter by scales (comma-separated)
+    - root: Subtree root (any node); replaces the domain roots
+    - expand: Nodes whose children are included past max_depth, so an
+      explorer can fetch exactly its open branches (e.g. root=x&max_depth=1&expand=a,b)
     """
+    from sqlalchemy import func
+    from utils.hierarchy import child_counts, get_subtree_rows
+
     domain_filter = domains.split(',') if domains else None
     scale_filter = [int(s) for s in scales.split(',')] if scales else None
+    expand_ids = set(expand.split(',')) if expand else set()
 
-    # Get root nodes (depth=0 AND is_grouping_node=True)
-    root_query = db.query(Node).filter(
-        Node.depth == 0,
-        Node.is_grouping_node == True
+    counts = child_counts(Node)
+    root_query = db.query(Node, func.coalesce(counts.c.child_count, 0)).outerjoin(
+        counts, counts.c.node_id == Node.id
     )
-
-    if domain_filter:
-        root_query = root_query.filter(Node.id.in_(domain_filter))
+    if root:
+        root_query = root_query.filter(Node.id == root)
+    else:
+        # Root nodes: depth=0 AND is_grouping_node=True
+        root_query = root_query.filter(Node.depth == 0, Node.is_grouping_node == True)
+        if domain_filter:
+            root_query = root_query.filter(Node.id.in_(domain_filter))
 
     roots = root_query.order_by(Node.display_order, Node.name).all()
+    if root and not roots:
+        raise HTTPException(status_code=404, detail=f"Node '{root}' not found")
+
+    # Group child rows by (parent, level) so DAG nodes repeat under each parent
+    child_rows: Dict[Tuple[str, int], List[Tuple[Node, int]]] = defaultdict(list)
+    for node, parent_id, level, child_count in get_subtree_rows(
+        db, [r.id for r, _ in roots], Node, max_depth, expand_ids
+    ):
+        child_rows[(parent_id, level)].append((node, child_count))
+
+    total_nodes = 0
+    actual_max_depth = 0
+
+    def build_tree_node(node: Node, child_count: int, current_depth: int) -> HierarchyTreeNode:
+        """Assemble a tree node from the preloaded rows"""
+        nonlocal total_nodes, actual_max_depth
+        total_nodes += 1
+        actual_max_depth = max(actual_max_depth, current_depth)
 
-    def build_tree_node(node: Node, current_depth: int) -> HierarchyTreeNode:
-        """Recursively build tree node structure"""
-        # Get children
         children = []
-        if current_depth < max_depth and hasattr(node, 'children') and node.children:
-            for child in sorted(node.children, key=lambda c: (c.display_order or 0, c.name)):
+        if current_depth < max_depth or node.id in expand_ids:
+            rows = child_rows.get((node.id, current_depth + 1), [])
+            for child, count in sorted(rows, key=lambda r: (r[0].display_order or 0, r[0].name)):
                 # Apply scale filter
                 if scale_filter and get_node_scale(child) not in scale_filter:
                     continue
-                children.append(build_tree_node(child, current_depth + 1))
+                children.append(build_tree_node(child, count, current_depth + 1))
 
         return HierarchyTreeNode(
             id=node.id,
             name=node.name,
             scale=get_node_scale(node),
             depth=node.depth or 0,
-            domains=node.domains if hasattr(node, 'domains') else [],
+            domains=node.domains,
             isGroupingNode=node.is_grouping_node or False,
-            childCount=len(node.children) if hasattr(node, 'children') and node.children else 0,
+            childCount=child_count,
             children=children if children else None
         )
 
-    tree_roots = [build_tree_node(root, 0) for root in roots]
-
-    # Calculate total nodes and max depth
-    total_nodes = 0
-    actual_max_depth = 0
-
-    def count_nodes(tree_node: HierarchyTreeNode, depth: int):
-        nonlocal total_nodes, actual_max_depth
-        total_nodes += 1
-        actual_max_depth = max(actual_max_depth, depth)
-        if tree_node.children:
-            for child in tree_node.children:
-                count_nodes(child, depth + 1)
-
-    for root in tree_roots:
-        count_nodes(root, 0)
+    tree_roots = [build_tree_node(node, count, 0) for node, count in roots]
 
     return HierarchyTreeResponse(
         roots=tree_roots,
@@ -1640,16 +1675,19 @@ def get_node_ancestors(
     Returns all parent nodes in the hierarchy, including multiple
     paths for DAG structures where a node has multiple parents.
     """
+    from utils.hierarchy import get_ancestor_depths
+
     node = db.query(Node).filter(Node.id == node_id).first()
 
     if not node:
         raise HTTPException(status_code=404, detail=f"Node '{node_id}' not found")
 
-    # Get ancestors from all_ancestors field or compute from parents
-    ancestor_ids = node.all_ancestors or []
+    # Walk the junction table in one query, nearest ancestors first
+    ancestor_depths = get_ancestor_depths(db, node_id, Node)
 
-    if ancestor_ids:
-        ancestors = db.query(Node).filter(Node.id.in_(ancestor_ids)).all()
+    if ancestor_depths:
+        ancestors = db.query(Node).filter(Node.id.in_(ancestor_depths)).all()
+        ancestors.sort(key=lambda a: (ancestor_depths[a.id], a.id))
     else:
         ancestors = []
 
@@ -1681,32 +1719,27 @@ def get_node_descendants(
 
     Returns all child nodes recursively up to max_depth.
     """
-    from utils.hierarchy import get_all_descendants
+    from utils.hierarchy import get_descendant_depths
 
     node = db.query(Node).filter(Node.id == node_id).first()
 
     if not node:
         raise HTTPException(status_code=404, detail=f"Node '{node_id}' not found")
 
-    # Get all descendants recursively
-    descendant_ids = get_all_descendants(db, node_id, Node)
+    # All descendants within max_depth levels, in one query
+    descendant_depths = get_descendant_depths(db, node_id, Node, max_depth=max_depth)
 
-    if descendant_ids:
-        descendants = db.query(Node).filter(Node.id.in_(descendant_ids)).all()
+    if descendant_depths:
+        descendants = db.query(Node).filter(Node.id.in_(descendant_depths)).all()
+        descendants.sort(key=lambda d: (descendant_depths[d.id], d.id))
     else:
         descendants = []
 
-    # Calculate max depth among descendants
-    max_found_depth = 0
-    for d in descendants:
-        if d.depth and d.depth > max_found_depth:
-            max_found_depth = d.depth
-
     return NodeDescendantsResponse(
         nodeId=node_id,
         descendants=[node_to_hierarchy_response(d) for d in descendants],
         totalCount=len(descendants),
-        maxDepth=max_found_depth - (node.depth or 0)
+        maxDepth=max(descendant_depths.values(), default=0)
     )
 
 
@@ -1791,12 +1824,16 @@ def add_hierarchy_relationship(
         node_model=Node,
         node_hierarchy_table=node_hierarchy,
         relationship_type=request.relationshipType,
-        order_index=request.orderIndex
+        order_index=request.orderIndex,
+        commit=False
     )
 
     if not success:
         raise HTTPException(status_code=400, detail=message)
 
+    graph_store.record_write(db)
+    db.commit()
+
     return HierarchyRelationshipResponse(
         success=success,
         message=message,
@@ -1825,12 +1862,16 @@ def remove_hierarchy_relationship(
         parent_id=parent_id,
         child_id=child_id,
         node_model=Node,
-        node_hierarchy_table=node_hierarchy
+        node_hierarchy_table=node_hierarchy,
+        commit=False
     )
 
     if not success:
         raise HTTPException(status_code=400, detail=message)
 
+    graph_store.record_write(db)
+    db.commit()
+
     return HierarchyRelationshipResponse(
         success=success,
         message=message,
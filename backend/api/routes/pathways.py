@@ -3,17 +3,23 @@ API routes for browsing curated pathways.
 
 Pathways are sequences of mechanisms that form notable causal chains,
 such as "Poverty → Health Outcomes" or "Housing Policy → Disease Burden".
+
+Pathways are precomputed from the mechanism graph and stored in the
+``pathways`` table (see services/pathway_catalogue.py), so list, detail and
+search are indexed lookups. The table is rebuilt when the graph changes.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List, Optional, Dict, Set, Tuple
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 from pydantic import BaseModel, Field
-from collections import defaultdict
-import json
 
-from models import Mechanism, Node, get_db
+from api.config import settings
+from models import Mechanism, Node, Pathway, SessionLocal, get_async_db
+from services.graph_executor import graph_executor
+from services.graph_store import graph_store
+from services.pathway_catalogue import PathwayCatalogue
 
 
 router = APIRouter(prefix="/api/pathways", tags=["pathways"])
@@ -97,161 +103,55 @@ def get_evidence_grade(avg_score: float) -> str:
         return 'C'
 
 
-def build_pathway_graph(mechanisms: List[Mechanism]) -> Dict[str, List[Tuple[str, Mechanism]]]:
-    """Build adjacency list from mechanisms"""
-    graph = defaultdict(list)
-    for mech in mechanisms:
-        graph[mech.from_node_id].append((mech.to_node_id, mech))
-    return graph
-
+def to_summary(pathway: Pathway) -> PathwaySummary:
+    """Convert a stored pathway row to its list view"""
+    return PathwaySummary(
+        pathwayId=pathway.id,
+        title=pathway.title,
+        description=pathway.description,
+        fromNodeLabel=pathway.from_node_label,
+        toNodeLabel=pathway.to_node_label,
+        category=pathway.category,
+        pathLength=pathway.path_length,
+        avgEvidenceQuality=pathway.avg_evidence_quality,
+        overallDirection=pathway.overall_direction,
+        tags=pathway.tags or []
+    )
 
-def find_paths(
-    graph: Dict[str, List[Tuple[str, Mechanism]]],
-    start: str,
-    end: str,
-    max_length: int = 4,
-    current_path: Optional[List[Mechanism]] = None,
-    visited: Optional[Set[str]] = None
-) -> List[List[Mechanism]]:
-    """Find all paths between two nodes (DFS with cycle detection)"""
-    if current_path is None:
-        current_path = []
-    if visited is None:
-        visited = set()
 
-    # Avoid cycles
-    if start in visited:
-        return []
+# Shared pathway catalogue (rebuilt in the background when the graph changes)
+pathway_catalogue = PathwayCatalogue(
+    graph_store,
+    session_factory=SessionLocal,
+    background_refresh=settings.pathway_catalogue_background_refresh,
+    max_paths_per_pair=settings.pathway_catalogue_max_paths_per_pair
+)
 
-    # Path too long
-    if len(current_path) >= max_length:
-        return []
 
-    # Found target
-    if start == end and current_path:
-        return [current_path.copy()]
+def _rebuild_catalogue() -> None:
+    """Bring the pathway table up to date (runs on the graph executor)."""
+    db = SessionLocal()
+    try:
+        pathway_catalogue.ensure_current(db)
+    finally:
+        db.close()
 
-    visited.add(start)
-    all_paths = []
 
-    for next_node, mechanism in graph.get(start, []):
-        current_path.append(mechanism)
-        paths = find_paths(graph, next_node, end, max_length, current_path, visited.copy())
-        all_paths.extend(paths)
-        current_path.pop()
+async def ensure_catalogue_current() -> None:
+    """Rebuild the pathway table off the event loop if the graph changed."""
+    if not pathway_catalogue.is_current or graph_store.sync_due:
+        await graph_executor.run(_rebuild_catalogue)
 
-    return all_paths
 
+def _search_pathway_ids(query: str, limit: int) -> List[str]:
+    """Ranked pathway IDs from the search index (runs on the graph executor)."""
+    from api.routes.search import search_index
 
-def generate_curated_pathways(db: Session) -> List[PathwaySummary]:
-    """
-    Generate curated pathways from mechanism bank.
-
-    For MVP: Dynamically discover interesting pathways.
-    For production: Pre-compute and store in database.
-    """
-    # Fetch all mechanisms
-    mechanisms = db.query(Mechanism).all()
-
-    # Fetch all nodes for labels
-    nodes = db.query(Node).all()
-    node_map = {node.node_id: node for node in nodes}
-
-    # Build pathway graph
-    graph = build_pathway_graph(mechanisms)
-
-    # Define key intervention nodes (starting points)
-    intervention_nodes = [
-        "housing_policy",
-        "minimum_wage",
-        "healthcare_access",
-        "education_funding",
-        "social_safety_net",
-        "neighborhood_investment"
-    ]
-
-    # Define key outcome nodes (endpoints)
-    outcome_nodes = [
-        "health_outcomes",
-        "mortality",
-        "disease_burden",
-        "life_expectancy",
-        "health_equity",
-        "ald_mortality"
-    ]
-
-    # Find pathways between interventions and outcomes
-    pathways = []
-    pathway_id = 1
-
-    for start_node in intervention_nodes:
-        if start_node not in node_map:
-            continue
-
-        for end_node in outcome_nodes:
-            if end_node not in node_map:
-                continue
-
-            # Find all paths (max 4 steps)
-            paths = find_paths(graph, start_node, end_node, max_length=4)
-
-            # Convert each path to PathwaySummary
-            for path in paths:
-                if not path:
-                    continue
-
-                # Calculate metrics
-                evidence_scores = [calculate_evidence_score(m.evidence_quality or 'C') for m in path]
-                avg_evidence = sum(evidence_scores) / len(evidence_scores) if evidence_scores else 0.0
-
-                # Determine overall direction
-                positive_count = sum(1 for m in path if m.direction == 'positive')
-                negative_count = sum(1 for m in path if m.direction == 'negative')
-                if positive_count > negative_count:
-                    overall_direction = 'positive'
-                elif negative_count > positive_count:
-                    overall_direction = 'negative'
-                else:
-                    overall_direction = 'mixed'
-
-                # Get primary category (most common)
-                categories = [m.category for m in path if m.category]
-                primary_category = max(set(categories), key=categories.count) if categories else 'unknown'
-
-                # Generate tags
-                tags = []
-                for m in path:
-                    if m.tags:
-                        try:
-                            if isinstance(m.tags, str):
-                                mechanism_tags = json.loads(m.tags)
-                            else:
-                                mechanism_tags = m.tags
-                            tags.extend(mechanism_tags)
-                        except:
-                            pass
-                tags = list(set(tags))[:5]  # Unique, max 5
-
-                # Create summary
-                start_label = node_map[start_node].label
-                end_label = node_map[end_node].label
-
-                pathway = PathwaySummary(
-                    pathwayId=f"pathway_{pathway_id}",
-                    title=f"{start_label} to {end_label}",
-                    description=f"Causal pathway from {start_label} to {end_label} through {len(path)} mechanisms",
-                    fromNodeLabel=start_label,
-                    toNodeLabel=end_label,
-                    category=primary_category,
-                    pathLength=len(path),
-                    avgEvidenceQuality=avg_evidence,
-                    overallDirection=overall_direction,
-                    tags=tags
-                )
-                pathways.append(pathway)
-                pathway_id += 1
-
-    return pathways
+    db = SessionLocal()
+    try:
+        return [hit.id for hit in search_index.search(db, query, kinds=["pathway"], limit=limit).hits]
+    finally:
+        db.close()
 
 
 # ==========================================
@@ -259,139 +159,101 @@ def generate_curated_pathways(db: Session) -> List[PathwaySummary]:
 # ==========================================
 
 @router.get("/", response_model=List[PathwaySummary])
-def list_pathways(
+async def list_pathways(
     category: Optional[str] = Query(None),
     tag: Optional[str] = Query(None),
     min_evidence: Optional[str] = Query(None, regex="^[ABC]$"),
     limit: int = Query(50, le=100),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     List curated pathways with optional filtering.
 
-    For MVP: Returns common pathways discovered from mechanism bank.
-    For production: Store pre-curated pathways in database.
+    Returns pathways sorted by average evidence quality (descending).
     """
+    await ensure_catalogue_current()
 
-    # Generate pathways dynamically
-    pathways = generate_curated_pathways(db)
-
-    # Apply filters
-    filtered = pathways
+    query = select(Pathway)
 
     if category:
-        filtered = [p for p in filtered if p.category == category]
+        query = query.filter(Pathway.category == category)
+
+    if min_evidence:
+        query = query.filter(Pathway.avg_evidence_quality >= calculate_evidence_score(min_evidence))
+
+    query = query.order_by(Pathway.avg_evidence_quality.desc(), Pathway.id)
 
     if tag:
-        filtered = [p for p in filtered if tag in p.tags]
+        # Tags are a small JSON list; match exactly after the indexed filters
+        pathways = [p for p in (await db.scalars(query)).all() if tag in (p.tags or [])][:limit]
+    else:
+        pathways = (await db.scalars(query.limit(limit))).all()
 
-    if min_evidence:
-        min_score = calculate_evidence_score(min_evidence)
-        filtered = [p for p in filtered if p.avgEvidenceQuality >= min_score]
+    return [to_summary(p) for p in pathways]
 
-    # Sort by evidence quality (descending)
-    filtered.sort(key=lambda p: p.avgEvidenceQuality, reverse=True)
 
-    # Apply limit
-    return filtered[:limit]
+@router.get("/search", response_model=List[PathwaySummary])
+async def search_pathways(
+    query: str = Query(..., min_length=2),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Search pathways by keyword in title, description or tags (ranked, prefix match)."""
+    ids = await graph_executor.run(_search_pathway_ids, query, 50)
+    pathways = {p.id: p for p in (await db.scalars(select(Pathway).filter(Pathway.id.in_(ids)))).all()}
+
+    return [to_summary(pathways[i]) for i in ids if i in pathways]
 
 
 @router.get("/{pathway_id}", response_model=PathwayDetail)
-def get_pathway(
+async def get_pathway(
     pathway_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get detailed information for a specific pathway."""
-
-    # For MVP: Reconstruct pathway from ID
-    # Format: pathway_123
-    try:
-        pathway_index = int(pathway_id.split('_')[1]) - 1
-    except (IndexError, ValueError):
+    if not pathway_id.startswith("pathway_"):
         raise HTTPException(status_code=400, detail="Invalid pathway ID format")
 
-    # Generate all pathways and find the one matching the ID
-    all_pathways = generate_curated_pathways(db)
+    await ensure_catalogue_current()
 
-    if pathway_index < 0 or pathway_index >= len(all_pathways):
+    pathway = await db.scalar(select(Pathway).filter(Pathway.id == pathway_id))
+    if pathway is None:
         raise HTTPException(status_code=404, detail="Pathway not found")
 
-    summary = all_pathways[pathway_index]
-
-    # Fetch mechanisms for this pathway
-    # We need to reconstruct the path again (this is inefficient, but works for MVP)
-    mechanisms = db.query(Mechanism).all()
-    nodes = db.query(Node).all()
-    node_map = {node.node_id: node for node in nodes}
-
-    graph = build_pathway_graph(mechanisms)
-
-    # Find the start and end nodes from labels
-    start_node_id = None
-    end_node_id = None
-    for node_id, node in node_map.items():
-        if node.label == summary.fromNodeLabel:
-            start_node_id = node_id
-        if node.label == summary.toNodeLabel:
-            end_node_id = node_id
-
-    if not start_node_id or not end_node_id:
-        raise HTTPException(status_code=404, detail="Pathway nodes not found")
-
-    # Find paths and get the one at the correct index
-    paths = find_paths(graph, start_node_id, end_node_id, max_length=4)
+    # Fetch the pathway's mechanisms and node labels in two queries
+    mechanisms = {
+        m.id: m for m in (await db.scalars(
+            select(Mechanism).filter(Mechanism.id.in_(pathway.mechanism_ids))
+        )).all()
+    }
+    node_ids = {m.from_node_id for m in mechanisms.values()} | {m.to_node_id for m in mechanisms.values()}
+    labels = dict((await db.execute(select(Node.id, Node.name).filter(Node.id.in_(node_ids)))).all())
 
-    # Calculate which path matches (skip to correct index)
-    # This is a simplification - in production, store pathway definitions
     pathway_mechanisms = []
-    if pathway_index < len(paths):
-        for mech in paths[pathway_index]:
-            pathway_mechanisms.append(PathwayMechanism(
-                mechanismId=mech.mechanism_id,
-                name=mech.name or f"{mech.from_node_id} → {mech.to_node_id}",
-                fromNode=node_map[mech.from_node_id].label,
-                toNode=node_map[mech.to_node_id].label,
-                direction=mech.direction or 'unknown',
-                evidenceQuality=mech.evidence_quality or 'C'
-            ))
-
-    # Build detail object
-    detail = PathwayDetail(
-        pathwayId=summary.pathwayId,
-        title=summary.title,
-        description=summary.description,
-        fromNodeId=start_node_id,
-        toNodeId=end_node_id,
+    for mechanism_id in pathway.mechanism_ids:
+        mech = mechanisms.get(mechanism_id)
+        if mech is None:
+            continue  # Deleted since the catalogue was built
+        pathway_mechanisms.append(PathwayMechanism(
+            mechanismId=mech.id,
+            name=mech.name or f"{mech.from_node_id} → {mech.to_node_id}",
+            fromNode=labels.get(mech.from_node_id, mech.from_node_id),
+            toNode=labels.get(mech.to_node_id, mech.to_node_id),
+            direction=mech.direction or 'unknown',
+            evidenceQuality=mech.evidence_quality or 'C'
+        ))
+
+    return PathwayDetail(
+        pathwayId=pathway.id,
+        title=pathway.title,
+        description=pathway.description,
+        fromNodeId=pathway.from_node_id,
+        toNodeId=pathway.to_node_id,
         mechanisms=pathway_mechanisms,
-        pathLength=summary.pathLength,
-        avgEvidenceQuality=summary.avgEvidenceQuality,
-        evidenceGrade=get_evidence_grade(summary.avgEvidenceQuality),
-        overallDirection=summary.overallDirection,
-        tags=summary.tags,
+        pathLength=pathway.path_length,
+        avgEvidenceQuality=pathway.avg_evidence_quality,
+        evidenceGrade=get_evidence_grade(pathway.avg_evidence_quality),
+        overallDirection=pathway.overall_direction,
+        tags=pathway.tags or [],
         curatedBy="System",
-        dateCreated="2025-01-15"
+        dateCreated=pathway.created_at.date().isoformat() if pathway.created_at else None
     )
-
-    return detail
-
-
-@router.get("/search", response_model=List[PathwaySummary])
-def search_pathways(
-    query: str = Query(..., min_length=2),
-    db: Session = Depends(get_db)
-):
-    """Search pathways by keyword in title or description."""
-
-    # Generate pathways
-    pathways = generate_curated_pathways(db)
-
-    # Filter by search query
-    query_lower = query.lower()
-    results = [
-        p for p in pathways
-        if query_lower in p.title.lower() or
-           query_lower in p.description.lower() or
-           any(query_lower in tag.lower() for tag in p.tags)
-    ]
-
-    return results[:50]
@@ -0,0 +1,86 @@
+"""
+API routes for full-text search across nodes, mechanisms and pathways.
+
+Backs the frontend typeahead: every query token is matched as a prefix and
+results are ranked (title matches first) and paginated.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from pydantic import BaseModel
+
+from api.config import settings
+from api.routes.pathways import pathway_catalogue
+from models import SessionLocal, get_db
+from services.graph_store import graph_store
+from services.search_index import DOCUMENT_KINDS, SearchIndex
+
+
+router = APIRouter(prefix="/api/search", tags=["search"])
+
+
+# ==========================================
+# Schemas
+# ==========================================
+
+class SearchResult(BaseModel):
+    """Single ranked search hit"""
+    type: str  # node, mechanism, pathway
+    id: str
+    title: str
+    score: float
+
+
+class SearchResponse(BaseModel):
+    """Paginated search results"""
+    query: str
+    total: int
+    limit: int
+    offset: int
+    results: List[SearchResult]
+
+
+# Shared search index (pathways are refreshed before each rebuild)
+search_index = SearchIndex(
+    graph_store,
+    before_build=pathway_catalogue.ensure_current,
+    session_factory=SessionLocal,
+    background_refresh=settings.search_index_background_refresh,
+    backend=settings.search_index_backend
+)
+
+
+# ==========================================
+# Endpoints
+# ==========================================
+
+@router.get("/", response_model=SearchResponse)
+def search(
+    q: str = Query(..., min_length=1, description="Search text (each word matched as a prefix)"),
+    types: Optional[List[str]] = Query(None, description="Restrict to node, mechanism and/or pathway"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db)
+):
+    """
+    Ranked full-text search over node names/descriptions, mechanism
+    names/descriptions/pathway steps and pathway titles/tags.
+    """
+    if types:
+        invalid = [t for t in types if t not in DOCUMENT_KINDS]
+        if invalid:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid types {invalid}; expected any of {list(DOCUMENT_KINDS)}"
+            )
+
+    page = search_index.search(db, q, kinds=types, limit=limit, offset=offset)
+
+    return SearchResponse(
+        query=q,
+        total=page.total,
+        limit=limit,
+        offset=offset,
+        results=[SearchResult(type=h.kind, id=h.id, title=h.title, score=h.score) for h in page.hits]
+    )
@@ -6,6 +6,8 @@ import os
 from anthropic import Anthropic
 from typing import Optional
 
+from utils.llm_cache import cached_client
+
 
 class LLMClient:
     """Wrapper for Anthropic Claude API."""
@@ -20,7 +22,7 @@ class LLMClient:
         self.model = model
         self.max_tokens = max_tokens
         self.temperature = temperature
-        self.client = Anthropic(api_key=api_key or os.environ.get("ANTHROPIC_API_KEY"))
+        self.client = cached_client(Anthropic(api_key=api_key or os.environ.get("ANTHROPIC_API_KEY")))
 
     def call(self, prompt: str) -> str:
         """
@@ -2,15 +2,22 @@
 Database models for HealthSystems Platform.
 """
 
-from models.database import Base, engine, SessionLocal, get_db
-from models.mechanism import Mechanism, Node, GeographicContext
+from models.database import Base, engine, SessionLocal, get_db, get_async_db
+from models.mechanism import (
+    Mechanism, Node, GeographicContext, Pathway, YamlLoadRecord, YamlLoadJobRecord, GraphVersion
+)
 
 __all__ = [
     "Base",
     "engine",
     "SessionLocal",
     "get_db",
+    "get_async_db",
     "Mechanism",
     "Node",
     "GeographicContext",
+    "Pathway",
+    "YamlLoadRecord",
+    "YamlLoadJobRecord",
+    "GraphVersion",
 ]
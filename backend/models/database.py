@@ -5,6 +5,7 @@ Database connection and session management.
 from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
+from sqlalchemy.pool import NullPool
 import logging
 
 from api.config import settings
@@ -25,8 +26,20 @@ if is_sqlite:
     )
     # For SQLite, we use sync sessions
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
-    AsyncSessionLocal = None  # Not used for SQLite
     engine = sync_engine  # Alembic needs this
+
+    # Async engine for async read routes (aiosqlite). SQLite connections are
+    # cheap, and NullPool avoids reusing a connection across event loops.
+    async_engine = create_async_engine(
+        database_url.replace("sqlite://", "sqlite+aiosqlite://", 1),
+        echo=settings.debug,
+        poolclass=NullPool,
+    )
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
 else:
     # PostgreSQL - create both sync and async engines
     # Sync engine for Alembic migrations
@@ -74,6 +87,7 @@ async def close_db():
     """Close database connections."""
     if is_sqlite:
         engine.dispose()
+        await async_engine.dispose()
         logger.info("Database connections closed (SQLite)")
     else:
         await async_engine.dispose()
@@ -96,13 +110,12 @@ def get_db():
 
 async def get_async_db():
     """
-    Async dependency for getting database sessions (PostgreSQL with asyncpg).
+    Async dependency for getting database sessions (asyncpg for PostgreSQL,
+    aiosqlite for SQLite).
 
     Yields:
         AsyncSession: Async database session
     """
-    if AsyncSessionLocal is None:
-        raise RuntimeError("Async session not available - using SQLite?")
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -10,7 +10,7 @@ Hierarchy Support:
 - Mechanisms reference nodes that must exist in the node bank
 """
 
-from sqlalchemy import Column, String, Integer, DateTime, JSON, Text, Boolean, ForeignKey, Float, CheckConstraint, Table, UniqueConstraint, Index
+from sqlalchemy import Column, String, Integer, DateTime, JSON, Text, Boolean, ForeignKey, Float, CheckConstraint, Table, UniqueConstraint, Index, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime
@@ -372,3 +372,159 @@ class GeographicContext(Base):
             },
             "data_year": self.data_year
         }
+
+
+class Pathway(Base):
+    """
+    Precomputed causal pathway (intervention -> outcome mechanism chain).
+
+    Rows are generated from the mechanism graph by the pathway catalogue
+    (services/pathway_catalogue.py) and replaced wholesale whenever the graph
+    changes. The ID is derived from the ordered mechanism IDs, so a pathway
+    keeps the same ID across rebuilds as long as its mechanisms exist.
+    """
+
+    __tablename__ = "pathways"
+
+    id = Column(String, primary_key=True, index=True)  # pathway_<hash of mechanism IDs>
+    title = Column(String, nullable=False)
+    description = Column(Text, nullable=False)
+
+    # Endpoints (labels denormalized for list views)
+    from_node_id = Column(String, nullable=False, index=True)
+    to_node_id = Column(String, nullable=False, index=True)
+    from_node_label = Column(String, nullable=False)
+    to_node_label = Column(String, nullable=False)
+
+    # Ordered mechanism IDs along the path
+    mechanism_ids = Column(JSON, nullable=False)
+
+    # Summary metrics
+    category = Column(String, nullable=False, index=True)  # Most common mechanism category
+    path_length = Column(Integer, nullable=False)
+    avg_evidence_quality = Column(Float, nullable=False, index=True)  # A=3, B=2, C=1
+    overall_direction = Column(String, nullable=False)  # positive, negative, mixed
+    tags = Column(JSON)  # List of strings
+
+    # Shared graph version (graph_versions.mechanisms) the row was computed from
+    graph_version = Column(Integer)
+    created_at = Column(DateTime, server_default=func.now())
+
+    def __repr__(self):
+        return f"<Pathway {self.id}: {self.from_node_id} -> {self.to_node_id} ({self.path_length} steps)>"
+
+
+class YamlLoadRecord(Base):
+    """
+    Content hash of a YAML file as last loaded by the admin loaders.
+
+    Lets /admin/load-from-yaml and /admin/load-nodes-from-yaml skip files
+    that haven't changed since the previous load (services/yaml_loader.py).
+    """
+
+    __tablename__ = "yaml_load_records"
+
+    kind = Column(String, primary_key=True)  # nodes, mechanisms
+    path = Column(String, primary_key=True)  # Relative to the kind's source directory
+    content_hash = Column(String, nullable=False)  # sha256 of the file bytes
+    record_id = Column(String)  # Node/mechanism ID the file produced
+    loaded_at = Column(DateTime, server_default=func.now())
+
+    def __repr__(self):
+        return f"<YamlLoadRecord {self.kind}:{self.path}>"
+
+
+class YamlLoadJobRecord(Base):
+    """
+    Status and progress of an admin YAML load job.
+
+    Kept in the database so any API worker can report a job started by
+    another one, and so only one job per kind is active across workers
+    (services/yaml_loader.py).
+    """
+
+    __tablename__ = "yaml_load_jobs"
+
+    id = Column(String, primary_key=True)
+    kind = Column(String, nullable=False, index=True)  # nodes, mechanisms
+    force = Column(Boolean, nullable=False, default=False)
+    status = Column(String, nullable=False, index=True)  # queued, running, completed, failed
+    phase = Column(String)  # scanning, writing while running
+    total = Column(Integer, nullable=False, default=0)
+    processed = Column(Integer, nullable=False, default=0)
+    loaded = Column(Integer, nullable=False, default=0)
+    updated = Column(Integer, nullable=False, default=0)
+    unchanged = Column(Integer, nullable=False, default=0)
+    errors = Column(JSON)  # [{"file": ..., "error": ...}]
+    error = Column(Text)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)  # Last progress write; stale active jobs are abandoned
+    finished_at = Column(DateTime)
+
+    def __repr__(self):
+        return f"<YamlLoadJobRecord {self.id} {self.kind} {self.status}>"
+
+
+class GraphVersion(Base):
+    """
+    Named version stamps shared by every API worker through the database.
+
+    The ``mechanisms`` row is bumped in the same transaction as any write to
+    mechanisms or nodes (services/graph_store.py), so each worker can tell
+    that its in-memory graph is stale. Derived tables record the mechanisms
+    version they were built from under their own name (e.g. ``pathways``).
+    """
+
+    __tablename__ = "graph_versions"
+
+    name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<GraphVersion {self.name}={self.version}>"
+
+
+# ==========================================
+# Full-text search tables
+# ==========================================
+# Filled by services/search_index.py. Their columns are dialect-specific (an
+# FTS5 virtual table on SQLite, a GIN-indexed tsvector table on PostgreSQL),
+# so they are created alongside create_all() and by the add_search_tables
+# migration rather than declared as models.
+
+SEARCH_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5("
+    "kind UNINDEXED, doc_id UNINDEXED, title, body, tokenize='unicode61')"
+)
+
+SEARCH_DOCUMENTS_DDL = (
+    "CREATE TABLE IF NOT EXISTS search_documents ("
+    "kind text NOT NULL, doc_id text NOT NULL, title text NOT NULL, body text, "
+    "tsv tsvector NOT NULL, PRIMARY KEY (kind, doc_id))",
+    "CREATE INDEX IF NOT EXISTS ix_search_documents_tsv ON search_documents USING GIN (tsv)",
+)
+
+
+def sqlite_has_fts5(connection) -> bool:
+    """Whether the connected SQLite library was built with FTS5."""
+    return connection.exec_driver_sql(
+        "SELECT 1 FROM pragma_compile_options WHERE compile_options = 'ENABLE_FTS5'"
+    ).first() is not None
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_search_tables(target, connection, **kw):
+    dialect = connection.dialect.name
+    if dialect == "sqlite" and sqlite_has_fts5(connection):
+        connection.exec_driver_sql(SEARCH_FTS_DDL)
+    elif dialect == "postgresql":
+        for statement in SEARCH_DOCUMENTS_DDL:
+            connection.exec_driver_sql(statement)
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def _drop_search_tables(target, connection, **kw):
+    table = {"sqlite": "search_fts", "postgresql": "search_documents"}.get(connection.dialect.name)
+    if table:
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {table}")
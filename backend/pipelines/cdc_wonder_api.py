@@ -27,6 +27,8 @@ from dataclasses import dataclass
 from datetime import datetime
 import os
 
+from utils.http_cache import mount_cache
+
 
 @dataclass
 class CDCWonderResult:
@@ -66,6 +68,9 @@ class CDCWonderAPI:
         self.session = requests.Session()
         self.rate_limit_seconds = rate_limit_seconds
         self.last_request_time = 0.0
+        # Queries are POSTed; identical queries are answered from the response cache
+        # without waiting out the rate limit
+        mount_cache(self.session, before_send=self._enforce_rate_limit, methods=("POST",))
 
     def _enforce_rate_limit(self):
         """Enforce rate limiting between requests"""
@@ -105,9 +110,6 @@ class CDCWonderAPI:
                 "See: https://wonder.cdc.gov/datause.html"
             )
 
-        # Ensure rate limit compliance
-        self._enforce_rate_limit()
-
         # Build URL
         url = f"{self.BASE_URL}/{database_id}"
 
@@ -331,11 +331,20 @@ class EndToEndDiscoveryPipelineV3:
         papers_with_doi = [p for p in papers if p.doi]
         print(f"  Attempting full-text fetch for {len(papers_with_doi)}/{len(papers)} papers with DOIs...")
 
+        # Concurrent, hedged fetches; provider rate limits are shared across DOIs
+        try:
+            results = self.fulltext_fetcher.fetch_batch([p.doi for p in papers_with_doi], parallel=True)
+        except Exception as e:
+            logger.error(f"Error fetching full-text batch: {e}")
+            results = {}
+
         for paper in papers_with_doi:
             try:
                 self.fulltext_stats["attempted"] += 1
 
-                result = self.fulltext_fetcher.fetch_fulltext(paper.doi)
+                result = results.get(paper.doi)
+                if result is None:
+                    continue
                 self.fulltext_results[paper.doi] = result
 
                 if result.success:
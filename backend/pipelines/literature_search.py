@@ -6,15 +6,38 @@ This module provides integration with academic literature databases:
 - PubMed API (no key required)
 
 Used to retrieve papers for mechanism discovery pipeline.
+
+LiteratureSearchAggregator searches are async underneath: every query x
+source request is issued concurrently over one HTTP client, and each
+provider is paced by its own token bucket instead of a sleep before every
+request. Batches of queries (search_many) therefore take as long as the
+provider quotas require, not the sum of per-request delays.
+
+All clients read through the shared HTTP response cache (utils.http_cache);
+cache hits are answered from disk without consuming rate-limit budget.
 """
 
+import asyncio
 import requests
 import time
-from typing import List, Dict, Optional, Set
+from typing import Any, Dict, List, Optional, Sequence, Set
 from dataclasses import dataclass
 from datetime import datetime
 import xml.etree.ElementTree as ET
 
+import httpx
+
+from utils.http_cache import HttpCache, get_http_cache, mount_cache
+
+# Retries for HTTP 429 responses (honouring Retry-After)
+MAX_RATE_LIMIT_RETRIES = 3
+# A 200 with an unreadable body fails only its own request (ValueError
+# covers JSONDecodeError)
+RESPONSE_ERRORS = (httpx.HTTPError, ValueError, ET.ParseError)
+# Concurrent connections across all providers
+MAX_CONNECTIONS = 20
+REQUEST_TIMEOUT = 30.0
+
 
 @dataclass
 class Paper:
@@ -32,6 +55,113 @@ class Paper:
     field_of_study: List[str]
 
 
+class TokenBucket:
+    """
+    Async token bucket: allows `rate` requests per second with bursts of
+    up to `capacity`. Waiters are served in arrival order.
+
+    Buckets are bound to the event loop they are first used on.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class RateLimitedClient:
+    """
+    Shared async HTTP client with a token bucket per provider.
+    """
+
+    def __init__(
+        self,
+        rates: Dict[str, float],
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: Optional[HttpCache] = None
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            rates: Requests per second allowed for each provider
+            transport: HTTP transport override (testing)
+            cache: Response cache; hits skip the rate limit (None = no caching)
+        """
+        self.buckets = {provider: TokenBucket(rate) for provider, rate in rates.items()}
+        self.cache = cache
+        self._client = httpx.AsyncClient(
+            transport=transport,
+            timeout=REQUEST_TIMEOUT,
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS)
+        )
+
+    async def get(
+        self,
+        provider: str,
+        url: str,
+        params: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """
+        GET under the provider's rate limit, retrying HTTP 429.
+
+        Raises:
+            httpx.HTTPError: On transport errors or non-2xx responses
+        """
+        request = self._client.build_request("GET", url, params=params, headers=headers)
+        cached = self.cache.lookup("GET", str(request.url)) if self.cache else None
+        if cached is not None:
+            response = httpx.Response(
+                cached.status, headers=cached.headers, content=cached.body, request=request
+            )
+            response.raise_for_status()
+            return response
+
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            await self.buckets[provider].acquire()
+            response = await self._client.send(request)
+            if response.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                break
+            retry_after = response.headers.get("Retry-After", "")
+            await asyncio.sleep(float(retry_after) if retry_after.isdigit() else 2 ** attempt)
+
+        if self.cache:
+            self.cache.store("GET", str(request.url), None, response.status_code, response.headers, response.content)
+        response.raise_for_status()
+        return response
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "RateLimitedClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+
 class SemanticScholarSearch:
     """
     Search Semantic Scholar for academic papers.
@@ -41,6 +171,7 @@ class SemanticScholarSearch:
     """
 
     BASE_URL = "https://api.semanticscholar.org/graph/v1"
+    PROVIDER = "semantic_scholar"
 
     def __init__(self, api_key: Optional[str] = None):
         """
@@ -55,6 +186,13 @@ class SemanticScholarSearch:
             self.session.headers.update({"x-api-key": api_key})
 
         self.rate_limit_delay = 1.0  # seconds between requests
+        # Rate limit only requests that miss the response cache
+        mount_cache(self.session, before_send=lambda: time.sleep(self.rate_limit_delay))
+
+    @property
+    def requests_per_second(self) -> float:
+        """Request rate allowed by the rate limit."""
+        return 1.0 / self.rate_limit_delay
 
     def search_papers(
         self,
@@ -77,6 +215,51 @@ class SemanticScholarSearch:
         Returns:
             List of Paper objects
         """
+        params = self._search_params(query, limit, fields, year_range, min_citations)
+
+        try:
+            response = self.session.get(
+                f"{self.BASE_URL}/paper/search",
+                params=params
+            )
+            response.raise_for_status()
+            return self._parse_search_results(response.json())
+
+        except requests.exceptions.RequestException as e:
+            print(f"Error searching Semantic Scholar: {e}")
+            return []
+
+    async def search_papers_async(
+        self,
+        http: RateLimitedClient,
+        query: str,
+        limit: int = 10,
+        fields: Optional[List[str]] = None,
+        year_range: Optional[tuple] = None,
+        min_citations: int = 0
+    ) -> List[Paper]:
+        """
+        Async search_papers() over a shared rate-limited client.
+        """
+        params = self._search_params(query, limit, fields, year_range, min_citations)
+        headers = {"x-api-key": self.api_key} if self.api_key else None
+
+        try:
+            response = await http.get(self.PROVIDER, f"{self.BASE_URL}/paper/search", params, headers)
+            return self._parse_search_results(response.json())
+        except RESPONSE_ERRORS as e:
+            print(f"Error searching Semantic Scholar: {e}")
+            return []
+
+    def _search_params(
+        self,
+        query: str,
+        limit: int,
+        fields: Optional[List[str]],
+        year_range: Optional[tuple],
+        min_citations: int
+    ) -> Dict[str, Any]:
+        """Query parameters for /paper/search."""
         if fields is None:
             fields = [
                 "title",
@@ -104,27 +287,16 @@ class SemanticScholarSearch:
         if min_citations > 0:
             params["minCitationCount"] = min_citations
 
-        try:
-            time.sleep(self.rate_limit_delay)
-            response = self.session.get(
-                f"{self.BASE_URL}/paper/search",
-                params=params
-            )
-            response.raise_for_status()
-
-            data = response.json()
+        return params
 
-            papers = []
-            for item in data.get("data", []):
-                paper = self._parse_paper(item)
-                if paper:
-                    papers.append(paper)
-
-            return papers
-
-        except requests.exceptions.RequestException as e:
-            print(f"Error searching Semantic Scholar: {e}")
-            return []
+    def _parse_search_results(self, data: Dict) -> List[Paper]:
+        """Papers from a /paper/search response."""
+        papers = []
+        for item in data.get("data", []):
+            paper = self._parse_paper(item)
+            if paper:
+                papers.append(paper)
+        return papers
 
     def get_paper_by_doi(self, doi: str) -> Optional[Paper]:
         """
@@ -137,7 +309,6 @@ class SemanticScholarSearch:
             Paper object or None
         """
         try:
-            time.sleep(self.rate_limit_delay)
             response = self.session.get(
                 f"{self.BASE_URL}/paper/DOI:{doi}",
                 params={"fields": "title,abstract,authors,year,externalIds,citationCount,venue,fieldsOfStudy,url"}
@@ -192,6 +363,7 @@ class PubMedSearch:
     """
 
     BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+    PROVIDER = "pubmed"
 
     def __init__(self, email: Optional[str] = None, api_key: Optional[str] = None):
         """
@@ -205,6 +377,13 @@ class PubMedSearch:
         self.api_key = api_key
         self.session = requests.Session()
         self.rate_limit_delay = 0.34 if api_key else 0.5  # seconds between requests
+        # Rate limit only requests that miss the response cache
+        mount_cache(self.session, before_send=lambda: time.sleep(self.rate_limit_delay))
+
+    @property
+    def requests_per_second(self) -> float:
+        """Request rate allowed by the rate limit."""
+        return 1.0 / self.rate_limit_delay
 
     def search_papers(
         self,
@@ -236,14 +415,45 @@ class PubMedSearch:
 
         return papers
 
-    def _search_pmids(
+    async def search_papers_async(
+        self,
+        http: RateLimitedClient,
+        query: str,
+        limit: int = 10,
+        min_date: Optional[str] = None,
+        max_date: Optional[str] = None
+    ) -> List[Paper]:
+        """
+        Async search_papers() over a shared rate-limited client.
+        """
+        try:
+            response = await http.get(
+                self.PROVIDER, f"{self.BASE_URL}/esearch.fcgi",
+                self._esearch_params(query, limit, min_date, max_date)
+            )
+            pmids = response.json().get("esearchresult", {}).get("idlist", [])
+        except RESPONSE_ERRORS as e:
+            print(f"Error searching PubMed: {e}")
+            return []
+
+        if not pmids:
+            return []
+
+        try:
+            response = await http.get(self.PROVIDER, f"{self.BASE_URL}/efetch.fcgi", self._efetch_params(pmids))
+            return self._parse_articles(response.content)
+        except RESPONSE_ERRORS as e:
+            print(f"Error fetching PubMed details: {e}")
+            return []
+
+    def _esearch_params(
         self,
         query: str,
         limit: int,
         min_date: Optional[str],
         max_date: Optional[str]
-    ) -> List[str]:
-        """Search for PMIDs matching query"""
+    ) -> Dict[str, Any]:
+        """Query parameters for esearch.fcgi."""
         params = {
             "db": "pubmed",
             "term": query,
@@ -263,8 +473,47 @@ class PubMedSearch:
         if max_date:
             params["maxdate"] = max_date
 
+        return params
+
+    def _efetch_params(self, pmids: List[str]) -> Dict[str, Any]:
+        """Query parameters for efetch.fcgi."""
+        params = {
+            "db": "pubmed",
+            "id": ",".join(pmids),
+            "retmode": "xml"
+        }
+
+        if self.email:
+            params["email"] = self.email
+
+        if self.api_key:
+            params["api_key"] = self.api_key
+
+        return params
+
+    def _parse_articles(self, content: bytes) -> List[Paper]:
+        """Papers from an efetch.fcgi XML response."""
+        root = ET.fromstring(content)
+
+        papers = []
+        for article in root.findall(".//PubmedArticle"):
+            paper = self._parse_pubmed_article(article)
+            if paper:
+                papers.append(paper)
+
+        return papers
+
+    def _search_pmids(
+        self,
+        query: str,
+        limit: int,
+        min_date: Optional[str],
+        max_date: Optional[str]
+    ) -> List[str]:
+        """Search for PMIDs matching query"""
+        params = self._esearch_params(query, limit, min_date, max_date)
+
         try:
-            time.sleep(self.rate_limit_delay)
             response = self.session.get(
                 f"{self.BASE_URL}/esearch.fcgi",
                 params=params
@@ -285,36 +534,13 @@ class PubMedSearch:
         if not pmids:
             return []
 
-        params = {
-            "db": "pubmed",
-            "id": ",".join(pmids),
-            "retmode": "xml"
-        }
-
-        if self.email:
-            params["email"] = self.email
-
-        if self.api_key:
-            params["api_key"] = self.api_key
-
         try:
-            time.sleep(self.rate_limit_delay)
             response = self.session.get(
                 f"{self.BASE_URL}/efetch.fcgi",
-                params=params
+                params=self._efetch_params(pmids)
             )
             response.raise_for_status()
-
-            # Parse XML
-            root = ET.fromstring(response.content)
-
-            papers = []
-            for article in root.findall(".//PubmedArticle"):
-                paper = self._parse_pubmed_article(article)
-                if paper:
-                    papers.append(paper)
-
-            return papers
+            return self._parse_articles(response.content)
 
         except requests.exceptions.RequestException as e:
             print(f"Error fetching PubMed details: {e}")
@@ -388,15 +614,30 @@ class LiteratureSearchAggregator:
     Deduplicates by DOI/PMID.
     """
 
+    SOURCES = ("semantic_scholar", "pubmed")
+
     def __init__(
         self,
         semantic_scholar_api_key: Optional[str] = None,
         pubmed_email: Optional[str] = None,
-        pubmed_api_key: Optional[str] = None
+        pubmed_api_key: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: Optional[HttpCache] = None
     ):
-        """Initialize aggregator with both search clients"""
+        """
+        Initialize aggregator with both search clients.
+
+        Args:
+            semantic_scholar_api_key: Semantic Scholar API key (optional)
+            pubmed_email: Contact email sent to NCBI (optional)
+            pubmed_api_key: NCBI API key, raises the PubMed rate limit (optional)
+            transport: HTTP transport override for async searches (testing)
+            cache: Response cache for async searches (default: get_http_cache())
+        """
         self.semantic_scholar = SemanticScholarSearch(api_key=semantic_scholar_api_key)
         self.pubmed = PubMedSearch(email=pubmed_email, api_key=pubmed_api_key)
+        self.transport = transport
+        self.cache = cache if cache is not None else get_http_cache()
 
     def search(
         self,
@@ -419,42 +660,100 @@ class LiteratureSearchAggregator:
         Returns:
             Deduplicated list of papers
         """
-        all_papers = []
-
-        # Search Semantic Scholar
-        if "semantic_scholar" in sources:
-            print(f"Searching Semantic Scholar for: {query}")
-            ss_papers = self.semantic_scholar.search_papers(
-                query=query,
-                limit=limit_per_source,
-                year_range=year_range,
-                min_citations=min_citations
-            )
-            all_papers.extend(ss_papers)
-            print(f"  Found {len(ss_papers)} papers")
-
-        # Search PubMed
-        if "pubmed" in sources:
-            print(f"Searching PubMed for: {query}")
-
-            # Convert year range to PubMed date format
-            min_date = f"{year_range[0]}/01/01" if year_range else None
-            max_date = f"{year_range[1]}/12/31" if year_range else None
-
-            pm_papers = self.pubmed.search_papers(
-                query=query,
-                limit=limit_per_source,
-                min_date=min_date,
-                max_date=max_date
-            )
-            all_papers.extend(pm_papers)
-            print(f"  Found {len(pm_papers)} papers")
+        return self.search_many([query], limit_per_source, year_range, min_citations, sources)[0]
+
+    def search_many(
+        self,
+        queries: Sequence[str],
+        limit_per_source: int = 10,
+        year_range: Optional[tuple] = None,
+        min_citations: int = 0,
+        sources: List[str] = ["semantic_scholar", "pubmed"]
+    ) -> List[List[Paper]]:
+        """
+        Search several queries concurrently (blocking wrapper around search_many_async).
+
+        Must not be called from a running event loop; await search_many_async there.
 
-        # Deduplicate by DOI and PMID
-        deduplicated = self._deduplicate_papers(all_papers)
+        Returns:
+            One deduplicated paper list per query, in query order
+        """
+        return asyncio.run(
+            self.search_many_async(queries, limit_per_source, year_range, min_citations, sources)
+        )
 
-        print(f"\nTotal unique papers: {len(deduplicated)}")
-        return deduplicated
+    async def search_async(
+        self,
+        query: str,
+        limit_per_source: int = 10,
+        year_range: Optional[tuple] = None,
+        min_citations: int = 0,
+        sources: List[str] = ["semantic_scholar", "pubmed"]
+    ) -> List[Paper]:
+        """Async search(): both sources are queried concurrently."""
+        results = await self.search_many_async([query], limit_per_source, year_range, min_citations, sources)
+        return results[0]
+
+    async def search_many_async(
+        self,
+        queries: Sequence[str],
+        limit_per_source: int = 10,
+        year_range: Optional[tuple] = None,
+        min_citations: int = 0,
+        sources: List[str] = ["semantic_scholar", "pubmed"]
+    ) -> List[List[Paper]]:
+        """
+        Fan out every query x source request at once.
+
+        Requests share one HTTP client; each provider is paced by its own
+        token bucket, so total time is bounded by the slowest provider's
+        quota rather than by summed per-request delays.
+
+        Args:
+            queries: Search queries
+            limit_per_source: Max results per source and query
+            year_range: (min_year, max_year) or None
+            min_citations: Minimum citation count (Semantic Scholar only)
+            sources: List of sources to search
+
+        Returns:
+            One deduplicated paper list per query, in query order
+        """
+        sources = [source for source in self.SOURCES if source in sources]
+        # PubMed date format
+        min_date = f"{year_range[0]}/01/01" if year_range else None
+        max_date = f"{year_range[1]}/12/31" if year_range else None
+
+        rates = {
+            self.semantic_scholar.PROVIDER: self.semantic_scholar.requests_per_second,
+            self.pubmed.PROVIDER: self.pubmed.requests_per_second,
+        }
+        async with RateLimitedClient(rates, transport=self.transport, cache=self.cache) as http:
+            def request(query: str, source: str):
+                if source == "semantic_scholar":
+                    return self.semantic_scholar.search_papers_async(
+                        http, query, limit=limit_per_source,
+                        year_range=year_range, min_citations=min_citations
+                    )
+                return self.pubmed.search_papers_async(
+                    http, query, limit=limit_per_source, min_date=min_date, max_date=max_date
+                )
+
+            results = await asyncio.gather(*(
+                request(query, source) for query in queries for source in sources
+            ))
+
+        papers_per_query = []
+        for i, query in enumerate(queries):
+            # Semantic Scholar results first, so their records win deduplication
+            per_source = results[i * len(sources):(i + 1) * len(sources)]
+            all_papers = [paper for papers in per_source for paper in papers]
+            counts = ", ".join(f"{source}: {len(papers)}" for source, papers in zip(sources, per_source))
+            deduplicated = self._deduplicate_papers(all_papers)
+            print(f"Searched '{query}' ({counts}) -> {len(deduplicated)} unique papers")
+            papers_per_query.append(deduplicated)
+
+        return papers_per_query
 
     def _deduplicate_papers(self, papers: List[Paper]) -> List[Paper]:
         """Remove duplicate papers based on DOI and PMID"""
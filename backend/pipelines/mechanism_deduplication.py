@@ -19,6 +19,8 @@ from pathlib import Path
 import yaml
 import json
 
+from utils.llm_cache import cached_client
+
 try:
     from sentence_transformers import SentenceTransformer
     from sklearn.cluster import DBSCAN
@@ -71,7 +73,7 @@ class MechanismDeduplicator:
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY not set")
 
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+        self.client = cached_client(anthropic.Anthropic(api_key=self.api_key))
 
         # Initialize embedding model
         if EMBEDDINGS_AVAILABLE:
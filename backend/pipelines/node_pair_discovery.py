@@ -280,35 +280,78 @@ class NodePairDiscovery:
         Returns:
             NodePairEvidence with papers found
         """
+        # The pair's queries run concurrently, like a batch of one
+        return self.search_papers_for_pairs([pair], max_papers)[0]
+
+    def search_papers_for_pairs(
+        self,
+        pairs: List[NodePair],
+        max_papers: int = 30
+    ) -> List[NodePairEvidence]:
+        """
+        Search for papers for many node pairs at once.
+
+        All unique queries across the pairs are fanned out concurrently
+        (LiteratureSearchAggregator.search_many), so the search time is
+        bounded by the providers' rate limits rather than per-pair sleeps.
+
+        Args:
+            pairs: NodePairs to search for
+            max_papers: Maximum papers to retrieve per pair
+
+        Returns:
+            NodePairEvidence per pair, in pair order
+        """
+        aggregator = self._create_aggregator()
+        queries_per_pair = [self.build_search_query(pair) for pair in pairs]
+        unique_queries = list(dict.fromkeys(q for queries in queries_per_pair for q in queries))
+
+        try:
+            results = dict(zip(
+                unique_queries,
+                aggregator.search_many(unique_queries, limit_per_source=max_papers // 2)
+            ))
+        except Exception as e:
+            logger.warning(f"Search error for {len(pairs)} node pairs: {e}")
+            results = {}
+
+        return [
+            self._collect_evidence(pair, queries, [results[q] for q in queries if q in results], max_papers)
+            for pair, queries in zip(pairs, queries_per_pair)
+        ]
+
+    def _create_aggregator(self) -> LiteratureSearchAggregator:
         if not self.pubmed_email:
             raise ValueError("PUBMED_EMAIL required for literature search")
 
-        queries = self.build_search_query(pair)
+        return LiteratureSearchAggregator(
+            pubmed_email=self.pubmed_email,
+            semantic_scholar_api_key=self.ss_key
+        )
+
+    def _collect_evidence(
+        self,
+        pair: NodePair,
+        queries: List[str],
+        paper_lists: List[List[Any]],
+        max_papers: int
+    ) -> NodePairEvidence:
+        """Deduplicate per-query search results into NodePairEvidence."""
         evidence = NodePairEvidence(
             node_pair=pair,
             search_queries_used=queries
         )
 
-        # Initialize aggregator
-        aggregator = LiteratureSearchAggregator(
-            pubmed_email=self.pubmed_email,
-            semantic_scholar_api_key=self.ss_key
-        )
-
         all_papers = []
         seen_titles = set()
 
-        for query in queries:
-            try:
-                papers = aggregator.search(query, limit_per_source=max_papers // 2)
-                for p in papers:
-                    # Deduplicate by title
-                    title_lower = (p.title or '').lower()[:100]
-                    if title_lower and title_lower not in seen_titles:
-                        seen_titles.add(title_lower)
-                        all_papers.append(p)
-            except Exception as e:
-                logger.warning(f"Search error for {pair.from_node_id}->{pair.to_node_id}: {e}")
+        for papers in paper_lists:
+            for p in papers:
+                # Deduplicate by title
+                title_lower = (p.title or '').lower()[:100]
+                if title_lower and title_lower not in seen_titles:
+                    seen_titles.add(title_lower)
+                    all_papers.append(p)
 
         # Convert to PaperInput
         for i, paper in enumerate(all_papers[:max_papers]):
@@ -759,10 +802,7 @@ Return ONLY valid JSON. No additional text.
             search_config = self.config.get('search_config', {})
             papers_per_pair = search_config.get('papers_per_pair', 30)
 
-            for pair in pairs:
-                evidence = self.search_papers_for_pair(pair, max_papers=papers_per_pair)
-                evidence_list.append(evidence)
-                time.sleep(1)  # Rate limiting
+            evidence_list = self.search_papers_for_pairs(pairs, max_papers=papers_per_pair)
 
         # Report on evidence found
         total_papers = sum(len(e.papers) for e in evidence_list)
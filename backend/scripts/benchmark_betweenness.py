@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark sampled (approximate) betweenness against exact betweenness.
+
+Builds the mechanism graph directly from the YAML corpus in
+mechanism-bank/mechanisms and, for each sample size k, reports:
+- Runtime of exact vs. sampled betweenness
+- Spearman rank correlation with the exact scores
+- Overlap of the top-N nodes
+- Observed max absolute error vs. the reported error bound
+
+Usage:
+    # Default sample sizes (32, 64, 128, 256, 512):
+    python benchmark_betweenness.py
+
+    # Custom sample sizes and repetitions:
+    python benchmark_betweenness.py --k 50 100 200 --repeat 3
+
+    # Save results as JSON:
+    python benchmark_betweenness.py --output betweenness_benchmark.json
+"""
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from typing import Dict, List
+
+import networkx as nx
+import yaml
+from scipy.stats import spearmanr
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.routes.nodes import approximate_betweenness
+from services.graph_store import EVIDENCE_WEIGHTS
+
+DEFAULT_MECHANISMS_DIR = Path(__file__).parent.parent.parent / "mechanism-bank" / "mechanisms"
+
+
+def load_graph(mechanisms_dir: Path) -> nx.DiGraph:
+    """Build a DiGraph from mechanism YAML files (same edges as the API graph)."""
+    G = nx.DiGraph()
+
+    for yaml_file in sorted(mechanisms_dir.rglob("*.y*ml")):
+        try:
+            with open(yaml_file, 'r', encoding='utf-8') as f:
+                data = yaml.safe_load(f)
+            from_id = data['from_node']['node_id']
+            to_id = data['to_node']['node_id']
+        except Exception:
+            continue  # Skip malformed / non-mechanism files
+
+        quality = (data.get('evidence') or {}).get('quality_rating')
+        G.add_edge(from_id, to_id, weight=EVIDENCE_WEIGHTS.get(quality, 1))
+
+    return G
+
+
+def top_n_overlap(exact: Dict[str, float], approx: Dict[str, float], n: int) -> float:
+    """Fraction of the exact top-n nodes that also appear in the approximate top-n."""
+    exact_top = set(sorted(exact, key=exact.get, reverse=True)[:n])
+    approx_top = set(sorted(approx, key=approx.get, reverse=True)[:n])
+    return len(exact_top & approx_top) / n if n else 1.0
+
+
+def run_benchmark(G: nx.DiGraph, sample_sizes: List[int], repeat: int, seed: int,
+                  top_n: int) -> Dict:
+    """Run exact and sampled betweenness and compare them."""
+    start = time.perf_counter()
+    exact = nx.betweenness_centrality(G)
+    exact_seconds = time.perf_counter() - start
+
+    nodes = list(G.nodes())
+    exact_values = [exact[v] for v in nodes]
+
+    results = []
+    for k in sample_sizes:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            approx, error_bound = approximate_betweenness(G, k=k, seed=seed)
+            timings.append(time.perf_counter() - start)
+
+        rho = spearmanr(exact_values, [approx[v] for v in nodes]).correlation
+        max_error = max(abs(approx[v] - exact[v]) for v in nodes)
+
+        results.append({
+            "k": k,
+            "seconds": min(timings),
+            "speedup": exact_seconds / min(timings) if min(timings) > 0 else None,
+            "spearman": rho,
+            f"top_{top_n}_overlap": top_n_overlap(exact, approx, top_n),
+            "max_abs_error": max_error,
+            "error_bound": error_bound,
+        })
+
+    return {
+        "nodes": G.number_of_nodes(),
+        "edges": G.number_of_edges(),
+        "exact_seconds": exact_seconds,
+        "seed": seed,
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark approximate betweenness centrality")
+    parser.add_argument("--mechanisms-dir", type=Path, default=DEFAULT_MECHANISMS_DIR,
+                        help="Mechanism YAML directory")
+    parser.add_argument("--k", type=int, nargs="+", default=[32, 64, 128, 256, 512],
+                        help="Sample sizes to benchmark")
+    parser.add_argument("--repeat", type=int, default=1, help="Timing repetitions per k")
+    parser.add_argument("--seed", type=int, default=42, help="Sampling seed")
+    parser.add_argument("--top-n", type=int, default=20, help="Top-N overlap size")
+    parser.add_argument("--output", type=Path, help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    if not args.mechanisms_dir.exists():
+        print(f"Error: Mechanisms directory not found: {args.mechanisms_dir}")
+        sys.exit(1)
+
+    print(f"Loading mechanisms from {args.mechanisms_dir}...")
+    G = load_graph(args.mechanisms_dir)
+    print(f"Graph: {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
+
+    report = run_benchmark(G, args.k, args.repeat, args.seed, args.top_n)
+
+    print(f"\nExact betweenness: {report['exact_seconds']:.3f}s\n")
+    print(f"{'k':>6} {'time (s)':>10} {'speedup':>8} {'spearman':>9} "
+          f"{'top-' + str(args.top_n):>7} {'max err':>9} {'bound':>9}")
+    for r in report["results"]:
+        speedup = f"{r['speedup']:.1f}x" if r["speedup"] else "-"
+        print(f"{r['k']:>6} {r['seconds']:>10.3f} {speedup:>8} {r['spearman']:>9.4f} "
+              f"{r[f'top_{args.top_n}_overlap']:>7.0%} {r['max_abs_error']:>9.5f} "
+              f"{r['error_bound']:>9.5f}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Compile the mechanism and node banks into a binary snapshot.
+
+Writes bank.snapshot (memory-mapped by utils.bank_snapshot.open_bank and
+seed_database.py --bulk) and bank.manifest.json (per-file content hashes)
+next to the mechanisms directory. Only files changed since the previous
+snapshot are re-parsed.
+
+Usage:
+    # Incremental compile:
+    python compile_bank.py
+
+    # Re-parse everything:
+    python compile_bank.py --force
+
+    # Custom output location:
+    python compile_bank.py --snapshot /tmp/bank.snapshot
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.bank_snapshot import BankSnapshot, compile_bank, default_snapshot_path, default_sources
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the mechanism/node banks into a binary snapshot")
+    parser.add_argument("--snapshot", type=Path, help="Snapshot file (default: next to mechanism-bank/mechanisms)")
+    parser.add_argument("--force", action="store_true", help="Re-parse every file")
+    args = parser.parse_args()
+
+    sources = default_sources()
+    if not sources:
+        print("Error: no mechanism or node bank found")
+        sys.exit(1)
+    snapshot_path = args.snapshot or default_snapshot_path(sources)
+
+    start = time.perf_counter()
+    stats = compile_bank(snapshot_path, sources, force=args.force)
+    compile_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with BankSnapshot(snapshot_path) as bank:
+        documents = sum(1 for _ in bank.documents())
+    load_seconds = time.perf_counter() - start
+
+    print(f"Snapshot: {snapshot_path} ({snapshot_path.stat().st_size / 1e6:.1f} MB, {documents} files)")
+    print(f"Compiled in {compile_seconds:.2f}s: {stats.parsed} parsed, {stats.reused} reused, "
+          f"{stats.removed} removed, {stats.failed} failed")
+    print(f"Full load and decode: {load_seconds * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
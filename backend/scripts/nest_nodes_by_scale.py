@@ -64,6 +64,7 @@ from utils.hierarchy import (
     update_node_hierarchy_fields,
     validate_hierarchy_integrity
 )
+from utils.llm_cache import cached_client
 
 # Configure logging
 logging.basicConfig(
@@ -158,7 +159,7 @@ class NodeNestingPipeline:
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY environment variable not set")
 
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+        self.client = cached_client(anthropic.Anthropic(api_key=self.api_key))
 
         # Database setup
         self.database_url = database_url or os.getenv(
@@ -24,17 +24,25 @@ Usage:
 
     # Seed alcohol mechanisms with quality B or better:
     python seed_database.py --min-quality B --topic alcohol
+
+    # Bulk mode (compiled bank snapshot, batched inserts, per-stage timings):
+    python seed_database.py --bulk
 """
 
 import os
+import re
 import sys
+import time
 import yaml
 import logging
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Set, Optional
+from typing import Any, Dict, List, Set, Optional, Tuple
 from datetime import datetime
-from sqlalchemy import create_engine, select
+from sqlalchemy import create_engine, select, update
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import IntegrityError
 
@@ -45,8 +53,17 @@ from models.database import Base
 from models.mechanism import Node, Mechanism, node_hierarchy
 from config.database import DatabaseConfig
 from utils.scale_inference import infer_scale_from_name
+from utils.hierarchy import recompute_hierarchy_fields
+from utils.bank_snapshot import BankSnapshot, open_bank
+from services.graph_store import graph_store
 from sqlalchemy import insert
 
+# libyaml-backed loader is several times faster; fall back to pure Python
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader
+
 # Quality rating hierarchy (A is best, C is worst)
 QUALITY_HIERARCHY = {'A': 1, 'B': 2, 'C': 3}
 
@@ -78,6 +95,12 @@ VALID_MECHANISM_CATEGORIES = [
     'biological'
 ]
 
+# Rows per executemany batch in bulk mode
+BULK_BATCH_SIZE = 5000
+
+# Upper bound on the default number of parser processes
+MAX_DEFAULT_WORKERS = 4
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -86,6 +109,240 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def load_yaml(file_path: Path) -> Any:
+    """Load a YAML file with the fastest available safe loader."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=YAMLLoader)
+
+
+def parse_yaml_file(file_path: Path) -> Optional[Dict]:
+    """Parse a single mechanism YAML file (None if unusable)."""
+    try:
+        data = load_yaml(file_path)
+
+        # Validate minimum required fields
+        if not data:
+            logger.warning(f"Empty YAML file: {file_path.name}")
+            return None
+
+        if 'id' not in data:
+            logger.warning(f"Missing 'id' field in {file_path.name}")
+            return None
+
+        return data
+    except yaml.YAMLError as e:
+        logger.warning(f"YAML syntax error in {file_path.name}: {e} - skipping")
+        return None
+    except Exception as e:
+        logger.warning(f"Error parsing {file_path.name}: {e} - skipping")
+        return None
+
+
+def passes_quality_filter(mech_data: Dict, min_quality: Optional[str]) -> bool:
+    """Check if mechanism meets the minimum evidence quality."""
+    if not min_quality:
+        return True
+
+    evidence = mech_data.get('evidence', {})
+    quality = evidence.get('quality_rating', 'C')
+
+    # Compare quality ratings (lower number = better quality)
+    mech_rank = QUALITY_HIERARCHY.get(quality.upper(), 3)
+    min_rank = QUALITY_HIERARCHY.get(min_quality.upper(), 3)
+
+    return mech_rank <= min_rank
+
+
+def passes_topic_filter(mech_data: Dict, topic: Optional[str]) -> bool:
+    """Check if mechanism matches the topic keywords."""
+    if not topic:
+        return True
+
+    keywords = TOPIC_KEYWORDS.get(topic.lower(), [])
+    if not keywords:
+        logger.warning(f"Unknown topic '{topic}'. Available: {list(TOPIC_KEYWORDS.keys())}")
+        return True
+
+    # Check mechanism ID, from_node, to_node, description
+    mech_id = mech_data.get('id', '').lower()
+    description = mech_data.get('description', '').lower()
+
+    # Extract node IDs
+    from_node_id, to_node_id = '', ''
+    if '_to_' in mech_id:
+        parts = mech_id.split('_to_')
+        from_node_id = parts[0].lower()
+        to_node_id = '_to_'.join(parts[1:]).lower()
+
+    # Check if any keyword matches
+    text_to_search = f"{mech_id} {from_node_id} {to_node_id} {description}"
+    return any(keyword in text_to_search for keyword in keywords)
+
+
+def parse_node_file(file_path: Path) -> Optional[Dict]:
+    """
+    Parse a node YAML file into a nodes-table row.
+
+    The row carries an extra 'parent_ids' key with the declared hierarchy
+    parents. Runs in worker processes in bulk mode.
+    """
+    try:
+        data = load_yaml(file_path)
+    except Exception as e:
+        logger.warning(f"Error loading node from {file_path}: {e}")
+        return None
+    return build_node_row(data, file_path)
+
+
+def build_node_row(data: Optional[Dict], file_path: Path) -> Optional[Dict]:
+    """Nodes-table row (plus 'parent_ids') for a parsed node document."""
+    if not data or 'id' not in data:
+        return None
+
+    node_id = data.get('id')
+    hierarchy = data.get('hierarchy', {}) or {}
+    return {
+        'id': node_id,
+        'name': data.get('name', node_id.replace('_', ' ').title()),
+        'node_type': data.get('type', 'stock').lower(),
+        'category': data.get('category', 'built_environment'),
+        'scale': data.get('scale', DatabaseSeeder.extract_scale_from_path(Path(file_path))),
+        'description': data.get('description', ''),
+        'depth': hierarchy.get('depth', 0),
+        'is_grouping_node': hierarchy.get('is_grouping_node', False),
+        'parent_ids': hierarchy.get('parent_ids', []),
+    }
+
+
+def build_stub_node_row(node_id: str, node_data: Dict, category: str) -> Dict:
+    """Row for a node referenced by a mechanism but missing from the node bank."""
+    clean_node_id = node_id.replace('NEW:', '')
+    node_name = node_data.get('node_name', clean_node_id.replace('_', ' ').title())
+    return {
+        'id': clean_node_id,
+        'name': node_name,
+        'node_type': 'stock',
+        'category': category,
+        # Use intelligent scale inference instead of defaulting to 4
+        'scale': infer_scale_from_name(clean_node_id, node_name),
+        'description': '',
+        'depth': 0,
+        'is_grouping_node': False,
+    }
+
+
+def build_mechanism_row(mech_data: Dict) -> Dict:
+    """Mechanisms-table row for a mechanism YAML document."""
+    clean_mech_id = mech_data['id'].replace('NEW:', '')
+    from_node_id, to_node_id = DatabaseSeeder.get_node_ids_from_mechanism(mech_data)
+    evidence = mech_data.get('evidence', {})
+    structural_competency = mech_data.get('structural_competency', {})
+
+    return {
+        'id': clean_mech_id,
+        'name': mech_data.get('name', clean_mech_id),
+        'from_node_id': from_node_id.replace('NEW:', ''),
+        'to_node_id': to_node_id.replace('NEW:', ''),
+        'direction': DatabaseSeeder.infer_direction(mech_data),
+        'category': mech_data.get('category', 'built_environment'),
+        'mechanism_pathway': mech_data.get('mechanism_pathway', []),
+        'evidence_quality': evidence.get('quality_rating', 'C'),
+        'evidence_n_studies': evidence.get('n_studies', 1),
+        'evidence_primary_citation': evidence.get('primary_citation', evidence.get('citation', 'No citation provided')).strip(),
+        'evidence_supporting_citations': evidence.get('supporting_citations', []),
+        'evidence_doi': evidence.get('doi'),
+        'varies_by_geography': mech_data.get('varies_by_geography', False),
+        'variation_notes': mech_data.get('variation_notes'),
+        'relevant_geographies': mech_data.get('relevant_geographies', []),
+        'moderators': mech_data.get('moderators', []),
+        'structural_competency_root_cause': structural_competency.get('root_cause'),
+        'structural_competency_avoids_victim_blaming': structural_competency.get('avoids_victim_blaming', True),
+        'structural_competency_equity_implications': structural_competency.get('equity_implications'),
+        'version': str(mech_data.get('version', '1.0')),
+        'last_updated': DatabaseSeeder.parse_date(mech_data.get('last_updated')),
+        'validated_by': mech_data.get('validated_by', []),
+        'description': mech_data.get('description', '').strip(),
+        'assumptions': mech_data.get('assumptions', []),
+        'limitations': mech_data.get('limitations', []),
+    }
+
+
+def parse_mechanism_file(
+    file_path: Path,
+    min_quality: Optional[str] = None,
+    topic: Optional[str] = None
+) -> Tuple[str, Optional[Dict]]:
+    """
+    Parse, validate and filter a mechanism YAML file.
+
+    Runs in worker processes in bulk mode.
+
+    Returns:
+        (outcome, payload): outcome is 'ok', 'failed', 'invalid_nodes',
+        'quality' or 'topic'; payload for 'ok' holds the mechanism row and
+        stub rows for its two endpoint nodes
+    """
+    return classify_mechanism(parse_yaml_file(file_path), min_quality, topic)
+
+
+def classify_mechanism(
+    mech_data: Optional[Dict],
+    min_quality: Optional[str] = None,
+    topic: Optional[str] = None
+) -> Tuple[str, Optional[Dict]]:
+    """Validate and filter a parsed mechanism document (see parse_mechanism_file)."""
+    if not isinstance(mech_data, dict) or 'id' not in mech_data:
+        return 'failed', None
+
+    # Check for valid node references FIRST
+    from_node_id, to_node_id = DatabaseSeeder.get_node_ids_from_mechanism(mech_data)
+    if not from_node_id or not to_node_id:
+        return 'invalid_nodes', None
+    if not passes_quality_filter(mech_data, min_quality):
+        return 'quality', None
+    if not passes_topic_filter(mech_data, topic):
+        return 'topic', None
+
+    try:
+        category = mech_data.get('category', 'built_environment')
+        return 'ok', {
+            'mechanism': build_mechanism_row(mech_data),
+            'nodes': [
+                build_stub_node_row(from_node_id, mech_data.get('from_node', {}), category),
+                build_stub_node_row(to_node_id, mech_data.get('to_node', {}), category),
+            ],
+        }
+    except Exception as e:
+        logger.error(f"Error creating mechanism {mech_data.get('id', 'unknown')}: {e}")
+        return 'failed', None
+
+
+def default_worker_count() -> int:
+    """
+    Parser processes to use when none are requested.
+
+    os.cpu_count() reports the host's CPUs inside a container, so count the
+    CPUs this process may run on instead, capped at MAX_DEFAULT_WORKERS
+    (CPU quotas aren't visible in the affinity mask either).
+    """
+    try:
+        available = len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS/Windows
+        available = os.cpu_count() or 1
+    return max(1, min(available, MAX_DEFAULT_WORKERS))
+
+
+@contextmanager
+def timed_stage(timings: Dict[str, float], stage: str):
+    """Record the wall-clock duration of a seeding stage."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = time.perf_counter() - start
+        logger.info(f"Stage '{stage}' took {timings[stage]:.2f}s")
+
+
 class DatabaseSeeder:
     """Seeds database with mechanisms from YAML files."""
 
@@ -136,42 +393,11 @@ class DatabaseSeeder:
 
     def passes_quality_filter(self, mech_data: Dict) -> bool:
         """Check if mechanism passes quality filter."""
-        if not self.min_quality:
-            return True
-
-        evidence = mech_data.get('evidence', {})
-        quality = evidence.get('quality_rating', 'C')
-
-        # Compare quality ratings (lower number = better quality)
-        mech_rank = QUALITY_HIERARCHY.get(quality.upper(), 3)
-        min_rank = QUALITY_HIERARCHY.get(self.min_quality.upper(), 3)
-
-        return mech_rank <= min_rank
+        return passes_quality_filter(mech_data, self.min_quality)
 
     def passes_topic_filter(self, mech_data: Dict) -> bool:
         """Check if mechanism passes topic filter."""
-        if not self.topic:
-            return True
-
-        keywords = TOPIC_KEYWORDS.get(self.topic.lower(), [])
-        if not keywords:
-            logger.warning(f"Unknown topic '{self.topic}'. Available: {list(TOPIC_KEYWORDS.keys())}")
-            return True
-
-        # Check mechanism ID, from_node, to_node, description
-        mech_id = mech_data.get('id', '').lower()
-        description = mech_data.get('description', '').lower()
-
-        # Extract node IDs
-        from_node_id, to_node_id = '', ''
-        if '_to_' in mech_id:
-            parts = mech_id.split('_to_')
-            from_node_id = parts[0].lower()
-            to_node_id = '_to_'.join(parts[1:]).lower()
-
-        # Check if any keyword matches
-        text_to_search = f"{mech_id} {from_node_id} {to_node_id} {description}"
-        return any(keyword in text_to_search for keyword in keywords)
+        return passes_topic_filter(mech_data, self.topic)
 
     def has_valid_node_references(self, mech_data: Dict) -> bool:
         """
@@ -284,12 +510,12 @@ class DatabaseSeeder:
         logger.info(f"Found {len(yaml_files)} node definition files")
         return yaml_files
 
-    def extract_scale_from_path(self, file_path: Path) -> int:
+    @staticmethod
+    def extract_scale_from_path(file_path: Path) -> int:
         """Extract scale level from node file path (e.g., scale_5_behaviors -> 5)."""
         path_str = str(file_path)
 
         # Look for scale_N pattern in path
-        import re
         match = re.search(r'scale_(\d+)', path_str)
         if match:
             return int(match.group(1))
@@ -300,21 +526,14 @@ class DatabaseSeeder:
     def load_node_from_yaml(self, session: Session, file_path: Path) -> Optional[Node]:
         """Load a node from a YAML definition file, including hierarchy data."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-
-            if not data or 'id' not in data:
+            row = parse_node_file(file_path)
+            if row is None:
                 return None
 
-            node_id = data.get('id')
-
-            # Extract hierarchy data if present
-            hierarchy = data.get('hierarchy', {})
-            parent_ids = hierarchy.get('parent_ids', [])
-            depth = hierarchy.get('depth', 0)
-            is_grouping_node = hierarchy.get('is_grouping_node', False)
+            node_id = row['id']
 
             # Store parent_ids for later junction table population
+            parent_ids = row.pop('parent_ids')
             if parent_ids:
                 self._pending_hierarchy[node_id] = parent_ids
 
@@ -323,30 +542,14 @@ class DatabaseSeeder:
             existing_node = session.execute(stmt).scalar_one_or_none()
 
             if existing_node:
-                # Update existing node with YAML data
-                existing_node.name = data.get('name', node_id.replace('_', ' ').title())
-                existing_node.scale = data.get('scale', self.extract_scale_from_path(file_path))
-                existing_node.category = data.get('category', 'built_environment')
-                existing_node.description = data.get('description', '')
-                existing_node.node_type = data.get('type', 'stock').lower()
-                # Update hierarchy fields
-                existing_node.depth = depth
-                existing_node.is_grouping_node = is_grouping_node
+                # Update existing node with YAML data (including hierarchy fields)
+                for field, value in row.items():
+                    setattr(existing_node, field, value)
                 self.nodes_cache[node_id] = existing_node
                 return existing_node
 
             # Create new node with hierarchy data
-            new_node = Node(
-                id=node_id,
-                name=data.get('name', node_id.replace('_', ' ').title()),
-                node_type=data.get('type', 'stock').lower(),
-                category=data.get('category', 'built_environment'),
-                scale=data.get('scale', self.extract_scale_from_path(file_path)),
-                description=data.get('description', ''),
-                # Hierarchy fields
-                depth=depth,
-                is_grouping_node=is_grouping_node
-            )
+            new_node = Node(**row)
 
             session.add(new_node)
             self.nodes_cache[node_id] = new_node
@@ -439,115 +642,22 @@ class DatabaseSeeder:
         """
         Compute all_ancestors and primary_path for all nodes.
 
-        Uses iterative approach to handle DAG structure.
+        Single topological pass over the junction table, written back in
+        one bulk UPDATE. Depth is kept as declared in the node YAML.
         """
         logger.info("Computing all_ancestors and primary_path for nodes...")
 
-        # Build parent lookup from junction table
-        from sqlalchemy import select as sql_select
-        stmt = sql_select(node_hierarchy.c.child_node_id, node_hierarchy.c.parent_node_id)
-        results = session.execute(stmt).fetchall()
-
-        child_to_parents: Dict[str, List[str]] = {}
-        for child_id, parent_id in results:
-            if child_id not in child_to_parents:
-                child_to_parents[child_id] = []
-            child_to_parents[child_id].append(parent_id)
-
-        # Get all nodes
-        all_nodes = session.query(Node).all()
-        node_dict = {n.id: n for n in all_nodes}
-
-        # Compute all_ancestors for each node using BFS
-        for node_id, node in node_dict.items():
-            ancestors = self._get_all_ancestors(node_id, child_to_parents)
-            node.all_ancestors = list(ancestors)
-
-            # Compute primary_path (using first parent at each level)
-            node.primary_path = self._compute_primary_path(node_id, child_to_parents)
-
-        session.commit()
-        logger.info(f"Computed hierarchy fields for {len(all_nodes)} nodes")
-
-    def _get_all_ancestors(
-        self,
-        node_id: str,
-        child_to_parents: Dict[str, List[str]],
-        visited: Optional[Set[str]] = None
-    ) -> Set[str]:
-        """Recursively get all ancestors of a node."""
-        if visited is None:
-            visited = set()
-
-        if node_id in visited:
-            return set()  # Cycle detection
-
-        visited.add(node_id)
-
-        parent_ids = child_to_parents.get(node_id, [])
-        ancestors = set(parent_ids)
-
-        for parent_id in parent_ids:
-            ancestors.update(self._get_all_ancestors(parent_id, child_to_parents, visited.copy()))
-
-        return ancestors
-
-    def _compute_primary_path(
-        self,
-        node_id: str,
-        child_to_parents: Dict[str, List[str]]
-    ) -> str:
-        """
-        Compute primary path for a node.
-
-        Uses first parent at each level to build canonical path.
-        Format: "root_id/parent_id/node_id"
-        """
-        path_parts = [node_id]
-
-        current_id = node_id
-        visited = {node_id}
-
-        while current_id in child_to_parents:
-            parents = child_to_parents[current_id]
-            if not parents:
-                break
-
-            # Use first parent (primary)
-            first_parent = parents[0]
-            if first_parent in visited:
-                break  # Cycle detected
-
-            visited.add(first_parent)
-            path_parts.insert(0, first_parent)
-            current_id = first_parent
-
-        return '/'.join(path_parts)
+        # Flush ORM state first so the bulk UPDATE isn't overwritten
+        session.flush()
+        updated = recompute_hierarchy_fields(session, Node, update_depth=False)
+        logger.info(f"Computed hierarchy fields for {updated} nodes")
 
     def parse_yaml_file(self, file_path: Path) -> Optional[Dict]:
         """Parse a single YAML file."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-
-                # Validate minimum required fields
-                if not data:
-                    logger.warning(f"Empty YAML file: {file_path.name}")
-                    return None
-
-                if 'id' not in data:
-                    logger.warning(f"Missing 'id' field in {file_path.name}")
-                    return None
-
-                return data
-        except yaml.YAMLError as e:
-            logger.warning(f"YAML syntax error in {file_path.name}: {e} - skipping")
-            return None
-        except Exception as e:
-            logger.warning(f"Error parsing {file_path.name}: {e} - skipping")
-            return None
+        return parse_yaml_file(file_path)
 
-    def infer_direction(self, mech_data: Dict) -> str:
+    @staticmethod
+    def infer_direction(mech_data: Dict) -> str:
         """Infer mechanism direction (positive/negative)."""
         # Check for explicit direction field
         direction = mech_data.get('direction', '').lower()
@@ -564,7 +674,8 @@ class DatabaseSeeder:
         # Default to positive
         return 'positive'
 
-    def parse_date(self, date_value) -> Optional[datetime]:
+    @staticmethod
+    def parse_date(date_value) -> Optional[datetime]:
         """Parse date string to datetime object."""
         if not date_value:
             return None
@@ -585,7 +696,8 @@ class DatabaseSeeder:
 
         return None
 
-    def get_node_ids_from_mechanism(self, mech_data: Dict) -> tuple[str, str]:
+    @staticmethod
+    def get_node_ids_from_mechanism(mech_data: Dict) -> Tuple[str, str]:
         """
         Extract from_node_id and to_node_id from mechanism data.
 
@@ -632,19 +744,7 @@ class DatabaseSeeder:
             return existing_node
 
         # Create new node from mechanism data
-        node_name = node_data.get('node_name', clean_node_id.replace('_', ' ').title())
-
-        # Use intelligent scale inference instead of defaulting to 4
-        inferred_scale = infer_scale_from_name(clean_node_id, node_name)
-
-        new_node = Node(
-            id=clean_node_id,
-            name=node_name,
-            node_type='stock',
-            category=category,
-            scale=inferred_scale,
-            description=''
-        )
+        new_node = Node(**build_stub_node_row(clean_node_id, node_data, category))
 
         session.add(new_node)
         # Flush to ensure the node is in the database before other queries try to find it
@@ -681,47 +781,11 @@ class DatabaseSeeder:
             category = mech_data.get('category', 'built_environment')
 
             # Get or create nodes dynamically
-            from_node_data = mech_data.get('from_node', {})
-            to_node_data = mech_data.get('to_node', {})
-
-            from_node = self.get_or_create_node(session, from_node_id, from_node_data, category)
-            to_node = self.get_or_create_node(session, to_node_id, to_node_data, category)
-
-            # Extract evidence data
-            evidence = mech_data.get('evidence', {})
-
-            # Clean node IDs for storage
-            clean_from_node_id = from_node_id.replace('NEW:', '')
-            clean_to_node_id = to_node_id.replace('NEW:', '')
+            self.get_or_create_node(session, from_node_id, mech_data.get('from_node', {}), category)
+            self.get_or_create_node(session, to_node_id, mech_data.get('to_node', {}), category)
 
             # Create mechanism
-            mechanism = Mechanism(
-                id=clean_mech_id,
-                name=mech_data.get('name', clean_mech_id),
-                from_node_id=clean_from_node_id,
-                to_node_id=clean_to_node_id,
-                direction=self.infer_direction(mech_data),
-                category=category,
-                mechanism_pathway=mech_data.get('mechanism_pathway', []),
-                evidence_quality=evidence.get('quality_rating', 'C'),
-                evidence_n_studies=evidence.get('n_studies', 1),
-                evidence_primary_citation=evidence.get('primary_citation', evidence.get('citation', 'No citation provided')).strip(),
-                evidence_supporting_citations=evidence.get('supporting_citations', []),
-                evidence_doi=evidence.get('doi'),
-                varies_by_geography=mech_data.get('varies_by_geography', False),
-                variation_notes=mech_data.get('variation_notes'),
-                relevant_geographies=mech_data.get('relevant_geographies', []),
-                moderators=mech_data.get('moderators', []),
-                structural_competency_root_cause=mech_data.get('structural_competency', {}).get('root_cause'),
-                structural_competency_avoids_victim_blaming=mech_data.get('structural_competency', {}).get('avoids_victim_blaming', True),
-                structural_competency_equity_implications=mech_data.get('structural_competency', {}).get('equity_implications'),
-                version=str(mech_data.get('version', '1.0')),
-                last_updated=self.parse_date(mech_data.get('last_updated')),
-                validated_by=mech_data.get('validated_by', []),
-                description=mech_data.get('description', '').strip(),
-                assumptions=mech_data.get('assumptions', []),
-                limitations=mech_data.get('limitations', [])
-            )
+            mechanism = Mechanism(**build_mechanism_row(mech_data))
 
             session.add(mechanism)
             logger.debug(f"Created mechanism: {mech_id}")
@@ -845,28 +909,7 @@ class DatabaseSeeder:
             # Final commit
             session.commit()
 
-            # Get final counts
-            total_nodes = session.query(Node).count()
-            total_mechanisms = session.query(Mechanism).count()
-            stats['nodes_created'] = total_nodes
-
-            logger.info("=" * 60)
-            logger.info("DATABASE SEEDING COMPLETE")
-            logger.info("=" * 60)
-            logger.info(f"Filters applied:")
-            logger.info(f"  - Quality: {self.min_quality or 'None'}")
-            logger.info(f"  - Topic: {self.topic or 'None'}")
-            logger.info("-" * 60)
-            logger.info(f"Mechanisms created: {stats['mechanisms_created']}")
-            logger.info(f"Nodes created: {total_nodes}")
-            logger.info(f"Mechanisms filtered (invalid refs): {stats['mechanisms_filtered_invalid_nodes']}")
-            logger.info(f"Mechanisms filtered (quality): {stats['mechanisms_filtered_quality']}")
-            logger.info(f"Mechanisms filtered (topic): {stats['mechanisms_filtered_topic']}")
-            logger.info(f"Files failed: {stats['files_failed']}")
-            logger.info("-" * 60)
-            logger.info(f"TOTAL nodes in database: {total_nodes}")
-            logger.info(f"TOTAL mechanisms in database: {total_mechanisms}")
-            logger.info("=" * 60)
+            self._log_summary(session, stats)
 
         except Exception as e:
             logger.error(f"Fatal error during seeding: {e}")
@@ -877,6 +920,240 @@ class DatabaseSeeder:
 
         return stats
 
+    def seed_bulk(
+        self,
+        skip_if_data_exists: bool = True,
+        workers: Optional[int] = None,
+        node_files: Optional[List[Path]] = None,
+        mechanism_files: Optional[List[Path]] = None,
+        bank: Optional[BankSnapshot] = None
+    ) -> Dict[str, int]:
+        """
+        Bulk seeding: same result as seed(), built for cold starts.
+
+        YAML files are parsed and validated across a process pool with the C
+        loader, then nodes, hierarchy rows and mechanisms are written with
+        batched executemany inserts in a single transaction. Per-stage
+        timings are logged and kept in self.stage_timings.
+
+        With a compiled bank snapshot (utils.bank_snapshot) the parse stage
+        decodes the snapshot instead of reading YAML.
+
+        Args:
+            skip_if_data_exists: If True, skip seeding if data already exists
+            workers: Parser processes (default: default_worker_count(); 1 parses inline)
+            node_files: Node YAML files (default: discovered under Nodes/by_scale/)
+            mechanism_files: Mechanism YAML files (default: discovered in mechanism-bank)
+            bank: Compiled bank snapshot to read instead of the YAML files
+
+        Returns:
+            Dictionary with counts of nodes and mechanisms created
+        """
+        stats = {
+            'nodes_from_yaml': 0,
+            'nodes_created': 0,
+            'mechanisms_created': 0,
+            'mechanisms_filtered_invalid_nodes': 0,
+            'mechanisms_filtered_quality': 0,
+            'mechanisms_filtered_topic': 0,
+            'files_processed': 0,
+            'files_failed': 0
+        }
+        timings: Dict[str, float] = {}
+        self.stage_timings = timings
+
+        session = self.SessionLocal()
+
+        try:
+            if skip_if_data_exists:
+                existing_count = session.query(Mechanism).count()
+                if existing_count > 0:
+                    logger.info(f"Database already contains {existing_count} mechanisms. Skipping seed.")
+                    return stats
+
+            if bank is not None:
+                with timed_stage(timings, 'parse'):
+                    node_rows, mechanism_results = self._load_from_snapshot(bank)
+            else:
+                with timed_stage(timings, 'discover'):
+                    if node_files is None:
+                        node_files = self.load_node_files()
+                    if mechanism_files is None:
+                        mechanism_files = self.load_mechanism_files()
+
+                with timed_stage(timings, 'parse'):
+                    node_rows, mechanism_results = self._parse_in_pool(node_files, mechanism_files, workers)
+
+            with timed_stage(timings, 'assemble'):
+                existing_nodes = set(session.scalars(select(Node.id)))
+                existing_mechanisms = set(session.scalars(select(Mechanism.id)))
+                existing_edges = set(session.execute(
+                    select(node_hierarchy.c.parent_node_id, node_hierarchy.c.child_node_id)
+                ).tuples())
+
+                # YAML nodes: later files override earlier ones, as in seed()
+                yaml_nodes: Dict[str, Dict] = {}
+                pending_hierarchy: Dict[str, List[str]] = {}
+                for row in node_rows:
+                    if row is None:
+                        continue
+                    parent_ids = row.pop('parent_ids')
+                    if parent_ids:
+                        pending_hierarchy[row['id']] = parent_ids
+                    yaml_nodes[row['id']] = row
+                stats['nodes_from_yaml'] = len(yaml_nodes)
+                self.valid_node_ids = set(yaml_nodes)
+
+                hierarchy_rows = []
+                for child_id, parent_ids in pending_hierarchy.items():
+                    for order_idx, parent_id in enumerate(parent_ids):
+                        if parent_id not in self.valid_node_ids:
+                            logger.warning(f"Skipping hierarchy: parent '{parent_id}' not found for child '{child_id}'")
+                            continue
+                        if (parent_id, child_id) in existing_edges:
+                            continue
+                        existing_edges.add((parent_id, child_id))
+                        hierarchy_rows.append({
+                            'parent_node_id': parent_id,
+                            'child_node_id': child_id,
+                            'relationship_type': 'contains',
+                            'order_index': order_idx,
+                        })
+
+                # Mechanisms in file order; referenced nodes missing from the bank become stubs
+                stub_nodes: Dict[str, Dict] = {}
+                mechanism_rows = []
+                for outcome, payload in mechanism_results:
+                    if outcome == 'failed':
+                        stats['files_failed'] += 1
+                        continue
+                    stats['files_processed'] += 1
+                    if outcome != 'ok':
+                        stats[f'mechanisms_filtered_{outcome}'] += 1
+                        continue
+
+                    row = payload['mechanism']
+                    if row['id'] in existing_mechanisms:
+                        logger.debug(f"Mechanism {row['id']} already exists, skipping")
+                        continue
+                    existing_mechanisms.add(row['id'])
+                    for stub in payload['nodes']:
+                        if stub['id'] not in yaml_nodes and stub['id'] not in existing_nodes:
+                            stub_nodes.setdefault(stub['id'], stub)
+                    mechanism_rows.append(row)
+                stats['mechanisms_created'] = len(mechanism_rows)
+                self.valid_node_ids |= set(stub_nodes)
+
+            with timed_stage(timings, 'insert_nodes'):
+                new_nodes = [r for r in yaml_nodes.values() if r['id'] not in existing_nodes]
+                changed_nodes = [r for r in yaml_nodes.values() if r['id'] in existing_nodes]
+                self._bulk_insert(session, Node.__table__, new_nodes + list(stub_nodes.values()))
+                if changed_nodes:
+                    session.execute(update(Node), changed_nodes)
+
+            with timed_stage(timings, 'insert_hierarchy'):
+                self._bulk_insert(session, node_hierarchy, hierarchy_rows)
+                stats['hierarchy_relationships'] = len(hierarchy_rows)
+
+            with timed_stage(timings, 'hierarchy_fields'):
+                recompute_hierarchy_fields(session, Node, update_depth=False, commit=False)
+
+            with timed_stage(timings, 'insert_mechanisms'):
+                self._bulk_insert(session, Mechanism.__table__, mechanism_rows)
+
+            with timed_stage(timings, 'commit'):
+                if new_nodes or stub_nodes or changed_nodes or hierarchy_rows or mechanism_rows:
+                    # Core inserts bypass the ORM hooks; tell running API workers
+                    graph_store.record_write(session)
+                session.commit()
+
+            self._log_summary(session, stats)
+            logger.info("Stage timings:")
+            for stage, seconds in timings.items():
+                logger.info(f"  {stage:<20} {seconds:8.2f}s")
+            logger.info(f"  {'total':<20} {sum(timings.values()):8.2f}s")
+
+        except Exception as e:
+            logger.error(f"Fatal error during bulk seeding: {e}")
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+        return stats
+
+    def _parse_in_pool(
+        self,
+        node_files: List[Path],
+        mechanism_files: List[Path],
+        workers: Optional[int]
+    ) -> Tuple[List[Optional[Dict]], List[Tuple[str, Optional[Dict]]]]:
+        """Parse node and mechanism files across a process pool (order preserved)."""
+        parse_mechanism = partial(parse_mechanism_file, min_quality=self.min_quality, topic=self.topic)
+        workers = workers or default_worker_count()
+
+        if workers == 1:
+            return [parse_node_file(f) for f in node_files], [parse_mechanism(f) for f in mechanism_files]
+
+        chunksize = max(1, (len(node_files) + len(mechanism_files)) // (workers * 8))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Submit both before collecting so the pool stays busy
+            nodes = pool.map(parse_node_file, node_files, chunksize=chunksize)
+            mechanisms = pool.map(parse_mechanism, mechanism_files, chunksize=chunksize)
+            return list(nodes), list(mechanisms)
+
+    def _load_from_snapshot(
+        self,
+        bank: BankSnapshot
+    ) -> Tuple[List[Optional[Dict]], List[Tuple[str, Optional[Dict]]]]:
+        """Node rows and mechanism results from a compiled bank snapshot."""
+        node_rows = [build_node_row(doc, Path(entry.path)) for entry, doc in bank.documents('node')]
+
+        mechanism_results = []
+        for entry in bank.entries('mechanism'):
+            # Same selection as load_mechanism_files(): top level of a valid category directory
+            parts = entry.path.split('/')
+            if len(parts) != 2 or parts[0] not in VALID_MECHANISM_CATEGORIES:
+                continue
+            if entry.error:
+                logger.warning(f"YAML syntax error in {parts[1]}: {entry.error} - skipping")
+            mechanism_results.append(
+                classify_mechanism(bank.document(entry), self.min_quality, self.topic)
+            )
+
+        logger.info(f"Loaded {len(node_rows)} nodes and {len(mechanism_results)} mechanisms from {bank.path}")
+        return node_rows, mechanism_results
+
+    @staticmethod
+    def _bulk_insert(session: Session, table, rows: List[Dict]) -> None:
+        """executemany inserts in BULK_BATCH_SIZE batches."""
+        for start in range(0, len(rows), BULK_BATCH_SIZE):
+            session.execute(insert(table), rows[start:start + BULK_BATCH_SIZE])
+
+    def _log_summary(self, session: Session, stats: Dict[str, int]) -> None:
+        """Log final counts (and record the node total in stats)."""
+        total_nodes = session.query(Node).count()
+        total_mechanisms = session.query(Mechanism).count()
+        stats['nodes_created'] = total_nodes
+
+        logger.info("=" * 60)
+        logger.info("DATABASE SEEDING COMPLETE")
+        logger.info("=" * 60)
+        logger.info(f"Filters applied:")
+        logger.info(f"  - Quality: {self.min_quality or 'None'}")
+        logger.info(f"  - Topic: {self.topic or 'None'}")
+        logger.info("-" * 60)
+        logger.info(f"Mechanisms created: {stats['mechanisms_created']}")
+        logger.info(f"Nodes created: {total_nodes}")
+        logger.info(f"Mechanisms filtered (invalid refs): {stats['mechanisms_filtered_invalid_nodes']}")
+        logger.info(f"Mechanisms filtered (quality): {stats['mechanisms_filtered_quality']}")
+        logger.info(f"Mechanisms filtered (topic): {stats['mechanisms_filtered_topic']}")
+        logger.info(f"Files failed: {stats['files_failed']}")
+        logger.info("-" * 60)
+        logger.info(f"TOTAL nodes in database: {total_nodes}")
+        logger.info(f"TOTAL mechanisms in database: {total_mechanisms}")
+        logger.info("=" * 60)
+
 
 def main():
     """Run database seeding with command-line options."""
@@ -900,6 +1177,12 @@ Examples:
   # Keep existing data (don't drop tables):
   python seed_database.py --no-drop
 
+  # Bulk mode for cold starts (compiled bank snapshot, batched inserts, stage timings):
+  python seed_database.py --bulk
+
+  # Bulk mode parsing the YAML files in parallel instead of the snapshot:
+  python seed_database.py --bulk --no-snapshot --workers 4
+
 Available topics: alcohol, housing, respiratory
 Quality ratings: A (best), B, C (lowest)
         """
@@ -929,6 +1212,25 @@ Quality ratings: A (best), B, C (lowest)
         help='Skip seeding if data already exists'
     )
 
+    parser.add_argument(
+        '--bulk',
+        action='store_true',
+        help='Parse files in parallel and insert in batches (one transaction)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help=f'Parser processes for --bulk (default: available CPUs, at most {MAX_DEFAULT_WORKERS})'
+    )
+
+    parser.add_argument(
+        '--no-snapshot',
+        action='store_true',
+        help='With --bulk, parse the YAML files instead of the compiled bank snapshot'
+    )
+
     args = parser.parse_args()
 
     logger.info("Starting database seeding process...")
@@ -944,7 +1246,21 @@ Quality ratings: A (best), B, C (lowest)
     seeder.init_tables(drop_existing=not args.no_drop)
 
     # Seed data
-    stats = seeder.seed(skip_if_data_exists=args.skip_if_exists)
+    if args.bulk:
+        bank = None
+        if not args.no_snapshot:
+            try:
+                # Recompiles only files changed since the last snapshot
+                bank = open_bank()
+            except OSError as e:
+                logger.warning(f"Bank snapshot unavailable ({e}); parsing YAML files")
+        try:
+            stats = seeder.seed_bulk(skip_if_data_exists=args.skip_if_exists, workers=args.workers, bank=bank)
+        finally:
+            if bank is not None:
+                bank.close()
+    else:
+        stats = seeder.seed(skip_if_data_exists=args.skip_if_exists)
 
     total_created = stats.get('nodes_created', 0) + stats.get('mechanisms_created', 0)
     if total_created > 0:
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Verify every DOI cited in the mechanism bank against Crossref.
+
+DOIs are collected from the compiled bank snapshot (see compile_bank.py),
+deduplicated, and resolved concurrently within Crossref's polite-pool
+limits. Results are kept in the local citation store, so reruns only query
+DOIs that are new (or were not found more than 30 days ago).
+
+Set CROSSREF_MAILTO to your email to use the polite pool.
+
+Usage:
+    # Audit the whole bank:
+    python verify_citations.py
+
+    # Write failures to a JSON report:
+    python verify_citations.py --output reports/citation_audit.json
+"""
+
+import sys
+import json
+import time
+import argparse
+from collections import defaultdict
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.bank_snapshot import open_bank
+from utils.citation_validation import CROSSREF_MAX_CONCURRENCY, CitationValidator
+
+
+def collect_dois(bank, validator: CitationValidator) -> dict:
+    """Cleaned DOI -> mechanism files citing it."""
+    citing = defaultdict(list)
+    for entry, mechanism in bank.documents("mechanism"):
+        if not isinstance(mechanism, dict):
+            continue
+        evidence = mechanism.get("evidence") or {}
+        for doi in (mechanism.get("doi"), evidence.get("doi") if isinstance(evidence, dict) else None):
+            if isinstance(doi, str) and validator.clean_doi(doi):
+                citing[validator.clean_doi(doi)].append(entry.path)
+    return citing
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verify mechanism bank DOIs against Crossref")
+    parser.add_argument("--workers", type=int, default=CROSSREF_MAX_CONCURRENCY, help="Concurrent requests")
+    parser.add_argument("--output", type=Path, help="Write failed DOIs (with citing files) as JSON")
+    args = parser.parse_args()
+
+    validator = CitationValidator()
+    with open_bank() as bank:
+        citing = collect_dois(bank, validator)
+    print(f"Found {sum(len(v) for v in citing.values())} DOI citations ({len(citing)} unique)")
+
+    start = time.perf_counter()
+    results = validator.verify_dois(citing, max_workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    failures = {doi: result for doi, result in results.items() if not result["valid"]}
+    print(f"Verified in {elapsed:.1f}s: {len(results) - len(failures)} valid, {len(failures)} failed")
+
+    errors = defaultdict(int)
+    for result in failures.values():
+        errors[result["error"]] += 1
+    for error, count in sorted(errors.items(), key=lambda item: -item[1]):
+        print(f"  {count:5d}  {error}")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        report = {
+            doi: {"error": result["error"], "mechanisms": citing[doi]}
+            for doi, result in sorted(failures.items())
+        }
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"Report: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
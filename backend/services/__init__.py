@@ -1 +1,15 @@
 """Business logic services."""
+
+from services.graph_store import GraphStore, graph_store
+from services.graph_csr import CSRGraph
+from services.centrality_index import CentralityIndex
+from services.graph_executor import GraphExecutor, graph_executor
+from services.path_search import PathSearchResult, ranked_simple_paths, strongest_evidence_path
+from services.response_cache import ResponseCache
+from services.yaml_loader import YamlLoader
+
+__all__ = [
+    "GraphStore", "graph_store", "CSRGraph", "CentralityIndex", "GraphExecutor", "graph_executor",
+    "PathSearchResult", "ranked_simple_paths", "strongest_evidence_path", "ResponseCache",
+    "YamlLoader",
+]
@@ -0,0 +1,168 @@
+"""
+Materialized node-centrality index.
+
+Centrality measures (betweenness in particular, O(V*E)) are far too expensive
+to recompute on every /api/nodes/importance request. The CentralityIndex keeps
+one precomputed table of per-node rows for each filter key (e.g. the selected
+category set), stamped with the graph version it was computed from.
+
+When the graph store is invalidated, a single background worker recomputes
+the keys that were recently requested so the next dashboard load reads fresh
+rows. Requests that find no row set for the current version compute it
+synchronously (once per key; concurrent requests wait for the same result).
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+import networkx as nx
+from sqlalchemy.orm import Session
+
+from services.graph_store import GraphStore
+
+logger = logging.getLogger(__name__)
+
+# compute(db, graph, key) -> list of per-node rows
+ComputeFn = Callable[[Session, nx.DiGraph, Hashable], List[Dict[str, Any]]]
+# graph_for_key(db, key) -> graph view to compute over
+GraphFn = Callable[[Session, Hashable], nx.DiGraph]
+
+
+@dataclass
+class IndexEntry:
+    """Precomputed rows for one filter key at one graph version."""
+    version: int
+    rows: List[Dict[str, Any]]
+
+
+class CentralityIndex:
+    """
+    Per-filter cache of precomputed centrality rows, refreshed on graph changes.
+    """
+
+    def __init__(
+        self,
+        store: GraphStore,
+        graph_for_key: GraphFn,
+        compute: ComputeFn,
+        session_factory: Optional[Callable[[], Session]] = None,
+        background_refresh: bool = True,
+        max_keys: int = 32
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            store: Graph store providing the graph and its version
+            graph_for_key: Returns the graph view a key is computed over
+            compute: Computes the per-node rows for a key
+            session_factory: Opens database sessions for background refreshes
+            background_refresh: Recompute warm keys when the graph changes
+            max_keys: Maximum number of filter keys kept (LRU)
+        """
+        self.store = store
+        self.graph_for_key = graph_for_key
+        self.compute = compute
+        self.session_factory = session_factory
+        self.background_refresh = background_refresh and session_factory is not None
+        self.max_keys = max_keys
+
+        self._entries: "OrderedDict[Hashable, IndexEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        if self.background_refresh:
+            store.subscribe(self._on_graph_changed)
+
+    def get_rows(self, db: Session, key: Hashable) -> List[Dict[str, Any]]:
+        """
+        Return precomputed rows for a key, computing them if missing or stale.
+
+        Args:
+            db: Database session (used only if the rows must be computed)
+            key: Hashable filter key
+
+        Returns:
+            List of per-node rows (shared; do not mutate)
+        """
+        self.store.sync(db)
+        entry = self._fresh_entry(key)
+        if entry is not None:
+            return entry.rows
+
+        with self._key_lock(key):
+            # Another request may have computed it while we waited
+            entry = self._fresh_entry(key)
+            if entry is not None:
+                return entry.rows
+            return self._refresh_key(db, key).rows
+
+    def clear(self) -> None:
+        """Drop all precomputed rows."""
+        with self._lock:
+            self._entries.clear()
+
+    def _fresh_entry(self, key: Hashable) -> Optional[IndexEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.version == self.store.version:
+                self._entries.move_to_end(key)
+                return entry
+        return None
+
+    def _key_lock(self, key: Hashable) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _refresh_key(self, db: Session, key: Hashable) -> IndexEntry:
+        """Compute and store rows for a key at the current graph version."""
+        version = self.store.version
+        G = self.graph_for_key(db, key)
+        entry = IndexEntry(version=version, rows=self.compute(db, G, key))
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_keys:
+                evicted, _ = self._entries.popitem(last=False)
+                self._key_locks.pop(evicted, None)
+
+        return entry
+
+    def _on_graph_changed(self, version: int) -> None:
+        """Graph store listener: schedule a recompute of warm keys."""
+        with self._lock:
+            if not self._entries:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="centrality-index"
+                )
+        self._executor.submit(self._refresh_warm_keys, version)
+
+    def _refresh_warm_keys(self, version: int) -> None:
+        """Recompute every cached key (runs on the background worker)."""
+        if version != self.store.version:
+            return  # Superseded by a newer invalidation
+
+        with self._lock:
+            keys = list(self._entries.keys())
+
+        db = self.session_factory()
+        try:
+            for key in reversed(keys):  # Most recently used first
+                if version != self.store.version:
+                    return
+                with self._key_lock(key):
+                    if self._fresh_entry(key) is None:
+                        self._refresh_key(db, key)
+            logger.info(f"Centrality index refreshed {len(keys)} keys (version={version})")
+        except Exception as e:
+            logger.error(f"Centrality index refresh failed: {e}")
+        finally:
+            db.close()
@@ -0,0 +1,249 @@
+"""
+Compressed sparse (CSR/CSC) representation of the mechanism graph.
+
+Traversals over the NetworkX graph visit one node at a time through Python
+dicts. CSRGraph maps node IDs to dense integers and stores adjacency as NumPy
+offset/target arrays in both directions (CSR for successors, CSC for
+predecessors), plus per-edge attribute columns. Breadth-first search then
+expands a whole frontier per hop with array operations, for any number of
+seed nodes at once.
+
+Usage:
+    csr = graph_store.csr(db)
+    mask = csr.edge_mask(min_strength=2, categories=["economic"])
+    dist = csr.multi_source_bfs(["mortality"], max_hops=4, reverse=True, edge_mask=mask)
+    reached = csr.nodes_within(dist)
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import networkx as nx
+import numpy as np
+
+DIRECTION_CODES = {'positive': 1, 'negative': -1}
+
+
+class CSRGraph:
+    """
+    Immutable integer-indexed adjacency for a directed mechanism graph.
+
+    Attributes:
+        node_ids: Node ID for each integer index
+        index: Node ID -> integer index
+        edge_source, edge_target: Endpoint indices per edge (int32)
+        edge_strength: Evidence strength per edge (A=3, B=2, C=1, unknown=0)
+        edge_direction: +1 positive, -1 negative, 0 unknown
+        edge_category: Integer category code per edge (see ``categories``)
+        edge_attrs: Original edge attribute dicts (for building responses)
+        out_indptr, out_edges: CSR offsets and edge ids ordered by source
+        in_indptr, in_edges: CSC offsets and edge ids ordered by target
+    """
+
+    def __init__(self, node_ids: List[str], sources: List[int], targets: List[int],
+                 edge_attrs: List[Dict[str, Any]]):
+        """
+        Build CSR/CSC arrays from an edge list.
+
+        Args:
+            node_ids: Node ID for each integer index
+            sources: Source index per edge
+            targets: Target index per edge
+            edge_attrs: Attribute dict per edge
+        """
+        self.node_ids = node_ids
+        self.index = {node_id: i for i, node_id in enumerate(node_ids)}
+        n = len(node_ids)
+
+        self.edge_source = np.asarray(sources, dtype=np.int32)
+        self.edge_target = np.asarray(targets, dtype=np.int32)
+        self.edge_attrs = edge_attrs
+
+        strength_map = {'A': 3, 'B': 2, 'C': 1}
+        self.edge_strength = np.array(
+            [strength_map.get(a.get('evidence_quality'), 0) for a in edge_attrs], dtype=np.int8
+        )
+        self.edge_direction = np.array(
+            [DIRECTION_CODES.get(a.get('direction'), 0) for a in edge_attrs], dtype=np.int8
+        )
+        self.categories: List[Optional[str]] = sorted(
+            {a.get('category') for a in edge_attrs}, key=lambda c: (c is None, c or '')
+        )
+        category_codes = {c: i for i, c in enumerate(self.categories)}
+        self.edge_category = np.array(
+            [category_codes[a.get('category')] for a in edge_attrs], dtype=np.int32
+        )
+
+        # CSR (by source) and CSC (by target): stable sort keeps edge order within a node
+        self.out_edges = np.argsort(self.edge_source, kind='stable').astype(np.int32)
+        self.out_indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.edge_source, minlength=n), out=self.out_indptr[1:])
+
+        self.in_edges = np.argsort(self.edge_target, kind='stable').astype(np.int32)
+        self.in_indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.edge_target, minlength=n), out=self.in_indptr[1:])
+
+    @classmethod
+    def from_graph(cls, G: nx.DiGraph) -> "CSRGraph":
+        """
+        Build a CSRGraph from a NetworkX DiGraph.
+
+        Args:
+            G: Directed graph with mechanism edge attributes
+
+        Returns:
+            CSRGraph with the same nodes and edges
+        """
+        return cls.from_edge_list(list(G.nodes()), G.edges(data=True))
+
+    @classmethod
+    def from_edge_list(cls, node_ids: List[str],
+                       edges: Iterable[Tuple[str, str, Dict[str, Any]]]) -> "CSRGraph":
+        """
+        Build a CSRGraph from (source, target, attrs) triples.
+
+        Parallel edges are kept, e.g. one per mechanism when several
+        mechanisms connect the same pair of nodes.
+
+        Args:
+            node_ids: Node IDs (every edge endpoint must be listed)
+            edges: Edge triples
+
+        Returns:
+            CSRGraph with one edge per triple, in order
+        """
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        sources, targets, attrs = [], [], []
+        for u, v, data in edges:
+            sources.append(index[u])
+            targets.append(index[v])
+            attrs.append(data)
+        return cls(node_ids, sources, targets, attrs)
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.edge_attrs)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self.index
+
+    def edge_mask(self, min_strength: Optional[int] = None,
+                  categories: Optional[Iterable[str]] = None) -> Optional[np.ndarray]:
+        """
+        Boolean mask of edges passing evidence-strength and category filters.
+
+        Args:
+            min_strength: Minimum evidence strength (1=C, 2=B, 3=A)
+            categories: Only include edges in these categories
+
+        Returns:
+            Boolean array over edges, or None if no filter applies
+        """
+        if not min_strength and not categories:
+            return None
+
+        mask = np.ones(self.num_edges, dtype=bool)
+        if min_strength:
+            mask &= self.edge_strength >= min_strength
+        if categories:
+            codes = [i for i, c in enumerate(self.categories) if c in set(categories)]
+            mask &= np.isin(self.edge_category, codes)
+        return mask
+
+    def incident_nodes(self, edge_mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Boolean mask of nodes touching at least one (masked) edge.
+
+        Args:
+            edge_mask: Optional edge mask
+
+        Returns:
+            Boolean array over nodes
+        """
+        present = np.zeros(self.num_nodes, dtype=bool)
+        if edge_mask is None:
+            present[self.edge_source] = True
+            present[self.edge_target] = True
+        else:
+            present[self.edge_source[edge_mask]] = True
+            present[self.edge_target[edge_mask]] = True
+        return present
+
+    def multi_source_bfs(
+        self,
+        seeds: Iterable[str],
+        max_hops: Optional[int] = None,
+        reverse: bool = False,
+        edge_mask: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Breadth-first search from many seed nodes at once.
+
+        Each hop gathers the adjacency ranges of the whole frontier with one
+        vectorized operation, so the cost is proportional to the number of
+        hops rather than the number of visited nodes.
+
+        Args:
+            seeds: Seed node IDs (unknown IDs are ignored)
+            max_hops: Maximum hops to traverse (None = unlimited)
+            reverse: Follow edges backwards (predecessors) instead of forwards
+            edge_mask: Only traverse edges where the mask is True
+
+        Returns:
+            int32 array of hop distance to the nearest seed per node (-1 = unreached)
+        """
+        indptr, edges = (self.in_indptr, self.in_edges) if reverse else (self.out_indptr, self.out_edges)
+        neighbor_of = self.edge_source if reverse else self.edge_target
+
+        dist = np.full(self.num_nodes, -1, dtype=np.int32)
+        frontier = np.unique(np.array(
+            [self.index[s] for s in seeds if s in self.index], dtype=np.int32
+        ))
+        dist[frontier] = 0
+
+        hop = 0
+        while frontier.size and (max_hops is None or hop < max_hops):
+            starts = indptr[frontier]
+            counts = indptr[frontier + 1] - starts
+            total = int(counts.sum())
+            if total == 0:
+                break
+
+            # Concatenate the ranges [start, start + count) of every frontier node
+            offsets = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+            edge_ids = edges[offsets]
+            if edge_mask is not None:
+                edge_ids = edge_ids[edge_mask[edge_ids]]
+
+            neighbors = neighbor_of[edge_ids]
+            neighbors = np.unique(neighbors[dist[neighbors] < 0])
+
+            hop += 1
+            dist[neighbors] = hop
+            frontier = neighbors
+
+        return dist
+
+    def nodes_within(self, dist: np.ndarray) -> Set[str]:
+        """Node IDs reached by a BFS (distance >= 0)."""
+        return {self.node_ids[i] for i in np.flatnonzero(dist >= 0)}
+
+    def edges_within(self, node_mask: np.ndarray,
+                     edge_mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Edge ids whose endpoints both lie in a node set.
+
+        Args:
+            node_mask: Boolean array over nodes
+            edge_mask: Optional additional edge filter
+
+        Returns:
+            Array of edge ids
+        """
+        selected = node_mask[self.edge_source] & node_mask[self.edge_target]
+        if edge_mask is not None:
+            selected &= edge_mask
+        return np.flatnonzero(selected)
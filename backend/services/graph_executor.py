@@ -0,0 +1,72 @@
+"""
+Dedicated executor for CPU-bound graph work.
+
+Async routes must not run NetworkX/NumPy computations on the event loop, and
+running them on the default threadpool lets a few slow graph requests starve
+every other sync dependency and route. Graph endpoints instead submit their
+computation to this bounded pool, so the event loop stays free to serve
+database-bound requests while at most ``max_workers`` graph computations run
+at once.
+
+Threads (not processes) are used because the computations read the shared,
+in-memory GraphStore graph, which would otherwise have to be pickled to each
+worker.
+
+Usage:
+    from services.graph_executor import graph_executor
+
+    result = await graph_executor.run(compute_fn, db, arg, key=value)
+"""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from api.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class GraphExecutor:
+    """
+    Bounded thread pool for graph computations, awaitable from async routes.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        """
+        Initialize the executor (threads are started lazily).
+
+        Args:
+            max_workers: Maximum concurrent graph computations
+        """
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking function on the pool and await its result.
+
+        Args:
+            fn: Function to run
+            *args, **kwargs: Arguments for fn
+
+        Returns:
+            The function's return value (exceptions propagate)
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="graph-executor"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    def shutdown(self) -> None:
+        """Stop the worker threads (pending tasks are cancelled)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+graph_executor = GraphExecutor(max_workers=settings.graph_executor_workers)
@@ -0,0 +1,579 @@
+"""
+Process-wide cache of the causal mechanism graph.
+
+The mechanism graph is read by every graph endpoint (importance, pathfinding,
+focal subgraph, crisis subgraph) but only changes when mechanisms or nodes are
+written. Rather than rebuilding a NetworkX DiGraph from a full table scan on
+every request, the GraphStore builds it once, stamps it with a version number
+and hands out read-only filtered views until it is invalidated.
+
+Duplicate (from, to) pairs are collapsed into one DiGraph edge, so each
+mechanism is also kept as its own record: filtered views and the CSR arrays
+apply category/evidence filters per mechanism before collapsing.
+
+Any ORM commit that inserts, updates or deletes a Mechanism or Node
+invalidates the shared store automatically (see ``_track_graph_writes``).
+Core-level writes (bulk ``insert()``/``delete()`` statements, raw SQL) must
+call ``graph_store.record_write(db)`` before committing.
+
+Several API workers each hold their own graph. Every graph write also bumps
+the ``mechanisms`` row of the ``graph_versions`` table in the same
+transaction; ``sync()`` (run by every reader that has a session, at most
+once per ``version_check_interval``) invalidates the local graph when
+another worker has bumped it.
+
+Usage:
+    from services.graph_store import graph_store
+
+    G = graph_store.view(db, only_categories=["economic"], min_evidence="B")
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Optional, Tuple, Union
+
+import networkx as nx
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from api.config import settings
+from models.mechanism import GraphVersion, Mechanism, Node
+from services.graph_csr import CSRGraph
+
+logger = logging.getLogger(__name__)
+
+# Map evidence quality to numeric weight (A=3, B=2, C=1)
+EVIDENCE_WEIGHTS = {'A': 3, 'B': 2, 'C': 1}
+
+ViewKey = Tuple[Optional[FrozenSet[str]], Optional[FrozenSet[str]], int]
+MechanismEdge = Tuple[str, str, Dict[str, Any]]
+
+# graph_versions row bumped on every mechanism/node write
+GRAPH_VERSION_NAME = "mechanisms"
+
+
+# ==========================================
+# Shared version stamps (graph_versions table)
+# ==========================================
+
+def read_shared_version(
+    db: Union[Session, Connection],
+    name: str = GRAPH_VERSION_NAME,
+    default: Optional[int] = 0
+) -> Optional[int]:
+    """
+    Current value of a shared version stamp.
+
+    Args:
+        db: Session or connection
+        name: Stamp name
+        default: Returned if the stamp was never written
+
+    Returns:
+        Stored version
+    """
+    table = GraphVersion.__table__
+    value = db.execute(select(table.c.version).where(table.c.name == name)).scalar()
+    return default if value is None else value
+
+
+def lock_shared_version(db: Session, name: str) -> int:
+    """
+    Row-lock a stamp until the session's transaction ends.
+
+    Serializes work keyed on the stamp (e.g. table rebuilds) across
+    workers on databases with row locks (PostgreSQL); SQLite serializes
+    writers by itself. A missing stamp is created with version -1; if
+    another worker creates it concurrently, the transaction is rolled back
+    before locking, so call this before making any changes.
+
+    Args:
+        db: Database session
+        name: Stamp name
+
+    Returns:
+        The stamp's version once the lock is held
+    """
+    table = GraphVersion.__table__
+    locked = select(table.c.version).where(table.c.name == name).with_for_update()
+    value = db.execute(locked).scalar()
+    if value is None:
+        try:
+            db.execute(insert(table).values(name=name, version=-1))
+        except IntegrityError:
+            db.rollback()
+        value = db.execute(locked).scalar()
+    return value
+
+
+def write_shared_version(db: Union[Session, Connection], name: str, version: int) -> None:
+    """
+    Set a shared version stamp in the caller's transaction.
+
+    Args:
+        db: Session or connection
+        name: Stamp name
+        version: Value to store
+    """
+    table = GraphVersion.__table__
+    result = db.execute(update(table).where(table.c.name == name).values(version=version))
+    if result.rowcount == 0:
+        db.execute(insert(table).values(name=name, version=version))
+
+
+def bump_shared_version(db: Union[Session, Connection], name: str = GRAPH_VERSION_NAME) -> int:
+    """
+    Increment a shared version stamp in the caller's transaction.
+
+    The UPDATE row-locks the stamp until commit, so concurrent writers get
+    distinct versions.
+
+    Args:
+        db: Session or connection
+        name: Stamp name
+
+    Returns:
+        The new version
+    """
+    table = GraphVersion.__table__
+    result = db.execute(update(table).where(table.c.name == name).values(version=table.c.version + 1))
+    if result.rowcount == 0:
+        db.execute(insert(table).values(name=name, version=1))
+    return read_shared_version(db, name)
+
+
+class GraphStore:
+    """
+    Versioned, in-memory mechanism graph shared by all requests.
+
+    The full graph is built lazily (or eagerly at startup via ``build()``)
+    and replaced atomically on rebuild, so readers never observe a partially
+    built graph. Filtered views are NetworkX subgraph views over the shared
+    graph and are memoized per filter combination for the current version,
+    as are derived results registered through ``memoize()``.
+    """
+
+    def __init__(
+        self,
+        max_cached_views: int = 64,
+        max_cached_results: int = 256,
+        version_check_interval: Optional[float] = 1.0
+    ):
+        """
+        Initialize an empty graph store.
+
+        Args:
+            max_cached_views: Maximum number of filtered views kept per version
+            max_cached_results: Maximum number of memoized results kept per version
+            version_check_interval: Seconds between checks of the shared version
+                stamp (None = never check; writes in other processes go unseen)
+        """
+        self._graph: Optional[nx.DiGraph] = None
+        self._mechanisms: List[MechanismEdge] = []
+        self._csr: Optional[CSRGraph] = None
+        self._built_version: int = -1
+        self._version: int = 0
+        self._lock = threading.Lock()
+        self._views: "OrderedDict[ViewKey, nx.DiGraph]" = OrderedDict()
+        self._max_cached_views = max_cached_views
+        self._results: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._max_cached_results = max_cached_results
+        self._listeners: List[Callable[[int], None]] = []
+        self.version_check_interval = version_check_interval
+        self._shared_version: Optional[int] = None
+        self._checked_at = float("-inf")
+
+    @property
+    def version(self) -> int:
+        """Current graph version (process-local; bumped on every invalidation)."""
+        return self._version
+
+    @property
+    def shared_version(self) -> Optional[int]:
+        """Last shared (database) version seen by this process, if any."""
+        return self._shared_version
+
+    @property
+    def is_built(self) -> bool:
+        """Whether the cached graph matches the current version."""
+        return self._graph is not None and self._built_version == self._version
+
+    def invalidate(self, shared_version: Optional[int] = None) -> int:
+        """
+        Mark the cached graph as stale.
+
+        Writes normally reach this through the commit hooks; call it directly
+        only to drop the local graph. The next reader rebuilds the graph from
+        the database.
+
+        Args:
+            shared_version: Shared version stamp written by the invalidating
+                commit, so ``sync()`` doesn't invalidate again for it
+
+        Returns:
+            The new graph version
+        """
+        with self._lock:
+            self._version += 1
+            self._views.clear()
+            self._results.clear()
+            if shared_version is not None:
+                self._shared_version = shared_version
+            version = self._version
+
+        logger.info(f"Graph store invalidated (version={version})")
+
+        for listener in list(self._listeners):
+            try:
+                listener(version)
+            except Exception as e:
+                logger.error(f"Graph store listener failed: {e}")
+
+        return version
+
+    def subscribe(self, listener: Callable[[int], None]) -> None:
+        """
+        Register a callback invoked with the new version after each invalidation.
+
+        Args:
+            listener: Callable receiving the new graph version
+        """
+        self._listeners.append(listener)
+
+    def record_write(self, db: Session) -> None:
+        """
+        Register a Core-level graph write in the session's transaction.
+
+        Bumps the shared version stamp now (rolled back with the transaction)
+        and invalidates this store when the session commits. ORM writes to
+        Mechanism/Node are registered automatically.
+
+        Args:
+            db: Session performing the write (before commit)
+        """
+        _register_write(db, self)
+
+    @property
+    def sync_due(self) -> bool:
+        """Whether the next ``sync()`` will read the shared version stamp."""
+        return (self.version_check_interval is not None
+                and time.monotonic() - self._checked_at >= self.version_check_interval)
+
+    def sync(self, db: Session) -> None:
+        """
+        Invalidate the local graph if another process changed the database.
+
+        Reads the shared version stamp at most once per
+        ``version_check_interval``.
+
+        Args:
+            db: Database session
+        """
+        if self.version_check_interval is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if now - self._checked_at < self.version_check_interval:
+                return
+            self._checked_at = now
+
+        shared = read_shared_version(db)
+        with self._lock:
+            changed = self._shared_version is not None and shared != self._shared_version
+            self._shared_version = shared
+        if changed:
+            logger.info(f"Graph changed in another process (shared version={shared})")
+            self.invalidate()
+
+    def build(self, db: Session) -> nx.DiGraph:
+        """
+        Build the full graph from the database and cache it.
+
+        Args:
+            db: Database session
+
+        Returns:
+            The freshly built full graph
+        """
+        with self._lock:
+            version = self._version
+
+        # Read the stamp first: a write landing after it is caught by the next sync()
+        shared = read_shared_version(db) if self.version_check_interval is not None else None
+
+        rows = db.query(
+            Mechanism.id,
+            Mechanism.name,
+            Mechanism.from_node_id,
+            Mechanism.to_node_id,
+            Mechanism.evidence_quality,
+            Mechanism.direction,
+            Mechanism.category,
+        ).order_by(Mechanism.id).all()
+
+        mechanisms: List[MechanismEdge] = []
+        for mechanism_id, name, from_id, to_id, evidence_quality, direction, category in rows:
+            mechanisms.append((from_id, to_id, {
+                'mechanism_id': mechanism_id,
+                'name': name,
+                'weight': EVIDENCE_WEIGHTS.get(evidence_quality, 1),
+                'cost': 1.0 / EVIDENCE_WEIGHTS.get(evidence_quality, 1),
+                'direction': direction,
+                'category': category,
+                'evidence_quality': evidence_quality,
+            }))
+
+        # One edge per (from, to) pair: the mechanism with the highest ID wins
+        G = nx.DiGraph()
+        for from_id, to_id, data in mechanisms:
+            G.add_edge(from_id, to_id, **data)
+
+        # Node scales (1 = policy ... 7 = crisis) for heuristic path search
+        for node_id, scale in db.query(Node.id, Node.scale).all():
+            if node_id in G:
+                G.nodes[node_id]['scale'] = scale
+        G.graph['max_scale_step'] = self._max_scale_step(G)
+        # Shared version the graph reflects (at least), for tables derived from it
+        G.graph['shared_version'] = shared
+
+        nx.freeze(G)
+
+        with self._lock:
+            # Only publish if no writer invalidated the graph while we were reading
+            if version == self._version:
+                self._graph = G
+                self._mechanisms = mechanisms
+                self._csr = None
+                self._built_version = version
+                self._views.clear()
+                if shared is not None:
+                    self._shared_version = shared
+                    self._checked_at = time.monotonic()
+
+        logger.info(
+            f"Graph store built (version={version}, nodes={G.number_of_nodes()}, "
+            f"edges={G.number_of_edges()})"
+        )
+        return G
+
+    @staticmethod
+    def _max_scale_step(G: nx.DiGraph) -> Optional[int]:
+        """
+        Largest scale difference spanned by a single edge.
+
+        Returns None if any edge touches a node without a scale, in which case
+        scale distance gives no lower bound on path length.
+        """
+        max_step = 0
+        for u, v in G.edges():
+            scale_u = G.nodes[u].get('scale')
+            scale_v = G.nodes[v].get('scale')
+            if scale_u is None or scale_v is None:
+                return None
+            max_step = max(max_step, abs(scale_u - scale_v))
+        return max_step
+
+    def get_graph(self, db: Session) -> nx.DiGraph:
+        """
+        Return the full (read-only) graph, rebuilding it if stale.
+
+        Args:
+            db: Database session used if a rebuild is needed
+
+        Returns:
+            Frozen NetworkX DiGraph of all mechanisms
+        """
+        self.sync(db)
+        with self._lock:
+            if self._graph is not None and self._built_version == self._version:
+                return self._graph
+        return self.build(db)
+
+    def csr(self, db: Session) -> CSRGraph:
+        """
+        Return the CSR/CSC array form of the full graph for the current version.
+
+        Unlike the DiGraph, the arrays hold one edge per mechanism, so
+        per-edge filters see every mechanism of a duplicated pair.
+
+        Args:
+            db: Database session used if a rebuild is needed
+
+        Returns:
+            CSRGraph built from the cached mechanisms
+        """
+        G = self.get_graph(db)
+        with self._lock:
+            if self._csr is not None and self._graph is G:
+                return self._csr
+            mechanisms = self._mechanisms if self._graph is G else None
+
+        if mechanisms is None:
+            # Invalidated meanwhile; this graph is still consistent on its own
+            csr = CSRGraph.from_graph(G)
+        else:
+            csr = CSRGraph.from_edge_list(list(G.nodes()), mechanisms)
+        with self._lock:
+            if self._graph is G:
+                self._csr = csr
+        return csr
+
+    def view(
+        self,
+        db: Session,
+        exclude_categories: Optional[List[str]] = None,
+        only_categories: Optional[List[str]] = None,
+        min_evidence: Optional[str] = None
+    ) -> nx.DiGraph:
+        """
+        Return a read-only filtered view of the graph.
+
+        Nodes only appear in the view if at least one of their mechanisms
+        passes the category filters, matching the behaviour of building a
+        graph from the filtered mechanism query. Filters apply to individual
+        mechanisms before duplicate (from, to) pairs are collapsed, so a pair
+        is present whenever any of its mechanisms qualifies.
+
+        Args:
+            db: Database session used if a rebuild is needed
+            exclude_categories: Categories to exclude from graph
+            only_categories: Only include these categories
+            min_evidence: Minimum evidence quality (A, B or C)
+
+        Returns:
+            Frozen NetworkX DiGraph (do not mutate)
+        """
+        G = self.get_graph(db)
+
+        min_weight = EVIDENCE_WEIGHTS.get(min_evidence, 0) if min_evidence else 0
+        excluded = frozenset(exclude_categories) if exclude_categories else None
+        included = frozenset(only_categories) if only_categories else None
+
+        if excluded is None and included is None and min_weight == 0:
+            return G
+
+        key: ViewKey = (excluded, included, min_weight)
+        with self._lock:
+            cached = self._views.get(key)
+            if cached is not None and self._graph is G:
+                self._views.move_to_end(key)
+                return cached
+            mechanisms = self._mechanisms if self._graph is G else None
+
+        if mechanisms is None:
+            # Invalidated meanwhile: filter this graph's (collapsed) edges
+            mechanisms = list(G.edges(data=True))
+
+        # Node membership follows the category filters only; the evidence
+        # threshold removes edges but keeps their endpoints, so a node whose
+        # mechanisms are all weak is still present (just disconnected).
+        nodes = set()
+        edges: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for u, v, data in mechanisms:
+            if excluded is not None and data['category'] in excluded:
+                continue
+            if included is not None and data['category'] not in included:
+                continue
+            nodes.add(u)
+            nodes.add(v)
+            if min_weight == 0 or self._edge_strength(data) >= min_weight:
+                edges[(u, v)] = data  # Same precedence as the full graph
+
+        subgraph = nx.DiGraph()
+        subgraph.graph.update(G.graph)
+        subgraph.add_nodes_from((n, G.nodes[n]) for n in G if n in nodes)
+        subgraph.add_edges_from((u, v, data) for (u, v), data in edges.items())
+        subgraph.graph['max_scale_step'] = self._max_scale_step(subgraph)
+        nx.freeze(subgraph)
+
+        with self._lock:
+            if self._graph is G:
+                self._views[key] = subgraph
+                if len(self._views) > self._max_cached_views:
+                    self._views.popitem(last=False)
+
+        return subgraph
+
+    def memoize(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return a result derived from the graph, computing it once per version.
+
+        Results are dropped on invalidation. A result computed while the graph
+        was invalidated is returned but not cached.
+
+        Args:
+            key: Hashable key identifying the computation and its parameters
+            compute: Zero-argument function producing the result
+
+        Returns:
+            The cached or freshly computed result (shared; do not mutate)
+        """
+        with self._lock:
+            version = self._version
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key]
+
+        result = compute()
+
+        with self._lock:
+            if version == self._version:
+                self._results[key] = result
+                if len(self._results) > self._max_cached_results:
+                    self._results.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _edge_strength(data: Dict) -> int:
+        """Numeric evidence strength of an edge (unknown quality = 0)."""
+        return EVIDENCE_WEIGHTS.get(data.get('evidence_quality'), 0)
+
+
+# Shared instance used by the API process
+graph_store = GraphStore(version_check_interval=settings.graph_version_check_interval)
+
+
+# ==========================================
+# Automatic invalidation on ORM writes
+# ==========================================
+
+_GRAPH_MODELS = (Mechanism, Node)
+_DIRTY_KEY = "graph_store_dirty"  # Stores to invalidate on commit
+_STAMP_KEY = "graph_store_stamp"  # Shared version written by this transaction
+
+
+def _register_write(session: Session, store: GraphStore) -> None:
+    """Bump the shared stamp (once per transaction) and queue the store for invalidation."""
+    if _STAMP_KEY not in session.info:
+        session.info[_STAMP_KEY] = bump_shared_version(session.connection())
+    stores = session.info.setdefault(_DIRTY_KEY, [])
+    if store not in stores:
+        stores.append(store)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_graph_writes(session: Session, flush_context) -> None:
+    """Register the transaction as a graph write if the flush touched mechanisms or nodes."""
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, _GRAPH_MODELS):
+            _register_write(session, graph_store)
+            return
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session: Session) -> None:
+    """Invalidate the registered stores once a graph write commits."""
+    stamp = session.info.pop(_STAMP_KEY, None)
+    for store in session.info.pop(_DIRTY_KEY, []):
+        store.invalidate(shared_version=stamp)
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_on_rollback(session: Session) -> None:
+    """Discard the write registration when the transaction is rolled back."""
+    session.info.pop(_DIRTY_KEY, None)
+    session.info.pop(_STAMP_KEY, None)
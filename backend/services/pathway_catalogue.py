@@ -0,0 +1,334 @@
+"""
+Persisted catalogue of curated intervention -> outcome pathways.
+
+Pathways used to be rediscovered with an unbounded DFS over every
+intervention x outcome pair on each /api/pathways request. The
+PathwayCatalogue instead computes them once per graph version, stores them
+in the ``pathways`` table and lets the routes serve indexed lookups.
+
+When the graph store is invalidated, a single background worker rebuilds
+the table. Requests that find the catalogue behind the current graph
+version rebuild it synchronously (once; concurrent requests wait).
+
+The table is shared by every API worker, so the shared graph version it
+was built from is stored in the ``pathways`` row of ``graph_versions``.
+A worker whose graph matches that stamp (e.g. after a restart, or after
+another worker rebuilt) adopts the table without recomputing it, and
+rebuilds hold a lock on the stamp row so only one worker rewrites the
+table at a time.
+
+Pathway IDs are a hash of the ordered mechanism IDs, so they are stable
+across rebuilds and processes.
+"""
+
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import networkx as nx
+from sqlalchemy.orm import Session
+
+from models.mechanism import Node, Pathway
+from services.graph_store import (
+    EVIDENCE_WEIGHTS,
+    GraphStore,
+    lock_shared_version,
+    read_shared_version,
+    write_shared_version,
+)
+from services.path_search import ranked_simple_paths
+
+logger = logging.getLogger(__name__)
+
+# Key intervention nodes (starting points)
+INTERVENTION_NODES = [
+    "housing_policy",
+    "minimum_wage",
+    "healthcare_access",
+    "education_funding",
+    "social_safety_net",
+    "neighborhood_investment",
+]
+
+# Key outcome nodes (endpoints)
+OUTCOME_NODES = [
+    "health_outcomes",
+    "mortality",
+    "disease_burden",
+    "life_expectancy",
+    "health_equity",
+    "ald_mortality",
+]
+
+# Scale fallback when none of the named anchors exist: policy -> crisis
+INTERVENTION_SCALE = 1
+OUTCOME_SCALE = 7
+
+MAX_PATH_LENGTH = 4  # Mechanisms per pathway
+
+# graph_versions row holding the shared graph version the table was built from
+PATHWAYS_VERSION_NAME = "pathways"
+
+
+def make_pathway_id(mechanism_ids: Sequence[str]) -> str:
+    """
+    Stable pathway ID derived from the ordered mechanism IDs.
+
+    Args:
+        mechanism_ids: Mechanism IDs along the path
+
+    Returns:
+        ID of the form ``pathway_<12 hex chars>``
+    """
+    digest = hashlib.sha1("|".join(mechanism_ids).encode("utf-8")).hexdigest()
+    return f"pathway_{digest[:12]}"
+
+
+def select_endpoints(G: nx.DiGraph) -> Tuple[List[str], List[str]]:
+    """
+    Choose pathway start and end nodes present in the graph.
+
+    Uses the named intervention/outcome anchors when the graph contains
+    them, otherwise every scale-1 (policy) node and scale-7 (crisis) node.
+
+    Args:
+        G: Mechanism graph (nodes carry a 'scale' attribute)
+
+    Returns:
+        Tuple of (start node IDs, end node IDs)
+    """
+    starts = [n for n in INTERVENTION_NODES if n in G]
+    ends = [n for n in OUTCOME_NODES if n in G]
+
+    if not starts:
+        starts = sorted(n for n, scale in G.nodes(data='scale') if scale == INTERVENTION_SCALE)
+    if not ends:
+        ends = sorted(n for n, scale in G.nodes(data='scale') if scale == OUTCOME_SCALE)
+
+    return starts, ends
+
+
+def summarize_path(G: nx.DiGraph, path: List[str], labels: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Build a pathway row for one node path.
+
+    Args:
+        G: Mechanism graph
+        path: Node IDs from start to end
+        labels: Node ID -> display name
+
+    Returns:
+        Dict of Pathway column values
+    """
+    edges = [G[u][v] for u, v in zip(path, path[1:])]
+    mechanism_ids = [e['mechanism_id'] for e in edges]
+
+    evidence_scores = [EVIDENCE_WEIGHTS.get(e.get('evidence_quality'), 1) for e in edges]
+    avg_evidence = sum(evidence_scores) / len(evidence_scores)
+
+    # Determine overall direction
+    positive_count = sum(1 for e in edges if e.get('direction') == 'positive')
+    negative_count = sum(1 for e in edges if e.get('direction') == 'negative')
+    if positive_count > negative_count:
+        overall_direction = 'positive'
+    elif negative_count > positive_count:
+        overall_direction = 'negative'
+    else:
+        overall_direction = 'mixed'
+
+    # Primary category (most common); tags are the distinct categories along the path
+    categories = [e['category'] for e in edges if e.get('category')]
+    primary_category = max(set(categories), key=categories.count) if categories else 'unknown'
+    tags = sorted(set(categories))[:5]
+
+    start_label = labels.get(path[0], path[0])
+    end_label = labels.get(path[-1], path[-1])
+
+    return {
+        'id': make_pathway_id(mechanism_ids),
+        'title': f"{start_label} to {end_label}",
+        'description': (
+            f"Causal pathway from {start_label} to {end_label} "
+            f"through {len(mechanism_ids)} mechanisms"
+        ),
+        'from_node_id': path[0],
+        'to_node_id': path[-1],
+        'from_node_label': start_label,
+        'to_node_label': end_label,
+        'mechanism_ids': mechanism_ids,
+        'category': primary_category,
+        'path_length': len(mechanism_ids),
+        'avg_evidence_quality': avg_evidence,
+        'overall_direction': overall_direction,
+        'tags': tags,
+    }
+
+
+def discover_pathways(db: Session, G: nx.DiGraph, max_paths_per_pair: int = 5) -> List[Dict[str, Any]]:
+    """
+    Find the best-ranked pathways between every start/end pair.
+
+    Args:
+        db: Database session (for node labels)
+        G: Mechanism graph
+        max_paths_per_pair: Maximum pathways kept per start/end pair
+
+    Returns:
+        List of Pathway column dicts (unique IDs)
+    """
+    starts, ends = select_endpoints(G)
+    if not starts or not ends:
+        return []
+
+    labels = dict(db.query(Node.id, Node.name).all())
+    rows: Dict[str, Dict[str, Any]] = {}
+
+    for start in starts:
+        # Skip ends that are unreachable within the length limit
+        reachable = nx.single_source_shortest_path_length(G, start, cutoff=MAX_PATH_LENGTH)
+        for end in ends:
+            if end == start or end not in reachable:
+                continue
+            search = ranked_simple_paths(
+                G, start, end, max_paths=max_paths_per_pair, max_depth=MAX_PATH_LENGTH
+            )
+            for path in search.paths:
+                row = summarize_path(G, path, labels)
+                rows[row['id']] = row
+
+    return list(rows.values())
+
+
+class PathwayCatalogue:
+    """
+    Pathway table kept in sync with the shared mechanism graph.
+    """
+
+    def __init__(
+        self,
+        store: GraphStore,
+        session_factory: Optional[Callable[[], Session]] = None,
+        background_refresh: bool = True,
+        max_paths_per_pair: int = 5
+    ):
+        """
+        Initialize the catalogue.
+
+        Args:
+            store: Graph store providing the graph and its version
+            session_factory: Opens database sessions for background rebuilds
+            background_refresh: Rebuild the table when the graph changes
+            max_paths_per_pair: Maximum pathways kept per start/end pair
+        """
+        self.store = store
+        self.session_factory = session_factory
+        self.background_refresh = background_refresh and session_factory is not None
+        self.max_paths_per_pair = max_paths_per_pair
+
+        self._built_version = -1
+        self._lock = threading.Lock()  # Held for the duration of a rebuild
+        self._executor_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        if self.background_refresh:
+            store.subscribe(self._on_graph_changed)
+
+    @property
+    def is_current(self) -> bool:
+        """Whether the table reflects the current graph version."""
+        return self._built_version == self.store.version
+
+    def ensure_current(self, db: Session) -> None:
+        """
+        Rebuild the pathway table if it is behind the graph.
+
+        Args:
+            db: Database session (used only if a rebuild is needed)
+        """
+        self.store.sync(db)
+        if self.is_current:
+            return
+        with self._lock:
+            if not self.is_current:
+                self._catch_up(db)
+
+    def _catch_up(self, db: Session) -> None:
+        """Adopt the table if it already matches the graph, otherwise rebuild it."""
+        version = self.store.version
+        stamp = self.store.get_graph(db).graph.get('shared_version')
+        if stamp is None:
+            self.rebuild(db)
+            return
+
+        if read_shared_version(db, PATHWAYS_VERSION_NAME, default=None) != stamp:
+            # Wait for any rebuild in another worker, then check again
+            built = lock_shared_version(db, PATHWAYS_VERSION_NAME)
+            if built != stamp:
+                self.rebuild(db)
+                return
+        db.commit()  # Release the lock (if taken) and end the read transaction
+
+        self._built_version = version
+        logger.info(f"Pathway catalogue already built for shared version {stamp}")
+
+    def rebuild(self, db: Session) -> int:
+        """
+        Recompute all pathways and replace the table contents.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of pathways stored
+        """
+        version = self.store.version
+        G = self.store.get_graph(db)
+        stamp = G.graph.get('shared_version')
+        rows = discover_pathways(db, G, self.max_paths_per_pair)
+        graph_version = stamp if stamp is not None else version
+
+        try:
+            if stamp is not None:
+                lock_shared_version(db, PATHWAYS_VERSION_NAME)
+            db.query(Pathway).delete(synchronize_session=False)
+            db.bulk_insert_mappings(Pathway, [{**row, 'graph_version': graph_version} for row in rows])
+            if stamp is not None:
+                write_shared_version(db, PATHWAYS_VERSION_NAME, stamp)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        self._built_version = version
+        logger.info(f"Pathway catalogue rebuilt: {len(rows)} pathways (version={graph_version})")
+        return len(rows)
+
+    def refresh_in_background(self) -> None:
+        """Schedule a rebuild on the background worker (no-op if disabled)."""
+        if not self.background_refresh:
+            return
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="pathway-catalogue"
+                )
+        self._executor.submit(self._rebuild_in_background, self.store.version)
+
+    def _on_graph_changed(self, version: int) -> None:
+        """Graph store listener: schedule a rebuild."""
+        self.refresh_in_background()
+
+    def _rebuild_in_background(self, version: int) -> None:
+        """Rebuild the table (runs on the background worker)."""
+        if version != self.store.version:
+            return  # Superseded by a newer invalidation
+
+        db = self.session_factory()
+        try:
+            self.ensure_current(db)
+        except Exception as e:
+            logger.error(f"Pathway catalogue rebuild failed: {e}")
+        finally:
+            db.close()
@@ -0,0 +1,260 @@
+"""
+Graph-version-aware cache for read-only query responses.
+
+Responses of the graph/query endpoints depend only on their request
+parameters and on the mechanism graph, so they can be reused until the
+graph changes. Cache keys combine the normalized request (method, path,
+sorted query parameters, canonical JSON body) with a cache *generation*
+that is bumped whenever the graph store is invalidated, so stale entries
+are never served and need no explicit purge.
+
+Two backends:
+- MemoryCacheBackend: per-process LRU, bounded by entry count, with TTL.
+  Other workers' graph writes reach it through the graph store's shared
+  version check (GraphStore.sync), which the middleware runs per request.
+- RedisCacheBackend: shared across workers; the generation is a Redis
+  counter, so an invalidation in one worker retires entries for all
+
+Backend failures never fail a request: the cache is bypassed instead.
+
+Each entry carries a strong ETag (hash of the body bytes) so clients can
+revalidate with If-None-Match and receive 304 Not Modified.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Optional
+from urllib.parse import parse_qsl
+
+from services.graph_store import GraphStore
+
+try:
+    import redis
+    import redis.asyncio as redis_asyncio
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """A cached response body with its metadata."""
+    body: bytes
+    media_type: str
+    etag: str
+    status_code: int = 200
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag for a response body."""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header matches an ETag (weak comparison, RFC 9110).
+
+    Args:
+        if_none_match: Raw If-None-Match header value
+        etag: Current strong ETag
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def normalize_request(method: str, path: str, query_string: bytes, body: bytes) -> str:
+    """
+    Canonical string for a request: parameter order and JSON formatting
+    do not change the key.
+
+    Args:
+        method: HTTP method
+        path: URL path (trailing slash ignored)
+        query_string: Raw query string
+        body: Raw request body
+
+    Returns:
+        Canonical request string
+    """
+    params = sorted(parse_qsl(query_string.decode("latin-1"), keep_blank_values=True))
+    if body:
+        try:
+            body_text = json.dumps(json.loads(body), sort_keys=True, separators=(",", ":"))
+        except ValueError:
+            body_text = body.decode("latin-1")
+    else:
+        body_text = ""
+    return json.dumps([method.upper(), path.rstrip("/") or "/", params, body_text])
+
+
+class MemoryCacheBackend:
+    """
+    In-process LRU cache with per-entry TTL.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 1024, ttl: int = 3600):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum entries kept (least recently used evicted)
+            ttl: Seconds an entry stays valid
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()  # key -> (expires_at, CachedResponse)
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    async def generation(self) -> int:
+        return self._generation
+
+    def bump_generation(self) -> None:
+        """Retire every entry (called from the graph store listener)."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, response = item
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    async def set(self, key: str, response: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend:
+    """
+    Redis-backed cache shared by all workers.
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str, ttl: int = 3600, prefix: str = "healthsystems:response-cache"):
+        """
+        Initialize the cache and check that Redis is reachable.
+
+        Args:
+            url: Redis URL
+            ttl: Seconds an entry stays valid
+            prefix: Key prefix
+
+        Raises:
+            RuntimeError: If the redis package is not installed
+            redis.RedisError: If the server can't be reached
+        """
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("redis package not installed. Install with: pip install redis")
+        self.ttl = ttl
+        self.prefix = prefix
+        self._generation_key = f"{prefix}:generation"
+        self._client = redis_asyncio.Redis.from_url(url)
+        # Invalidation listeners run outside the event loop
+        self._sync_client = redis.Redis.from_url(url)
+        # from_url() connects lazily; fail here so the caller can fall back
+        self._sync_client.ping()
+
+    async def generation(self) -> int:
+        value = await self._client.get(self._generation_key)
+        return int(value) if value is not None else 0
+
+    def bump_generation(self) -> None:
+        self._sync_client.incr(self._generation_key)
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        raw = await self._client.get(f"{self.prefix}:{key}")
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        data["body"] = data["body"].encode("latin-1")
+        return CachedResponse(**data)
+
+    async def set(self, key: str, response: CachedResponse) -> None:
+        data = asdict(response)
+        data["body"] = response.body.decode("latin-1")
+        await self._client.set(f"{self.prefix}:{key}", json.dumps(data), ex=self.ttl)
+
+
+class ResponseCache:
+    """
+    Response cache whose entries are retired when the graph changes.
+    """
+
+    def __init__(self, store: GraphStore, backend):
+        """
+        Initialize the cache and subscribe to graph invalidations.
+
+        Args:
+            store: Graph store whose invalidations retire entries
+            backend: MemoryCacheBackend or RedisCacheBackend
+        """
+        self.store = store
+        self.backend = backend
+        store.subscribe(self._on_graph_changed)
+
+    async def key(self, method: str, path: str, query_string: bytes, body: bytes) -> Optional[str]:
+        """
+        Cache key for a request at the current generation.
+
+        Returns:
+            Hex digest key, or None if the backend is unavailable (the
+            request should bypass the cache)
+        """
+        canonical = normalize_request(method, path, query_string, body)
+        try:
+            generation = await self.backend.generation()
+        except Exception as e:
+            logger.warning(f"Response cache unavailable ({self.backend.name}): {e}")
+            return None
+        return hashlib.sha256(f"{generation}:{canonical}".encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        """Cached response for a key, if any (backend errors are treated as misses)."""
+        try:
+            return await self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"Response cache read failed ({self.backend.name}): {e}")
+            return None
+
+    async def set(self, key: str, response: CachedResponse) -> None:
+        """Store a response (backend errors are logged and ignored)."""
+        try:
+            await self.backend.set(key, response)
+        except Exception as e:
+            logger.warning(f"Response cache write failed ({self.backend.name}): {e}")
+
+    def _on_graph_changed(self, version: int) -> None:
+        """Graph store listener: retire all cached responses."""
+        try:
+            self.backend.bump_generation()
+        except Exception as e:
+            logger.error(f"Response cache invalidation failed ({self.backend.name}): {e}")
@@ -0,0 +1,510 @@
+"""
+Full-text search over nodes, mechanisms and pathways.
+
+Documents are collected from the database once per graph version and loaded
+into one of three interchangeable backends:
+
+- SQLite: an FTS5 virtual table ranked with bm25()
+- PostgreSQL: a table with a weighted tsvector column and a GIN index,
+  ranked with ts_rank()
+- Fallback: a pure-Python inverted index with BM25 scoring, used when the
+  database has no full-text support (e.g. SQLite built without FTS5)
+
+Every query token is matched as a prefix and all tokens must match, so
+"hous evic" finds "Housing Eviction Rate" (typeahead semantics). Title
+matches rank above body matches.
+
+The database tables are created by migration (add_search_tables) and by
+create_all(); rebuilds replace their rows in one transaction, so other
+workers keep reading the previous contents until the new ones commit. As
+with the pathway catalogue, the shared graph version a table was built from
+is stored in the ``search_index`` row of ``graph_versions``: workers whose
+graph matches it adopt the table, and only one worker rebuilds at a time.
+Once an index exists, a stale one keeps answering queries while the
+background worker rebuilds it, so typeahead requests never wait on a build.
+
+Usage:
+    page = search_index.search(db, "eviction", kinds=["node"], limit=10)
+    for hit in page.hits:
+        print(hit.kind, hit.id, hit.title, hit.score)
+"""
+
+import bisect
+import logging
+import math
+import re
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from models.mechanism import Mechanism, Node, Pathway
+from services.graph_store import (
+    GraphStore,
+    lock_shared_version,
+    read_shared_version,
+    write_shared_version,
+)
+
+logger = logging.getLogger(__name__)
+
+DOCUMENT_KINDS = ("node", "mechanism", "pathway")
+
+# Relative weight of a title match vs. a body match
+TITLE_BOOST = 4.0
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# graph_versions row holding the shared graph version the table was built from
+SEARCH_VERSION_NAME = "search_index"
+
+
+def tokenize(value: Optional[str]) -> List[str]:
+    """Lowercase alphanumeric tokens of a string."""
+    return _TOKEN_RE.findall(value.lower()) if value else []
+
+
+@dataclass
+class SearchDocument:
+    """One searchable item."""
+    kind: str  # node, mechanism, pathway
+    doc_id: str
+    title: str
+    body: str
+
+
+@dataclass
+class SearchHit:
+    """A ranked search result."""
+    kind: str
+    id: str
+    title: str
+    score: float
+
+
+@dataclass
+class SearchPage:
+    """One page of ranked results plus the total number of matches."""
+    total: int
+    hits: List[SearchHit] = field(default_factory=list)
+
+
+def collect_documents(db: Session) -> List[SearchDocument]:
+    """
+    Load every node, mechanism and pathway as a search document.
+
+    Args:
+        db: Database session
+
+    Returns:
+        List of SearchDocument
+    """
+    documents = []
+
+    for node_id, name, description in db.query(Node.id, Node.name, Node.description):
+        documents.append(SearchDocument(
+            "node", node_id, name, " ".join(filter(None, [node_id.replace("_", " "), description]))
+        ))
+
+    for mech_id, name, description, steps in db.query(
+        Mechanism.id, Mechanism.name, Mechanism.description, Mechanism.mechanism_pathway
+    ):
+        step_text = " ".join(str(s) for s in steps) if isinstance(steps, list) else (steps or "")
+        documents.append(SearchDocument(
+            "mechanism", mech_id, name, " ".join(filter(None, [description, step_text]))
+        ))
+
+    for pathway_id, title, description, tags in db.query(
+        Pathway.id, Pathway.title, Pathway.description, Pathway.tags
+    ):
+        documents.append(SearchDocument(
+            "pathway", pathway_id, title, " ".join(filter(None, [description, " ".join(tags or [])]))
+        ))
+
+    return documents
+
+
+class InvertedIndex:
+    """
+    In-memory inverted index with prefix matching and BM25 ranking.
+    """
+
+    name = "memory"
+    shared = False  # Per-process; every worker builds its own
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        """
+        Initialize an empty index.
+
+        Args:
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self._docs: List[SearchDocument] = []
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._terms: List[str] = []  # Sorted vocabulary for prefix lookups
+        self._lengths: List[float] = []
+        self._avg_length = 1.0
+
+    def build(self, db: Session, documents: List[SearchDocument]) -> None:
+        """Replace the index contents with the given documents."""
+        postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        lengths = []
+
+        for doc_index, doc in enumerate(documents):
+            weights: Dict[str, float] = defaultdict(float)
+            for token in tokenize(doc.title):
+                weights[token] += TITLE_BOOST
+            for token in tokenize(doc.body):
+                weights[token] += 1.0
+            for token, weight in weights.items():
+                postings[token][doc_index] = weight
+            lengths.append(sum(weights.values()))
+
+        self._docs = documents
+        self._postings = dict(postings)
+        self._terms = sorted(postings)
+        self._lengths = lengths
+        self._avg_length = (sum(lengths) / len(lengths)) if lengths else 1.0
+
+    def _expand(self, prefix: str) -> List[str]:
+        """Vocabulary terms starting with prefix."""
+        start = bisect.bisect_left(self._terms, prefix)
+        end = bisect.bisect_left(self._terms, prefix + "\uffff")
+        return self._terms[start:end]
+
+    def search(self, db: Session, tokens: List[str], kinds: Optional[Sequence[str]],
+               limit: int, offset: int) -> SearchPage:
+        """Rank documents matching every token (as a prefix)."""
+        n_docs = len(self._docs)
+        scores: Optional[Dict[int, float]] = None
+
+        for token in tokens:
+            token_scores: Dict[int, float] = defaultdict(float)
+            for term in self._expand(token):
+                postings = self._postings[term]
+                idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_index, tf in postings.items():
+                    norm = self.k1 * (1 - self.b + self.b * self._lengths[doc_index] / self._avg_length)
+                    score = idf * tf * (self.k1 + 1) / (tf + norm)
+                    # A document matching several expansions keeps its best one
+                    if score > token_scores[doc_index]:
+                        token_scores[doc_index] = score
+
+            if scores is None:
+                scores = dict(token_scores)
+            else:
+                scores = {d: s + token_scores[d] for d, s in scores.items() if d in token_scores}
+            if not scores:
+                return SearchPage(total=0)
+
+        if kinds:
+            scores = {d: s for d, s in scores.items() if self._docs[d].kind in kinds}
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], self._docs[item[0]].doc_id))
+        hits = [
+            SearchHit(self._docs[d].kind, self._docs[d].doc_id, self._docs[d].title, round(s, 4))
+            for d, s in ranked[offset:offset + limit]
+        ]
+        return SearchPage(total=len(ranked), hits=hits)
+
+
+class SQLiteFTSIndex:
+    """
+    SQLite FTS5 backend (virtual table ``search_fts``).
+    """
+
+    name = "sqlite_fts5"
+    shared = True
+
+    def build(self, db: Session, documents: List[SearchDocument]) -> None:
+        """Replace the FTS5 table rows (in the caller's transaction)."""
+        db.execute(text("DELETE FROM search_fts"))
+        if documents:
+            db.execute(
+                text("INSERT INTO search_fts (kind, doc_id, title, body) VALUES (:kind, :doc_id, :title, :body)"),
+                [vars(doc) for doc in documents]
+            )
+
+    def search(self, db: Session, tokens: List[str], kinds: Optional[Sequence[str]],
+               limit: int, offset: int) -> SearchPage:
+        """Rank matches with bm25() (lower is better; negated for the response)."""
+        params = {"match": " ".join(f'"{token}"*' for token in tokens), "limit": limit, "offset": offset}
+        kind_filter = ""
+        if kinds:
+            kind_filter = " AND kind IN (" + ", ".join(f":kind{i}" for i in range(len(kinds))) + ")"
+            params.update({f"kind{i}": kind for i, kind in enumerate(kinds)})
+
+        where = f"search_fts MATCH :match{kind_filter}"
+        total = db.execute(text(f"SELECT count(*) FROM search_fts WHERE {where}"), params).scalar()
+        rows = db.execute(text(
+            f"SELECT kind, doc_id, title, bm25(search_fts, 0, 0, {TITLE_BOOST}, 1.0) AS rank "
+            f"FROM search_fts WHERE {where} ORDER BY rank, doc_id LIMIT :limit OFFSET :offset"
+        ), params).all()
+
+        return SearchPage(total=total, hits=[
+            SearchHit(kind, doc_id, title, round(-rank, 4)) for kind, doc_id, title, rank in rows
+        ])
+
+
+class PostgresFTSIndex:
+    """
+    PostgreSQL backend (``search_documents`` table with a GIN-indexed tsvector).
+    """
+
+    name = "postgres_tsvector"
+    shared = True
+
+    def build(self, db: Session, documents: List[SearchDocument]) -> None:
+        """Replace the table rows (in the caller's transaction)."""
+        db.execute(text("DELETE FROM search_documents"))
+        if documents:
+            db.execute(text(
+                "INSERT INTO search_documents (kind, doc_id, title, body, tsv) VALUES ("
+                ":kind, :doc_id, :title, :body, "
+                "setweight(to_tsvector('simple', CAST(:title AS text)), 'A') || "
+                "setweight(to_tsvector('simple', coalesce(CAST(:body AS text), '')), 'D'))"
+            ), [vars(doc) for doc in documents])
+
+    def search(self, db: Session, tokens: List[str], kinds: Optional[Sequence[str]],
+               limit: int, offset: int) -> SearchPage:
+        """Rank matches with ts_rank()."""
+        params = {"query": " & ".join(f"{token}:*" for token in tokens), "limit": limit, "offset": offset}
+        kind_filter = ""
+        if kinds:
+            kind_filter = " AND kind = ANY(:kinds)"
+            params["kinds"] = list(kinds)
+
+        where = f"tsv @@ to_tsquery('simple', :query){kind_filter}"
+        total = db.execute(text(f"SELECT count(*) FROM search_documents WHERE {where}"), params).scalar()
+        rows = db.execute(text(
+            f"SELECT kind, doc_id, title, ts_rank(tsv, to_tsquery('simple', :query)) AS rank "
+            f"FROM search_documents WHERE {where} ORDER BY rank DESC, doc_id LIMIT :limit OFFSET :offset"
+        ), params).all()
+
+        return SearchPage(total=total, hits=[
+            SearchHit(kind, doc_id, title, round(float(rank), 4)) for kind, doc_id, title, rank in rows
+        ])
+
+
+class SearchIndex:
+    """
+    Search index kept in sync with the shared mechanism graph.
+
+    The backend is chosen from the database dialect on first build; if the
+    database backend fails to build (e.g. its table is missing), the
+    in-memory index is used instead.
+    """
+
+    def __init__(
+        self,
+        store: GraphStore,
+        before_build: Optional[Callable[[Session], None]] = None,
+        session_factory: Optional[Callable[[], Session]] = None,
+        background_refresh: bool = True,
+        backend: Optional[str] = None
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            store: Graph store whose version marks the index stale
+            before_build: Called before each build (e.g. to refresh pathways)
+            session_factory: Opens database sessions for background rebuilds
+            background_refresh: Rebuild off the request path when the graph
+                changes, serving the previous index meanwhile
+            backend: Force a backend ('sqlite_fts5', 'postgres_tsvector', 'memory')
+        """
+        self.store = store
+        self.before_build = before_build
+        self.session_factory = session_factory
+        self.background_refresh = background_refresh and session_factory is not None
+        self.forced_backend = backend
+
+        self.backend = None
+        self._built_version = -1
+        self._lock = threading.Lock()  # Held for the duration of a build
+        self._executor_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending_version: Optional[int] = None  # Version of the queued rebuild
+
+        if self.background_refresh:
+            store.subscribe(self._on_graph_changed)
+
+    @property
+    def is_current(self) -> bool:
+        """Whether the index reflects the current graph version."""
+        return self._built_version == self.store.version
+
+    def search(self, db: Session, query: str, kinds: Optional[Iterable[str]] = None,
+               limit: int = 20, offset: int = 0) -> SearchPage:
+        """
+        Ranked prefix search.
+
+        Args:
+            db: Database session
+            query: Free-text query
+            kinds: Restrict to these document kinds (node, mechanism, pathway)
+            limit: Page size
+            offset: Number of hits to skip
+
+        Returns:
+            SearchPage with the total match count and the requested page
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return SearchPage(total=0)
+
+        self._ensure_servable(db)
+        kinds = [k for k in kinds if k in DOCUMENT_KINDS] if kinds else None
+        return self.backend.search(db, tokens, kinds, limit, offset)
+
+    def _ensure_servable(self, db: Session) -> None:
+        """
+        Make sure there is an index to query.
+
+        With background refresh, a stale index keeps serving while the
+        background worker rebuilds; only a worker with no index at all builds
+        on the request thread.
+        """
+        self.store.sync(db)
+        if self.is_current:
+            return
+        if self.background_refresh:
+            if self.backend is None:
+                self._attach(db)
+            if self.backend is not None:
+                self.refresh_in_background()
+                return
+        self.ensure_current(db)
+
+    def _attach(self, db: Session) -> None:
+        """Serve a database table built earlier (by any worker) until it is refreshed."""
+        backend = self._select_backend(db)
+        if backend.shared and read_shared_version(db, SEARCH_VERSION_NAME, default=None) is not None:
+            self.backend = backend
+
+    def ensure_current(self, db: Session) -> None:
+        """Bring the index up to the graph, building it if no worker has yet."""
+        self.store.sync(db)
+        if self.is_current:
+            return
+        with self._lock:
+            if not self.is_current:
+                self._catch_up(db)
+
+    def _catch_up(self, db: Session) -> None:
+        """Adopt the shared table if it already matches the graph, otherwise rebuild it."""
+        version = self.store.version
+        backend = self.backend or self._select_backend(db)
+        stamp = self.store.get_graph(db).graph.get('shared_version')
+        if not backend.shared or stamp is None:
+            self.rebuild(db)
+            return
+
+        if read_shared_version(db, SEARCH_VERSION_NAME, default=None) != stamp:
+            # Wait for any rebuild in another worker, then check again
+            built = lock_shared_version(db, SEARCH_VERSION_NAME)
+            if built != stamp:
+                self.rebuild(db)
+                return
+        db.commit()  # Release the lock (if taken) and end the read transaction
+
+        self.backend = backend
+        self._built_version = version
+        logger.info(f"Search index already built for shared version {stamp} ({backend.name})")
+
+    def rebuild(self, db: Session) -> int:
+        """
+        Reload every document into the backend.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of indexed documents
+        """
+        version = self.store.version
+        if self.before_build is not None:
+            self.before_build(db)
+        stamp = self.store.get_graph(db).graph.get('shared_version')
+        documents = collect_documents(db)
+
+        backend = self.backend or self._select_backend(db)
+        if not backend.shared:
+            backend = type(backend)()  # Build aside; the old index serves until the swap
+        try:
+            if backend.shared and stamp is not None:
+                lock_shared_version(db, SEARCH_VERSION_NAME)
+            backend.build(db, documents)
+            if backend.shared and stamp is not None:
+                write_shared_version(db, SEARCH_VERSION_NAME, stamp)
+            db.commit()
+        except DBAPIError as e:
+            db.rollback()
+            if not backend.shared:
+                raise
+            logger.warning(f"{backend.name} search index unavailable ({e}); using in-memory index")
+            backend = InvertedIndex()
+            backend.build(db, documents)
+
+        self.backend = backend
+        self._built_version = version
+        logger.info(f"Search index rebuilt: {len(documents)} documents ({backend.name}, version={version})")
+        return len(documents)
+
+    def _select_backend(self, db: Session):
+        name = self.forced_backend or {
+            "sqlite": SQLiteFTSIndex.name,
+            "postgresql": PostgresFTSIndex.name,
+        }.get(db.get_bind().dialect.name, InvertedIndex.name)
+        backends = {
+            SQLiteFTSIndex.name: SQLiteFTSIndex,
+            PostgresFTSIndex.name: PostgresFTSIndex,
+            InvertedIndex.name: InvertedIndex,
+        }
+        return backends[name]()
+
+    def refresh_in_background(self) -> None:
+        """Schedule a rebuild on the background worker (no-op if disabled or already queued)."""
+        if not self.background_refresh:
+            return
+        version = self.store.version
+        with self._executor_lock:
+            if self._pending_version == version:
+                return
+            self._pending_version = version
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="search-index"
+                )
+        self._executor.submit(self._rebuild_in_background, version)
+
+    def _on_graph_changed(self, version: int) -> None:
+        """Graph store listener: schedule a rebuild."""
+        self.refresh_in_background()
+
+    def _rebuild_in_background(self, version: int) -> None:
+        """Rebuild the index (runs on the background worker)."""
+        try:
+            if version != self.store.version:
+                return  # Superseded by a newer invalidation
+
+            db = self.session_factory()
+            try:
+                self.ensure_current(db)
+            except Exception as e:
+                logger.error(f"Search index rebuild failed: {e}")
+            finally:
+                db.close()
+        finally:
+            with self._executor_lock:
+                if self._pending_version == version:
+                    self._pending_version = None
@@ -39,7 +39,7 @@ python -m alembic upgrade head
 
 # Seed database with initial data (if needed)
 echo "Seeding database with mechanism data..."
-python scripts/seed_database.py
+python scripts/seed_database.py --bulk --workers ${SEED_WORKERS:-2}
 
 # Start the application
 echo "Starting FastAPI application..."
@@ -13,11 +13,26 @@ from sqlalchemy.orm import sessionmaker, Session
 # Using a file-based test database so it can be shared across connections
 TEST_DATABASE_URL = "sqlite:///./test_healthsystems.db"
 os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+# The whole suite shares one app instance; don't let it trip the rate limiter
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+# Keep centrality recomputation on the request thread for deterministic tests
+os.environ["CENTRALITY_BACKGROUND_REFRESH"] = "false"
+os.environ["PATHWAY_CATALOGUE_BACKGROUND_REFRESH"] = "false"
+os.environ["SEARCH_INDEX_BACKGROUND_REFRESH"] = "false"
+os.environ["YAML_LOADER_BACKGROUND"] = "false"
+# Outbound HTTP clients must not read or write the on-disk caches and stores
+os.environ["HTTP_CACHE_ENABLED"] = "false"
+os.environ["FULLTEXT_LEDGER_ENABLED"] = "false"
+os.environ["CITATION_STORE_ENABLED"] = "false"
+os.environ["LLM_CACHE_MODE"] = "off"
 
 from api.main import app
 from models.database import Base, get_db, engine
 # Import all models to ensure they're registered with Base.metadata
-from models.mechanism import Mechanism, Node, GeographicContext  # noqa: F401
+from models.mechanism import (  # noqa: F401
+    Mechanism, Node, GeographicContext, Pathway, YamlLoadRecord, YamlLoadJobRecord, GraphVersion
+)
+from services.graph_store import graph_store
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -45,6 +60,8 @@ def test_db() -> Generator[Session, None, None]:
         for table in reversed(Base.metadata.sorted_tables):
             db.execute(table.delete())
         db.commit()
+        # Core deletes bypass the ORM write hooks, so drop the cached graph
+        graph_store.invalidate()
 
 
 @pytest.fixture
@@ -0,0 +1,122 @@
+"""
+Tests for the compiled bank snapshot (utils.bank_snapshot).
+
+Tests cover:
+- Compiling and reloading documents identical to the YAML sources
+- Incremental recompiles (changed, touched, added and removed files)
+- Content-hash manifest
+- Date round-trips and unparseable files
+"""
+
+import hashlib
+import json
+import os
+from datetime import date
+
+import pytest
+import yaml
+
+from utils.bank_snapshot import BankSnapshot, compile_bank, open_bank
+
+
+FILES = {
+    "node": {
+        "scale_1/housing.yml": "id: housing\nname: Housing\n",
+        "scale_7/asthma.yml": "id: asthma\nname: Asthma\nscale: 7\n",
+    },
+    "mechanism": {
+        "economic/rent_to_asthma.yml": (
+            "id: rent_to_asthma\nlast_updated: 2024-05-01\nmechanism_pathway: [Step one, Step two]\n"
+            "evidence: {quality_rating: A, n_studies: 3}\n"
+        ),
+        "economic/broken.yml": "id: [unterminated\n",
+    },
+}
+
+
+@pytest.fixture
+def sources(tmp_path):
+    roots = {}
+    for kind, files in FILES.items():
+        roots[kind] = tmp_path / kind
+        for name, content in files.items():
+            path = roots[kind] / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+    return roots
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    return tmp_path / "out" / "bank.snapshot"
+
+
+def test_compile_and_load(sources, snapshot_path):
+    stats = compile_bank(snapshot_path, sources)
+    assert (stats.parsed, stats.reused, stats.failed) == (4, 0, 1)
+
+    with BankSnapshot(snapshot_path) as bank:
+        assert len(bank) == 4
+        assert [e.path for e in bank.entries("node")] == ["scale_1/housing.yml", "scale_7/asthma.yml"]
+        for entry, document in bank.documents("node"):
+            assert document == yaml.safe_load(FILES["node"][entry.path])
+
+        mechanism = bank.document(bank.entry("mechanism", "economic/rent_to_asthma.yml"))
+        assert mechanism["last_updated"] == date(2024, 5, 1)
+        assert mechanism["mechanism_pathway"] == ["Step one", "Step two"]
+
+        broken = bank.entry("mechanism", "economic/broken.yml")
+        assert broken.error
+        assert bank.document(broken) is None
+
+
+def test_manifest_hashes(sources, snapshot_path):
+    compile_bank(snapshot_path, sources)
+    manifest = json.loads(snapshot_path.with_name("bank.manifest.json").read_text())
+
+    content = FILES["node"]["scale_1/housing.yml"].encode()
+    assert manifest["files"]["node:scale_1/housing.yml"] == hashlib.sha256(content).hexdigest()
+    assert len(manifest["files"]) == 4
+
+
+def test_incremental_recompile(sources, snapshot_path):
+    compile_bank(snapshot_path, sources)
+    written = snapshot_path.stat().st_mtime_ns
+
+    # Nothing changed: nothing parsed, snapshot left alone
+    stats = compile_bank(snapshot_path, sources)
+    assert (stats.parsed, stats.reused, stats.changed) == (0, 4, False)
+    assert snapshot_path.stat().st_mtime_ns == written
+
+    # Touched but identical content is matched by hash
+    housing = sources["node"] / "scale_1" / "housing.yml"
+    os.utime(housing, ns=(1, 1))
+    assert compile_bank(snapshot_path, sources).parsed == 0
+
+    # Edited, added and removed files
+    (sources["node"] / "scale_7" / "asthma.yml").write_text("id: asthma\nname: Childhood Asthma\n")
+    (sources["node"] / "scale_7" / "copd.yml").write_text("id: copd\n")
+    housing.unlink()
+    stats = compile_bank(snapshot_path, sources)
+    assert (stats.parsed, stats.reused, stats.removed) == (2, 2, 1)
+
+    with BankSnapshot(snapshot_path) as bank:
+        assert bank.document(bank.entry("node", "scale_7/asthma.yml"))["name"] == "Childhood Asthma"
+        assert bank.entry("node", "scale_1/housing.yml") is None
+        assert [e.path for e in bank.entries("node")] == ["scale_7/asthma.yml", "scale_7/copd.yml"]
+
+
+def test_open_bank_refreshes(sources, snapshot_path):
+    with open_bank(snapshot_path, sources) as bank:
+        assert len(bank) == 4
+
+    (sources["mechanism"] / "economic" / "broken.yml").write_text("id: fixed\n")
+    with open_bank(snapshot_path, sources) as bank:
+        assert bank.document(bank.entry("mechanism", "economic/broken.yml")) == {"id": "fixed"}
+
+
+def test_rejects_foreign_files(tmp_path):
+    path = tmp_path / "bank.snapshot"
+    path.write_bytes(b"not a snapshot" * 4)
+    with pytest.raises(ValueError):
+        BankSnapshot(path)
@@ -0,0 +1,121 @@
+"""
+Tests for bulk DOI verification (utils.citation_validation).
+
+Tests cover:
+- Deduplicated, concurrent verification of a DOI batch
+- Persisting definitive results in the citation store across validators
+- Retrying transient errors and re-checking expired not-found results
+- Shared rate limit across concurrent workers
+- MechanismValidator.validate_batch resolving DOIs up front
+"""
+
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from agents.mechanism_validator import MechanismValidator
+from utils.citation_validation import NOT_FOUND_ERROR, CitationStore, CitationValidator
+
+
+class FakeCrossref:
+    """Stands in for HTTPAdapter.send: known DOIs resolve, others 404, 'flaky' ones 503."""
+
+    def __init__(self, known=(), flaky=()):
+        self.known, self.flaky = {d.lower() for d in known}, {d.lower() for d in flaky}
+        self.requested = []
+        self.times = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request, **kwargs):
+        doi = request.url.split("/works/", 1)[1].lower()
+        with self._lock:
+            self.requested.append(doi)
+            self.times.append(time.monotonic())
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        if doi in self.flaky:
+            response.status_code, response._content = 503, b""
+        elif doi in self.known:
+            response.status_code = 200
+            response._content = json.dumps({"message": {
+                "title": [f"Paper {doi}"], "DOI": doi, "published": {"date-parts": [[2020]]},
+            }}).encode()
+        else:
+            response.status_code, response._content = 404, b""
+        return response
+
+
+def test_verify_dois_deduplicates_and_persists(tmp_path):
+    crossref = FakeCrossref(known=["10.1000/a", "10.1000/b"])
+    dois = ["10.1000/a", "https://doi.org/10.1000/A", "doi:10.1000/b", "10.1000/missing", "not-a-doi", ""]
+
+    with patch.object(HTTPAdapter, "send", crossref):
+        validator = CitationValidator(rate_limit=0, store=CitationStore(tmp_path / "citations.sqlite"))
+        results = validator.verify_dois(dois)
+
+    assert sorted(crossref.requested) == ["10.1000/a", "10.1000/b", "10.1000/missing"]
+    assert set(results) == {"10.1000/a", "10.1000/b", "10.1000/missing", "not-a-doi"}
+    assert results["10.1000/a"]["valid"] and results["10.1000/a"]["metadata"]["year"] == 2020
+    assert results["10.1000/missing"]["error"] == NOT_FOUND_ERROR
+    assert "format" in results["not-a-doi"]["error"]
+
+    # A new run (new validator, same store) needs no network at all
+    with patch.object(HTTPAdapter, "send", FakeCrossref()) as rerun:
+        validator = CitationValidator(rate_limit=0, store=CitationStore(tmp_path / "citations.sqlite"))
+        assert validator.verify_dois(dois) == results
+        assert validator.lookup_doi("10.1000/B")["metadata"]["title"] == "Paper 10.1000/b"
+    assert rerun.requested == []
+
+
+def test_transient_errors_and_expired_not_found_are_retried():
+    store = CitationStore(":memory:")
+    crossref = FakeCrossref(flaky=["10.1000/flaky"])
+
+    with patch.object(HTTPAdapter, "send", crossref):
+        validator = CitationValidator(rate_limit=0, store=store)
+        assert not validator.verify_doi("10.1000/flaky")["valid"]
+        assert validator.lookup_doi("10.1000/flaky") is None
+        validator.verify_doi("10.1000/flaky")
+
+        validator.verify_doi("10.1000/gone")
+        store.not_found_ttl = 0
+        CitationValidator(rate_limit=0, store=store).verify_doi("10.1000/gone")
+
+    assert crossref.requested == ["10.1000/flaky", "10.1000/flaky", "10.1000/gone", "10.1000/gone"]
+
+
+def test_concurrent_workers_share_rate_limit():
+    dois = [f"10.1000/{i}" for i in range(6)]
+    crossref = FakeCrossref(known=dois)
+
+    with patch.object(HTTPAdapter, "send", crossref):
+        CitationValidator(rate_limit=0.05, store=CitationStore(":memory:")).verify_dois(dois, max_workers=3)
+
+    times = sorted(crossref.times)
+    assert len(times) == 6
+    assert all(b - a >= 0.045 for a, b in zip(times, times[1:]))
+
+
+def test_validate_batch_resolves_dois_up_front():
+    crossref = FakeCrossref(known=["10.1000/a"])
+    mechanisms = [
+        {"id": f"m{i}", "from_node_id": "a", "to_node_id": "b", "category": "economic",
+         "evidence_quality": "B", "n_studies": 5, "doi": "10.1000/a", "year": 2020}
+        for i in range(4)
+    ]
+
+    with patch.object(HTTPAdapter, "send", crossref):
+        validator = MechanismValidator()
+        validator.citation_validator = CitationValidator(rate_limit=0, store=CitationStore(":memory:"))
+        with patch.object(CitationValidator, "verify_dois", wraps=validator.citation_validator.verify_dois) as bulk:
+            results = validator.validate_batch(mechanisms, verbose=False)
+
+    assert len(results) == 4
+    assert bulk.call_count == 1
+    assert crossref.requested == ["10.1000/a"]
+    assert all(not any("DOI" in issue for issue in r.issues) for r in results.values())
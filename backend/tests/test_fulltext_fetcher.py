@@ -0,0 +1,175 @@
+"""
+Tests for the hedged full-text fetcher (utils.fulltext_fetcher).
+
+Tests cover:
+- Hedged waterfall: concurrent providers, first success wins, losers cancelled
+- Falling through to later providers and the last-resort proxy
+- Provider reordering from per-prefix success rates
+- Skipping DOIs recently found to have no full text
+- Transport errors recorded neither as misses nor as provider failures
+- Provider rate limits shared across concurrent fetches
+"""
+
+import threading
+import time
+
+from utils.fulltext_fetcher import (
+    BaseProvider,
+    FullTextFetcher,
+    FullTextLedger,
+    FullTextResult,
+    FullTextSource,
+    HarvardProxyProvider,
+    RateLimiter,
+)
+
+
+class FakeProvider(BaseProvider):
+    """Provider that 'makes' one rate-limited request per step, then answers."""
+
+    def __init__(self, source, succeeds=(), latency=0.05, steps=1, rate_limit=1000.0, down=False):
+        super().__init__(rate_limit=rate_limit)
+        self._source = source
+        self.succeeds = succeeds
+        self.latency = latency
+        self.steps = steps
+        self.down = down
+        self.calls = []
+        self.requests = 0
+        self._count_lock = threading.Lock()
+
+    @property
+    def source(self):
+        return self._source
+
+    def fetch(self, doi, **kwargs):
+        self.calls.append(doi)
+        try:
+            for _ in range(self.steps):
+                self._before_send()
+                with self._count_lock:
+                    self.requests += 1
+                time.sleep(self.latency)
+        except Exception as e:
+            return FullTextResult(success=False, doi=doi, error=str(e))
+        if self.down:
+            return FullTextResult(success=False, doi=doi, error="503 Service Unavailable")
+        if doi.startswith(self.succeeds):
+            return FullTextResult(success=True, doi=doi, source=self.source, pdf_url=f"https://x/{doi}")
+        return FullTextResult(success=False, doi=doi, error="not found", definitive=True)
+
+
+def _fetcher(providers, ledger=None, hedge_width=3):
+    fetcher = FullTextFetcher(enable_harvard_proxy=False, hedge_width=hedge_width, ledger=ledger)
+    fetcher.providers = providers
+    return fetcher
+
+
+def test_hedged_fetch_returns_first_success_and_cancels_losers():
+    slow = FakeProvider(FullTextSource.UNPAYWALL, succeeds=("10.1",), latency=0.3, steps=3)
+    fast = FakeProvider(FullTextSource.EUROPE_PMC, succeeds=("10.1",), latency=0.05)
+    unused = FakeProvider(FullTextSource.CORE, succeeds=("10.1",))
+
+    start = time.perf_counter()
+    result = _fetcher([slow, fast, unused], hedge_width=2).fetch_fulltext("10.1/abc")
+    elapsed = time.perf_counter() - start
+
+    assert result.success and result.source == FullTextSource.EUROPE_PMC
+    assert elapsed < 0.25
+    assert unused.calls == []
+    # The losing provider stops before its next request
+    time.sleep(0.4)
+    assert slow.requests == 1
+
+
+def test_waterfall_falls_through_to_proxy():
+    providers = [FakeProvider(FullTextSource.UNPAYWALL), FakeProvider(FullTextSource.CORE), HarvardProxyProvider()]
+    fetcher = _fetcher(providers, hedge_width=1)
+
+    result = fetcher.fetch_fulltext("doi:10.2/xyz")
+
+    assert result.success and result.source == FullTextSource.HARVARD_PROXY
+    assert [p.calls for p in providers[:2]] == [["10.2/xyz"], ["10.2/xyz"]]
+
+
+def test_learned_order_per_prefix():
+    ledger = FullTextLedger(":memory:")
+    unpaywall = FakeProvider(FullTextSource.UNPAYWALL, succeeds=("10.1371",))
+    core = FakeProvider(FullTextSource.CORE, succeeds=("10.1016", "10.1371"))
+    fetcher = _fetcher([unpaywall, core], ledger=ledger, hedge_width=1)
+
+    for i in range(3):
+        assert fetcher.fetch_fulltext(f"10.1016/{i}").source == FullTextSource.CORE
+
+    order = [p.source for p in fetcher._order_providers(None, None, "10.1016/new")]
+    assert order == [FullTextSource.CORE, FullTextSource.UNPAYWALL]
+    # Other publishers keep the default priority
+    assert [p.source for p in fetcher._order_providers(None, None, "10.1371/new")][0] == FullTextSource.UNPAYWALL
+    # Once demoted, unpaywall is no longer probed for this prefix
+    assert ledger.success_rates("10.1016/x") == {"unpaywall": (0, 1), "core": (3, 3)}
+
+
+def test_known_misses_are_not_reprobed():
+    ledger = FullTextLedger(":memory:")
+    provider = FakeProvider(FullTextSource.UNPAYWALL)
+    fetcher = _fetcher([provider], ledger=ledger)
+
+    assert not fetcher.fetch_fulltext("10.3/none").success
+    assert not fetcher.fetch_fulltext("10.3/none").success
+    assert len(provider.calls) == 1
+    assert fetcher.get_stats()["skipped_known_miss"] == 1
+
+    fetcher.fetch_fulltext("10.3/none", recheck_misses=True)
+    assert len(provider.calls) == 2
+
+    ledger.miss_ttl = 0
+    fetcher.fetch_fulltext("10.3/none")
+    assert len(provider.calls) == 3
+
+
+def test_transport_errors_are_not_misses():
+    ledger = FullTextLedger(":memory:")
+    answered = FakeProvider(FullTextSource.UNPAYWALL)
+    down = FakeProvider(FullTextSource.CORE, down=True)
+    fetcher = _fetcher([answered, down], ledger=ledger)
+
+    assert not fetcher.fetch_fulltext("10.5/outage").success
+    # One provider couldn't answer, so the DOI is probed again next time
+    assert not ledger.is_known_miss("10.5/outage")
+    assert ledger.success_rates("10.5/outage") == {"unpaywall": (0, 1)}
+
+    down.down = False
+    fetcher.fetch_fulltext("10.5/outage")
+    assert len(down.calls) == 2
+    assert ledger.is_known_miss("10.5/outage")
+
+
+def test_batch_shares_provider_rate_limits():
+    provider = FakeProvider(FullTextSource.UNPAYWALL, succeeds=("10.",), latency=0, rate_limit=20.0)
+    fetcher = _fetcher([provider])
+
+    start = time.perf_counter()
+    results = fetcher.fetch_batch([f"10.4/{i}" for i in range(6)], parallel=True, max_workers=6)
+    elapsed = time.perf_counter() - start
+
+    assert all(r.success for r in results.values()) and len(results) == 6
+    # Six requests at 20/s need at least five intervals even when run concurrently
+    assert elapsed >= 0.24
+
+
+def test_rate_limiter_spaces_concurrent_callers():
+    limiter = RateLimiter(calls_per_second=20)
+    times = []
+
+    def call():
+        limiter.wait()
+        times.append(time.monotonic())
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    times.sort()
+    assert all(b - a >= 0.04 for a, b in zip(times, times[1:]))
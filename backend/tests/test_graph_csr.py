@@ -0,0 +1,158 @@
+"""
+Tests for the CSR/CSC graph engine and the traversals built on it.
+
+Tests cover:
+- Array layout (node index mapping, offsets, attribute columns)
+- Multi-source BFS against NetworkX shortest path lengths
+- Hop limits and edge masks
+- Crisis subgraph degrees via the multi-source upstream traversal
+- Crisis subgraph memoization per graph version
+"""
+
+import random
+
+import networkx as nx
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from api.routes.nodes import compute_crisis_subgraph
+from models import Mechanism, Node
+from services.graph_csr import CSRGraph
+
+
+def _edge(quality="A", category="economic", direction="positive"):
+    return {"evidence_quality": quality, "category": category, "direction": direction}
+
+
+@pytest.fixture
+def chain():
+    """a -> b -> c -> d with a weak shortcut a -> d."""
+    G = nx.DiGraph()
+    G.add_edge("a", "b", **_edge("A"))
+    G.add_edge("b", "c", **_edge("B", "political"))
+    G.add_edge("c", "d", **_edge("A", direction="negative"))
+    G.add_edge("a", "d", **_edge("C"))
+    return CSRGraph.from_graph(G)
+
+
+def test_layout_and_columns(chain):
+    assert chain.num_nodes == 4
+    assert chain.num_edges == 4
+    assert chain.node_ids[chain.index["c"]] == "c"
+
+    a = chain.index["a"]
+    out = chain.out_edges[chain.out_indptr[a]:chain.out_indptr[a + 1]]
+    assert {chain.node_ids[chain.edge_target[e]] for e in out} == {"b", "d"}
+
+    d = chain.index["d"]
+    incoming = chain.in_edges[chain.in_indptr[d]:chain.in_indptr[d + 1]]
+    assert {chain.node_ids[chain.edge_source[e]] for e in incoming} == {"a", "c"}
+
+    assert sorted(chain.edge_strength.tolist()) == [1, 2, 3, 3]
+    assert sorted(chain.edge_direction.tolist()) == [-1, 1, 1, 1]
+
+
+def test_bfs_distances_and_hop_limit(chain):
+    dist = chain.multi_source_bfs(["a"])
+    assert dist[chain.index["d"]] == 1  # via the shortcut
+    assert dist[chain.index["c"]] == 2
+
+    dist = chain.multi_source_bfs(["a"], max_hops=1)
+    assert chain.nodes_within(dist) == {"a", "b", "d"}
+
+
+def test_bfs_reverse_with_edge_mask(chain):
+    # Drop C-rated edges: upstream of d is only reachable through the chain
+    mask = chain.edge_mask(min_strength=2)
+    dist = chain.multi_source_bfs(["d"], reverse=True, edge_mask=mask)
+
+    assert dist[chain.index["c"]] == 1
+    assert dist[chain.index["a"]] == 3
+
+    political_only = chain.edge_mask(categories=["political"])
+    assert chain.incident_nodes(political_only).tolist() == [
+        node in {"b", "c"} for node in chain.node_ids
+    ]
+
+
+def test_multi_source_bfs_matches_networkx():
+    rng = random.Random(7)
+    G = nx.gnp_random_graph(200, 0.02, seed=7, directed=True)
+    G = nx.relabel_nodes(G, {i: f"n{i}" for i in G.nodes()})
+    for u, v in G.edges():
+        G[u][v].update(_edge(rng.choice("ABC")))
+    csr = CSRGraph.from_graph(G)
+
+    seeds = ["n0", "n50", "n99"]
+    for reverse in (False, True):
+        H = G.reverse(copy=False) if reverse else G
+        expected = nx.multi_source_dijkstra_path_length(H, seeds, weight=None)
+        dist = csr.multi_source_bfs(seeds, reverse=reverse)
+
+        assert {csr.node_ids[i]: int(dist[i]) for i in np.flatnonzero(dist >= 0)} == expected
+
+
+def test_unknown_seeds_are_ignored(chain):
+    dist = chain.multi_source_bfs(["missing"])
+    assert (dist == -1).all()
+
+
+def _mechanism(mech_id, from_id, to_id, quality):
+    return Mechanism(
+        id=mech_id, name=f"{from_id} -> {to_id}", from_node_id=from_id, to_node_id=to_id,
+        direction="positive", category="economic", mechanism_pathway=["test"],
+        evidence_quality=quality, evidence_n_studies=1, evidence_primary_citation="Test (2024)",
+        description="Test"
+    )
+
+
+def test_crisis_subgraph_uses_nearest_crisis_degree(client: TestClient, test_db: Session):
+    test_db.add_all([
+        Node(id="policy", name="Policy", node_type="stock", category="political", scale=1),
+        Node(id="mid", name="Mid", node_type="stock", category="economic", scale=3),
+        Node(id="crisis_a", name="Crisis A", node_type="stock", category="crisis", scale=7),
+        Node(id="crisis_b", name="Crisis B", node_type="stock", category="crisis", scale=7),
+        Node(id="weak", name="Weak", node_type="stock", category="economic", scale=3),
+    ])
+    test_db.add_all([
+        _mechanism("policy_mid", "policy", "mid", "A"),
+        _mechanism("mid_a", "mid", "crisis_a", "A"),
+        _mechanism("policy_b", "policy", "crisis_b", "B"),
+        _mechanism("weak_a", "weak", "crisis_a", "C"),
+    ])
+    test_db.commit()
+
+    response = client.post("/api/nodes/crisis-subgraph", json={
+        "crisisNodeIds": ["crisis_a", "crisis_b"],
+        "maxDegrees": 3,
+        "minStrength": 2
+    })
+
+    assert response.status_code == 200
+    data = response.json()
+    degrees = {n["nodeId"]: n["degreeFromCrisis"] for n in data["nodes"]}
+    assert degrees == {"crisis_a": 0, "crisis_b": 0, "mid": 1, "policy": 1}
+    assert {e["mechanismId"] for e in data["edges"]} == {"policy_mid", "mid_a", "policy_b"}
+    assert data["stats"]["policyLevers"] == 1
+
+
+def test_crisis_subgraph_is_memoized_per_version(test_db: Session):
+    test_db.add_all([
+        Node(id="mid", name="Mid", node_type="stock", category="economic", scale=3),
+        Node(id="crisis_a", name="Crisis A", node_type="stock", category="crisis", scale=7),
+        Node(id="crisis_b", name="Crisis B", node_type="stock", category="crisis", scale=7),
+        _mechanism("mid_a", "mid", "crisis_a", "A"),
+    ])
+    test_db.commit()
+
+    first = compute_crisis_subgraph(test_db, ["crisis_a", "crisis_b"], 3, 1)
+    # Crisis order and minStrength 0/1 don't change the result
+    assert compute_crisis_subgraph(test_db, ["crisis_b", "crisis_a"], 3, 0) is first
+    assert compute_crisis_subgraph(test_db, ["crisis_a", "crisis_b"], 2, 1) is not first
+
+    test_db.add(_mechanism("mid_b", "mid", "crisis_b", "B"))
+    test_db.commit()
+    nodes, edges, _ = compute_crisis_subgraph(test_db, ["crisis_a", "crisis_b"], 3, 1)
+    assert {e["mechanismId"] for e in edges} == {"mid_a", "mid_b"}
@@ -0,0 +1,73 @@
+"""
+Tests for the graph executor used by async graph routes.
+
+Tests cover:
+- Results and exceptions cross the executor boundary
+- Work runs on the dedicated pool, not the event loop thread
+- Concurrency is bounded by max_workers
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from services.graph_executor import GraphExecutor
+
+
+def test_run_returns_result_on_worker_thread():
+    executor = GraphExecutor(max_workers=2)
+
+    async def main():
+        loop_thread = threading.current_thread().name
+        name = await executor.run(lambda: threading.current_thread().name)
+        total = await executor.run(sum, [1, 2, 3])
+        return loop_thread, name, total
+
+    try:
+        loop_thread, worker_thread, total = asyncio.run(main())
+    finally:
+        executor.shutdown()
+
+    assert worker_thread.startswith("graph-executor")
+    assert worker_thread != loop_thread
+    assert total == 6
+
+
+def test_run_propagates_exceptions():
+    executor = GraphExecutor(max_workers=1)
+
+    def fail():
+        raise ValueError("boom")
+
+    try:
+        with pytest.raises(ValueError, match="boom"):
+            asyncio.run(executor.run(fail))
+    finally:
+        executor.shutdown()
+
+
+def test_concurrency_is_bounded():
+    executor = GraphExecutor(max_workers=2)
+    active, peak = 0, 0
+    lock = threading.Lock()
+
+    def work():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+
+    async def main():
+        await asyncio.gather(*(executor.run(work) for _ in range(6)))
+
+    try:
+        asyncio.run(main())
+    finally:
+        executor.shutdown()
+
+    assert peak == 2
@@ -0,0 +1,251 @@
+"""
+Tests for the process-wide graph store.
+
+Tests cover:
+- Lazy build and caching across calls
+- Version bump and rebuild on invalidation
+- Category and evidence-quality filtered views
+- Memoized derived results
+- Read-only guarantee of the shared graph
+- Filtering duplicate (from, to) mechanisms before collapsing them
+- Invalidation across processes through the shared version stamp
+"""
+
+import networkx as nx
+import pytest
+from sqlalchemy.orm import Session
+
+from api.routes.nodes import compute_crisis_subgraph
+from models import Mechanism, Node
+from services.graph_store import GraphStore, graph_store, read_shared_version
+
+
+def _mechanism(mech_id, from_id, to_id, category, quality):
+    return Mechanism(
+        id=mech_id, name=f"{from_id} -> {to_id}", from_node_id=from_id, to_node_id=to_id,
+        direction="positive", category=category, mechanism_pathway=["test"],
+        evidence_quality=quality, evidence_n_studies=1, evidence_primary_citation="Test (2024)",
+        description="Test"
+    )
+
+
+@pytest.fixture
+def small_graph(test_db: Session):
+    """Three-node chain plus a weak side edge."""
+    test_db.add_all([
+        Node(id="a", name="A", node_type="stock", category="political", scale=1),
+        Node(id="b", name="B", node_type="stock", category="economic", scale=3),
+        Node(id="c", name="C", node_type="stock", category="crisis", scale=7),
+        Node(id="d", name="D", node_type="stock", category="behavioral", scale=5),
+    ])
+    test_db.add_all([
+        _mechanism("a_b", "a", "b", "political", "A"),
+        _mechanism("b_c", "b", "c", "economic", "B"),
+        _mechanism("d_c", "d", "c", "behavioral", "C"),
+    ])
+    test_db.commit()
+
+
+def test_graph_is_built_once_and_cached(test_db: Session, small_graph):
+    store = GraphStore()
+    G1 = store.get_graph(test_db)
+    G2 = store.get_graph(test_db)
+
+    assert G1 is G2
+    assert store.is_built
+    assert set(G1.nodes()) == {"a", "b", "c", "d"}
+    assert G1["a"]["b"]["weight"] == 3
+    assert G1["a"]["b"]["mechanism_id"] == "a_b"
+
+
+def test_invalidate_bumps_version_and_rebuilds(test_db: Session, small_graph):
+    store = GraphStore(version_check_interval=None)  # Ignore the shared version stamp
+    G1 = store.get_graph(test_db)
+    version = store.version
+
+    test_db.add(_mechanism("a_c", "a", "c", "political", "A"))
+    test_db.commit()
+
+    # Stale until invalidated
+    assert not store.get_graph(test_db).has_edge("a", "c")
+
+    assert store.invalidate() == version + 1
+    assert not store.is_built
+
+    G2 = store.get_graph(test_db)
+    assert G2 is not G1
+    assert G2.has_edge("a", "c")
+
+
+def test_invalidate_notifies_listeners(test_db: Session):
+    store = GraphStore()
+    seen = []
+    store.subscribe(seen.append)
+
+    store.invalidate()
+    store.invalidate()
+
+    assert seen == [1, 2]
+
+
+def test_orm_commit_invalidates_shared_store(test_db: Session, small_graph):
+    graph_store.get_graph(test_db)
+    version = graph_store.version
+
+    test_db.add(_mechanism("a_c", "a", "c", "political", "A"))
+    test_db.commit()
+
+    assert graph_store.version == version + 1
+    assert graph_store.get_graph(test_db).has_edge("a", "c")
+
+
+def test_rollback_does_not_invalidate(test_db: Session, small_graph):
+    graph_store.get_graph(test_db)
+    version = graph_store.version
+
+    test_db.add(_mechanism("a_c", "a", "c", "political", "A"))
+    test_db.flush()
+    test_db.rollback()
+
+    assert graph_store.version == version
+
+
+def test_category_view(test_db: Session, small_graph):
+    store = GraphStore()
+    view = store.view(test_db, only_categories=["political", "economic"])
+
+    assert set(view.nodes()) == {"a", "b", "c"}
+    assert set(view.edges()) == {("a", "b"), ("b", "c")}
+
+    excluded = store.view(test_db, exclude_categories=["political"])
+    assert "a" not in excluded
+    assert set(excluded.edges()) == {("b", "c"), ("d", "c")}
+
+
+def test_evidence_view_keeps_endpoints(test_db: Session, small_graph):
+    store = GraphStore()
+    view = store.view(test_db, min_evidence="B")
+
+    assert set(view.edges()) == {("a", "b"), ("b", "c")}
+    # Weak-only node is retained but disconnected
+    assert "d" in view
+    assert view.degree("d") == 0
+
+
+def test_views_are_memoized_per_version(test_db: Session, small_graph):
+    store = GraphStore()
+    v1 = store.view(test_db, only_categories=["economic"])
+    v2 = store.view(test_db, only_categories=["economic"])
+    assert v1 is v2
+
+    store.invalidate()
+    v3 = store.view(test_db, only_categories=["economic"])
+    assert v3 is not v1
+
+
+def test_memoize_per_version(test_db: Session):
+    store = GraphStore(max_cached_results=2)
+    calls = []
+
+    def compute(value):
+        calls.append(value)
+        return [value]
+
+    first = store.memoize("a", lambda: compute(1))
+    assert store.memoize("a", lambda: compute(2)) is first
+    assert calls == [1]
+
+    store.invalidate()
+    assert store.memoize("a", lambda: compute(3)) == [3]
+
+    # Least recently used results are evicted
+    store.memoize("b", lambda: compute(4))
+    store.memoize("c", lambda: compute(5))
+    assert store.memoize("a", lambda: compute(6)) == [6]
+
+
+def test_shared_graph_is_read_only(test_db: Session, small_graph):
+    store = GraphStore()
+    G = store.get_graph(test_db)
+
+    with pytest.raises(nx.NetworkXError):
+        G.add_edge("x", "y")
+
+
+@pytest.fixture
+def duplicate_pair(test_db: Session):
+    """Two mechanisms on the same node pair with different category and quality."""
+    test_db.add_all([
+        Node(id="a", name="A", node_type="stock", category="political", scale=1),
+        Node(id="b", name="B", node_type="stock", category="crisis", scale=7),
+    ])
+    test_db.add_all([
+        _mechanism("a_b_1", "a", "b", "political", "A"),
+        _mechanism("a_b_2", "a", "b", "economic", "C"),
+    ])
+    test_db.commit()
+
+
+def test_filters_apply_before_duplicates_collapse(test_db: Session, duplicate_pair):
+    store = GraphStore()
+
+    # The full graph keeps one edge per pair (highest mechanism ID)
+    assert store.get_graph(test_db)["a"]["b"]["mechanism_id"] == "a_b_2"
+
+    political = store.view(test_db, only_categories=["political"])
+    assert political["a"]["b"]["mechanism_id"] == "a_b_1"
+    assert store.view(test_db, min_evidence="A")["a"]["b"]["evidence_quality"] == "A"
+    assert not store.view(test_db, exclude_categories=["political"], min_evidence="B").has_edge("a", "b")
+
+    csr = store.csr(test_db)
+    assert csr.num_edges == 2
+    assert csr.edge_mask(min_strength=3, categories=["political"]).sum() == 1
+
+
+def test_crisis_subgraph_sees_every_mechanism_of_a_pair(test_db: Session, duplicate_pair):
+    _, edges, _ = compute_crisis_subgraph(test_db, ["b"], max_degrees=3, min_strength=3)
+    assert [(e["mechanismId"], e["evidenceQuality"]) for e in edges] == [("a_b_1", "A")]
+
+    _, edges, _ = compute_crisis_subgraph(test_db, ["b"], max_degrees=3, min_strength=1)
+    assert [e["mechanismId"] for e in edges] == ["a_b_2"]
+
+
+def test_writes_in_other_processes_invalidate_via_shared_version(test_db: Session, small_graph):
+    # Two stores stand in for two API workers
+    worker_1 = GraphStore(version_check_interval=0)
+    worker_2 = GraphStore(version_check_interval=0)
+    worker_1.get_graph(test_db)
+    worker_2.get_graph(test_db)
+    stamp = read_shared_version(test_db)
+
+    test_db.add(_mechanism("a_c", "a", "c", "political", "A"))
+    test_db.commit()
+
+    assert read_shared_version(test_db) == stamp + 1
+    assert worker_2.get_graph(test_db).has_edge("a", "c")
+    assert worker_1.get_graph(test_db).has_edge("a", "c")
+
+    # Unchanged stamp: no rebuild
+    G = worker_2.get_graph(test_db)
+    assert worker_2.get_graph(test_db) is G
+
+
+def test_record_write_bumps_shared_version_on_commit(test_db: Session, small_graph):
+    store = GraphStore(version_check_interval=0)
+    store.get_graph(test_db)
+    version = store.version
+    stamp = read_shared_version(test_db)
+
+    store.record_write(test_db)
+    store.record_write(test_db)  # Once per transaction
+    test_db.rollback()
+    assert read_shared_version(test_db) == stamp
+    assert store.version == version
+
+    store.record_write(test_db)
+    test_db.commit()
+    assert read_shared_version(test_db) == stamp + 1
+    assert store.version == version + 1
+    # The commit already accounted for its own stamp
+    store.get_graph(test_db)
+    assert store.version == version + 1
@@ -0,0 +1,207 @@
+"""
+Tests for hierarchy traversal (utils.hierarchy) and the hierarchy endpoints.
+
+Tests cover:
+- Ancestors and descendants with shortest distances in a DAG
+- Depth-limited traversal
+- Cycle detection against the live junction table
+- Termination on corrupt (cyclic) hierarchy data
+- /ancestors, /descendants and relationship endpoints
+- Hierarchy tree assembly, subtree fetch and expansion in a fixed number of queries
+- Batched recompute of depth, primary_path and all_ancestors
+- Relationship changes committed together with the graph version bump
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+from models import Node
+from models.database import engine
+from models.mechanism import node_hierarchy
+from services.graph_store import read_shared_version
+from utils.hierarchy import (
+    get_all_ancestors,
+    get_all_descendants,
+    get_ancestor_depths,
+    get_descendant_depths,
+    recompute_hierarchy_fields,
+    validate_hierarchy_integrity,
+    would_create_cycle,
+)
+
+
+@pytest.fixture
+def dag(test_db: Session):
+    """
+    root -> economic -> income -> wages
+    root -> social -> income (income has two parents)
+    """
+    test_db.add_all([
+        Node(id=node_id, name=node_id.title(), node_type="stock", category="economic", scale=4,
+             depth=depth, is_grouping_node=depth < 2)
+        for node_id, depth in [("root", 0), ("economic", 1), ("social", 1), ("income", 2), ("wages", 3)]
+    ])
+    test_db.flush()
+    test_db.execute(insert(node_hierarchy), [
+        {"parent_node_id": "root", "child_node_id": "economic"},
+        {"parent_node_id": "root", "child_node_id": "social"},
+        {"parent_node_id": "economic", "child_node_id": "income"},
+        {"parent_node_id": "social", "child_node_id": "income"},
+        {"parent_node_id": "income", "child_node_id": "wages"},
+    ])
+    test_db.commit()
+
+
+def test_ancestors_and_descendants(test_db: Session, dag):
+    assert get_ancestor_depths(test_db, "wages", Node) == {"income": 1, "economic": 2, "social": 2, "root": 3}
+    assert get_descendant_depths(test_db, "root", Node) == {"economic": 1, "social": 1, "income": 2, "wages": 3}
+
+    assert get_all_ancestors(test_db, "root", Node) == set()
+    assert get_all_descendants(test_db, "income", Node) == {"wages"}
+    assert get_all_descendants(test_db, "missing", Node) == set()
+
+
+def test_depth_limit(test_db: Session, dag):
+    assert get_descendant_depths(test_db, "root", Node, max_depth=1) == {"economic": 1, "social": 1}
+    assert set(get_ancestor_depths(test_db, "wages", Node, max_depth=2)) == {"income", "economic", "social"}
+
+
+def test_would_create_cycle(test_db: Session, dag):
+    assert would_create_cycle(test_db, "wages", "root", Node)
+    assert would_create_cycle(test_db, "income", "income", Node)
+    assert not would_create_cycle(test_db, "social", "wages", Node)
+
+
+def test_traversal_terminates_on_cyclic_data(test_db: Session, dag):
+    test_db.execute(insert(node_hierarchy), [{"parent_node_id": "wages", "child_node_id": "root"}])
+    test_db.commit()
+
+    assert get_all_descendants(test_db, "root", Node) == {"economic", "social", "income", "wages"}
+    assert get_all_ancestors(test_db, "root", Node) == {"economic", "social", "income", "wages"}
+
+
+def test_hierarchy_endpoints(client: TestClient, dag):
+    ancestors = client.get("/api/nodes/wages/ancestors").json()
+    assert [a["id"] for a in ancestors["ancestors"]] == ["income", "economic", "social", "root"]
+
+    descendants = client.get("/api/nodes/root/descendants", params={"max_depth": 2}).json()
+    assert {d["id"] for d in descendants["descendants"]} == {"economic", "social", "income"}
+    assert descendants["totalCount"] == 3
+    assert descendants["maxDepth"] == 2
+
+    assert client.get("/api/nodes/missing/descendants").status_code == 404
+
+    cyclic = client.post("/api/nodes/hierarchy/relationship", json={"parentId": "wages", "childId": "economic"})
+    assert cyclic.status_code == 400
+    assert "cycle" in cyclic.json()["detail"]
+
+
+def _tree_ids(tree_node):
+    return {tree_node["id"]: [_tree_ids(c) for c in tree_node["children"] or []]}
+
+
+def test_hierarchy_tree(client: TestClient, dag):
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        tree = client.get("/api/nodes/hierarchy/tree").json()
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert len(statements) == 2
+    # income has two parents, so it is shown under both
+    assert [_tree_ids(r) for r in tree["roots"]] == [
+        {"root": [{"economic": [{"income": [{"wages": []}]}]}, {"social": [{"income": [{"wages": []}]}]}]}
+    ]
+    assert tree["totalNodes"] == 7
+    assert tree["maxDepth"] == 3
+    assert tree["roots"][0]["childCount"] == 2
+
+
+def test_hierarchy_subtree_and_expansion(client: TestClient, dag):
+    shallow = client.get("/api/nodes/hierarchy/tree", params={"root": "economic", "max_depth": 1}).json()
+    assert [_tree_ids(r) for r in shallow["roots"]] == [{"economic": [{"income": []}]}]
+    # childCount tells the explorer income can be expanded
+    assert shallow["roots"][0]["children"][0]["childCount"] == 1
+
+    expanded = client.get(
+        "/api/nodes/hierarchy/tree", params={"root": "economic", "max_depth": 1, "expand": "income"}
+    ).json()
+    assert [_tree_ids(r) for r in expanded["roots"]] == [{"economic": [{"income": [{"wages": []}]}]}]
+
+    assert client.get("/api/nodes/hierarchy/tree", params={"root": "missing"}).status_code == 404
+
+
+def _fields(test_db: Session):
+    test_db.expire_all()
+    return {n.id: (n.depth, n.primary_path, sorted(n.all_ancestors or [])) for n in test_db.query(Node).all()}
+
+
+def test_recompute_hierarchy_fields(test_db: Session, dag):
+    assert recompute_hierarchy_fields(test_db, Node) == 5
+    assert _fields(test_db) == {
+        "root": (0, "root", []),
+        "economic": (1, "root/economic", ["root"]),
+        "social": (1, "root/social", ["root"]),
+        "income": (2, "root/economic/income", ["economic", "root", "social"]),
+        "wages": (3, "root/economic/income/wages", ["economic", "income", "root", "social"]),
+    }
+    assert validate_hierarchy_integrity(test_db, Node) == []
+
+
+def test_relationship_changes_update_descendants(client: TestClient, test_db: Session, dag):
+    recompute_hierarchy_fields(test_db, Node)
+
+    response = client.delete("/api/nodes/hierarchy/relationship",
+                             params={"parent_id": "economic", "child_id": "income"})
+    assert response.status_code == 200
+    fields = _fields(test_db)
+    assert fields["income"] == (2, "root/social/income", ["root", "social"])
+    assert fields["wages"] == (3, "root/social/income/wages", ["income", "root", "social"])
+
+    # Re-rooting income directly under root makes it shallower
+    response = client.post("/api/nodes/hierarchy/relationship",
+                           json={"parentId": "root", "childId": "income", "orderIndex": -1})
+    assert response.status_code == 200
+    fields = _fields(test_db)
+    assert fields["income"] == (2, "root/income", ["root", "social"])
+    assert fields["wages"][1] == "root/income/wages"
+    assert validate_hierarchy_integrity(test_db, Node) == []
+
+
+def test_relationship_change_commits_once_with_version_bump(client: TestClient, test_db: Session, dag):
+    stamp = read_shared_version(test_db)
+    commits = []
+
+    def count_commit(session):
+        commits.append(session)
+
+    event.listen(test_db, "after_commit", count_commit)
+    try:
+        added = client.post("/api/nodes/hierarchy/relationship", json={"parentId": "root", "childId": "wages"})
+        removed = client.delete("/api/nodes/hierarchy/relationship",
+                                params={"parent_id": "root", "child_id": "wages"})
+    finally:
+        event.remove(test_db, "after_commit", count_commit)
+
+    assert added.status_code == removed.status_code == 200
+    # One transaction per change, each carrying its own version bump
+    assert len(commits) == 2
+    assert read_shared_version(test_db) == stamp + 2
+
+
+def test_validate_reports_cycles_and_stale_fields(test_db: Session, dag):
+    errors = dict(validate_hierarchy_integrity(test_db, Node))
+    assert "Ancestor mismatch" in errors["wages"]
+
+    test_db.execute(insert(node_hierarchy), [{"parent_node_id": "wages", "child_node_id": "income"}])
+    test_db.commit()
+    errors = dict(validate_hierarchy_integrity(test_db, Node))
+    assert errors["income"].startswith("Cycle detected")
+    assert errors["wages"].startswith("Cycle detected")
@@ -0,0 +1,173 @@
+"""
+Tests for the persistent HTTP response cache (utils.http_cache).
+
+Tests cover:
+- Replaying requests from disk across cache instances
+- Per-source and negative-result TTLs, Cache-Control handling
+- Rate limiting only requests that miss the cache
+- Hit/miss counters
+- Cached async literature searches
+- Binary, oversized and licensed publisher responses never stored
+- Credential parameters stripped from stored URLs
+"""
+
+import time
+from unittest.mock import patch
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from pipelines.literature_search import LiteratureSearchAggregator
+from utils.citation_validation import CitationValidator
+from utils.http_cache import HttpCache, mount_cache
+
+
+CROSSREF_URL = "https://api.crossref.org/works/10.1000/xyz"
+
+
+class FakeNetwork:
+    """Stands in for HTTPAdapter.send; counts requests that reach the network."""
+
+    def __init__(self, status=200, headers=None, body=b'{"ok": true}'):
+        self.status, self.headers, self.body = status, headers or {}, body
+        self.sent = []
+
+    def __call__(self, request, **kwargs):
+        self.sent.append(request.url)
+        response = requests.Response()
+        response.status_code = self.status
+        response.headers.update(self.headers)
+        response._content = self.body
+        response.url = request.url
+        response.request = request
+        return response
+
+
+def _session(cache, **kwargs):
+    session = requests.Session()
+    mount_cache(session, cache=cache, **kwargs)
+    return session
+
+
+def test_responses_replay_from_disk(tmp_path):
+    network = FakeNetwork()
+    with patch.object(HTTPAdapter, "send", network):
+        first = _session(HttpCache(tmp_path / "cache.sqlite")).get(CROSSREF_URL, params={"a": "1"})
+        # A new process (new HttpCache on the same file) replays without the network
+        cache = HttpCache(tmp_path / "cache.sqlite")
+        second = _session(cache).get(CROSSREF_URL, params={"a": "1"})
+        _session(cache).get(CROSSREF_URL, params={"a": "2"})
+
+    assert len(network.sent) == 2
+    assert second.json() == first.json() == {"ok": True}
+    assert second.from_cache and not hasattr(first, "from_cache")
+    assert cache.stats()["by_source"]["crossref"] == {"hits": 1, "misses": 1, "entries": 2}
+
+
+def test_ttls_and_cache_control():
+    cache = HttpCache(":memory:", ttls={"crossref": 100}, default_ttl=50, negative_ttl=10)
+
+    assert cache.ttl_for("crossref", 200, {}) == 100
+    assert cache.ttl_for("openalex", 200, {}) == 50
+    assert cache.ttl_for("crossref", 404, {}) == 10
+    assert cache.ttl_for("crossref", 200, {"Cache-Control": "public, max-age=30"}) == 30
+    assert cache.ttl_for("crossref", 200, {"Cache-Control": "no-store"}) == 0
+    assert cache.ttl_for("crossref", 429, {}) == 0
+    assert cache.ttl_for("crossref", 503, {}) == 0
+
+
+def test_negative_results_expire_sooner():
+    cache = HttpCache(":memory:", negative_ttl=0.05)
+    network = FakeNetwork(status=404)
+    with patch.object(HTTPAdapter, "send", network):
+        session = _session(cache)
+        assert session.get(CROSSREF_URL).status_code == 404
+        assert session.get(CROSSREF_URL).from_cache
+        time.sleep(0.1)
+        session.get(CROSSREF_URL)
+
+    assert len(network.sent) == 2
+
+
+def test_errors_and_no_cache_requests_go_to_network():
+    cache = HttpCache(":memory:")
+    with patch.object(HTTPAdapter, "send", FakeNetwork(status=503)) as network:
+        _session(cache).get(CROSSREF_URL)
+        _session(cache).get(CROSSREF_URL)
+    assert len(network.sent) == 2
+
+    with patch.object(HTTPAdapter, "send", FakeNetwork()) as network:
+        _session(cache).get(CROSSREF_URL)
+        _session(cache).get(CROSSREF_URL, headers={"Cache-Control": "no-cache"})
+    assert len(network.sent) == 2
+
+
+def test_binary_large_and_licensed_responses_not_stored():
+    cache = HttpCache(":memory:", max_body_bytes=100)
+    json_type = {"Content-Type": "application/json"}
+
+    assert cache.store("GET", CROSSREF_URL, None, 200, json_type, b'{"ok": true}')
+    assert not cache.store("GET", CROSSREF_URL, None, 200, {"Content-Type": "application/pdf"}, b"%PDF-1.7")
+    assert not cache.store("GET", CROSSREF_URL, None, 200, json_type, b"x" * 101)
+
+    with patch.object(HTTPAdapter, "send", FakeNetwork(headers=json_type)) as network:
+        for _ in range(2):
+            _session(cache).get("https://api.elsevier.com/content/article/doi/10.1016/xyz")
+    assert len(network.sent) == 2
+    assert "elsevier" not in cache.stats()["by_source"]
+
+
+def test_credentials_stripped_from_stored_urls():
+    cache = HttpCache(":memory:")
+    url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
+    with patch.object(HTTPAdapter, "send", FakeNetwork()) as network:
+        _session(cache).get(url, params={"term": "asthma", "email": "me@example.org", "api_key": "secret"})
+        # Another key or email replays the same entry
+        replay = _session(cache).get(url, params={"term": "asthma", "email": "you@example.org"})
+
+    assert len(network.sent) == 1
+    assert replay.url == f"{url}?term=asthma"
+    stored = cache._conn.execute("SELECT url FROM responses").fetchall()
+    assert stored == [(f"{url}?term=asthma",)]
+
+
+def test_rate_limit_applies_only_to_misses():
+    waits = []
+    with patch.object(HTTPAdapter, "send", FakeNetwork()):
+        session = _session(HttpCache(":memory:"), before_send=lambda: waits.append(1))
+        for _ in range(3):
+            session.get(CROSSREF_URL)
+
+    assert waits == [1]
+
+
+def test_doi_verification_is_cached():
+    validator = CitationValidator(rate_limit=0)
+    mount_cache(validator.session, cache=HttpCache(":memory:"), before_send=validator._rate_limit_delay)
+    body = b'{"message": {"title": ["A title"], "DOI": "10.1000/xyz", "author": []}}'
+
+    with patch.object(HTTPAdapter, "send", FakeNetwork(body=body)) as network:
+        results = [validator.verify_doi("10.1000/xyz") for _ in range(2)]
+
+    assert len(network.sent) == 1
+    assert results[0] == results[1]
+    assert results[0]["metadata"]["title"] == "A title"
+
+
+def test_async_search_replays_from_cache():
+    calls = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"data": [{"paperId": "p1", "title": "Cached paper"}]})
+
+    cache = HttpCache(":memory:")
+    aggregator = LiteratureSearchAggregator(transport=httpx.MockTransport(handle), cache=cache)
+
+    first = aggregator.search("asthma", sources=["semantic_scholar"])
+    second = aggregator.search("asthma", sources=["semantic_scholar"])
+
+    assert len(calls) == 1
+    assert [p.title for p in second] == [p.title for p in first] == ["Cached paper"]
+    assert cache.stats()["by_source"]["semantic_scholar"]["hits"] == 1
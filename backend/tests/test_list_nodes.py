@@ -0,0 +1,78 @@
+"""
+Tests for GET /api/nodes/ (aggregated node listing).
+
+Tests cover:
+- Mechanism counts and the referenced_only filter
+- Offset and keyset pagination with totals
+- Filters combined with pagination
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from models import Mechanism, Node
+
+
+def _mechanism(mech_id, from_id, to_id):
+    return Mechanism(
+        id=mech_id, name=f"{from_id} -> {to_id}", from_node_id=from_id, to_node_id=to_id,
+        direction="positive", category="economic", mechanism_pathway=["test"],
+        evidence_quality="B", evidence_n_studies=1, evidence_primary_citation="Test (2024)",
+        description="Test"
+    )
+
+
+@pytest.fixture
+def node_bank(test_db: Session):
+    test_db.add_all([
+        Node(id=f"node_{i}", name=f"Node {i}", node_type="stock",
+             category="economic" if i % 2 else "political", scale=1 + i % 7)
+        for i in range(6)
+    ])
+    test_db.add(Node(id="orphan", name="Orphan", node_type="stock", category="economic", scale=3))
+    test_db.add_all([
+        _mechanism("m01", "node_0", "node_1"),
+        _mechanism("m12", "node_1", "node_2"),
+        _mechanism("m13", "node_1", "node_3"),
+        _mechanism("m45", "node_4", "node_5"),
+    ])
+    test_db.commit()
+
+
+def test_counts_and_referenced_filter(client: TestClient, node_bank):
+    data = client.get("/api/nodes/").json()
+
+    assert data["total"] == 6
+    assert data["referenced_count"] == 6
+    counts = {n["id"]: n["mechanism_count"] for n in data["nodes"]}
+    assert counts == {"node_0": 1, "node_1": 3, "node_2": 1, "node_3": 1, "node_4": 1, "node_5": 1}
+
+    data = client.get("/api/nodes/", params={"referenced_only": False}).json()
+    assert data["total"] == 7
+    assert {n["id"]: n["mechanism_count"] for n in data["nodes"]}["orphan"] == 0
+
+
+def test_offset_and_keyset_pagination(client: TestClient, node_bank):
+    page1 = client.get("/api/nodes/", params={"limit": 4}).json()
+    page2 = client.get("/api/nodes/", params={"limit": 4, "offset": 4}).json()
+
+    assert [n["id"] for n in page1["nodes"]] == ["node_0", "node_1", "node_2", "node_3"]
+    assert [n["id"] for n in page2["nodes"]] == ["node_4", "node_5"]
+    assert page1["total"] == page2["total"] == 6
+    assert page1["next_after"] == "node_3"
+    assert page2["next_after"] is None
+
+    keyset = client.get("/api/nodes/", params={"limit": 4, "after": page1["next_after"]}).json()
+    assert [n["id"] for n in keyset["nodes"]] == ["node_4", "node_5"]
+
+    past_end = client.get("/api/nodes/", params={"limit": 4, "offset": 10}).json()
+    assert past_end["nodes"] == []
+    assert past_end["total"] == 6
+    assert past_end["referenced_count"] == 6
+
+
+def test_filters(client: TestClient, node_bank):
+    data = client.get("/api/nodes/", params={"category": "economic", "search": "node"}).json()
+    assert [n["id"] for n in data["nodes"]] == ["node_1", "node_3", "node_5"]
+    assert data["total"] == 3
@@ -0,0 +1,152 @@
+"""
+Tests for the async literature search engine (pipelines.literature_search).
+
+Tests cover:
+- Token bucket pacing
+- Concurrent fan-out of queries x sources under per-provider rate limits
+- Per-query deduplication with Semantic Scholar results first
+- Retrying HTTP 429 responses
+- Malformed response bodies failing only their own query
+- Batched node-pair search (NodePairDiscovery.search_papers_for_pairs)
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import httpx
+
+from pipelines.literature_search import LiteratureSearchAggregator, TokenBucket
+from pipelines.node_pair_discovery import NodePair, NodePairDiscovery
+
+
+PUBMED_XML = """<PubmedArticleSet><PubmedArticle><MedlineCitation>
+<PMID>{pmid}</PMID><Article><ArticleTitle>PubMed {query}</ArticleTitle>
+<Abstract><AbstractText>Abstract</AbstractText></Abstract></Article>
+</MedlineCitation><PubmedData><ArticleIdList>
+<ArticleId IdType="doi">{doi}</ArticleId></ArticleIdList></PubmedData></PubmedArticle></PubmedArticleSet>"""
+
+
+def _handler(calls, latency=0.05, rate_limited=(), malformed=()):
+    """Fake Semantic Scholar / PubMed: one paper per source, shared DOI per query."""
+    async def handle(request: httpx.Request) -> httpx.Response:
+        calls.append((request.url.path, time.monotonic()))
+        await asyncio.sleep(latency)
+        params = request.url.params
+
+        if request.url.path.endswith("/paper/search"):
+            query = params["query"]
+            if query in rate_limited and sum(1 for c in calls if c[0].endswith("/paper/search")) == 1:
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            if query in malformed:
+                return httpx.Response(200, content=b"<html>Service busy</html>")
+            return httpx.Response(200, json={"data": [{
+                "paperId": f"ss-{query}", "title": f"Semantic Scholar {query}", "abstract": "Abstract",
+                "year": 2020, "authors": [], "citationCount": 1,
+                "externalIds": {"DOI": f"10.1/{query}"},
+            }]})
+        if request.url.path.endswith("/esearch.fcgi"):
+            return httpx.Response(200, json={"esearchresult": {"idlist": [params["term"]]}})
+        if request.url.path.endswith("/efetch.fcgi"):
+            query = params["id"]
+            if query in malformed:
+                return httpx.Response(200, content=b"<PubmedArticleSet><PubmedArticle>")
+            return httpx.Response(200, content=PUBMED_XML.format(pmid=query, query=query, doi=f"10.1/{query}"))
+        return httpx.Response(404)
+
+    return handle
+
+
+def _aggregator(calls, **kwargs):
+    aggregator = LiteratureSearchAggregator(transport=httpx.MockTransport(_handler(calls, **kwargs)))
+    # Generous quotas so the test measures concurrency, not the real provider limits
+    aggregator.semantic_scholar.rate_limit_delay = 0.01
+    aggregator.pubmed.rate_limit_delay = 0.01
+    return aggregator
+
+
+def test_token_bucket_paces_requests():
+    async def run():
+        bucket = TokenBucket(rate=20, capacity=1)
+        start = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    # First token is immediate, the next four arrive at 20/s
+    assert 0.18 <= asyncio.run(run()) < 0.5
+
+
+def test_search_many_fans_out_concurrently():
+    calls = []
+    queries = [f"q{i}" for i in range(8)]
+    start = time.perf_counter()
+    results = _aggregator(calls).search_many(queries, limit_per_source=5)
+    elapsed = time.perf_counter() - start
+
+    # 8 Semantic Scholar + 16 PubMed requests at 50ms latency: ~1.2s if sequential
+    assert len(calls) == 24
+    assert elapsed < 0.6
+    assert len(results) == len(queries)
+    for query, papers in zip(queries, results):
+        # Both sources return the same DOI; the Semantic Scholar record wins
+        assert [p.title for p in papers] == [f"Semantic Scholar {query}"]
+
+
+def test_provider_rate_limit_bounds_request_rate():
+    calls = []
+    aggregator = _aggregator(calls, latency=0)
+    aggregator.semantic_scholar.rate_limit_delay = 0.1
+
+    aggregator.search_many(["a", "b", "c", "d"], sources=["semantic_scholar"])
+
+    times = [t for path, t in calls if path.endswith("/paper/search")]
+    assert len(times) == 4
+    assert times[-1] - times[0] >= 0.28
+
+
+def test_search_single_query_and_sources():
+    calls = []
+    papers = _aggregator(calls).search("asthma", sources=["pubmed"])
+
+    assert [p.pmid for p in papers] == ["asthma"]
+    assert all("/paper/search" not in path for path, _ in calls)
+
+
+def test_rate_limited_request_is_retried():
+    calls = []
+    papers = _aggregator(calls, rate_limited={"asthma"}).search("asthma", sources=["semantic_scholar"])
+
+    assert len(calls) == 2
+    assert [p.semantic_scholar_id for p in papers] == ["ss-asthma"]
+
+
+def test_malformed_response_fails_only_its_query():
+    calls = []
+    results = _aggregator(calls, malformed={"bad query"}).search_many(["good query", "bad query"])
+
+    assert [p.title for p in results[0]] == ["Semantic Scholar good query"]
+    assert results[1] == []
+
+
+def test_search_papers_for_pairs_batches_queries():
+    discovery = NodePairDiscovery(pubmed_email="test@example.com")
+    discovery.config = {"search_config": {"search_templates": ["{from_keywords} AND {to_keywords}"]}}
+    pairs = [
+        NodePair(from_node_id=f"from_{i}", from_node_name=f"From {i}", to_node_id="to", to_node_name="To",
+                 expected_direction="positive", category="economic", priority=1,
+                 from_keywords=[f"from {i}"], to_keywords=["to"])
+        for i in range(3)
+    ]
+
+    with patch("pipelines.node_pair_discovery.LiteratureSearchAggregator") as mock_aggregator:
+        mock_aggregator.return_value.search_many.side_effect = lambda queries, **kwargs: [
+            _aggregator([]).search_many([q])[0] for q in queries
+        ]
+        evidence = discovery.search_papers_for_pairs(pairs, max_papers=10)
+
+    # One batched call for every pair's queries
+    assert mock_aggregator.return_value.search_many.call_count == 1
+    assert not mock_aggregator.return_value.search.called
+    assert [e.node_pair.from_node_id for e in evidence] == ["from_0", "from_1", "from_2"]
+    assert all(e.papers and len(e.search_queries_used) >= 1 for e in evidence)
@@ -0,0 +1,133 @@
+"""
+Tests for the LLM response cache (utils.llm_cache).
+
+Tests cover:
+- Identical requests answered from the cache, across cache instances
+- Keys covering model, prompt and sampling parameters
+- Least-recently-used eviction under the size cap
+- Replay mode offline with a stub client
+- LLMClient and FunctionalFormClassifier reading through the cache
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from anthropic.types import Message
+
+from algorithms.functional_form_classifier import FunctionalFormClassifier
+from extraction.llm_client import LLMClient
+from utils.llm_cache import CachingClient, LLMCacheMiss, LLMResponseCache, cached_client, request_key
+
+
+class StubAnthropic:
+    """Stands in for anthropic.Anthropic; answers with a canned text and counts calls."""
+
+    def __init__(self, text="stub answer"):
+        self.text = text
+        self.requests = []
+        self.messages = SimpleNamespace(create=self._create, batches="batches-api")
+
+    def _create(self, **params):
+        self.requests.append(params)
+        return Message.model_validate({
+            "id": f"msg_{len(self.requests)}", "type": "message", "role": "assistant",
+            "model": params["model"], "content": [{"type": "text", "text": self.text}],
+            "stop_reason": "end_turn", "usage": {"input_tokens": 10, "output_tokens": 5},
+        })
+
+
+def _request(prompt="Classify this mechanism", **overrides):
+    return {"model": "claude-sonnet-4-20250514", "max_tokens": 100, "temperature": 0.0,
+            "messages": [{"role": "user", "content": prompt}], **overrides}
+
+
+def test_identical_requests_hit_cache(tmp_path):
+    stub = StubAnthropic()
+    client = cached_client(stub, cache=LLMResponseCache(tmp_path / "llm.sqlite"), mode="readwrite")
+
+    first = client.messages.create(**_request())
+    second = client.messages.create(**_request(), timeout=30)
+
+    assert len(stub.requests) == 1
+    assert second.content[0].text == first.content[0].text == "stub answer"
+    assert second.usage.input_tokens == 10
+    assert client.messages.batches == "batches-api"
+
+    # A new run (new cache instance, same file) needs no API call
+    rerun = cached_client(StubAnthropic(), cache=LLMResponseCache(tmp_path / "llm.sqlite"), mode="readwrite")
+    assert rerun.messages.create(**_request()).content[0].text == "stub answer"
+    assert rerun._client.requests == []
+    assert rerun.cache.stats()["hits"] == 1
+
+
+def test_key_covers_model_prompt_and_params():
+    base = request_key(_request())
+
+    assert request_key(dict(reversed(list(_request().items())))) == base
+    assert request_key(_request(timeout=10)) == base
+    assert request_key(_request("Another prompt")) != base
+    assert request_key(_request(model="claude-3-5-haiku-20241022")) != base
+    assert request_key(_request(temperature=0.7)) != base
+    assert request_key(_request(system="Be terse")) != base
+
+
+def test_lru_eviction_under_size_cap():
+    cache = LLMResponseCache(":memory:", max_bytes=400)
+    text = "x" * 100
+
+    cache.put(_request("a"), text)
+    cache.put(_request("b"), text)
+    assert cache.get(_request("a")) is not None
+    cache.put(_request("c"), text)
+
+    stats = cache.stats()
+    assert stats["evictions"] == 1 and stats["entries"] == 2
+    assert stats["bytes"] <= 400
+    assert cache.get(_request("b")) is None
+    assert cache.get(_request("a")).content[0].text == text
+
+
+def test_replay_mode_is_offline():
+    cache = LLMResponseCache(":memory:")
+    cache.put(_request(), "recorded answer")
+    client = cached_client(None, cache=cache, mode="replay")
+
+    assert client.messages.create(**_request()).content[0].text == "recorded answer"
+    with pytest.raises(LLMCacheMiss):
+        client.messages.create(**_request("never recorded"))
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["stores"]) == (1, 1, 1)
+
+
+def test_mode_off_and_invalid_mode():
+    stub = StubAnthropic()
+    assert cached_client(stub, mode="off") is stub
+    with pytest.raises(ValueError):
+        cached_client(stub, mode="sometimes")
+
+
+def test_llm_client_reads_through_cache():
+    stub = StubAnthropic(text="extracted")
+    llm = LLMClient(api_key="test-key")
+    llm.client = CachingClient(stub, LLMResponseCache(":memory:"))
+
+    assert llm.call("Extract mechanisms") == llm.call("Extract mechanisms") == "extracted"
+    assert len(stub.requests) == 1
+
+
+def test_classifier_replays_recorded_response():
+    classifier = FunctionalFormClassifier(anthropic_api_key="test-key")
+    stub = StubAnthropic(text='{"primary_form": "sigmoid", "confidence": 0.9, "reasoning": "saturates"}')
+    recorder = CachingClient(stub, LLMResponseCache(":memory:"))
+    classifier.client = recorder
+    mechanism = {"id": "m1", "from_node": "a", "to_node": "b", "direction": "positive",
+                 "mechanism_pathway": ["step"], "evidence": {}}
+
+    recorded = classifier.classify(mechanism)
+
+    # Same prompt, no API: the stub is gone
+    classifier.client = cached_client(None, cache=recorder.cache, mode="replay")
+    replayed = classifier.classify(mechanism)
+    assert (replayed.form, replayed.confidence) == (recorded.form, recorded.confidence) == ("sigmoid", 0.9)
+    assert len(stub.requests) == 1
@@ -4,6 +4,10 @@ Integration tests for mechanisms API endpoints.
 Tests CRUD operations and filtering for mechanisms.
 """
 
+import csv
+import io
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
@@ -341,3 +345,96 @@ class TestStatsEndpoint:
         assert data["by_direction"]["negative"] == 1
         assert data["by_evidence_quality"]["A"] == 1
         assert data["by_evidence_quality"]["B"] == 1
+
+
+def _bank(test_db: Session, count: int = 5):
+    """Two nodes and `count` mechanisms between them (mech0..mechN)."""
+    test_db.add_all([
+        Node(id="node1", name="Housing Quality", node_type="stock", category="built_environment", scale=2),
+        Node(id="node2", name="Asthma Incidence", node_type="stock", category="biological", scale=7),
+    ])
+    test_db.add_all([
+        Mechanism(
+            id=f"mech{i}",
+            name=f"Mech {i}",
+            from_node_id="node1",
+            to_node_id="node2" if i % 2 else "missing_node",
+            direction="positive",
+            category="economic" if i % 2 else "built_environment",
+            mechanism_pathway=["test"],
+            evidence_quality="A",
+            evidence_n_studies=1,
+            evidence_primary_citation="Test (2024)",
+            description="Test mechanism"
+        )
+        for i in range(count)
+    ])
+    test_db.commit()
+
+
+class TestMechanismsCursorPagination:
+    """Tests for cursor pagination on GET /api/mechanisms/."""
+
+    def test_cursor_walks_all_pages(self, client: TestClient, test_db: Session):
+        """Following X-Next-Cursor returns every mechanism once, in ID order."""
+        _bank(test_db)
+
+        seen, after = [], None
+        while True:
+            params = {"limit": 2, **({"after": after} if after else {})}
+            response = client.get("/api/mechanisms/", params=params)
+            assert response.status_code == 200
+            seen.extend(m["id"] for m in response.json())
+            after = response.headers.get("X-Next-Cursor")
+            if after is None:
+                break
+
+        assert seen == [f"mech{i}" for i in range(5)]
+
+    def test_cursor_with_filter(self, client: TestClient, test_db: Session):
+        """Cursor pagination respects filters."""
+        _bank(test_db)
+
+        response = client.get("/api/mechanisms/", params={"category": "economic", "after": "mech1"})
+        assert [m["id"] for m in response.json()] == ["mech3"]
+        assert "X-Next-Cursor" not in response.headers
+
+
+class TestMechanismsExport:
+    """Tests for GET /api/mechanisms/export."""
+
+    def test_export_ndjson(self, client: TestClient, test_db: Session):
+        """NDJSON export streams one list item per line."""
+        _bank(test_db)
+
+        response = client.get("/api/mechanisms/export")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [r["id"] for r in rows] == [f"mech{i}" for i in range(5)]
+        assert rows[1]["to_node_name"] == "Asthma Incidence"
+        assert rows[1]["to_node_scale"] == 7
+        # Missing node falls back to the ID and scale 4, as in the list view
+        assert rows[0]["to_node_name"] == "missing_node"
+        assert rows[0]["to_node_scale"] == 4
+
+    def test_export_csv_with_filter(self, client: TestClient, test_db: Session):
+        """CSV export has a header row and applies filters."""
+        _bank(test_db)
+
+        response = client.get("/api/mechanisms/export", params={"format": "csv", "category": "economic"})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [r["id"] for r in rows] == ["mech1", "mech3"]
+        assert rows[0]["from_node_scale"] == "2"
+
+    def test_export_matches_list(self, client: TestClient, test_db: Session):
+        """Exported rows equal the list endpoint's items."""
+        _bank(test_db)
+
+        listed = client.get("/api/mechanisms/").json()
+        exported = [json.loads(line) for line in client.get("/api/mechanisms/export").text.splitlines()]
+        assert exported == listed
@@ -590,9 +590,9 @@ class TestIntegration:
     @patch('pipelines.node_pair_discovery.LiteratureSearchAggregator')
     def test_search_papers_for_pair(self, mock_aggregator, discovery_instance, sample_papers):
         """Test paper search for a node pair."""
-        # Mock the search results
+        # Mock the search results (one result list per query)
         mock_instance = MagicMock()
-        mock_instance.search.return_value = [
+        papers = [
             MagicMock(
                 title=p.title,
                 abstract=p.abstract,
@@ -603,6 +603,7 @@ class TestIntegration:
             )
             for p in sample_papers
         ]
+        mock_instance.search_many.side_effect = lambda queries, **kwargs: [papers for _ in queries]
         mock_aggregator.return_value = mock_instance
 
         discovery_instance.pubmed_email = "test@test.com"
@@ -612,6 +613,9 @@ class TestIntegration:
 
         assert evidence.node_pair == pairs[0]
         assert len(evidence.papers) > 0
+        # The pair's queries go out as one concurrent batch
+        mock_instance.search_many.assert_called_once()
+        mock_instance.search.assert_not_called()
 
     def test_full_pipeline_dry_run(self, sample_config):
         """Test that dry run doesn't make API calls."""
@@ -0,0 +1,160 @@
+"""
+Tests for bounded, ranked simple-path search used by /pathfinding.
+
+Tests cover:
+- Same path set as nx.all_simple_paths when unbounded
+- Ranking by hop count, then evidence cost
+- max_paths cutoff and expansion budget (truncated flag)
+- Strongest-evidence A* / bidirectional Dijkstra against plain Dijkstra
+- all_simple algorithm through the API
+"""
+
+import random
+
+import networkx as nx
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from models import Mechanism, Node
+from services.graph_store import GraphStore
+from services.path_search import (
+    edge_cost, ranked_simple_paths, scale_heuristic, strongest_evidence_path
+)
+
+
+@pytest.fixture
+def random_graph():
+    rng = random.Random(3)
+    G = nx.gnp_random_graph(30, 0.15, seed=3, directed=True)
+    for u, v in G.edges():
+        G[u][v]['weight'] = rng.choice([1, 2, 3])
+    return G
+
+
+def _cost(G, path):
+    return sum(edge_cost(G[u][v]) for u, v in zip(path, path[1:]))
+
+
+def test_unbounded_search_matches_all_simple_paths(random_graph):
+    expected = {tuple(p) for p in nx.all_simple_paths(random_graph, 0, 29, cutoff=4)}
+
+    result = ranked_simple_paths(random_graph, 0, 29, max_paths=10**6, max_depth=4)
+
+    assert {tuple(p) for p in result.paths} == expected
+    assert not result.truncated
+
+
+def test_paths_ranked_by_hops_then_cost(random_graph):
+    result = ranked_simple_paths(random_graph, 0, 29, max_paths=200, max_depth=5)
+    keys = [(len(p), round(_cost(random_graph, p), 9)) for p in result.paths]
+
+    assert keys == sorted(keys)
+
+
+def test_max_paths_stops_early(random_graph):
+    full = ranked_simple_paths(random_graph, 0, 29, max_paths=10**6, max_depth=4)
+    top = ranked_simple_paths(random_graph, 0, 29, max_paths=3, max_depth=4)
+
+    assert len(top.paths) == 3
+    assert top.expansions < full.expansions
+    assert not top.truncated
+
+
+def test_expansion_budget_sets_truncated(random_graph):
+    result = ranked_simple_paths(random_graph, 0, 29, max_paths=50, max_depth=6, max_expansions=5)
+
+    assert result.truncated
+    assert result.expansions == 5
+
+
+def test_unreachable_and_same_node():
+    G = nx.DiGraph([("a", "b")])
+    assert ranked_simple_paths(G, "b", "a", max_paths=5, max_depth=3).paths == []
+    assert ranked_simple_paths(G, "a", "a", max_paths=5, max_depth=3).paths == []
+
+
+def test_strongest_evidence_matches_dijkstra(random_graph):
+    rng = random.Random(5)
+    for node in random_graph.nodes():
+        random_graph.nodes[node]['scale'] = rng.randint(1, 7)
+    random_graph.graph['max_scale_step'] = GraphStore._max_scale_step(random_graph)
+    assert scale_heuristic(random_graph, 29) is not None
+
+    for source, target in [(0, 29), (3, 17), (12, 4)]:
+        expected = nx.dijkstra_path_length(
+            random_graph, source, target, weight=lambda u, v, d: edge_cost(d)
+        )
+        path = strongest_evidence_path(random_graph, source, target)
+
+        assert path[0] == source and path[-1] == target
+        assert _cost(random_graph, path) == pytest.approx(expected)
+
+
+def test_strongest_evidence_without_scales_uses_dijkstra():
+    G = nx.DiGraph()
+    G.add_edge("a", "b", cost=1.0)
+    G.add_edge("b", "c", cost=1.0)
+    G.add_edge("a", "c", cost=3.0)
+
+    assert scale_heuristic(G, "c") is None
+    assert strongest_evidence_path(G, "a", "c") == ["a", "b", "c"]
+    with pytest.raises(nx.NetworkXNoPath):
+        strongest_evidence_path(G, "c", "a")
+
+
+def _mechanism(mech_id, from_id, to_id, quality):
+    return Mechanism(
+        id=mech_id, name=f"{from_id} -> {to_id}", from_node_id=from_id, to_node_id=to_id,
+        direction="positive", category="economic", mechanism_pathway=["test"],
+        evidence_quality=quality, evidence_n_studies=1, evidence_primary_citation="Test (2024)",
+        description="Test"
+    )
+
+
+def test_all_simple_endpoint(client: TestClient, test_db: Session):
+    test_db.add_all([
+        Node(id=node_id, name=node_id.upper(), node_type="stock", category="economic", scale=3)
+        for node_id in ["s", "x", "y", "t"]
+    ])
+    test_db.add_all([
+        _mechanism("s_x", "s", "x", "C"),
+        _mechanism("x_t", "x", "t", "C"),
+        _mechanism("s_y", "s", "y", "A"),
+        _mechanism("y_t", "y", "t", "A"),
+        _mechanism("s_t", "s", "t", "B"),
+    ])
+    test_db.commit()
+
+    response = client.post("/api/nodes/pathfinding", json={
+        "from_node": "s", "to_node": "t", "algorithm": "all_simple", "max_paths": 2
+    })
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["truncated"] is False
+    assert [p["nodes"] for p in data["paths"]] == [["s", "t"], ["s", "y", "t"]]
+
+
+def test_strongest_evidence_endpoint(client: TestClient, test_db: Session):
+    test_db.add_all([
+        Node(id="policy", name="Policy", node_type="stock", category="political", scale=1),
+        Node(id="a", name="A", node_type="stock", category="economic", scale=3),
+        Node(id="b", name="B", node_type="stock", category="economic", scale=4),
+        Node(id="crisis", name="Crisis", node_type="stock", category="crisis", scale=7),
+    ])
+    test_db.add_all([
+        _mechanism("policy_crisis", "policy", "crisis", "C"),
+        _mechanism("policy_a", "policy", "a", "A"),
+        _mechanism("a_b", "a", "b", "B"),
+        _mechanism("b_crisis", "b", "crisis", "A"),
+        _mechanism("a_crisis", "a", "crisis", "B"),
+    ])
+    test_db.commit()
+
+    response = client.post("/api/nodes/pathfinding", json={
+        "from_node": "policy", "to_node": "crisis", "algorithm": "strongest_evidence"
+    })
+
+    assert response.status_code == 200
+    assert response.json()["paths"][0]["nodes"] == ["policy", "a", "crisis"]
@@ -0,0 +1,128 @@
+"""
+Tests for the precomputed pathway catalogue and /api/pathways.
+
+Tests cover:
+- Pathway discovery from scale-1 to scale-7 nodes
+- Stable pathway IDs across rebuilds
+- List filters, search and detail lookups
+- Rebuild after the mechanism graph changes
+- Workers adopting a table already built for the current graph
+"""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from api.routes.pathways import pathway_catalogue
+from models import Mechanism, Node, Pathway
+from services import pathway_catalogue as catalogue_module
+from services.graph_store import GraphStore, read_shared_version
+from services.pathway_catalogue import PATHWAYS_VERSION_NAME, PathwayCatalogue, make_pathway_id
+
+
+def _mechanism(mech_id, from_id, to_id, quality, category="economic", direction="positive"):
+    return Mechanism(
+        id=mech_id, name=f"{from_id} -> {to_id}", from_node_id=from_id, to_node_id=to_id,
+        direction=direction, category=category, mechanism_pathway=["test"],
+        evidence_quality=quality, evidence_n_studies=1, evidence_primary_citation="Test (2024)",
+        description="Test"
+    )
+
+
+@pytest.fixture
+def pathway_graph(test_db: Session):
+    """policy -> income -> mortality (A, A) and policy -> stress -> mortality (C, B)."""
+    test_db.add_all([
+        Node(id="policy", name="Wage Policy", node_type="stock", category="political", scale=1),
+        Node(id="income", name="Household Income", node_type="stock", category="economic", scale=4),
+        Node(id="stress", name="Chronic Stress", node_type="stock", category="biological", scale=6),
+        Node(id="mortality", name="Mortality", node_type="crisis_endpoint", category="crisis", scale=7),
+    ])
+    test_db.add_all([
+        _mechanism("policy_income", "policy", "income", "A"),
+        _mechanism("income_mortality", "income", "mortality", "A", direction="negative"),
+        _mechanism("policy_stress", "policy", "stress", "C", category="biological"),
+        _mechanism("stress_mortality", "stress", "mortality", "B", category="biological"),
+    ])
+    test_db.commit()
+
+
+def test_catalogue_discovers_policy_to_crisis_pathways(test_db: Session, pathway_graph):
+    count = pathway_catalogue.rebuild(test_db)
+
+    assert count == 2
+    ids = {p.id for p in test_db.query(Pathway).all()}
+    assert make_pathway_id(["policy_income", "income_mortality"]) in ids
+    assert make_pathway_id(["policy_stress", "stress_mortality"]) in ids
+
+
+def test_pathway_ids_are_stable_across_rebuilds(test_db: Session, pathway_graph):
+    pathway_catalogue.rebuild(test_db)
+    first = {p.id for p in test_db.query(Pathway).all()}
+    pathway_catalogue.rebuild(test_db)
+
+    assert {p.id for p in test_db.query(Pathway).all()} == first
+
+
+def test_list_filters_and_order(client: TestClient, pathway_graph):
+    response = client.get("/api/pathways/")
+    assert response.status_code == 200
+    data = response.json()
+    assert [p["avgEvidenceQuality"] for p in data] == [3.0, 1.5]
+    assert data[0]["title"] == "Wage Policy to Mortality"
+    assert data[0]["overallDirection"] == "mixed"
+
+    assert len(client.get("/api/pathways/?min_evidence=A").json()) == 1
+    assert len(client.get("/api/pathways/?category=biological").json()) == 1
+    assert len(client.get("/api/pathways/?tag=biological").json()) == 1
+
+
+def test_search_and_detail(client: TestClient, pathway_graph):
+    results = client.get("/api/pathways/search?query=wage").json()
+    assert len(results) == 2
+
+    pathway_id = make_pathway_id(["policy_income", "income_mortality"])
+    response = client.get(f"/api/pathways/{pathway_id}")
+    assert response.status_code == 200
+    detail = response.json()
+    assert detail["evidenceGrade"] == "A"
+    assert [m["mechanismId"] for m in detail["mechanisms"]] == ["policy_income", "income_mortality"]
+    assert detail["mechanisms"][0]["toNode"] == "Household Income"
+
+    assert client.get("/api/pathways/pathway_missing").status_code == 404
+    assert client.get("/api/pathways/not-a-pathway").status_code == 400
+
+
+def test_catalogue_rebuilds_after_graph_change(client: TestClient, test_db: Session, pathway_graph):
+    assert len(client.get("/api/pathways/").json()) == 2
+
+    test_db.query(Mechanism).filter(Mechanism.id == "stress_mortality").one().evidence_quality = "A"
+    test_db.add(_mechanism("policy_mortality", "policy", "mortality", "B"))
+    test_db.commit()
+
+    data = client.get("/api/pathways/").json()
+    assert len(data) == 3
+    assert sorted(p["avgEvidenceQuality"] for p in data) == [2.0, 2.0, 3.0]
+
+
+def test_workers_share_the_built_table(test_db: Session, pathway_graph):
+    # Catalogues over separate stores stand in for separate API workers
+    workers = [PathwayCatalogue(GraphStore(version_check_interval=0), background_refresh=False) for _ in range(3)]
+
+    with patch.object(catalogue_module, "discover_pathways", wraps=catalogue_module.discover_pathways) as discover:
+        for worker in workers:
+            worker.ensure_current(test_db)
+        assert discover.call_count == 1
+        assert read_shared_version(test_db, PATHWAYS_VERSION_NAME) == read_shared_version(test_db)
+
+        # A write in any worker: the next worker to look rebuilds, the others adopt
+        test_db.add(_mechanism("policy_mortality", "policy", "mortality", "B"))
+        test_db.commit()
+        for worker in reversed(workers):
+            worker.ensure_current(test_db)
+        assert discover.call_count == 2
+
+    assert all(worker.is_current for worker in workers)
+    assert test_db.query(Pathway).count() == 3
@@ -0,0 +1,143 @@
+"""
+Tests for the sliding-window rate limiter.
+
+Tests cover:
+- Budget enforcement within a window and recovery across windows
+- Previous-window weighting of the sliding estimate
+- Per-route costs and exempt paths in the middleware
+- Idle-key eviction
+- Per-process limits while the shared backend is down
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.middleware import rate_limit as rate_limit_module
+from api.middleware.rate_limit import (
+    REDIS_AVAILABLE,
+    LocalRateLimitBackend,
+    RateLimitMiddleware,
+    create_rate_limit_backend,
+    route_cost,
+)
+
+
+def _hit(backend, key, cost=1, now=0.0):
+    return asyncio.run(backend.hit(key, cost, now=now))
+
+
+def test_limit_within_window_and_recovery():
+    backend = LocalRateLimitBackend(limit=3, window=60)
+
+    assert [_hit(backend, "ip", now=1.0).allowed for _ in range(4)] == [True, True, True, False]
+    blocked = _hit(backend, "ip", now=1.0)
+    assert blocked.remaining == 0
+    assert blocked.retry_after == 60
+
+    # Other clients have their own budget
+    assert _hit(backend, "other", now=1.0).allowed
+
+    # Two windows later the budget is fully restored
+    assert _hit(backend, "ip", now=121.0).remaining == 2
+
+
+def test_previous_window_is_weighted():
+    backend = LocalRateLimitBackend(limit=10, window=60)
+    assert _hit(backend, "ip", cost=10, now=59.0).allowed
+
+    # 15s into the next window, 75% of the previous window still counts
+    assert not _hit(backend, "ip", cost=3, now=75.0).allowed
+    result = _hit(backend, "ip", cost=2, now=75.0)
+    assert result.allowed
+    assert result.remaining == 0
+
+    # 45s in, only 25% counts
+    assert _hit(backend, "ip", cost=5, now=105.0).allowed
+
+
+def test_idle_keys_are_evicted():
+    backend = LocalRateLimitBackend(limit=5, window=60, shards=1)
+    for i in range(100):
+        _hit(backend, f"ip{i}", now=1.0)
+    assert len(backend) == 100
+
+    _hit(backend, "fresh", now=200.0)
+    assert len(backend) == 1
+
+
+def test_route_costs():
+    assert route_cost("/api/nodes/pathfinding") > route_cost("/api/nodes/importance") > route_cost("/api/mechanisms/")
+    assert route_cost("/api/mechanisms/") == 1
+
+
+def test_middleware_charges_route_costs():
+    app = FastAPI()
+    backend = LocalRateLimitBackend(limit=6, window=3600)
+    app.add_middleware(RateLimitMiddleware, backend=backend)
+
+    @app.get("/api/nodes/pathfinding")
+    def expensive():
+        return {}
+
+    @app.get("/api/mechanisms/")
+    def cheap():
+        return {}
+
+    @app.get("/health")
+    def health():
+        return {}
+
+    with TestClient(app) as client:
+        response = client.get("/api/nodes/pathfinding")
+        assert response.status_code == 200
+        assert response.headers["X-RateLimit-Remaining"] == "1"
+
+        assert client.get("/api/mechanisms/").status_code == 200
+        blocked = client.get("/api/mechanisms/")
+        assert blocked.status_code == 429
+        assert "Retry-After" in blocked.headers
+
+        # Health checks are never limited
+        assert client.get("/health").status_code == 200
+
+
+class DownBackend:
+    """Shared backend whose server is unreachable."""
+
+    name = "down"
+    limit = 2
+
+    def __init__(self):
+        self.calls = 0
+
+    async def hit(self, key, cost=1, now=None):
+        self.calls += 1
+        raise ConnectionError("rate limit server unreachable")
+
+
+def test_backend_outage_uses_local_limits():
+    app = FastAPI()
+    backend = DownBackend()
+    app.add_middleware(RateLimitMiddleware, backend=backend)
+
+    @app.get("/api/mechanisms/")
+    def cheap():
+        return {}
+
+    with TestClient(app) as client:
+        assert [client.get("/api/mechanisms/").status_code for _ in range(3)] == [200, 200, 429]
+
+    # The failing backend isn't retried on every request
+    assert backend.calls == 1
+
+
+@pytest.mark.skipif(not REDIS_AVAILABLE, reason="redis package not installed")
+def test_unreachable_redis_falls_back():
+    with patch.object(rate_limit_module.settings, "rate_limit_backend", "redis"), \
+            patch.object(rate_limit_module.settings, "redis_url", "redis://127.0.0.1:1/0"):
+        assert isinstance(create_rate_limit_backend(), LocalRateLimitBackend)
@@ -0,0 +1,194 @@
+"""
+Tests for the graph-version-aware response cache.
+
+Tests cover:
+- Cache hits for repeated requests with reordered parameters
+- ETag revalidation returning 304 Not Modified
+- Entries retired when the mechanism graph changes
+- Non-cached endpoints and error responses passing through
+- LRU eviction and TTL expiry in the in-process backend
+- Requests bypassing the cache when its backend is down
+- Graph writes in another worker retiring this worker's entries
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from api.middleware import response_cache as middleware_module
+from api.middleware.response_cache import ResponseCacheMiddleware, create_response_cache
+from models import Mechanism, Node
+from services.graph_store import GraphStore
+from services.response_cache import (
+    CachedResponse,
+    REDIS_AVAILABLE,
+    MemoryCacheBackend,
+    ResponseCache,
+    etag_matches,
+    normalize_request,
+)
+
+
+def _mechanism(mech_id, from_id, to_id):
+    return Mechanism(
+        id=mech_id, name=f"{from_id} -> {to_id}", from_node_id=from_id, to_node_id=to_id,
+        direction="positive", category="economic", mechanism_pathway=["test"],
+        evidence_quality="A", evidence_n_studies=1, evidence_primary_citation="Test (2024)",
+        description="Test"
+    )
+
+
+@pytest.fixture
+def small_graph(test_db: Session):
+    test_db.add_all([
+        Node(id="a", name="A", node_type="stock", category="economic", scale=1),
+        Node(id="b", name="B", node_type="stock", category="economic", scale=4),
+        Node(id="c", name="C", node_type="stock", category="economic", scale=7),
+    ])
+    test_db.add_all([_mechanism("a_b", "a", "b"), _mechanism("b_c", "b", "c")])
+    test_db.commit()
+
+
+def test_repeated_request_is_served_from_cache(client: TestClient, small_graph):
+    first = client.get("/api/mechanisms/stats/summary?category=economic&evidence_quality=A")
+    second = client.get("/api/mechanisms/stats/summary?evidence_quality=A&category=economic")
+
+    assert first.status_code == second.status_code == 200
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert first.headers["etag"] == second.headers["etag"]
+    assert first.json() == second.json()
+
+
+def test_post_body_key_ignores_json_formatting(client: TestClient, small_graph):
+    first = client.post("/api/nodes/pathfinding", content='{"from_node": "a", "to_node": "c"}',
+                        headers={"content-type": "application/json"})
+    second = client.post("/api/nodes/pathfinding", content='{"to_node":"c","from_node":"a"}',
+                         headers={"content-type": "application/json"})
+
+    assert first.status_code == 200
+    assert second.headers["x-cache"] == "HIT"
+    assert second.json() == first.json()
+
+
+def test_if_none_match_returns_304(client: TestClient, small_graph):
+    response = client.get("/api/nodes/importance")
+    etag = response.headers["etag"]
+
+    revalidated = client.get("/api/nodes/importance", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+
+    assert client.get("/api/nodes/importance", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+
+def test_graph_change_retires_cached_responses(client: TestClient, test_db: Session, small_graph):
+    before = client.get("/api/mechanisms/stats/summary")
+    assert before.json()["total_mechanisms"] == 2
+
+    test_db.add(_mechanism("a_c", "a", "c"))
+    test_db.commit()
+
+    after = client.get("/api/mechanisms/stats/summary", headers={"If-None-Match": before.headers["etag"]})
+    assert after.status_code == 200
+    assert after.headers["x-cache"] == "MISS"
+    assert after.json()["total_mechanisms"] == 3
+
+
+def test_uncached_and_error_responses_pass_through(client: TestClient, small_graph):
+    assert "x-cache" not in client.get("/api/mechanisms/").headers
+
+    missing = client.post("/api/nodes/pathfinding", json={"from_node": "a", "to_node": "zzz"})
+    assert missing.status_code == 404
+    assert "etag" not in missing.headers
+
+
+class DownBackend(MemoryCacheBackend):
+    """Memory backend whose server is unreachable."""
+
+    name = "down"
+
+    async def generation(self) -> int:
+        raise ConnectionError("cache server unreachable")
+
+
+def _middleware(client: TestClient) -> ResponseCacheMiddleware:
+    middleware = client.app.middleware_stack
+    while not isinstance(middleware, ResponseCacheMiddleware):
+        middleware = middleware.app
+    return middleware
+
+
+def test_backend_outage_bypasses_cache(client: TestClient, small_graph):
+    with patch.object(_middleware(client), "cache", ResponseCache(GraphStore(), DownBackend())):
+        response = client.get("/api/mechanisms/stats/summary")
+
+    assert response.status_code == 200
+    assert response.json()["total_mechanisms"] == 2
+    assert "x-cache" not in response.headers
+
+
+def test_other_worker_write_retires_cached_responses(client: TestClient, test_db: Session, small_graph):
+    # This worker's store is only told about the write by the shared version stamp
+    worker = ResponseCache(GraphStore(version_check_interval=0), MemoryCacheBackend())
+
+    with patch.object(_middleware(client), "cache", worker):
+        assert client.get("/api/mechanisms/stats/summary").headers["x-cache"] == "MISS"
+        assert client.get("/api/mechanisms/stats/summary").headers["x-cache"] == "HIT"
+
+        test_db.add(_mechanism("a_c", "a", "c"))
+        test_db.commit()
+
+        after = client.get("/api/mechanisms/stats/summary")
+        assert after.headers["x-cache"] == "MISS"
+        assert after.json()["total_mechanisms"] == 3
+
+
+@pytest.mark.skipif(not REDIS_AVAILABLE, reason="redis package not installed")
+def test_unreachable_redis_falls_back():
+    with patch.object(middleware_module.settings, "cache_backend", "redis"), \
+            patch.object(middleware_module.settings, "redis_url", "redis://127.0.0.1:1/0"):
+        assert isinstance(create_response_cache().backend, MemoryCacheBackend)
+
+
+def test_memory_backend_lru_and_ttl():
+    backend = MemoryCacheBackend(max_entries=2, ttl=3600)
+    entry = CachedResponse(body=b"{}", media_type="application/json", etag='"x"')
+
+    async def scenario():
+        await backend.set("k1", entry)
+        await backend.set("k2", entry)
+        await backend.get("k1")  # k1 becomes most recently used
+        await backend.set("k3", entry)
+        return [await backend.get(k) is not None for k in ("k1", "k2", "k3")]
+
+    assert asyncio.run(scenario()) == [True, False, True]
+
+    backend.ttl = -1
+    asyncio.run(backend.set("k4", entry))
+    assert asyncio.run(backend.get("k4")) is None
+
+
+def test_key_changes_with_graph_version():
+    store = GraphStore()
+    cache = ResponseCache(store, MemoryCacheBackend())
+
+    before = asyncio.run(cache.key("GET", "/api/pathways/", b"tag=x", b""))
+    assert asyncio.run(cache.key("GET", "/api/pathways", b"tag=x", b"")) == before
+    store.invalidate()
+    assert asyncio.run(cache.key("GET", "/api/pathways/", b"tag=x", b"")) != before
+
+
+def test_request_normalization_and_etag_matching():
+    assert normalize_request("get", "/x", b"b=2&a=1", b"") == normalize_request("GET", "/x/", b"a=1&b=2", b"")
+    assert normalize_request("POST", "/x", b"", b'{"a": [1, 2]}') != normalize_request("POST", "/x", b"", b'{"a": [2, 1]}')
+
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('W/"abc", "def"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches(None, '"abc"')
+    assert not etag_matches('"def"', '"abc"')
@@ -0,0 +1,147 @@
+"""
+Tests for the full-text search index and /api/search.
+
+Tests cover:
+- Prefix matching with all-token (AND) semantics
+- Title matches ranking above body matches
+- Kind filters and pagination
+- In-memory and SQLite FTS5 backends returning the same matches
+- Index rebuild after the graph changes
+- Workers sharing one built table
+- A stale index serving queries while the background rebuild runs
+"""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session, sessionmaker
+
+import services.search_index as search_module
+from models import Mechanism, Node
+from models.database import engine
+from services.graph_store import GraphStore, read_shared_version
+from services.search_index import SEARCH_VERSION_NAME, InvertedIndex, SearchIndex, SQLiteFTSIndex
+
+
+def _mechanism(mech_id, from_id, to_id, description, steps):
+    return Mechanism(
+        id=mech_id, name=f"{from_id} -> {to_id}", from_node_id=from_id, to_node_id=to_id,
+        direction="positive", category="economic", mechanism_pathway=steps,
+        evidence_quality="A", evidence_n_studies=1, evidence_primary_citation="Test (2024)",
+        description=description
+    )
+
+
+@pytest.fixture
+def search_corpus(test_db: Session):
+    test_db.add_all([
+        Node(id="eviction_rate", name="Eviction Rate", node_type="stock", category="economic",
+             scale=4, description="Formal evictions per 100 renter households"),
+        Node(id="housing_instability", name="Housing Instability", node_type="stock", category="economic",
+             scale=4, description="Frequent moves and eviction risk"),
+        Node(id="asthma", name="Asthma Prevalence", node_type="stock", category="biological",
+             scale=7, description="Share of adults with asthma"),
+    ])
+    test_db.add_all([
+        _mechanism("eviction_rate_asthma", "eviction_rate", "asthma",
+                   "Evictions push families into substandard housing",
+                   ["Displacement into housing with mold exposure"]),
+    ])
+    test_db.commit()
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite_fts5"])
+def test_prefix_and_ranking(test_db: Session, search_corpus, backend):
+    index = SearchIndex(GraphStore(), backend=backend)
+
+    page = index.search(test_db, "evic")
+    assert page.total == 3
+    # Title match outranks description-only matches
+    assert page.hits[0].id == "eviction_rate"
+    assert {h.id for h in page.hits} == {"eviction_rate", "housing_instability", "eviction_rate_asthma"}
+
+    # Every token must match
+    assert [h.id for h in index.search(test_db, "instab evic", kinds=["node"]).hits] == ["housing_instability"]
+    # Mechanism pathway steps are indexed
+    assert [h.id for h in index.search(test_db, "mold").hits] == ["eviction_rate_asthma"]
+    assert index.search(test_db, "zzz").total == 0
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite_fts5"])
+def test_kind_filter_and_pagination(test_db: Session, search_corpus, backend):
+    index = SearchIndex(GraphStore(), backend=backend)
+
+    nodes = index.search(test_db, "evic", kinds=["node"])
+    assert nodes.total == 2
+    assert {h.kind for h in nodes.hits} == {"node"}
+
+    first = index.search(test_db, "evic", limit=2)
+    second = index.search(test_db, "evic", limit=2, offset=2)
+    assert first.total == second.total == 3
+    assert len(first.hits) == 2 and len(second.hits) == 1
+    assert {h.id for h in first.hits}.isdisjoint({h.id for h in second.hits})
+
+
+def test_backends_agree(test_db: Session, search_corpus):
+    memory = SearchIndex(GraphStore(), backend=InvertedIndex.name)
+    fts = SearchIndex(GraphStore(), backend=SQLiteFTSIndex.name)
+
+    for query in ["asthma", "hous", "rate evic", "per 100"]:
+        assert {h.id for h in memory.search(test_db, query, limit=50).hits} == \
+            {h.id for h in fts.search(test_db, query, limit=50).hits}
+
+
+def test_workers_share_the_built_table(test_db: Session, search_corpus):
+    # Indexes over separate stores stand in for separate API workers
+    workers = [SearchIndex(GraphStore(version_check_interval=0), backend=SQLiteFTSIndex.name) for _ in range(3)]
+
+    with patch.object(search_module, "collect_documents", wraps=search_module.collect_documents) as collect:
+        for worker in workers:
+            assert worker.search(test_db, "evic").total == 3
+        assert collect.call_count == 1
+        assert read_shared_version(test_db, SEARCH_VERSION_NAME) == read_shared_version(test_db)
+
+        # A write in any worker: the next worker to look rebuilds, the others adopt
+        test_db.add(Node(id="eviction_filings", name="Eviction Filings", node_type="stock",
+                         category="economic", scale=4))
+        test_db.commit()
+        for worker in reversed(workers):
+            assert worker.search(test_db, "evic").total == 4
+        assert collect.call_count == 2
+
+
+def test_stale_index_serves_during_background_rebuild(test_db: Session, search_corpus):
+    store = GraphStore(version_check_interval=None)
+    index = SearchIndex(store, session_factory=sessionmaker(bind=engine), backend=InvertedIndex.name)
+    assert index.search(test_db, "evic").total == 3
+
+    test_db.add(Node(id="eviction_filings", name="Eviction Filings", node_type="stock",
+                     category="economic", scale=4))
+    test_db.commit()
+
+    with patch.object(index, "refresh_in_background") as refresh:
+        store.invalidate()
+        # The previous index answers without a rebuild on the request thread
+        assert index.search(test_db, "evic").total == 3
+        assert refresh.called and not index.is_current
+
+    index._rebuild_in_background(store.version)
+    assert index.is_current
+    assert index.search(test_db, "evic").total == 4
+
+
+def test_search_endpoint(client: TestClient, test_db: Session, search_corpus):
+    response = client.get("/api/search/", params={"q": "asthma", "types": ["node"]})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 1
+    assert data["results"][0] == {**data["results"][0], "type": "node", "id": "asthma"}
+
+    assert client.get("/api/search/", params={"q": "asthma", "types": ["bogus"]}).status_code == 400
+
+    # New nodes are searchable after the graph changes
+    test_db.add(Node(id="asthma_ed_visits", name="Asthma ED Visits", node_type="stock",
+                     category="healthcare_access", scale=7))
+    test_db.commit()
+    assert client.get("/api/search/", params={"q": "asthma", "types": ["node"]}).json()["total"] == 2
@@ -0,0 +1,135 @@
+"""
+Tests for the database seeder (scripts/seed_database.py).
+
+Tests cover:
+- Bulk seeding producing the same nodes, hierarchy and mechanisms as seed()
+- Stub nodes for mechanism endpoints missing from the node bank
+- Quality filtering and unparseable files in bulk mode
+- Per-stage timings
+- Bulk seeding from a compiled bank snapshot
+- Parsing across a process pool
+"""
+
+import pytest
+from sqlalchemy import select
+
+from models.mechanism import Mechanism, Node, node_hierarchy
+from scripts.seed_database import MAX_DEFAULT_WORKERS, DatabaseSeeder, default_worker_count
+from utils.bank_snapshot import open_bank
+
+
+NODE_FILES = {
+    "scale_1/housing.yml": "id: housing\nname: Housing\nhierarchy:\n  depth: 0\n  is_grouping_node: true\n",
+    "scale_4/rent_burden.yml": (
+        "id: rent_burden\nname: Rent Burden\ncategory: economic\n"
+        "hierarchy:\n  depth: 1\n  parent_ids: [housing, missing_parent]\n"
+    ),
+    "scale_7/asthma.yml": "id: asthma\nname: Asthma\nscale: 7\ncategory: biological\n",
+}
+
+MECHANISM_FILES = {
+    "economic/rent_burden_to_asthma.yml": (
+        "id: rent_burden_to_asthma\nname: Rent burden raises asthma\ncategory: economic\n"
+        "direction: positive\nmechanism_pathway: [Step one]\n"
+        "evidence: {quality_rating: A, n_studies: 3, primary_citation: Test (2024)}\n"
+        "from_node: {node_id: rent_burden}\nto_node: {node_id: asthma}\n"
+    ),
+    "economic/eviction_to_asthma.yml": (
+        "id: eviction_to_asthma\ncategory: economic\n"
+        "evidence: {quality_rating: B, primary_citation: Test (2024)}\n"
+        "from_node: {node_id: 'NEW:eviction_filings', node_name: Eviction Filings}\nto_node: {node_id: asthma}\n"
+    ),
+    "economic/low_quality_to_asthma.yml": (
+        "id: low_quality_to_asthma\ncategory: economic\nevidence: {quality_rating: C}\n"
+        "from_node: {node_id: rent_burden}\nto_node: {node_id: asthma}\n"
+    ),
+    "economic/broken.yml": "id: [unterminated\n",
+}
+
+
+def _write(root, files):
+    paths = []
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def bank(tmp_path):
+    return _write(tmp_path / "nodes", NODE_FILES), _write(tmp_path / "mechanisms", MECHANISM_FILES)
+
+
+def _seed(tmp_path, name, bank, bulk, workers=1, **kwargs):
+    seeder = DatabaseSeeder(database_url=f"sqlite:///{tmp_path / name}", **kwargs)
+    seeder.init_tables()
+    node_files, mechanism_files = bank
+    seeder.load_node_files = lambda: node_files
+    seeder.load_mechanism_files = lambda: mechanism_files
+    if bulk == "snapshot":
+        sources = {"node": tmp_path / "nodes", "mechanism": tmp_path / "mechanisms"}
+        with open_bank(tmp_path / "bank.snapshot", sources) as snapshot:
+            stats = seeder.seed_bulk(bank=snapshot)
+    else:
+        stats = seeder.seed_bulk(workers=workers) if bulk else seeder.seed()
+
+    session = seeder.SessionLocal()
+    try:
+        nodes = {
+            n.id: (n.name, n.scale, n.category, n.depth, n.is_grouping_node, sorted(n.all_ancestors or []))
+            for n in session.scalars(select(Node))
+        }
+        edges = set(session.execute(select(node_hierarchy.c.parent_node_id, node_hierarchy.c.child_node_id)).tuples())
+        mechanisms = {
+            m.id: (m.from_node_id, m.to_node_id, m.direction, m.evidence_quality, m.evidence_n_studies)
+            for m in session.scalars(select(Mechanism))
+        }
+    finally:
+        session.close()
+        seeder.engine.dispose()
+    return seeder, stats, nodes, edges, mechanisms
+
+
+def test_bulk_seed_matches_sequential_seed(tmp_path, bank):
+    _, seq_stats, seq_nodes, seq_edges, seq_mechanisms = _seed(tmp_path, "seq.db", bank, bulk=False)
+    seeder, stats, nodes, edges, mechanisms = _seed(tmp_path, "bulk.db", bank, bulk=True)
+
+    assert nodes == seq_nodes
+    assert edges == seq_edges == {("housing", "rent_burden")}
+    assert mechanisms == seq_mechanisms
+    assert stats["mechanisms_created"] == 3
+    assert stats["files_failed"] == seq_stats["files_failed"] == 1
+
+    # Missing endpoints become stub nodes with the NEW: prefix stripped
+    assert nodes["eviction_filings"][0] == "Eviction Filings"
+    assert nodes["rent_burden"][5] == ["housing"]
+    assert set(seeder.stage_timings) >= {"parse", "insert_nodes", "insert_mechanisms", "commit"}
+
+
+def test_bulk_seed_in_process_pool(tmp_path, bank):
+    _, _, inline_nodes, inline_edges, inline_mechanisms = _seed(tmp_path, "inline.db", bank, bulk=True)
+    _, stats, nodes, edges, mechanisms = _seed(tmp_path, "pool.db", bank, bulk=True, workers=2)
+
+    assert (nodes, edges, mechanisms) == (inline_nodes, inline_edges, inline_mechanisms)
+    assert stats["mechanisms_created"] == 3
+    assert stats["files_failed"] == 1
+    assert 1 <= default_worker_count() <= MAX_DEFAULT_WORKERS
+
+
+def test_bulk_seed_quality_filter(tmp_path, bank):
+    _, stats, _, _, mechanisms = _seed(tmp_path, "bulk.db", bank, bulk=True, min_quality="B")
+
+    assert set(mechanisms) == {"rent_burden_to_asthma", "eviction_to_asthma"}
+    assert stats["mechanisms_filtered_quality"] == 1
+
+
+def test_bulk_seed_from_snapshot(tmp_path, bank):
+    _, _, seq_nodes, seq_edges, seq_mechanisms = _seed(tmp_path, "seq.db", bank, bulk=True)
+    seeder, stats, nodes, edges, mechanisms = _seed(tmp_path, "snap.db", bank, bulk="snapshot")
+
+    assert (nodes, edges, mechanisms) == (seq_nodes, seq_edges, seq_mechanisms)
+    assert stats["mechanisms_created"] == 3
+    assert stats["files_failed"] == 1
+    assert "discover" not in seeder.stage_timings
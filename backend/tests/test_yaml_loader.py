@@ -0,0 +1,183 @@
+"""
+Tests for the background admin YAML loaders (services/yaml_loader.py).
+
+Tests cover:
+- Job start, status polling and unknown job IDs
+- Node and mechanism loads with stub endpoint nodes
+- Skipping files unchanged since the last load, reloading changed ones
+- Per-file errors and forced reloads
+- Prefetching instead of per-file queries
+- Job status shared with, and one active job per kind across, workers
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from api.routes.mechanisms import yaml_loader
+from models import Mechanism, Node, SessionLocal, YamlLoadJobRecord
+from models.database import engine
+from services.graph_store import GraphStore
+from services.yaml_loader import STALE_JOB_AFTER, YamlLoader
+
+
+NODE_YAML = "id: {id}\nname: {name}\nscale: {scale}\ncategory: economic\n"
+
+MECHANISM_YAML = """\
+id: {id}
+name: {name}
+from_node: {{node_id: {from_id}, node_name: {from_name}}}
+to_node: {{node_id: asthma, node_name: Asthma}}
+direction: positive
+category: biological
+evidence: {{quality_rating: B, n_studies: 2, primary_citation: Test (2024)}}
+"""
+
+
+@pytest.fixture
+def bank(tmp_path, monkeypatch):
+    nodes_dir = tmp_path / "nodes"
+    mechanisms_dir = tmp_path / "mechanisms"
+    (mechanisms_dir / "economic").mkdir(parents=True)
+    nodes_dir.mkdir()
+    monkeypatch.setattr(yaml_loader, "nodes_dir", nodes_dir)
+    monkeypatch.setattr(yaml_loader, "mechanisms_dir", mechanisms_dir)
+    return nodes_dir, mechanisms_dir
+
+
+def _write_mechanism(mechanisms_dir, mech_id, name="Rent burden raises asthma", from_id="rent_burden"):
+    (mechanisms_dir / "economic" / f"{mech_id}.yml").write_text(MECHANISM_YAML.format(
+        id=mech_id, name=name, from_id=from_id, from_name=from_id.replace("_", " ").title()
+    ))
+
+
+def _load(client: TestClient, endpoint: str, **params):
+    response = client.post(f"/api/mechanisms/admin/{endpoint}", params=params)
+    assert response.status_code == 202
+    job = response.json()
+    status = client.get(job["status_url"])
+    assert status.status_code == 200
+    return status.json()
+
+
+def test_load_nodes(client: TestClient, test_db: Session, bank):
+    nodes_dir, _ = bank
+    (nodes_dir / "rent_burden.yml").write_text(NODE_YAML.format(id="rent_burden", name="Rent Burden", scale=4))
+    (nodes_dir / "bad_scale.yml").write_text(NODE_YAML.format(id="bad_scale", name="Bad", scale=9))
+
+    job = _load(client, "load-nodes-from-yaml")
+    assert job["status"] == "completed"
+    assert (job["loaded"], job["updated"], job["total_errors"]) == (1, 0, 1)
+    assert "scale must be between 1 and 7" in job["errors"][0]["error"]
+    assert job["progress"] == 1.0
+
+    node = test_db.get(Node, "rent_burden")
+    assert (node.name, node.scale, node.node_type) == ("Rent Burden", 4, "stock")
+
+    # Only the edited file is reloaded; the failed file is retried
+    (nodes_dir / "rent_burden.yml").write_text(NODE_YAML.format(id="rent_burden", name="Rent Cost Burden", scale=3))
+    job = _load(client, "load-nodes-from-yaml")
+    assert (job["loaded"], job["updated"], job["unchanged"], job["total_errors"]) == (0, 1, 0, 1)
+    test_db.expire_all()
+    assert test_db.get(Node, "rent_burden").name == "Rent Cost Burden"
+
+
+def test_load_mechanisms_incrementally(client: TestClient, test_db: Session, bank):
+    _, mechanisms_dir = bank
+    for i in range(5):
+        _write_mechanism(mechanisms_dir, f"mech_{i}", from_id=f"cause_{i}")
+    (mechanisms_dir / "economic" / "broken.yml").write_text("id: broken\n")
+
+    job = _load(client, "load-from-yaml")
+    assert job["status"] == "completed"
+    assert (job["total"], job["loaded"], job["total_errors"]) == (6, 5, 1)
+    assert test_db.query(Mechanism).count() == 5
+    # Endpoint nodes are created with inferred scales
+    asthma = test_db.get(Node, "asthma")
+    assert (asthma.name, asthma.scale) == ("Asthma", 7)
+
+    # Nothing changed: no file is re-parsed or rewritten
+    job = _load(client, "load-from-yaml")
+    assert (job["loaded"], job["updated"], job["unchanged"]) == (0, 0, 5)
+
+    _write_mechanism(mechanisms_dir, "mech_0", name="Edited")
+    _write_mechanism(mechanisms_dir, "mech_5", from_id="cause_5")
+    job = _load(client, "load-from-yaml")
+    assert (job["loaded"], job["updated"], job["unchanged"]) == (1, 1, 4)
+    test_db.expire_all()
+    assert test_db.get(Mechanism, "mech_0").name == "Edited"
+    assert test_db.get(Mechanism, "mech_0").from_node_id == "rent_burden"
+
+    # Deleted rows are restored even though their files are unchanged
+    test_db.delete(test_db.get(Mechanism, "mech_1"))
+    test_db.commit()
+    job = _load(client, "load-from-yaml")
+    assert (job["loaded"], job["unchanged"]) == (1, 5)
+
+    job = _load(client, "load-from-yaml", force=True)
+    assert (job["updated"], job["unchanged"]) == (6, 0)
+
+
+def test_load_uses_constant_queries(client: TestClient, bank):
+    _, mechanisms_dir = bank
+    for i in range(20):
+        _write_mechanism(mechanisms_dir, f"mech_{i}", from_id=f"cause_{i}")
+
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        job = _load(client, "load-from-yaml")
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert job["loaded"] == 20
+    # Scans and batched writes, plus the shared graph version bump and the job start lock
+    work = [s for s in statements if "yaml_load_jobs" not in s]
+    assert len(work) < 15
+    # Job status writes don't grow with the number of files either
+    assert len(statements) - len(work) < 10
+
+
+def test_unknown_job(client: TestClient):
+    assert client.get("/api/mechanisms/admin/load-jobs/missing").status_code == 404
+
+
+def test_job_status_shared_across_workers(client: TestClient, bank):
+    nodes_dir, mechanisms_dir = bank
+    _write_mechanism(mechanisms_dir, "mech_0")
+    job = _load(client, "load-from-yaml")
+
+    # Another worker's loader answers from the jobs table
+    other = YamlLoader(SessionLocal, GraphStore(), nodes_dir, mechanisms_dir, background=False)
+    assert other.get(job["job_id"]).to_dict() == {k: v for k, v in job.items() if k != "status_url"}
+    assert other.get("missing") is None
+
+
+def test_one_active_job_per_kind_across_workers(test_db: Session, bank):
+    _, mechanisms_dir = bank
+    _write_mechanism(mechanisms_dir, "mech_0")
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    # A load running in another worker
+    test_db.add(YamlLoadJobRecord(id="other", kind="mechanisms", status="running", phase="scanning",
+                                  created_at=now, updated_at=now))
+    test_db.commit()
+
+    job = yaml_loader.start("mechanisms")
+    assert (job.id, job.status) == ("other", "running")
+    assert test_db.query(Mechanism).count() == 0
+
+    # Without progress for too long, the job is abandoned and a new one runs
+    test_db.query(YamlLoadJobRecord).update({"updated_at": now - STALE_JOB_AFTER - timedelta(minutes=1)})
+    test_db.commit()
+    job = yaml_loader.start("mechanisms")
+    assert job.id != "other" and job.status == "completed"
+    assert test_db.query(Mechanism).count() == 1
+    test_db.expire_all()
+    assert test_db.get(YamlLoadJobRecord, "other").status == "failed"
@@ -0,0 +1,356 @@
+"""
+Compiled snapshot of the mechanism and node banks.
+
+Parsing the ~3,300 YAML files under mechanism-bank/mechanisms and
+Nodes/by_scale takes seconds; this module compiles them once into a single
+binary snapshot that loads in milliseconds:
+
+- Snapshot file: header, then one compact JSON blob per source document,
+  then a JSON index (kind, path, size, mtime, sha256, blob offset/length).
+  The file is memory-mapped and documents are decoded only when accessed.
+- Manifest file: per-file content hashes, for tooling and review.
+
+Recompiles are incremental: files whose size and mtime (or, failing that,
+content hash) match the previous snapshot reuse their compiled blob, so
+only changed files are re-parsed. Snapshots are replaced atomically, so
+open readers keep a consistent view.
+
+Usage:
+    with open_bank() as bank:
+        for entry, node in bank.documents("node"):
+            ...
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+from dataclasses import asdict, dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import yaml
+
+# libyaml-backed loader is several times faster; fall back to pure Python
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Same search order as scripts/seed_database.py: Docker layout, local dev, absolute Docker path
+MECHANISM_ROOTS = [
+    BACKEND_DIR / "mechanism-bank" / "mechanisms",
+    BACKEND_DIR.parent / "mechanism-bank" / "mechanisms",
+    Path("/app/mechanism-bank/mechanisms"),
+]
+NODE_ROOTS = [
+    BACKEND_DIR / "Nodes" / "by_scale",
+    BACKEND_DIR.parent / "Nodes" / "by_scale",
+    Path("/app/Nodes/by_scale"),
+]
+
+SNAPSHOT_NAME = "bank.snapshot"
+MANIFEST_SUFFIX = ".manifest.json"  # bank.snapshot -> bank.manifest.json
+
+MAGIC = b"HSBANK\x00\x01"
+FORMAT_VERSION = 1
+# magic, format version, document count, index offset, index length
+HEADER = struct.Struct("<8sIIQQ")
+
+# YAML dates have no JSON form; they round-trip as {"$date": iso} / {"$datetime": iso}
+_DATE_TAG = "$date"
+_DATETIME_TAG = "$datetime"
+
+
+@dataclass
+class SnapshotEntry:
+    """Index entry for one compiled source file."""
+    kind: str
+    path: str  # relative to the kind's source root, POSIX separators
+    sha256: str
+    size: int
+    mtime_ns: int
+    offset: int = 0
+    length: int = 0
+    tagged: bool = False  # blob contains tagged dates
+    error: Optional[str] = None  # parse error; the document is None
+
+
+@dataclass
+class CompileStats:
+    """Outcome of a (re)compile."""
+    reused: int = 0
+    parsed: int = 0
+    removed: int = 0
+    failed: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.parsed or self.removed)
+
+
+def default_sources() -> Dict[str, Path]:
+    """Source roots by kind ('mechanism', 'node'); missing roots are omitted."""
+    sources = {}
+    for kind, candidates in (("mechanism", MECHANISM_ROOTS), ("node", NODE_ROOTS)):
+        root = next((p for p in candidates if p.exists()), None)
+        if root is None:
+            logger.warning(f"No {kind} bank found. Tried: {[str(p) for p in candidates]}")
+        else:
+            sources[kind] = root
+    return sources
+
+
+def default_snapshot_path(sources: Dict[str, Path]) -> Path:
+    """Snapshot location: next to the mechanisms directory."""
+    root = sources.get("mechanism") or next(iter(sources.values()))
+    return root.parent / SNAPSHOT_NAME
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {_DATETIME_TAG: value.isoformat()}
+    if isinstance(value, date):
+        return {_DATE_TAG: value.isoformat()}
+    raise TypeError(f"Unsupported YAML value of type {type(value).__name__}")
+
+
+def _decode_tags(obj: Dict):
+    if len(obj) == 1:
+        if _DATE_TAG in obj:
+            return date.fromisoformat(obj[_DATE_TAG])
+        if _DATETIME_TAG in obj:
+            return datetime.fromisoformat(obj[_DATETIME_TAG])
+    return obj
+
+
+def _compile_document(content: bytes) -> Tuple[bytes, bool]:
+    """Parse YAML source and encode it as a compact JSON blob."""
+    document = yaml.load(content, Loader=YAMLLoader)
+    tagged = False
+
+    def encode(value):
+        nonlocal tagged
+        tagged = True
+        return _encode_value(value)
+
+    blob = json.dumps(document, separators=(",", ":"), ensure_ascii=False, default=encode)
+    return blob.encode("utf-8"), tagged
+
+
+def _source_files(root: Path) -> List[Path]:
+    return sorted(set(root.rglob("*.yml")) | set(root.rglob("*.yaml")))
+
+
+class BankSnapshot:
+    """
+    Read-only, memory-mapped view of a compiled snapshot.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open a snapshot file.
+
+        Args:
+            path: Snapshot file path
+
+        Raises:
+            ValueError: If the file is not a snapshot of this format version
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, index_offset, index_length = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"{self.path} is not a version {FORMAT_VERSION} bank snapshot")
+
+        index = json.loads(self._mmap[index_offset:index_offset + index_length])
+        self._entries = [SnapshotEntry(**e) for e in index]
+        self._by_key = {(e.kind, e.path): e for e in self._entries}
+        assert len(self._entries) == count
+
+    def entries(self, kind: Optional[str] = None) -> List[SnapshotEntry]:
+        """Index entries, optionally for one kind, in path order."""
+        return [e for e in self._entries if kind is None or e.kind == kind]
+
+    def entry(self, kind: str, path: str) -> Optional[SnapshotEntry]:
+        """Index entry for a source file, if compiled."""
+        return self._by_key.get((kind, path))
+
+    def raw(self, entry: SnapshotEntry) -> bytes:
+        """Compiled JSON blob of an entry."""
+        return self._mmap[entry.offset:entry.offset + entry.length]
+
+    def document(self, entry: SnapshotEntry):
+        """Decoded document of an entry (None if its source failed to parse)."""
+        if entry.error is not None:
+            return None
+        return json.loads(self.raw(entry), object_hook=_decode_tags if entry.tagged else None)
+
+    def documents(self, kind: Optional[str] = None) -> Iterator[Tuple[SnapshotEntry, Optional[Dict]]]:
+        """(entry, document) pairs, optionally for one kind."""
+        for entry in self.entries(kind):
+            yield entry, self.document(entry)
+
+    def manifest(self) -> Dict[str, str]:
+        """'kind:path' -> content hash for every compiled file."""
+        return {f"{e.kind}:{e.path}": e.sha256 for e in self._entries}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def __enter__(self) -> "BankSnapshot":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _open_previous(path: Path) -> Optional[BankSnapshot]:
+    if not path.exists():
+        return None
+    try:
+        return BankSnapshot(path)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable snapshot {path}: {e}")
+        return None
+
+
+def compile_bank(
+    snapshot_path: Optional[Path] = None,
+    sources: Optional[Dict[str, Path]] = None,
+    force: bool = False
+) -> CompileStats:
+    """
+    Compile (or incrementally recompile) the bank into a snapshot.
+
+    Args:
+        snapshot_path: Output file (default: next to the mechanisms directory)
+        sources: Source roots by kind (default: default_sources())
+        force: Re-parse every file instead of reusing unchanged blobs
+
+    Returns:
+        CompileStats (the snapshot is only rewritten if something changed)
+    """
+    sources = sources if sources is not None else default_sources()
+    if not sources:
+        raise FileNotFoundError("No bank sources to compile")
+    snapshot_path = Path(snapshot_path or default_snapshot_path(sources))
+    previous = None if force else _open_previous(snapshot_path)
+
+    stats = CompileStats()
+    entries: List[SnapshotEntry] = []
+    blobs: List[bytes] = []
+    stat_refreshed = False
+    try:
+        for kind, root in sources.items():
+            for file_path in _source_files(root):
+                rel = file_path.relative_to(root).as_posix()
+                st = file_path.stat()
+                old = previous.entry(kind, rel) if previous else None
+
+                if old and old.size == st.st_size and old.mtime_ns == st.st_mtime_ns:
+                    entry, blob = old, previous.raw(old)
+                    stats.reused += 1
+                else:
+                    content = file_path.read_bytes()
+                    sha = hashlib.sha256(content).hexdigest()
+                    if old and old.sha256 == sha:
+                        # Touched but unchanged: keep the blob, refresh the stat fields
+                        entry, blob = old, previous.raw(old)
+                        stats.reused += 1
+                        stat_refreshed = True
+                    else:
+                        entry = SnapshotEntry(kind=kind, path=rel, sha256=sha, size=0, mtime_ns=0)
+                        try:
+                            blob, entry.tagged = _compile_document(content)
+                        except Exception as e:
+                            blob, entry.error = b"null", str(e)
+                            stats.failed += 1
+                        stats.parsed += 1
+                    entry = SnapshotEntry(**{**asdict(entry), "size": st.st_size, "mtime_ns": st.st_mtime_ns})
+
+                entries.append(entry)
+                blobs.append(blob)
+
+        if previous:
+            current = {(e.kind, e.path) for e in entries}
+            stats.removed = sum(1 for e in previous.entries() if (e.kind, e.path) not in current)
+
+        if previous is not None and not stats.changed and not stat_refreshed:
+            return stats
+        _write_snapshot(snapshot_path, entries, blobs)
+    finally:
+        if previous:
+            previous.close()
+
+    logger.info(
+        f"Compiled bank snapshot {snapshot_path} ({len(entries)} files: "
+        f"{stats.parsed} parsed, {stats.reused} reused, {stats.removed} removed, {stats.failed} failed)"
+    )
+    return stats
+
+
+def _write_snapshot(path: Path, entries: List[SnapshotEntry], blobs: List[bytes]) -> None:
+    """Write snapshot and manifest atomically (readers keep the old file)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    with open(tmp_path, "wb") as f:
+        f.write(b"\x00" * HEADER.size)
+        offset = HEADER.size
+        for entry, blob in zip(entries, blobs):
+            entry.offset, entry.length = offset, len(blob)
+            f.write(blob)
+            offset += len(blob)
+        index = json.dumps([asdict(e) for e in entries], separators=(",", ":")).encode("utf-8")
+        f.write(index)
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(entries), offset, len(index)))
+    os.replace(tmp_path, path)
+
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "files": {f"{e.kind}:{e.path}": e.sha256 for e in entries},
+    }
+    manifest_path = path.with_suffix(MANIFEST_SUFFIX)
+    tmp_manifest = manifest_path.with_name(manifest_path.name + ".tmp")
+    tmp_manifest.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    os.replace(tmp_manifest, manifest_path)
+
+
+def open_bank(
+    snapshot_path: Optional[Path] = None,
+    sources: Optional[Dict[str, Path]] = None,
+    refresh: bool = True
+) -> BankSnapshot:
+    """
+    Open the bank snapshot, recompiling changed files first.
+
+    Args:
+        snapshot_path: Snapshot file (default: next to the mechanisms directory)
+        sources: Source roots by kind (default: default_sources())
+        refresh: Recompile files changed since the snapshot was written
+
+    Returns:
+        BankSnapshot (close it, or use it as a context manager)
+    """
+    sources = sources if sources is not None else default_sources()
+    if not sources:
+        raise FileNotFoundError("No bank sources to compile")
+    snapshot_path = Path(snapshot_path or default_snapshot_path(sources))
+    if refresh or not snapshot_path.exists():
+        compile_bank(snapshot_path, sources)
+    return BankSnapshot(snapshot_path)
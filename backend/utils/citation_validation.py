@@ -5,36 +5,186 @@ Provides functions to validate and verify academic citations:
 - DOI validation via Crossref API
 - Citation metadata extraction
 - Author/year/journal verification
+
+Verification results (verified DOIs, and DOIs Crossref doesn't know) are kept
+in memory and in a local citation store (SQLite, next to the HTTP cache), so
+audits only query Crossref for DOIs they haven't seen. verify_dois() checks a
+whole batch, deduplicated, with a few concurrent requests paced by one rate
+limit:
+    - CROSSREF_MAILTO: contact email; joins Crossref's polite pool
+    - CITATION_STORE_ENABLED: "false" disables the store
+    - CITATION_STORE_PATH: SQLite file (default: backend/.cache/citations.sqlite)
+
+Usage:
+    validator = CitationValidator()
+    results = validator.verify_dois(all_dois)       # network only for new DOIs
+    validator.lookup_doi("10.1056/NEJMra1611832")   # in-memory, no network
 """
 
 import requests
 import re
+import os
+import json
 import time
-from typing import Dict, Optional, List
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional, List
 import logging
 
+from utils.http_cache import mount_cache
+
 logger = logging.getLogger(__name__)
 
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_STORE_PATH = BACKEND_DIR / ".cache" / "citations.sqlite"
+
+# Crossref polite pool (requests identifying a mailto): 10 requests/s, 3 concurrent
+POLITE_POOL_INTERVAL = 0.1
+CROSSREF_MAX_CONCURRENCY = 3
+DEFAULT_RATE_LIMIT = 0.5
+
+NOT_FOUND_ERROR = "DOI not found in Crossref database"
+# Seconds before a DOI Crossref didn't know is checked again
+NOT_FOUND_TTL = 30 * 24 * 3600
+
+
+class CitationStore:
+    """
+    Local store of DOI verification results (thread-safe).
+
+    Only definitive results are kept: verified DOIs (indefinitely) and DOIs
+    Crossref doesn't know (for NOT_FOUND_TTL). Timeouts and server errors
+    are not stored, so they are retried.
+    """
+
+    def __init__(self, path: Path = DEFAULT_STORE_PATH, not_found_ttl: float = NOT_FOUND_TTL):
+        """
+        Open (or create) a store.
+
+        Args:
+            path: SQLite file (":memory:" for a private in-memory store)
+            not_found_ttl: Seconds a not-found result stays valid
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self.not_found_ttl = not_found_ttl
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS citations (
+                doi TEXT PRIMARY KEY,
+                result TEXT NOT NULL,
+                valid INTEGER NOT NULL,
+                checked_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def get_many(self, dois: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Stored results by DOI key (lowercased DOI); unknown or expired DOIs are omitted.
+        """
+        keys = list(dict.fromkeys(dois))
+        expired_before = time.time() - self.not_found_ttl
+        found = {}
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                rows = self._conn.execute(
+                    f"SELECT doi, result FROM citations WHERE doi IN ({','.join('?' * len(chunk))}) "
+                    "AND (valid = 1 OR checked_at > ?)",
+                    (*chunk, expired_before)
+                )
+                found.update((doi, json.loads(result)) for doi, result in rows)
+        return found
+
+    def put(self, doi: str, result: Dict) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO citations VALUES (?, ?, ?, ?)",
+                (doi, json.dumps(result), int(bool(result.get("valid"))), time.time())
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_default_store: Optional[CitationStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_citation_store() -> Optional[CitationStore]:
+    """
+    The shared store configured by CITATION_STORE_ENABLED / CITATION_STORE_PATH.
+
+    Returns:
+        CitationStore, or None if disabled or the file can't be opened
+    """
+    global _default_store
+    if os.getenv("CITATION_STORE_ENABLED", "true").lower() in ("0", "false", "no"):
+        return None
+
+    with _default_store_lock:
+        if _default_store is None:
+            path = os.getenv("CITATION_STORE_PATH") or DEFAULT_STORE_PATH
+            try:
+                _default_store = CitationStore(path)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Citation store disabled, can't open {path}: {e}")
+                return None
+        return _default_store
+
+
+def _is_definitive(result: Dict) -> bool:
+    return bool(result.get("valid")) or result.get("error") == NOT_FOUND_ERROR
+
 
 class CitationValidator:
     """Validates academic citations and DOIs"""
 
-    def __init__(self, rate_limit: float = 0.5):
+    def __init__(
+        self,
+        rate_limit: Optional[float] = None,
+        mailto: Optional[str] = None,
+        store: Optional[CitationStore] = None
+    ):
         """
         Initialize validator
 
         Args:
-            rate_limit: Seconds to wait between API calls (be nice to Crossref)
+            rate_limit: Seconds between Crossref requests, across all threads
+                (default: 0.1 in the polite pool, else 0.5)
+            mailto: Contact email for Crossref's polite pool (default: CROSSREF_MAILTO)
+            store: Citation store (default: get_citation_store())
         """
+        self.mailto = mailto or os.getenv("CROSSREF_MAILTO")
+        if rate_limit is None:
+            rate_limit = POLITE_POOL_INTERVAL if self.mailto else DEFAULT_RATE_LIMIT
         self.rate_limit = rate_limit
         self.last_request_time = 0
+        self._rate_lock = threading.Lock()
+        self.store = store if store is not None else get_citation_store()
+        # Definitive results by lowercased DOI
+        self._known: Dict[str, Dict] = {}
+        # Crossref lookups go through the shared response cache; only misses are rate limited
+        self.session = requests.Session()
+        mount_cache(self.session, before_send=self._rate_limit_delay)
 
     def _rate_limit_delay(self):
-        """Ensure we don't exceed API rate limits"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.rate_limit:
-            time.sleep(self.rate_limit - elapsed)
-        self.last_request_time = time.time()
+        """Ensure we don't exceed API rate limits (each caller reserves the next slot)"""
+        with self._rate_lock:
+            now = time.time()
+            slot = max(now, self.last_request_time + self.rate_limit)
+            self.last_request_time = slot
+        if slot > now:
+            time.sleep(slot - now)
 
     def clean_doi(self, doi: str) -> str:
         """
@@ -104,16 +254,81 @@ class CitationValidator:
                 "metadata": None
             }
 
-        # Query Crossref API
-        try:
-            self._rate_limit_delay()
+        known = self.lookup_doi(doi)
+        if known is not None:
+            return known
+
+        result = self._query_crossref(doi, timeout)
+        if _is_definitive(result):
+            self._known[doi.lower()] = result
+            if self.store:
+                self.store.put(doi.lower(), result)
+        return dict(result)
+
+    def verify_dois(
+        self,
+        dois: Iterable[str],
+        max_workers: int = CROSSREF_MAX_CONCURRENCY,
+        timeout: int = 10
+    ) -> Dict[str, Dict[str, any]]:
+        """
+        Verify many DOIs: deduplicated, stored results first, the rest
+        resolved concurrently (all workers share the rate limit).
+
+        Args:
+            dois: DOI strings (duplicates and URL forms allowed)
+            max_workers: Concurrent Crossref requests
+            timeout: Request timeout in seconds
 
+        Returns:
+            Dict mapping cleaned DOI to its verify_doi() result
+        """
+        unique: Dict[str, str] = {}
+        for doi in dois:
+            cleaned = self.clean_doi(doi)
+            if cleaned:
+                unique.setdefault(cleaned.lower(), cleaned)
+
+        self._load_known(unique)
+        pending = [doi for key, doi in unique.items() if key not in self._known]
+        logger.info(f"Verifying {len(unique)} unique DOIs ({len(unique) - len(pending)} already known)")
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            resolved = dict(zip(pending, executor.map(lambda d: self.verify_doi(d, timeout), pending)))
+
+        return {
+            doi: resolved[doi] if doi in resolved else self.lookup_doi(doi)
+            for doi in unique.values()
+        }
+
+    def lookup_doi(self, doi: str) -> Optional[Dict[str, any]]:
+        """
+        Known verification result for a DOI, without querying Crossref.
+
+        Returns:
+            verify_doi()-style result, or None if the DOI hasn't been resolved
+        """
+        key = self.clean_doi(doi).lower()
+        if key not in self._known:
+            self._load_known([key])
+        result = self._known.get(key)
+        return dict(result) if result is not None else None
+
+    def _load_known(self, keys: Iterable[str]) -> None:
+        """Pull stored results for DOI keys into memory."""
+        missing = [key for key in keys if key not in self._known]
+        if self.store and missing:
+            self._known.update(self.store.get_many(missing))
+
+    def _query_crossref(self, doi: str, timeout: int) -> Dict[str, any]:
+        """Resolve a (clean, well-formed) DOI against the Crossref API."""
+        try:
             url = f"https://api.crossref.org/works/{doi}"
             headers = {
-                'User-Agent': 'HealthSystemsPlatform/1.0 (mailto:research@example.org)'
+                'User-Agent': f'HealthSystemsPlatform/1.0 (mailto:{self.mailto or "research@example.org"})'
             }
 
-            response = requests.get(url, headers=headers, timeout=timeout)
+            response = self.session.get(url, headers=headers, timeout=timeout)
 
             if response.status_code == 200:
                 data = response.json()
@@ -143,7 +358,7 @@ class CitationValidator:
                 logger.warning(f"DOI not found: {doi}")
                 return {
                     "valid": False,
-                    "error": "DOI not found in Crossref database",
+                    "error": NOT_FOUND_ERROR,
                     "metadata": None
                 }
 
@@ -21,6 +21,14 @@ Configuration:
     - CORE_API_KEY: CORE API key (optional, for higher limits)
     - SEMANTIC_SCHOLAR_API_KEY: S2 API key (optional)
 
+The waterfall is hedged: the top few providers are queried concurrently,
+the first success wins and the rest are cancelled. Provider rate limits are
+shared by every concurrent fetch. A ledger (SQLite, next to the HTTP cache)
+learns provider success rates per DOI prefix to reorder the waterfall and
+remembers DOIs with no full text so they are not re-probed every run:
+    - FULLTEXT_LEDGER_ENABLED: "false" disables the ledger
+    - FULLTEXT_LEDGER_PATH: SQLite file (default: backend/.cache/fulltext_ledger.sqlite)
+
 Usage:
     from utils.fulltext_fetcher import FullTextFetcher
 
@@ -30,25 +38,47 @@ Usage:
     if result.success:
         print(f"PDF URL: {result.pdf_url}")
         print(f"Source: {result.source}")
+
+    # Many DOIs, 8 at a time
+    results = fetcher.fetch_batch(dois, parallel=True, max_workers=8)
 """
 
 import os
 import re
 import time
 import json
+import asyncio
 import logging
+import sqlite3
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from enum import Enum
 from abc import ABC, abstractmethod
 import requests
-from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from utils.http_cache import get_http_cache, mount_cache
+
 logger = logging.getLogger(__name__)
 
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_LEDGER_PATH = BACKEND_DIR / ".cache" / "fulltext_ledger.sqlite"
+
+# Providers queried concurrently per DOI
+HEDGE_WIDTH = 3
+# Threads running provider requests, shared by all concurrent fetches
+MAX_PROVIDER_THREADS = 16
+# Seconds a DOI with no full text is skipped before being probed again
+MISS_TTL = 30 * 24 * 3600
+
+# Set while a hedged fetch has been decided; providers stop before their next request
+_cancel_event: ContextVar[Optional[threading.Event]] = ContextVar("fulltext_cancel_event", default=None)
+
 
 class FullTextSource(Enum):
     """Enumeration of full-text sources"""
@@ -79,6 +109,9 @@ class FullTextResult:
     error: Optional[str] = None
     is_open_access: bool = False
     license: Optional[str] = None
+    # The source's own "no full text" answer (not found, no OA copy, no
+    # access), as opposed to a timeout, server error or auth failure
+    definitive: bool = False
 
     def to_dict(self) -> Dict:
         return {
@@ -94,39 +127,64 @@ class FullTextResult:
 
 
 class RateLimiter:
-    """Simple rate limiter for API calls"""
+    """
+    Rate limiter for API calls, shared by all threads using the provider.
+
+    Each caller reserves the next free slot, so concurrent fetches are
+    spaced min_interval apart instead of bursting.
+    """
 
     def __init__(self, calls_per_second: float = 1.0):
         self.min_interval = 1.0 / calls_per_second
         self.last_call = 0.0
+        self._lock = threading.Lock()
 
     def wait(self):
         """Wait if necessary to respect rate limit"""
-        elapsed = time.time() - self.last_call
-        if elapsed < self.min_interval:
-            time.sleep(self.min_interval - elapsed)
-        self.last_call = time.time()
+        with self._lock:
+            now = time.time()
+            slot = max(now, self.last_call + self.min_interval)
+            self.last_call = slot
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class FetchCancelled(Exception):
+    """Raised inside a provider whose hedged fetch is no longer needed."""
 
 
 class BaseProvider(ABC):
     """Abstract base class for full-text providers"""
 
+    # Always "succeeds" without checking availability; tried only after the others fail
+    is_fallback = False
+
     def __init__(self, rate_limit: float = 1.0, timeout: int = 30):
         self.rate_limiter = RateLimiter(rate_limit)
         self.timeout = timeout
         self.session = self._create_session()
 
+    def _before_send(self):
+        """Rate limit a network request, unless its hedged fetch was already decided."""
+        cancel = _cancel_event.get()
+        if cancel is not None and cancel.is_set():
+            raise FetchCancelled(self.source.value)
+        self.rate_limiter.wait()
+        if cancel is not None and cancel.is_set():
+            raise FetchCancelled(self.source.value)
+
     def _create_session(self) -> requests.Session:
-        """Create a requests session with retry logic"""
+        """
+        Create a requests session with retry logic, backed by the shared
+        response cache. Only requests that miss the cache are rate limited.
+        """
         session = requests.Session()
         retry_strategy = Retry(
             total=3,
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504]
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
+        mount_cache(session, before_send=self._before_send, max_retries=retry_strategy)
         return session
 
     @abstractmethod
@@ -160,8 +218,6 @@ class UnpaywallProvider(BaseProvider):
 
     def fetch(self, doi: str, **kwargs) -> FullTextResult:
         """Fetch open access PDF link from Unpaywall"""
-        self.rate_limiter.wait()
-
         try:
             url = f"{self.base_url}/{doi}"
             params = {"email": self.email}
@@ -172,7 +228,8 @@ class UnpaywallProvider(BaseProvider):
                 return FullTextResult(
                     success=False,
                     doi=doi,
-                    error="DOI not found in Unpaywall"
+                    error="DOI not found in Unpaywall",
+                    definitive=True
                 )
 
             response.raise_for_status()
@@ -220,6 +277,7 @@ class UnpaywallProvider(BaseProvider):
                 success=False,
                 doi=doi,
                 error="No open access PDF found",
+                definitive=True,
                 metadata={"is_oa": data.get("is_oa", False)}
             )
 
@@ -250,48 +308,53 @@ class PMCProvider(BaseProvider):
         return FullTextSource.PMC
 
     def _doi_to_pmcid(self, doi: str) -> Optional[str]:
-        """Convert DOI to PMCID using E-utilities"""
-        self.rate_limiter.wait()
+        """
+        Convert DOI to PMCID using E-utilities.
 
-        try:
-            params = {
-                "db": "pmc",
-                "term": f"{doi}[doi]",
-                "retmode": "json",
-                "email": self.email
-            }
-            if self.api_key:
-                params["api_key"] = self.api_key
+        Returns:
+            PMCID, or None if PMC has no article with this DOI
 
-            response = self.session.get(self.esearch_url, params=params, timeout=self.timeout)
-            response.raise_for_status()
+        Raises:
+            requests.exceptions.RequestException: If the lookup itself failed
+            ValueError: If the response is not JSON
+        """
+        params = {
+            "db": "pmc",
+            "term": f"{doi}[doi]",
+            "retmode": "json",
+            "email": self.email
+        }
+        if self.api_key:
+            params["api_key"] = self.api_key
 
-            data = response.json()
-            id_list = data.get("esearchresult", {}).get("idlist", [])
+        response = self.session.get(self.esearch_url, params=params, timeout=self.timeout)
+        response.raise_for_status()
 
-            if id_list:
-                return f"PMC{id_list[0]}"
-            return None
+        data = response.json()
+        id_list = data.get("esearchresult", {}).get("idlist", [])
 
-        except Exception as e:
-            logger.warning(f"Failed to convert DOI to PMCID: {e}")
-            return None
+        if id_list:
+            return f"PMC{id_list[0]}"
+        return None
 
     def fetch(self, doi: str, pmcid: Optional[str] = None, **kwargs) -> FullTextResult:
         """Fetch full-text from PMC"""
         # Get PMCID if not provided
         if not pmcid:
-            pmcid = self._doi_to_pmcid(doi)
+            try:
+                pmcid = self._doi_to_pmcid(doi)
+            except (requests.exceptions.RequestException, ValueError) as e:
+                logger.warning(f"Failed to convert DOI to PMCID: {e}")
+                return FullTextResult(success=False, doi=doi, error=str(e))
 
         if not pmcid:
             return FullTextResult(
                 success=False,
                 doi=doi,
-                error="Could not find PMCID for DOI"
+                error="Could not find PMCID for DOI",
+                definitive=True
             )
 
-        self.rate_limiter.wait()
-
         try:
             # Try OA service first for PDF link
             params = {"id": pmcid}
@@ -327,7 +390,6 @@ class PMCProvider(BaseProvider):
                     )
 
             # Fallback: Try to get XML full-text
-            self.rate_limiter.wait()
             xml_params = {
                 "db": "pmc",
                 "id": pmcid.replace("PMC", ""),
@@ -354,6 +416,7 @@ class PMCProvider(BaseProvider):
                 success=False,
                 doi=doi,
                 error="Article not in PMC Open Access subset",
+                definitive=xml_response.status_code == 200,
                 metadata={"pmcid": pmcid}
             )
 
@@ -380,8 +443,6 @@ class EuropePMCProvider(BaseProvider):
 
     def fetch(self, doi: str, **kwargs) -> FullTextResult:
         """Fetch full-text from Europe PMC"""
-        self.rate_limiter.wait()
-
         try:
             # Search for article
             search_url = f"{self.base_url}/search"
@@ -401,7 +462,8 @@ class EuropePMCProvider(BaseProvider):
                 return FullTextResult(
                     success=False,
                     doi=doi,
-                    error="DOI not found in Europe PMC"
+                    error="DOI not found in Europe PMC",
+                    definitive=True
                 )
 
             article = results[0]
@@ -412,6 +474,7 @@ class EuropePMCProvider(BaseProvider):
                     success=False,
                     doi=doi,
                     error="No PMCID - article not in open access",
+                    definitive=True,
                     metadata={
                         "title": article.get("title"),
                         "source": article.get("source")
@@ -419,7 +482,6 @@ class EuropePMCProvider(BaseProvider):
                 )
 
             # Get full-text XML
-            self.rate_limiter.wait()
             fulltext_url = f"{self.base_url}/{article.get('source', 'PMC')}/{pmcid}/fullTextXML"
 
             ft_response = self.session.get(fulltext_url, timeout=self.timeout)
@@ -445,7 +507,8 @@ class EuropePMCProvider(BaseProvider):
             return FullTextResult(
                 success=False,
                 doi=doi,
-                error="Full-text not available in Europe PMC"
+                error="Full-text not available in Europe PMC",
+                definitive=ft_response.status_code in (200, 404)
             )
 
         except requests.exceptions.RequestException as e:
@@ -473,8 +536,6 @@ class COREProvider(BaseProvider):
 
     def fetch(self, doi: str, **kwargs) -> FullTextResult:
         """Fetch full-text from CORE"""
-        self.rate_limiter.wait()
-
         headers = {}
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
@@ -499,7 +560,8 @@ class COREProvider(BaseProvider):
                 return FullTextResult(
                     success=False,
                     doi=doi,
-                    error="DOI not found in CORE"
+                    error="DOI not found in CORE",
+                    definitive=True
                 )
 
             article = results[0]
@@ -541,7 +603,8 @@ class COREProvider(BaseProvider):
             return FullTextResult(
                 success=False,
                 doi=doi,
-                error="No downloadable PDF in CORE"
+                error="No downloadable PDF in CORE",
+                definitive=True
             )
 
         except requests.exceptions.RequestException as e:
@@ -569,8 +632,6 @@ class OpenAlexProvider(BaseProvider):
 
     def fetch(self, doi: str, **kwargs) -> FullTextResult:
         """Fetch open access PDF link from OpenAlex"""
-        self.rate_limiter.wait()
-
         try:
             # Clean DOI
             clean_doi = doi.replace("https://doi.org/", "").replace("http://doi.org/", "")
@@ -586,7 +647,8 @@ class OpenAlexProvider(BaseProvider):
                 return FullTextResult(
                     success=False,
                     doi=doi,
-                    error="DOI not found in OpenAlex"
+                    error="DOI not found in OpenAlex",
+                    definitive=True
                 )
 
             response.raise_for_status()
@@ -629,6 +691,7 @@ class OpenAlexProvider(BaseProvider):
                 success=False,
                 doi=doi,
                 error="No open access PDF in OpenAlex",
+                definitive=True,
                 metadata={
                     "is_oa": oa_info.get("is_oa", False),
                     "oa_status": oa_info.get("oa_status")
@@ -669,11 +732,10 @@ class ElsevierProvider(BaseProvider):
             return FullTextResult(
                 success=False,
                 doi=doi,
-                error="Not an Elsevier DOI"
+                error="Not an Elsevier DOI",
+                definitive=True
             )
 
-        self.rate_limiter.wait()
-
         headers = {
             "X-ELS-APIKey": self.api_key,
             "Accept": "application/pdf"
@@ -724,14 +786,16 @@ class ElsevierProvider(BaseProvider):
                 return FullTextResult(
                     success=False,
                     doi=doi,
-                    error="Access denied - institutional access required"
+                    error="Access denied - institutional access required",
+                    definitive=True
                 )
 
             else:
                 return FullTextResult(
                     success=False,
                     doi=doi,
-                    error=f"Elsevier API returned {response.status_code}"
+                    error=f"Elsevier API returned {response.status_code}",
+                    definitive=response.status_code == 404
                 )
 
         except requests.exceptions.RequestException as e:
@@ -768,11 +832,10 @@ class WileyProvider(BaseProvider):
             return FullTextResult(
                 success=False,
                 doi=doi,
-                error="Not a Wiley DOI"
+                error="Not a Wiley DOI",
+                definitive=True
             )
 
-        self.rate_limiter.wait()
-
         headers = {
             "Wiley-TDM-Client-Token": self.tdm_token,
             "Accept": "application/pdf"
@@ -818,13 +881,15 @@ class WileyProvider(BaseProvider):
                 return FullTextResult(
                     success=False,
                     doi=doi,
-                    error="Access denied - article not covered by subscription"
+                    error="Access denied - article not covered by subscription",
+                    definitive=True
                 )
 
             return FullTextResult(
                 success=False,
                 doi=doi,
-                error=f"Wiley TDM returned {response.status_code}"
+                error=f"Wiley TDM returned {response.status_code}",
+                definitive=response.status_code == 404
             )
 
         except requests.exceptions.RequestException as e:
@@ -851,8 +916,6 @@ class SemanticScholarProvider(BaseProvider):
 
     def fetch(self, doi: str, **kwargs) -> FullTextResult:
         """Fetch open access PDF from Semantic Scholar"""
-        self.rate_limiter.wait()
-
         headers = {}
         if self.api_key:
             headers["x-api-key"] = self.api_key
@@ -872,7 +935,8 @@ class SemanticScholarProvider(BaseProvider):
                 return FullTextResult(
                     success=False,
                     doi=doi,
-                    error="DOI not found in Semantic Scholar"
+                    error="DOI not found in Semantic Scholar",
+                    definitive=True
                 )
 
             response.raise_for_status()
@@ -898,6 +962,7 @@ class SemanticScholarProvider(BaseProvider):
                 success=False,
                 doi=doi,
                 error="No open access PDF in Semantic Scholar",
+                definitive=True,
                 metadata={"is_oa": data.get("isOpenAccess", False)}
             )
 
@@ -915,6 +980,7 @@ class HarvardProxyProvider(BaseProvider):
     """
 
     PROXY_BASE = "https://ezp-prod1.hul.harvard.edu/login?url="
+    is_fallback = True
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -944,6 +1010,119 @@ class HarvardProxyProvider(BaseProvider):
         )
 
 
+def doi_prefix(doi: str) -> str:
+    """Registrant prefix of a DOI (e.g. "10.1016"), which identifies the publisher."""
+    return doi.split("/", 1)[0].lower()
+
+
+class FullTextLedger:
+    """
+    Persistent record of full-text fetch outcomes (thread-safe).
+
+    - Provider attempts/successes per DOI prefix, used to reorder the waterfall
+    - DOIs for which no provider found full text, skipped until MISS_TTL passes
+    """
+
+    def __init__(self, path: Path = DEFAULT_LEDGER_PATH, miss_ttl: float = MISS_TTL):
+        """
+        Open (or create) a ledger.
+
+        Args:
+            path: SQLite file (":memory:" for a private in-memory ledger)
+            miss_ttl: Seconds a DOI without full text is skipped
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self.miss_ttl = miss_ttl
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS provider_outcomes (
+                prefix TEXT NOT NULL,
+                source TEXT NOT NULL,
+                attempts INTEGER NOT NULL,
+                successes INTEGER NOT NULL,
+                PRIMARY KEY (prefix, source)
+            );
+            CREATE TABLE IF NOT EXISTS misses (
+                doi TEXT PRIMARY KEY,
+                checked_at REAL NOT NULL
+            );
+        """)
+        self._conn.commit()
+
+    def record_outcome(self, doi: str, source: FullTextSource, success: bool) -> None:
+        """Count one completed provider attempt for the DOI's prefix."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO provider_outcomes VALUES (?, ?, 1, ?) "
+                "ON CONFLICT (prefix, source) DO UPDATE SET "
+                "attempts = attempts + 1, successes = successes + excluded.successes",
+                (doi_prefix(doi), source.value, int(success))
+            )
+            self._conn.commit()
+
+    def success_rates(self, doi: str) -> Dict[str, Tuple[int, int]]:
+        """source -> (successes, attempts) for the DOI's prefix."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT source, successes, attempts FROM provider_outcomes WHERE prefix = ?",
+                (doi_prefix(doi),)
+            ).fetchall()
+        return {source: (successes, attempts) for source, successes, attempts in rows}
+
+    def is_known_miss(self, doi: str) -> bool:
+        """True if the DOI had no full text within the last miss_ttl seconds."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM misses WHERE doi = ? AND checked_at > ?",
+                (doi.lower(), time.time() - self.miss_ttl)
+            ).fetchone()
+        return row is not None
+
+    def record_miss(self, doi: str) -> None:
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO misses VALUES (?, ?)", (doi.lower(), time.time()))
+            self._conn.commit()
+
+    def clear_miss(self, doi: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM misses WHERE doi = ?", (doi.lower(),))
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_default_ledger: Optional[FullTextLedger] = None
+_default_ledger_lock = threading.Lock()
+
+
+def get_fulltext_ledger() -> Optional[FullTextLedger]:
+    """
+    The shared ledger configured by FULLTEXT_LEDGER_ENABLED / FULLTEXT_LEDGER_PATH.
+
+    Returns:
+        FullTextLedger, or None if disabled or the file can't be opened
+    """
+    global _default_ledger
+    if os.getenv("FULLTEXT_LEDGER_ENABLED", "true").lower() in ("0", "false", "no"):
+        return None
+
+    with _default_ledger_lock:
+        if _default_ledger is None:
+            path = os.getenv("FULLTEXT_LEDGER_PATH") or DEFAULT_LEDGER_PATH
+            try:
+                _default_ledger = FullTextLedger(path)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Full-text ledger disabled, can't open {path}: {e}")
+                return None
+        return _default_ledger
+
+
 class FullTextFetcher:
     """
     Unified full-text fetcher with waterfall approach
@@ -958,6 +1137,10 @@ class FullTextFetcher:
     7. Wiley (if institutional access)
     8. Semantic Scholar (fallback)
     9. Harvard Proxy (last resort - manual browser access)
+
+    Up to hedge_width providers run at once; when one fails the next in
+    line starts, and the first success cancels the rest. The order is
+    adjusted per DOI prefix from the ledger's success rates.
     """
 
     def __init__(
@@ -971,7 +1154,9 @@ class FullTextFetcher:
         core_api_key: Optional[str] = None,
         semantic_scholar_api_key: Optional[str] = None,
         enable_publisher_apis: bool = True,
-        enable_harvard_proxy: bool = True
+        enable_harvard_proxy: bool = True,
+        hedge_width: int = HEDGE_WIDTH,
+        ledger: Optional[FullTextLedger] = None
     ):
         """
         Initialize the full-text fetcher with API credentials.
@@ -985,6 +1170,9 @@ class FullTextFetcher:
         - WILEY_TDM_TOKEN
         - CORE_API_KEY
         - SEMANTIC_SCHOLAR_API_KEY
+
+        hedge_width sets how many providers are queried concurrently per DOI;
+        ledger defaults to get_fulltext_ledger().
         """
         # Load from env if not provided
         self.unpaywall_email = unpaywall_email or os.getenv("UNPAYWALL_EMAIL")
@@ -998,6 +1186,10 @@ class FullTextFetcher:
 
         self.enable_publisher_apis = enable_publisher_apis
         self.enable_harvard_proxy = enable_harvard_proxy
+        self.hedge_width = max(1, hedge_width)
+        self.ledger = ledger if ledger is not None else get_fulltext_ledger()
+        # Created lazily; outlives event loops so cancelled hedges never block a caller
+        self._executor: Optional[ThreadPoolExecutor] = None
 
         # Initialize providers
         self.providers: List[BaseProvider] = []
@@ -1007,6 +1199,7 @@ class FullTextFetcher:
         self.stats = {
             "total_requests": 0,
             "successful": 0,
+            "skipped_known_miss": 0,
             "by_source": {}
         }
 
@@ -1067,16 +1260,46 @@ class FullTextFetcher:
         doi: str,
         stop_on_first: bool = True,
         preferred_sources: Optional[List[FullTextSource]] = None,
-        skip_sources: Optional[List[FullTextSource]] = None
+        skip_sources: Optional[List[FullTextSource]] = None,
+        recheck_misses: bool = False
     ) -> FullTextResult:
         """
         Fetch full-text PDF for a DOI using waterfall approach.
 
+        Blocking wrapper around fetch_fulltext_async(); must not be called
+        from a running event loop.
+
+        Args:
+            doi: The DOI to fetch
+            stop_on_first: Kept for compatibility; the hedged waterfall always
+                returns the first success
+            preferred_sources: Try these sources first
+            skip_sources: Skip these sources
+            recheck_misses: Probe providers even if the DOI recently had no full text
+
+        Returns:
+            FullTextResult with PDF URL, content, or error
+        """
+        return asyncio.run(self.fetch_fulltext_async(doi, preferred_sources, skip_sources, recheck_misses))
+
+    async def fetch_fulltext_async(
+        self,
+        doi: str,
+        preferred_sources: Optional[List[FullTextSource]] = None,
+        skip_sources: Optional[List[FullTextSource]] = None,
+        recheck_misses: bool = False
+    ) -> FullTextResult:
+        """
+        Hedged waterfall fetch for one DOI.
+
+        Providers run in worker threads, hedge_width at a time; the first
+        success wins and the others stop before their next request.
+
         Args:
             doi: The DOI to fetch
-            stop_on_first: Stop after first successful fetch (default: True)
             preferred_sources: Try these sources first
             skip_sources: Skip these sources
+            recheck_misses: Probe providers even if the DOI recently had no full text
 
         Returns:
             FullTextResult with PDF URL, content, or error
@@ -1090,32 +1313,43 @@ class FullTextFetcher:
             return FullTextResult(success=False, error="Invalid or empty DOI")
 
         # Reorder providers if preferred sources specified
-        providers = self._order_providers(preferred_sources, skip_sources)
+        providers = self._order_providers(preferred_sources, skip_sources, doi)
+        primary = [p for p in providers if not p.is_fallback]
+        fallback = [p for p in providers if p.is_fallback]
 
         all_errors = []
+        result = None
+        if self.ledger and not recheck_misses and self.ledger.is_known_miss(doi):
+            self.stats["skipped_known_miss"] += 1
+            all_errors.append("no full text on a recent check")
+        else:
+            inconclusive: List[BaseProvider] = []
+            result = await self._hedged_fetch(doi, primary, all_errors, inconclusive)
+            if self.ledger and primary:
+                if result is not None:
+                    self.ledger.clear_miss(doi)
+                elif not inconclusive:
+                    # Only a unanimous "no full text" is worth remembering;
+                    # a timeout or outage says nothing about the DOI
+                    self.ledger.record_miss(doi)
+
+        # Last resort providers (manual access links)
+        for provider in fallback:
+            if result is not None:
+                break
+            attempt = await self._run_provider(provider, doi)
+            if attempt.success:
+                result = attempt
+            else:
+                all_errors.append(f"{provider.source.value}: {attempt.error}")
 
-        for provider in providers:
-            try:
-                logger.debug(f"Trying {provider.source.value} for {doi}")
-                result = provider.fetch(doi)
-
-                if result.success:
-                    self.stats["successful"] += 1
-                    source_name = provider.source.value
-                    self.stats["by_source"][source_name] = \
-                        self.stats["by_source"].get(source_name, 0) + 1
-
-                    logger.info(f"Found full-text for {doi} via {source_name}")
-
-                    if stop_on_first:
-                        return result
-
-                else:
-                    all_errors.append(f"{provider.source.value}: {result.error}")
-
-            except Exception as e:
-                logger.error(f"Error with {provider.source.value}: {e}")
-                all_errors.append(f"{provider.source.value}: {str(e)}")
+        if result is not None:
+            self.stats["successful"] += 1
+            source_name = result.source.value if result.source else "unknown"
+            self.stats["by_source"][source_name] = \
+                self.stats["by_source"].get(source_name, 0) + 1
+            logger.info(f"Found full-text for {doi} via {source_name}")
+            return result
 
         # No provider succeeded
         return FullTextResult(
@@ -1124,6 +1358,65 @@ class FullTextFetcher:
             error=f"No full-text found. Tried: {', '.join(all_errors)}"
         )
 
+    async def _hedged_fetch(
+        self,
+        doi: str,
+        providers: List[BaseProvider],
+        errors: List[str],
+        inconclusive: Optional[List[BaseProvider]] = None
+    ) -> Optional[FullTextResult]:
+        """
+        First successful result of the providers, hedge_width in flight at a time.
+
+        Providers that failed without a definitive answer (timeouts, server
+        errors, auth failures) are appended to inconclusive and left out of
+        the ledger's success rates.
+        """
+        cancel = threading.Event()
+        token = _cancel_event.set(cancel)
+        queue = list(providers)
+        in_flight: Dict[asyncio.Task, BaseProvider] = {}
+        try:
+            while queue or in_flight:
+                while queue and len(in_flight) < self.hedge_width:
+                    provider = queue.pop(0)
+                    logger.debug(f"Trying {provider.source.value} for {doi}")
+                    in_flight[asyncio.create_task(self._run_provider(provider, doi))] = provider
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    provider = in_flight.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        logger.error(f"Error with {provider.source.value}: {e}")
+                        result = FullTextResult(success=False, doi=doi, error=str(e))
+
+                    if self.ledger and (result.success or result.definitive):
+                        self.ledger.record_outcome(doi, provider.source, result.success)
+                    if result.success:
+                        return result
+                    if not result.definitive and inconclusive is not None:
+                        inconclusive.append(provider)
+                    errors.append(f"{provider.source.value}: {result.error}")
+            return None
+        finally:
+            # Losing providers abort before their next request; their results are discarded
+            cancel.set()
+            for task in in_flight:
+                task.cancel()
+            _cancel_event.reset(token)
+
+    async def _run_provider(self, provider: BaseProvider, doi: str) -> FullTextResult:
+        """Run a (blocking) provider fetch in the fetcher's thread pool."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=MAX_PROVIDER_THREADS, thread_name_prefix="fulltext")
+        # The copied context carries the hedge's cancel event into the thread
+        context = copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, context.run, provider.fetch, doi
+        )
+
     def fetch_batch(
         self,
         dois: List[str],
@@ -1133,40 +1426,42 @@ class FullTextFetcher:
         """
         Fetch full-text for multiple DOIs.
 
+        Provider rate limits are shared by all concurrent fetches, so
+        parallel fetching stays within each provider's quota.
+
         Args:
             dois: List of DOIs to fetch
-            parallel: Use parallel fetching (default: False to respect rate limits)
-            max_workers: Number of parallel workers if parallel=True
+            parallel: Fetch several DOIs concurrently
+            max_workers: Number of DOIs in flight if parallel=True
 
         Returns:
             Dict mapping DOI to FullTextResult
         """
-        results = {}
+        return asyncio.run(self.fetch_batch_async(dois, max_concurrency=max_workers if parallel else 1))
 
-        if parallel:
-            from concurrent.futures import ThreadPoolExecutor, as_completed
+    async def fetch_batch_async(
+        self,
+        dois: List[str],
+        max_concurrency: int = 4
+    ) -> Dict[str, FullTextResult]:
+        """
+        Fetch full-text for multiple DOIs, max_concurrency at a time.
 
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_doi = {
-                    executor.submit(self.fetch_fulltext, doi): doi
-                    for doi in dois
-                }
+        Returns:
+            Dict mapping DOI to FullTextResult
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
 
-                for future in as_completed(future_to_doi):
-                    doi = future_to_doi[future]
-                    try:
-                        results[doi] = future.result()
-                    except Exception as e:
-                        results[doi] = FullTextResult(
-                            success=False,
-                            doi=doi,
-                            error=str(e)
-                        )
-        else:
-            for doi in dois:
-                results[doi] = self.fetch_fulltext(doi)
+        async def fetch_one(doi: str) -> FullTextResult:
+            async with semaphore:
+                try:
+                    return await self.fetch_fulltext_async(doi)
+                except Exception as e:
+                    return FullTextResult(success=False, doi=doi, error=str(e))
 
-        return results
+        unique = list(dict.fromkeys(dois))
+        results = await asyncio.gather(*(fetch_one(doi) for doi in unique))
+        return dict(zip(unique, results))
 
     def _clean_doi(self, doi: str) -> str:
         """Clean and normalize DOI"""
@@ -1183,13 +1478,28 @@ class FullTextFetcher:
     def _order_providers(
         self,
         preferred: Optional[List[FullTextSource]],
-        skip: Optional[List[FullTextSource]]
+        skip: Optional[List[FullTextSource]],
+        doi: Optional[str] = None
     ) -> List[BaseProvider]:
-        """Reorder providers based on preferences"""
+        """
+        Reorder providers based on preferences and, for a DOI, on the
+        ledger's success rates for its prefix.
+        """
         skip_set = set(skip) if skip else set()
 
         filtered = [p for p in self.providers if p.source not in skip_set]
 
+        if doi and self.ledger:
+            rates = self.ledger.success_rates(doi)
+
+            def score(provider: BaseProvider) -> float:
+                # Laplace-smoothed success rate; untried providers score 0.5
+                successes, attempts = rates.get(provider.source.value, (0, 0))
+                return (successes + 1) / (attempts + 2)
+
+            # Stable sort keeps the priority order among equal scores
+            filtered.sort(key=score, reverse=True)
+
         if not preferred:
             return filtered
 
@@ -1215,9 +1525,11 @@ class FullTextFetcher:
             if self.stats["total_requests"] > 0 else 0
         )
 
+        cache = get_http_cache()
         return {
             **self.stats,
-            "success_rate": f"{success_rate:.1f}%"
+            "success_rate": f"{success_rate:.1f}%",
+            "http_cache": cache.stats() if cache else None
         }
 
     def get_available_providers(self) -> List[str]:
@@ -3,14 +3,177 @@ Hierarchy utilities for node DAG management.
 
 Provides functions for:
 - Cycle detection
-- Ancestor/descendant traversal
-- Path computation
+- Ancestor/descendant traversal (one recursive CTE per query)
+- Path computation (batched, topological recompute of denormalized fields)
 - Hierarchy validation
 """
 
+import logging
+from collections import deque
 from typing import List, Set, Dict, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import Table, func, literal, select, update
+
+logger = logging.getLogger(__name__)
+
+
+# Traversal cap: guards the recursive queries against cycles in corrupt data
+MAX_HIERARCHY_DEPTH = 64
+
+
+def _hierarchy_table(node_model) -> Table:
+    """The parent/child junction table behind node_model.parents."""
+    return node_model.parents.property.secondary
+
+
+def _traverse(
+    db: Session,
+    node_id: str,
+    node_model,
+    upward: bool,
+    max_depth: Optional[int] = None
+) -> Dict[str, int]:
+    """
+    Walk the hierarchy from a node with a single recursive CTE.
+
+    Args:
+        db: Database session
+        node_id: ID of the starting node
+        node_model: The Node model class
+        upward: True to follow parents (ancestors), False for children
+        max_depth: Maximum number of levels to traverse
+
+    Returns:
+        Dict of reached node ID -> shortest distance (1 = direct neighbour)
+    """
+    table = _hierarchy_table(node_model)
+    if upward:
+        near, far = table.c.child_node_id, table.c.parent_node_id
+    else:
+        near, far = table.c.parent_node_id, table.c.child_node_id
+    limit = min(max_depth or MAX_HIERARCHY_DEPTH, MAX_HIERARCHY_DEPTH)
+
+    reached = (
+        select(far.label("node_id"), literal(1).label("distance"))
+        .where(near == node_id)
+        .cte("reached", recursive=True)
+    )
+    reached = reached.union(
+        select(far, reached.c.distance + 1)
+        .join(reached, near == reached.c.node_id)
+        .where(reached.c.distance < limit)
+    )
+
+    rows = db.execute(
+        select(reached.c.node_id, func.min(reached.c.distance))
+        .where(reached.c.node_id != node_id)
+        .group_by(reached.c.node_id)
+    )
+    return {row[0]: row[1] for row in rows}
+
+
+def get_ancestor_depths(
+    db: Session,
+    node_id: str,
+    node_model,
+    max_depth: Optional[int] = None
+) -> Dict[str, int]:
+    """
+    Get all ancestors of a node with their distance, in one query.
+
+    Args:
+        db: Database session
+        node_id: ID of the node
+        node_model: The Node model class
+        max_depth: Maximum number of levels to traverse
+
+    Returns:
+        Dict of ancestor ID -> shortest distance (1 = direct parent)
+    """
+    return _traverse(db, node_id, node_model, upward=True, max_depth=max_depth)
+
+
+def get_descendant_depths(
+    db: Session,
+    node_id: str,
+    node_model,
+    max_depth: Optional[int] = None
+) -> Dict[str, int]:
+    """
+    Get all descendants of a node with their distance, in one query.
+
+    Args:
+        db: Database session
+        node_id: ID of the node
+        node_model: The Node model class
+        max_depth: Maximum number of levels to traverse
+
+    Returns:
+        Dict of descendant ID -> shortest distance (1 = direct child)
+    """
+    return _traverse(db, node_id, node_model, upward=False, max_depth=max_depth)
+
+
+def child_counts(node_model):
+    """Subquery of parent ID -> number of direct children."""
+    table = _hierarchy_table(node_model)
+    return (
+        select(table.c.parent_node_id.label("node_id"), func.count().label("child_count"))
+        .group_by(table.c.parent_node_id)
+        .subquery("child_counts")
+    )
+
+
+def get_subtree_rows(
+    db: Session,
+    root_ids: List[str],
+    node_model,
+    max_depth: int,
+    expand: Optional[Set[str]] = None
+) -> List[Tuple[object, str, int, int]]:
+    """
+    Load every node below the given roots, with its parent edge, in one query.
+
+    A node reached through several parents appears once per parent edge, so
+    the rows describe a tree (as displayed) rather than the underlying DAG.
+
+    Args:
+        db: Database session
+        root_ids: IDs of the subtree roots
+        node_model: The Node model class
+        max_depth: Number of levels to load below the roots
+        expand: Node IDs whose children are loaded even beyond max_depth
+
+    Returns:
+        List of (node, parent_id, level, child_count) with level 1 = root children
+    """
+    if not root_ids:
+        return []
+    table = _hierarchy_table(node_model)
+    expand = expand or set()
+
+    edges = (
+        select(table.c.parent_node_id, table.c.child_node_id, literal(1).label("level"))
+        .where(table.c.parent_node_id.in_(root_ids))
+        .cte("subtree", recursive=True)
+    )
+    within = edges.c.level < max_depth
+    if expand:
+        within = within | edges.c.child_node_id.in_(expand)
+    edges = edges.union(
+        select(table.c.parent_node_id, table.c.child_node_id, edges.c.level + 1)
+        .join(edges, table.c.parent_node_id == edges.c.child_node_id)
+        .where(within, edges.c.level < MAX_HIERARCHY_DEPTH)
+    )
+
+    counts = child_counts(node_model)
+    rows = db.execute(
+        select(node_model, edges.c.parent_node_id, edges.c.level,
+               func.coalesce(counts.c.child_count, 0))
+        .join(edges, node_model.id == edges.c.child_node_id)
+        .outerjoin(counts, counts.c.node_id == node_model.id)
+    )
+    return [tuple(row) for row in rows]
 
 
 def would_create_cycle(
@@ -37,85 +200,46 @@ def would_create_cycle(
     if parent_id == child_id:
         return True  # Self-loop is a cycle
 
-    parent = db.query(node_model).filter(node_model.id == parent_id).first()
-    if not parent:
-        return False  # Parent doesn't exist, no cycle possible
-
-    # Check if child_id is in parent's ancestors
-    ancestors = parent.all_ancestors or []
-    return child_id in ancestors
+    # Walk the live junction table rather than the denormalized all_ancestors
+    return child_id in get_ancestor_depths(db, parent_id, node_model)
 
 
 def get_all_ancestors(
     db: Session,
     node_id: str,
-    node_model,
-    visited: Optional[Set[str]] = None
+    node_model
 ) -> Set[str]:
     """
-    Recursively get all ancestors of a node via the hierarchy junction table.
+    Get all ancestors of a node via the hierarchy junction table.
 
     Args:
         db: Database session
         node_id: ID of the node
         node_model: The Node model class
-        visited: Set of already visited nodes (for cycle detection)
 
     Returns:
         Set of all ancestor node IDs
     """
-    if visited is None:
-        visited = set()
-
-    if node_id in visited:
-        return visited  # Already processed, avoid infinite loop
-
-    visited.add(node_id)
-
-    node = db.query(node_model).filter(node_model.id == node_id).first()
-    if not node or not node.parents:
-        return visited - {node_id}  # Exclude self from ancestors
-
-    for parent in node.parents:
-        get_all_ancestors(db, parent.id, node_model, visited)
-
-    return visited - {node_id}  # Exclude self
+    return set(get_ancestor_depths(db, node_id, node_model))
 
 
 def get_all_descendants(
     db: Session,
     node_id: str,
-    node_model,
-    visited: Optional[Set[str]] = None
+    node_model
 ) -> Set[str]:
     """
-    Recursively get all descendants of a node.
+    Get all descendants of a node via the hierarchy junction table.
 
     Args:
         db: Database session
         node_id: ID of the node
         node_model: The Node model class
-        visited: Set of already visited nodes (for cycle detection)
 
     Returns:
         Set of all descendant node IDs
     """
-    if visited is None:
-        visited = set()
-
-    if node_id in visited:
-        return visited
-
-    visited.add(node_id)
-
-    node = db.query(node_model).filter(node_model.id == node_id).first()
-    if not node or not hasattr(node, 'children') or not node.children:
-        return visited - {node_id}
-
-    for child in node.children:
-        get_all_descendants(db, child.id, node_model, visited)
-
-    return visited - {node_id}  # Exclude self
+    return set(get_descendant_depths(db, node_id, node_model))
 
 
 def compute_depth(
@@ -218,14 +342,168 @@ def get_root_ancestors(
         List of root ancestor IDs (domain IDs)
     """
     all_ancestors = get_all_ancestors(db, node_id, node_model)
+    if not all_ancestors:
+        return []
+
+    return list(db.scalars(
+        select(node_model.id).where(node_model.id.in_(all_ancestors), node_model.depth == 0)
+    ))
+
+
+def load_parent_edges(
+    db: Session,
+    node_model,
+    child_ids: Optional[Set[str]] = None
+) -> Dict[str, List[str]]:
+    """
+    Load parent lists from the junction table in one query.
+
+    Parents are ordered by order_index (then ID), so the first parent is the
+    one used for the primary path.
+
+    Args:
+        db: Database session
+        node_model: The Node model class
+        child_ids: Only load parents of these nodes (default: all)
 
-    root_ids = []
-    for ancestor_id in all_ancestors:
-        ancestor = db.query(node_model).filter(node_model.id == ancestor_id).first()
-        if ancestor and ancestor.depth == 0:
-            root_ids.append(ancestor_id)
+    Returns:
+        Dict of child ID -> ordered parent IDs
+    """
+    table = _hierarchy_table(node_model)
+    stmt = select(table.c.child_node_id, table.c.parent_node_id).order_by(
+        table.c.child_node_id, table.c.order_index, table.c.parent_node_id
+    )
+    if child_ids is not None:
+        stmt = stmt.where(table.c.child_node_id.in_(child_ids))
+
+    child_to_parents: Dict[str, List[str]] = {}
+    for child_id, parent_id in db.execute(stmt):
+        child_to_parents.setdefault(child_id, []).append(parent_id)
+    return child_to_parents
 
-    return root_ids
+
+def compute_hierarchy_fields(
+    node_ids: Set[str],
+    child_to_parents: Dict[str, List[str]],
+    known: Optional[Dict[str, Tuple[int, str, List[str]]]] = None
+) -> Tuple[Dict[str, Tuple[int, str, List[str]]], Set[str]]:
+    """
+    Compute depth, primary_path and all_ancestors in topological order.
+
+    Each node is visited once, after all of its parents, and derives its
+    fields from theirs. Nothing is queried, so callers load the affected
+    sub-DAG up front.
+
+    Args:
+        node_ids: Nodes to compute
+        child_to_parents: Ordered parent IDs for every node in node_ids
+        known: Stored (depth, primary_path, all_ancestors) of parents outside node_ids
+
+    Returns:
+        Tuple of ({node_id: (depth, primary_path, all_ancestors)}, IDs on or below a cycle)
+    """
+    fields: Dict[str, Tuple[int, str, Set[str]]] = {
+        node_id: (depth, path, set(ancestors)) for node_id, (depth, path, ancestors) in (known or {}).items()
+    }
+
+    # Kahn's algorithm over the edges inside node_ids
+    pending = {n: sum(1 for p in child_to_parents.get(n, []) if p in node_ids) for n in node_ids}
+    children: Dict[str, List[str]] = {}
+    for child_id in node_ids:
+        for parent_id in child_to_parents.get(child_id, []):
+            if parent_id in node_ids:
+                children.setdefault(parent_id, []).append(child_id)
+
+    ready = deque(sorted(n for n, count in pending.items() if count == 0))
+    while ready:
+        node_id = ready.popleft()
+        parents = [p for p in child_to_parents.get(node_id, []) if p in fields]
+        if parents:
+            depth = max(fields[p][0] for p in parents) + 1
+            path = f"{fields[parents[0]][1]}/{node_id}"
+            ancestors = set(parents)
+            for p in parents:
+                ancestors |= fields[p][2]
+        else:
+            depth, path, ancestors = 0, node_id, set()
+        fields[node_id] = (depth, path, ancestors)
+
+        for child_id in children.get(node_id, []):
+            pending[child_id] -= 1
+            if pending[child_id] == 0:
+                ready.append(child_id)
+
+    cyclic = {n for n, count in pending.items() if count > 0}
+    computed = {
+        node_id: (depth, path, sorted(ancestors))
+        for node_id, (depth, path, ancestors) in fields.items()
+        if node_id in node_ids
+    }
+    return computed, cyclic
+
+
+def recompute_hierarchy_fields(
+    db: Session,
+    node_model,
+    node_ids: Optional[List[str]] = None,
+    include_descendants: bool = True,
+    update_depth: bool = True,
+    commit: bool = True
+) -> int:
+    """
+    Recompute depth, primary_path and all_ancestors for part of the hierarchy.
+
+    Loads the affected sub-DAG once, computes the fields in memory and writes
+    them back with one bulk UPDATE in the current transaction.
+
+    Args:
+        db: Database session
+        node_model: The Node model class
+        node_ids: Nodes whose hierarchy changed (default: every node)
+        include_descendants: Also recompute everything below node_ids
+        update_depth: Write depth as well (seeding keeps the declared depth)
+        commit: Commit after writing
+
+    Returns:
+        Number of nodes updated
+    """
+    if node_ids is None:
+        affected = set(db.scalars(select(node_model.id)))
+    else:
+        affected = set(db.scalars(select(node_model.id).where(node_model.id.in_(node_ids))))
+        if include_descendants:
+            for node_id in list(affected):
+                affected |= set(get_descendant_depths(db, node_id, node_model))
+    if not affected:
+        return 0
+
+    child_to_parents = load_parent_edges(db, node_model, None if node_ids is None else affected)
+
+    # Parents outside the affected set keep their stored fields
+    external = {p for parents in child_to_parents.values() for p in parents} - affected
+    known = {
+        row.id: (row.depth or 0, row.primary_path or row.id, row.all_ancestors or [])
+        for row in db.execute(
+            select(node_model.id, node_model.depth, node_model.primary_path, node_model.all_ancestors)
+            .where(node_model.id.in_(external))
+        )
+    } if external else {}
+
+    computed, cyclic = compute_hierarchy_fields(affected, child_to_parents, known)
+    if cyclic:
+        logger.warning(f"Hierarchy cycle: skipped {len(cyclic)} nodes ({sorted(cyclic)[:5]})")
+
+    rows = []
+    for node_id, (depth, path, ancestors) in computed.items():
+        row = {"id": node_id, "primary_path": path, "all_ancestors": ancestors}
+        if update_depth:
+            row["depth"] = depth
+        rows.append(row)
+    if rows:
+        db.execute(update(node_model), rows)
+    if commit:
+        db.commit()
+    return len(rows)
 
 
 def update_node_hierarchy_fields(
@@ -244,27 +522,14 @@ def update_node_hierarchy_fields(
         node_id: ID of the node to update
         node_model: The Node model class
     """
-    node = db.query(node_model).filter(node_model.id == node_id).first()
-    if not node:
-        return
-
-    # Compute new values
-    depth = compute_depth(db, node_id, node_model)
-    primary_path = compute_primary_path(db, node_id, node_model)
-    all_ancestors = list(get_all_ancestors(db, node_id, node_model))
-
-    # Update node
-    node.depth = depth
-    node.primary_path = primary_path
-    node.all_ancestors = all_ancestors
-
-    db.commit()
+    recompute_hierarchy_fields(db, node_model, [node_id], include_descendants=False)
 
 
 def update_descendant_hierarchy_fields(
     db: Session,
     node_id: str,
-    node_model
+    node_model,
+    commit: bool = True
 ) -> None:
     """
     Update hierarchy fields for a node and all its descendants.
@@ -275,14 +540,9 @@ def update_descendant_hierarchy_fields(
         db: Database session
         node_id: ID of the node whose hierarchy changed
         node_model: The Node model class
+        commit: Commit after writing
     """
-    # Update the node itself
-    update_node_hierarchy_fields(db, node_id, node_model)
-
-    # Update all descendants
-    descendants = get_all_descendants(db, node_id, node_model)
-    for desc_id in descendants:
-        update_node_hierarchy_fields(db, desc_id, node_model)
+    recompute_hierarchy_fields(db, node_model, [node_id], commit=commit)
 
 
 def validate_hierarchy_integrity(
@@ -294,8 +554,8 @@ def validate_hierarchy_integrity(
 
     Checks for:
     - Cycles
-    - Orphaned paths
     - Inconsistent depths
+    - Stale all_ancestors
 
     Args:
         db: Database session
@@ -306,24 +566,24 @@ def validate_hierarchy_integrity(
     """
     errors = []
 
-    nodes = db.query(node_model).all()
+    stored = {
+        row.id: row for row in db.execute(select(node_model.id, node_model.depth, node_model.all_ancestors))
+    }
+    computed, cyclic = compute_hierarchy_fields(set(stored), load_parent_edges(db, node_model))
 
-    for node in nodes:
-        # Check depth consistency
-        computed_depth = compute_depth(db, node.id, node_model)
-        if node.depth != computed_depth:
-            errors.append((node.id, f"Depth mismatch: stored={node.depth}, computed={computed_depth}"))
+    for node_id in sorted(cyclic):
+        errors.append((node_id, "Cycle detected: node is its own ancestor or below a cycle"))
 
-        # Check for cycles (node should not be in its own ancestors)
-        ancestors = get_all_ancestors(db, node.id, node_model)
-        if node.id in ancestors:
-            errors.append((node.id, "Cycle detected: node is its own ancestor"))
+    for node_id, (depth, _, ancestors) in sorted(computed.items()):
+        row = stored[node_id]
+        # Check depth consistency
+        if row.depth != depth:
+            errors.append((node_id, f"Depth mismatch: stored={row.depth}, computed={depth}"))
 
         # Check all_ancestors consistency
-        computed_ancestors = set(get_all_ancestors(db, node.id, node_model))
-        stored_ancestors = set(node.all_ancestors or [])
-        if computed_ancestors != stored_ancestors:
-            errors.append((node.id, f"Ancestor mismatch: stored={stored_ancestors}, computed={computed_ancestors}"))
+        stored_ancestors = set(row.all_ancestors or [])
+        if stored_ancestors != set(ancestors):
+            errors.append((node_id, f"Ancestor mismatch: stored={stored_ancestors}, computed={set(ancestors)}"))
 
     return errors
 
@@ -335,7 +595,8 @@ def add_parent_child_relationship(
     node_model,
     node_hierarchy_table,
     relationship_type: str = "contains",
-    order_index: int = 0
+    order_index: int = 0,
+    commit: bool = True
 ) -> Tuple[bool, str]:
     """
     Add a parent-child relationship with cycle detection.
@@ -348,6 +609,7 @@ def add_parent_child_relationship(
         node_hierarchy_table: The node_hierarchy junction table
         relationship_type: Type of relationship (contains, specializes, etc.)
         order_index: Order among siblings
+        commit: Commit after writing (False leaves the transaction to the caller)
 
     Returns:
         Tuple of (success, message)
@@ -376,10 +638,11 @@ def add_parent_child_relationship(
 
     try:
         db.execute(stmt)
-        db.commit()
 
-        # Update hierarchy fields for child and its descendants
-        update_descendant_hierarchy_fields(db, child_id, node_model)
+        # Update hierarchy fields for child and its descendants in the same transaction
+        update_descendant_hierarchy_fields(db, child_id, node_model, commit=False)
+        if commit:
+            db.commit()
 
         return True, f"Successfully added relationship: {parent_id} -> {child_id}"
     except Exception as e:
@@ -392,7 +655,8 @@ def remove_parent_child_relationship(
     parent_id: str,
     child_id: str,
     node_model,
-    node_hierarchy_table
+    node_hierarchy_table,
+    commit: bool = True
 ) -> Tuple[bool, str]:
     """
     Remove a parent-child relationship.
@@ -403,6 +667,7 @@ def remove_parent_child_relationship(
         child_id: ID of the child node
         node_model: The Node model class
         node_hierarchy_table: The node_hierarchy junction table
+        commit: Commit after writing (False leaves the transaction to the caller)
 
     Returns:
         Tuple of (success, message)
@@ -418,13 +683,15 @@ def remove_parent_child_relationship(
 
     try:
         result = db.execute(stmt)
-        db.commit()
 
         if result.rowcount == 0:
+            db.rollback()
             return False, f"Relationship not found: {parent_id} -> {child_id}"
 
-        # Update hierarchy fields for child and its descendants
-        update_descendant_hierarchy_fields(db, child_id, node_model)
+        # Update hierarchy fields for child and its descendants in the same transaction
+        update_descendant_hierarchy_fields(db, child_id, node_model, commit=False)
+        if commit:
+            db.commit()
 
         return True, f"Successfully removed relationship: {parent_id} -> {child_id}"
     except Exception as e:
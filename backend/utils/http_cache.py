@@ -0,0 +1,435 @@
+"""
+Persistent HTTP response cache for outbound research clients.
+
+Semantic Scholar, PubMed, Crossref, the full-text providers and CDC WONDER
+all answer the same queries the same way for days; this module keeps their
+responses in one SQLite file so re-running a discovery topic (e.g. after a
+crash) replays searches and DOI lookups from disk:
+
+- Entries are keyed by method, URL (with query string) and request body.
+  Credential parameters (api_key, email, ...) are stripped from the URL
+  before it is keyed or stored.
+- Each source (derived from the host) has its own TTL; 404/410 responses
+  are kept as negative results with a shorter TTL. Errors (429, 5xx) are
+  never stored.
+- Only JSON, XML and text bodies (or untyped ones) up to max_body_bytes
+  are stored, so PDFs and archives are always fetched. Licensed publisher sources (Elsevier,
+  Wiley TDM) are never cached.
+- Response Cache-Control is respected: no-store/no-cache responses are not
+  stored and max-age shortens the TTL. A request sent with
+  Cache-Control: no-cache bypasses the lookup and refreshes the entry.
+- Hit/miss counters per source.
+
+requests clients mount CachingAdapter on their session; rate limiting moves
+into its before_send hook so cache hits are not throttled. The async
+literature search (pipelines.literature_search.RateLimitedClient) uses the
+same HttpCache directly.
+
+Configuration (environment):
+    HTTP_CACHE_ENABLED: "false" disables the shared cache (default: enabled)
+    HTTP_CACHE_PATH: SQLite file (default: backend/.cache/http_cache.sqlite)
+
+Usage:
+    session = requests.Session()
+    mount_cache(session, before_send=rate_limiter.wait)
+    session.get("https://api.crossref.org/works/10.1056/NEJMra1611832")
+
+    get_http_cache().stats()
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_CACHE_PATH = BACKEND_DIR / ".cache" / "http_cache.sqlite"
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# Source name by host; unknown hosts use the host itself
+SOURCE_HOSTS = {
+    "api.semanticscholar.org": "semantic_scholar",
+    "eutils.ncbi.nlm.nih.gov": "pubmed",
+    "www.ncbi.nlm.nih.gov": "pubmed_central",
+    "api.crossref.org": "crossref",
+    "api.unpaywall.org": "unpaywall",
+    "www.ebi.ac.uk": "europe_pmc",
+    "api.core.ac.uk": "core",
+    "api.openalex.org": "openalex",
+    "api.elsevier.com": "elsevier",
+    "api.wiley.com": "wiley",
+    "wonder.cdc.gov": "cdc_wonder",
+}
+
+# Seconds a successful response stays fresh, by source
+SOURCE_TTLS = {
+    "semantic_scholar": 7 * DAY,
+    "pubmed": 7 * DAY,
+    "crossref": 30 * DAY,  # DOI metadata rarely changes
+    "cdc_wonder": 30 * DAY,  # Published vital statistics
+}
+DEFAULT_TTL = 7 * DAY
+# Licensed full-text sources whose content must not be kept on disk
+UNCACHED_SOURCES = {"elsevier", "wiley"}
+# Seconds a 404/410 stays cached
+NEGATIVE_TTL = 6 * HOUR
+NEGATIVE_STATUSES = {404, 410}
+
+CACHEABLE_METHODS = ("GET",)
+# Successful responses are stored only with one of these content types
+CACHEABLE_CONTENT_TYPES = ("json", "xml", "text/")
+MAX_BODY_BYTES = 8 * 1024 * 1024
+# Query parameters identifying the caller; they don't change the response
+CREDENTIAL_PARAMS = {"api_key", "apikey", "email", "mailto", "token", "access_token", "insttoken"}
+_FRAMING_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+@dataclass
+class CachedResponse:
+    """A stored HTTP response."""
+    url: str
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    stored_at: float
+
+    def to_requests(self, request: requests.PreparedRequest) -> requests.Response:
+        """Rebuild a requests.Response (marked with from_cache=True)."""
+        response = requests.Response()
+        response.status_code = self.status
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.body
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = self.url
+        response.request = request
+        response.reason = "OK" if self.status < 400 else "Cached Error"
+        response.from_cache = True
+        return response
+
+
+def cache_key(method: str, url: str, body: Optional[bytes] = None) -> str:
+    """Stable key for a request."""
+    digest = hashlib.sha256(f"{method.upper()} {url}\n".encode("utf-8"))
+    if body:
+        digest.update(body if isinstance(body, bytes) else str(body).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def redact_url(url: str) -> str:
+    """URL without credential query parameters."""
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    params = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+              if k.lower() not in CREDENTIAL_PARAMS]
+    return urlunsplit(parts._replace(query=urlencode(params)))
+
+
+def source_for_url(url: str) -> str:
+    """Source name used for TTLs and stats."""
+    host = urlsplit(url).hostname or ""
+    return SOURCE_HOSTS.get(host, host)
+
+
+def _cache_control(headers) -> Dict[str, Optional[str]]:
+    directives = {}
+    for part in (headers.get("Cache-Control") or "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+class HttpCache:
+    """
+    SQLite-backed HTTP response cache shared by all outbound clients.
+
+    Thread-safe; one instance can back any number of sessions.
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_CACHE_PATH,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = DEFAULT_TTL,
+        negative_ttl: float = NEGATIVE_TTL,
+        max_body_bytes: int = MAX_BODY_BYTES
+    ):
+        """
+        Open (or create) a cache file.
+
+        Args:
+            path: SQLite file (":memory:" for a private in-memory cache)
+            ttls: Seconds a successful response stays fresh, by source
+            default_ttl: TTL for sources not in ttls
+            negative_ttl: TTL for 404/410 responses
+            max_body_bytes: Larger responses are not stored
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self.ttls = {**SOURCE_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.negative_ttl = negative_ttl
+        self.max_body_bytes = max_body_bytes
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        if self.path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+
+    def ttl_for(self, source: str, status: int, headers) -> float:
+        """
+        Seconds to keep a response (0 = don't store).
+        """
+        if source in UNCACHED_SOURCES:
+            return 0
+        if status in NEGATIVE_STATUSES:
+            ttl = self.negative_ttl
+        elif 200 <= status < 300:
+            ttl = self.ttls.get(source, self.default_ttl)
+        else:
+            return 0
+
+        directives = _cache_control(headers)
+        if "no-store" in directives or "no-cache" in directives:
+            return 0
+        max_age = directives.get("max-age")
+        if max_age is not None and max_age.isdigit():
+            ttl = min(ttl, int(max_age))
+        return ttl
+
+    def lookup(self, method: str, url: str, body: Optional[bytes] = None) -> Optional[CachedResponse]:
+        """
+        Fresh cached response for a request, counting a hit or miss.
+        """
+        source = source_for_url(url)
+        if source in UNCACHED_SOURCES:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status, headers, body, stored_at FROM responses WHERE key = ? AND expires_at > ?",
+                (cache_key(method, redact_url(url), body), time.time())
+            ).fetchone()
+            counter = self._hits if row else self._misses
+            counter[source] = counter.get(source, 0) + 1
+
+        if row is None:
+            return None
+        return CachedResponse(url=row[0], status=row[1], headers=json.loads(row[2]), body=row[3], stored_at=row[4])
+
+    def store(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        status: int,
+        headers,
+        content: bytes
+    ) -> bool:
+        """
+        Store a response if it is cacheable.
+
+        Returns:
+            True if stored
+        """
+        source = source_for_url(url)
+        ttl = self.ttl_for(source, status, headers)
+        if ttl <= 0 or len(content) > self.max_body_bytes:
+            return False
+        content_type = (headers.get("Content-Type") or "").lower()
+        if content_type and 200 <= status < 300 and not any(t in content_type for t in CACHEABLE_CONTENT_TYPES):
+            return False  # PDFs, archives and other binary downloads
+        url = redact_url(url)
+
+        # content is already decoded, so drop the transfer framing headers
+        stored_headers = {
+            name: value for name, value in headers.items()
+            if name.lower() not in _FRAMING_HEADERS
+        }
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (cache_key(method, url, body), source, url, status, json.dumps(stored_headers),
+                 content, now, now + ttl)
+            )
+            self._conn.commit()
+        return True
+
+    def purge_expired(self) -> int:
+        """Delete expired entries; returns the number removed."""
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+            self._conn.commit()
+            return cursor.rowcount
+
+    def clear(self, source: Optional[str] = None) -> None:
+        """Delete all entries, or those of one source."""
+        with self._lock:
+            if source is None:
+                self._conn.execute("DELETE FROM responses")
+            else:
+                self._conn.execute("DELETE FROM responses WHERE source = ?", (source,))
+            self._conn.commit()
+
+    def stats(self) -> Dict:
+        """Hit/miss counters (this process) and stored entries, by source."""
+        with self._lock:
+            stored = dict(self._conn.execute("SELECT source, COUNT(*) FROM responses GROUP BY source"))
+            hits, misses = dict(self._hits), dict(self._misses)
+
+        sources = sorted(set(hits) | set(misses) | set(stored))
+        return {
+            "hits": sum(hits.values()),
+            "misses": sum(misses.values()),
+            "by_source": {
+                source: {
+                    "hits": hits.get(source, 0),
+                    "misses": misses.get(source, 0),
+                    "entries": stored.get(source, 0),
+                }
+                for source in sources
+            },
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CachingAdapter(HTTPAdapter):
+    """
+    requests transport adapter that answers from an HttpCache when it can.
+
+    before_send runs before every request that goes to the network (not
+    for cache hits), which makes it the place for client rate limiting.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[HttpCache],
+        before_send: Optional[Callable[[], None]] = None,
+        methods: Iterable[str] = CACHEABLE_METHODS,
+        **kwargs
+    ):
+        """
+        Initialize the adapter.
+
+        Args:
+            cache: Response cache (None = pass-through)
+            before_send: Called before each network request (e.g. a rate limiter)
+            methods: HTTP methods to cache (add POST for query APIs like CDC WONDER)
+            **kwargs: HTTPAdapter arguments (max_retries, pool sizes)
+        """
+        super().__init__(**kwargs)
+        self.cache = cache
+        self.before_send = before_send
+        self.methods = {m.upper() for m in methods}
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        cacheable = self.cache is not None and request.method in self.methods
+        if cacheable and "no-cache" not in _cache_control(request.headers):
+            cached = self.cache.lookup(request.method, request.url, request.body)
+            if cached is not None:
+                return cached.to_requests(request)
+
+        if self.before_send is not None:
+            self.before_send()
+        response = super().send(request, **kwargs)
+
+        if cacheable and not kwargs.get("stream"):
+            self.cache.store(request.method, request.url, request.body,
+                             response.status_code, response.headers, response.content)
+        return response
+
+
+_default_cache: Optional[HttpCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    """
+    The shared cache configured by HTTP_CACHE_ENABLED / HTTP_CACHE_PATH.
+
+    Returns:
+        HttpCache, or None if caching is disabled or the file can't be opened
+    """
+    global _default_cache
+    if os.getenv("HTTP_CACHE_ENABLED", "true").lower() in ("0", "false", "no"):
+        return None
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            path = os.getenv("HTTP_CACHE_PATH") or DEFAULT_CACHE_PATH
+            try:
+                _default_cache = HttpCache(path)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"HTTP cache disabled, can't open {path}: {e}")
+                return None
+        return _default_cache
+
+
+def mount_cache(
+    session: requests.Session,
+    cache: Optional[HttpCache] = None,
+    before_send: Optional[Callable[[], None]] = None,
+    methods: Iterable[str] = CACHEABLE_METHODS,
+    **adapter_kwargs
+) -> CachingAdapter:
+    """
+    Mount a CachingAdapter on a session for http:// and https://.
+
+    Args:
+        session: Session to configure
+        cache: Cache to use (default: get_http_cache())
+        before_send: Called before each network request (e.g. a rate limiter)
+        methods: HTTP methods to cache
+        **adapter_kwargs: HTTPAdapter arguments (max_retries, ...)
+
+    Returns:
+        The mounted adapter
+    """
+    adapter = CachingAdapter(
+        cache if cache is not None else get_http_cache(),
+        before_send=before_send,
+        methods=methods,
+        **adapter_kwargs
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return adapter
@@ -0,0 +1,283 @@
+"""
+Content-addressed cache for LLM (Anthropic Messages API) responses.
+
+Extraction, classification and consolidation prompts are deterministic
+functions of their inputs, so rerunning a pipeline should not pay for the
+same prompt twice. cached_client() wraps an Anthropic client so that
+client.messages.create(...) is answered from an on-disk store keyed by a
+hash of the full request (model, messages, system, max_tokens, temperature,
+...); everything else on the client (batches, count_tokens) passes through.
+
+- Store: SQLite, with a size cap; least recently used entries are evicted.
+- Statistics: hits, misses, stores, evictions, entries and bytes.
+- Modes: "readwrite" (default), "replay" (offline: a miss raises
+  LLMCacheMiss instead of calling the API; the wrapped client may be a stub
+  or None), "off" (pass-through).
+
+Cached responses are returned as lightweight objects with the same shape as
+anthropic Message (response.content[0].text, response.usage.input_tokens).
+
+Configuration (environment):
+    LLM_CACHE_MODE: readwrite | replay | off (default: readwrite)
+    LLM_CACHE_PATH: SQLite file (default: backend/.cache/llm_cache.sqlite)
+    LLM_CACHE_MAX_MB: Size cap in megabytes (default: 512)
+
+Usage:
+    self.client = cached_client(anthropic.Anthropic(api_key=api_key))
+    response = self.client.messages.create(model=..., max_tokens=..., messages=[...])
+
+    # Offline tests
+    cache = LLMResponseCache(":memory:")
+    cache.put({"model": "m", "max_tokens": 10, "messages": [...]}, "recorded answer")
+    client = cached_client(None, cache=cache, mode="replay")
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_CACHE_PATH = BACKEND_DIR / ".cache" / "llm_cache.sqlite"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+MODES = ("readwrite", "replay", "off")
+# Request options that don't change the response
+NON_KEY_PARAMS = {"timeout", "extra_headers", "extra_query"}
+
+
+class LLMCacheMiss(LookupError):
+    """Raised in replay mode for a request that was never recorded."""
+
+
+def request_key(params: Dict[str, Any]) -> str:
+    """Content hash of a messages.create request."""
+    keyed = {k: v for k, v in params.items() if k not in NON_KEY_PARAMS}
+    canonical = json.dumps(keyed, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _serialize(response: Any) -> Dict[str, Any]:
+    """JSON form of a Message (or a plain response text)."""
+    if isinstance(response, str):
+        return {"type": "message", "role": "assistant", "content": [{"type": "text", "text": response}]}
+    if hasattr(response, "model_dump"):
+        return response.model_dump(mode="json")
+    if isinstance(response, dict):
+        return response
+    raise TypeError(f"Can't cache response of type {type(response).__name__}")
+
+
+def _deserialize(data: str) -> SimpleNamespace:
+    return json.loads(data, object_hook=lambda d: SimpleNamespace(**d))
+
+
+class LLMResponseCache:
+    """
+    On-disk, size-capped store of LLM responses keyed by request hash.
+
+    Thread-safe; one instance can back any number of clients.
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Open (or create) a cache file.
+
+        Args:
+            path: SQLite file (":memory:" for a private in-memory cache)
+            max_bytes: Size cap; least recently used entries are evicted beyond it
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                model TEXT,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_used_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_responses_last_used ON responses (last_used_at)")
+        self._conn.commit()
+
+        self._counters = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def get(self, params: Dict[str, Any]) -> Optional[SimpleNamespace]:
+        """Cached response for a request, counting a hit or miss."""
+        key = request_key(params)
+        with self._lock:
+            row = self._conn.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._counters["misses"] += 1
+                return None
+            self._counters["hits"] += 1
+            self._conn.execute("UPDATE responses SET last_used_at = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        return _deserialize(row[0])
+
+    def put(self, params: Dict[str, Any], response: Any) -> None:
+        """
+        Store a response (an anthropic Message, its dict form, or just the text).
+        """
+        data = json.dumps(_serialize(response), separators=(",", ":"), ensure_ascii=False)
+        size = len(data.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (request_key(params), params.get("model"), data, size, now, now)
+            )
+            self._counters["stores"] += 1
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until under the size cap (lock held)."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY last_used_at").fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self._counters["evictions"] += len(evicted)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters (this process) plus stored entries and bytes."""
+        with self._lock:
+            entries, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            counters = dict(self._counters)
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            **counters,
+            "hit_rate": counters["hits"] / lookups if lookups else 0.0,
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CachedMessages:
+    """client.messages replacement whose create() reads through the cache."""
+
+    def __init__(self, messages: Any, cache: LLMResponseCache, mode: str):
+        self._messages = messages
+        self.cache = cache
+        self.mode = mode
+
+    def create(self, **params):
+        # Streams are consumed incrementally by the caller; don't cache them
+        if params.get("stream"):
+            return self._messages.create(**params)
+
+        cached = self.cache.get(params)
+        if cached is not None:
+            return cached
+        if self.mode == "replay":
+            raise LLMCacheMiss(f"No recorded response for {params.get('model')} request {request_key(params)[:12]}")
+
+        response = self._messages.create(**params)
+        self.cache.put(params, response)
+        return response
+
+    def __getattr__(self, name):
+        # batches, count_tokens, ... go to the real client
+        return getattr(self._messages, name)
+
+
+class CachingClient:
+    """Wraps an Anthropic client; only messages.create is cached."""
+
+    def __init__(self, client: Any, cache: LLMResponseCache, mode: str = "readwrite"):
+        self._client = client
+        self.cache = cache
+        self.mode = mode
+        self.messages = CachedMessages(getattr(client, "messages", None), cache, mode)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+_default_cache: Optional[LLMResponseCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """
+    The shared cache configured by LLM_CACHE_PATH / LLM_CACHE_MAX_MB.
+
+    Returns:
+        LLMResponseCache, or None if the file can't be opened
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            path = os.getenv("LLM_CACHE_PATH") or DEFAULT_CACHE_PATH
+            max_bytes = int(float(os.getenv("LLM_CACHE_MAX_MB", DEFAULT_MAX_BYTES / 1024 / 1024)) * 1024 * 1024)
+            try:
+                _default_cache = LLMResponseCache(path, max_bytes=max_bytes)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"LLM cache disabled, can't open {path}: {e}")
+                return None
+        return _default_cache
+
+
+def cached_client(
+    client: Any,
+    cache: Optional[LLMResponseCache] = None,
+    mode: Optional[str] = None
+) -> Any:
+    """
+    Wrap an Anthropic client with the response cache.
+
+    Args:
+        client: anthropic.Anthropic (or a stub with messages.create; may be None in replay mode)
+        cache: Cache to use (default: get_llm_cache())
+        mode: readwrite | replay | off (default: LLM_CACHE_MODE, else readwrite)
+
+    Returns:
+        CachingClient, or the client itself when caching is off
+
+    Raises:
+        ValueError: For an unknown mode
+    """
+    mode = (mode or os.getenv("LLM_CACHE_MODE") or "readwrite").lower()
+    if mode not in MODES:
+        raise ValueError(f"Unknown LLM cache mode {mode!r} (expected one of {', '.join(MODES)})")
+    if mode == "off":
+        return client
+
+    cache = cache if cache is not None else get_llm_cache()
+    if cache is None:
+        if mode == "replay":
+            raise ValueError("LLM cache replay mode requires a cache")
+        return client
+    return CachingClient(client, cache, mode)